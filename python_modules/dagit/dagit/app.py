@@ -34,7 +34,8 @@ class RepositoryContainer(object):
     object allows the RepositoryInfo to be written in an immutable fashion.
     '''
 
-    def __init__(self, repository_target_info=None, repository=None):
+    def __init__(self, repository_target_info=None, repository=None, warm_up=False):
+        self.warm_up = check.bool_param(warm_up, 'warm_up')
         if repository_target_info is not None:
             self.repository_target_info = repository_target_info
             self.repo_dynamic_obj = check.inst(
@@ -53,6 +54,8 @@ class RepositoryContainer(object):
             return
         try:
             self.repo = self.repo_dynamic_obj.load()
+            if self.warm_up:
+                self.repo.warm_up()
             self.repo_error = None
         except:  # pylint: disable=W0702
             self.repo_error = sys.exc_info()
@@ -93,14 +93,19 @@ def execute_query_from_cli(repository_container, query, variables):
 @click.option('--sync', is_flag=True, help='Use the synchronous execution manager')
 @click.option('--log', is_flag=False, help='Record logs of pipeline runs')
 @click.option('--log-dir', help="Directory to record logs to", default='dagit_run_logs/')
+@click.option(
+    '--warm-up',
+    is_flag=True,
+    help='Construct all pipelines of the repository at startup and on reload',
+)
 @click.option('--query', '-q', type=click.STRING)
 @click.option('--variables', '-v', type=click.STRING)
 @click.version_option(version=__version__)
-def ui(host, port, watch, sync, log, log_dir, query, variables, **kwargs):
+def ui(host, port, watch, sync, log, log_dir, warm_up, query, variables, **kwargs):
     repository_target_info = load_target_info_from_cli_args(kwargs)
 
     sys.path.append(os.getcwd())
-    repository_container = RepositoryContainer(repository_target_info)
+    repository_container = RepositoryContainer(repository_target_info, warm_up=warm_up)
 
     if query:
         return execute_query_from_cli(repository_container, query, variables)
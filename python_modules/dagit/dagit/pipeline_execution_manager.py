@@ -103,6 +103,8 @@ class SynchronousExecutionManager(PipelineExecutionManager):
                     pipeline.name,
                 )
             )
+        finally:
+            pipeline_run.close()
 
 
 class MultiprocessingDone(object):
@@ -172,7 +174,9 @@ class MultiprocessingExecutionManager(PipelineExecutionManager):
                             )
                         )
 
-            if not done:
+            if done:
+                process.pipeline_run.close()
+            else:
                 with self._processes_lock:
                     self._processes.append(process)
 
@@ -11,6 +11,7 @@ import gevent.lock
 import pyrsistent
 
 from dagster import check
+from dagster.core.event_log import EventLogWriter
 from dagster.core.events import EventRecord, EventType
 from dagster.core.execution import ExecutionSelector
 from dagster.core.execution_plan.objects import ExecutionPlan
@@ -93,6 +94,9 @@ class PipelineRun(object):
     def store_event(self, new_event):
         raise NotImplementedError()
 
+    def close(self):
+        '''Called once the execution of the run has ended, however it ended.'''
+
     def handle_new_event(self, new_event):
         check.inst_param(new_event, 'new_event', EventRecord)
 
@@ -139,6 +143,12 @@ class InMemoryPipelineRun(PipelineRun):
 
 
 class LogFilePipelineRun(InMemoryPipelineRun):
+    '''
+    Writes the event records of the run to <log_dir>/<timestamp>_<run_id>.events, in the binary
+    format of dagster.core.event_log. Runs used to be written to .log files with the json of a
+    record per line; dagster.core.event_log.read_event_records reads both.
+    '''
+
     def __init__(self, log_dir, *args, **kwargs):
         super(LogFilePipelineRun, self).__init__(*args, **kwargs)
         self._log_dir = check.str_param(log_dir, 'log_dir')
@@ -147,8 +157,9 @@ class LogFilePipelineRun(InMemoryPipelineRun):
         )
         ensure_dir(log_dir)
         self._write_metadata_to_file()
-        self._log_file = '{}.log'.format(self._file_prefix)
+        self._log_file = '{}.events'.format(self._file_prefix)
         self._log_file_lock = gevent.lock.Semaphore()
+        self._event_log_writer = EventLogWriter(self._log_file)
 
     def _write_metadata_to_file(self):
         metadata_file = '{}.json'.format(self._file_prefix)
@@ -172,11 +183,15 @@ class LogFilePipelineRun(InMemoryPipelineRun):
         super().store_event(new_event)
 
         with self._log_file_lock:
-            # Going to do the less error-prone, simpler, but slower strategy:
-            # open, append, close for every log message for now
-            with open(self._log_file, 'a', encoding='utf-8') as log_file_handle:
-                log_file_handle.write(json.dumps(new_event.to_dict(), sort_keys=True))
-                log_file_handle.write('\n')
+            self._event_log_writer.write(new_event)
+
+            # The log is only kept open while the pipeline executes
+            if new_event.event_type in (EventType.PIPELINE_SUCCESS, EventType.PIPELINE_FAILURE):
+                self._event_log_writer.close()
+
+    def close(self):
+        with self._log_file_lock:
+            self._event_log_writer.close()
 
 
 def ensure_dir(file_path):
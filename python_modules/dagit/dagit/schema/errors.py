@@ -90,6 +90,14 @@ class DauphinPipelineConfigValidationResult(dauphin.Union):
         )
 
 
+class DauphinPipelineConfigIncrementalValidation(dauphin.ObjectType):
+    class Meta:
+        name = 'PipelineConfigIncrementalValidation'
+
+    result = dauphin.Field(dauphin.NonNull('PipelineConfigValidationResult'))
+    token = dauphin.String()
+
+
 class DauphinPipelineConfigValidationError(dauphin.Interface):
     class Meta:
         name = 'PipelineConfigValidationError'
@@ -24,7 +24,11 @@ from dagster.core.execution import (
     execute_marshalling,
     get_subset_pipeline,
 )
-from dagster.core.types.evaluator import evaluate_config_value, EvaluateValueResult
+from dagster.core.types.evaluator import (
+    evaluate_config_value,
+    validate_config_value_incremental,
+    EvaluateValueResult,
+)
 
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -174,6 +178,43 @@ def validate_pipeline_config(graphene_info, selector, config):
     return pipeline_or_error.chain(do_validation).value()
 
 
+def validate_pipeline_config_incremental(
+    graphene_info, selector, config, changed_path, previous_token
+):
+    check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
+    check.inst_param(selector, 'selector', ExecutionSelector)
+    check.opt_list_param(changed_path, 'changed_path', of_type=str)
+    check.opt_str_param(previous_token, 'previous_token')
+
+    def do_validation(pipeline):
+        pipeline_env_type = pipeline.get_dagster_pipeline().environment_type
+        validation = validate_config_value_incremental(
+            pipeline_env_type, config, changed_path, previous_token
+        )
+        config_or_error = _config_or_error_from_result(
+            graphene_info,
+            pipeline,
+            EvaluateValueResult(
+                success=not validation.errors, value=None, errors=validation.errors
+            ),
+        )
+        return graphene_info.schema.type_named('PipelineConfigIncrementalValidation')(
+            result=config_or_error.chain(
+                lambda _: graphene_info.schema.type_named('PipelineConfigValidationValid')(pipeline)
+            ).value(),
+            token=validation.token,
+        )
+
+    pipeline_or_error = _pipeline_or_error_from_container(
+        graphene_info, graphene_info.context.repository_container, selector
+    )
+    if isinstance(pipeline_or_error, EitherError):
+        return graphene_info.schema.type_named('PipelineConfigIncrementalValidation')(
+            result=pipeline_or_error.value()
+        )
+    return pipeline_or_error.chain(do_validation).value()
+
+
 def get_execution_plan(graphene_info, selector, config):
     check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
     check.inst_param(selector, 'selector', ExecutionSelector)
@@ -304,8 +345,12 @@ def _pipeline_or_error_from_container(graphene_info, container, selector):
 
 def _config_or_error_from_pipeline(graphene_info, pipeline, env_config):
     pipeline_env_type = pipeline.get_dagster_pipeline().environment_type
-    validated_config = evaluate_config_value(pipeline_env_type, env_config)
+    return _config_or_error_from_result(
+        graphene_info, pipeline, evaluate_config_value(pipeline_env_type, env_config)
+    )
+
 
+def _config_or_error_from_result(graphene_info, pipeline, validated_config):
     if not validated_config.success:
         return EitherError(
             graphene_info.schema.type_named('PipelineConfigValidationInvalid')(
@@ -40,6 +40,20 @@ class DauphinQuery(dauphin.ObjectType):
         },
     )
 
+    isPipelineConfigValidIncremental = dauphin.Field(
+        dauphin.NonNull('PipelineConfigIncrementalValidation'),
+        description='''
+Validates config that differs from the config validated with previousToken only in the subtree
+at changedPath, a list of field names and list indices, by validating only that subtree again.
+Without changedPath, or if previousToken has expired, the config is validated in full.''',
+        args={
+            'pipeline': dauphin.Argument(dauphin.NonNull('ExecutionSelector')),
+            'config': dauphin.Argument('PipelineConfig'),
+            'changedPath': dauphin.Argument(dauphin.List(dauphin.NonNull(dauphin.String))),
+            'previousToken': dauphin.Argument(dauphin.String),
+        },
+    )
+
     executionPlan = dauphin.Field(
         dauphin.NonNull('ExecutionPlanResult'),
         args={
@@ -85,6 +99,15 @@ class DauphinQuery(dauphin.ObjectType):
     def resolve_isPipelineConfigValid(self, graphene_info, pipeline, config):
         return model.validate_pipeline_config(graphene_info, pipeline.to_selector(), config)
 
+    def resolve_isPipelineConfigValidIncremental(self, graphene_info, pipeline, **kwargs):
+        return model.validate_pipeline_config_incremental(
+            graphene_info,
+            pipeline.to_selector(),
+            kwargs.get('config'),
+            kwargs.get('changedPath'),
+            kwargs.get('previousToken'),
+        )
+
     def resolve_executionPlan(self, graphene_info, pipeline, config):
         return model.get_execution_plan(graphene_info, pipeline.to_selector(), config)
 
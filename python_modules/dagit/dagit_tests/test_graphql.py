@@ -477,6 +477,73 @@ def test_basic_valid_config():
     assert result.data['isPipelineConfigValid']['pipeline']['name'] == 'pandas_hello_world'
 
 
+INCREMENTAL_CONFIG_VALIDATION_QUERY = '''
+query PipelineQuery(
+    $config: PipelineConfig,
+    $changedPath: [String!],
+    $previousToken: String,
+    $pipeline: ExecutionSelector!
+) {
+    isPipelineConfigValidIncremental(
+        config: $config,
+        changedPath: $changedPath,
+        previousToken: $previousToken,
+        pipeline: $pipeline
+    ) {
+        token
+        result {
+            __typename
+            ... on PipelineConfigValidationInvalid {
+                errors {
+                    __typename
+                    ... on RuntimeMismatchConfigError {
+                        valueRep
+                    }
+                }
+            }
+        }
+    }
+}
+'''
+
+
+def test_incremental_config_validation():
+    path = ['solids', 'sum_solid', 'inputs', 'num', 'csv', 'path']
+
+    def _validate_incremental(config, changed_path=None, previous_token=None):
+        result = execute_dagster_graphql(
+            define_context(),
+            INCREMENTAL_CONFIG_VALIDATION_QUERY,
+            {
+                'config': config,
+                'changedPath': changed_path,
+                'previousToken': previous_token,
+                'pipeline': {'name': 'pandas_hello_world'},
+            },
+        )
+        assert not result.errors
+        return result.data['isPipelineConfigValidIncremental']
+
+    invalid_config = pandas_hello_world_solids_config()
+    invalid_config['solids']['sum_solid']['inputs']['num']['csv']['path'] = 1
+
+    validation = _validate_incremental(invalid_config)
+    assert validation['token']
+    errors = validation['result']['errors']
+    assert len(errors) == 1
+    assert errors[0]['__typename'] == 'RuntimeMismatchConfigError'
+    assert errors[0]['valueRep'] == '1'
+
+    validation = _validate_incremental(
+        pandas_hello_world_solids_config(), path, validation['token']
+    )
+    assert validation['result']['__typename'] == 'PipelineConfigValidationValid'
+
+    validation = _validate_incremental(invalid_config, path, validation['token'])
+    assert validation['result']['__typename'] == 'PipelineConfigValidationInvalid'
+    assert len(validation['result']['errors']) == 1
+
+
 def test_root_field_not_defined():
     result = execute_config_graphql(
         pipeline_name='pandas_hello_world',
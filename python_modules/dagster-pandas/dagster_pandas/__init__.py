@@ -1,4 +1,14 @@
-from .data_frame import DataFrame
+from .data_frame import DataFrame, DataFrameSummarizer
+from .serialization import (
+    ArrowTableSerializationStrategy,
+    DataFrameArrowSerializationStrategy,
+    NumpySerializationStrategy,
+)
 
-
-__all__ = ['DataFrame']
+__all__ = [
+    'ArrowTableSerializationStrategy',
+    'DataFrame',
+    'DataFrameArrowSerializationStrategy',
+    'DataFrameSummarizer',
+    'NumpySerializationStrategy',
+]
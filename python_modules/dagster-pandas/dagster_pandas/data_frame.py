@@ -12,6 +12,13 @@ from dagster import (
     NamedSelector,
     String,
 )
+from dagster.core.types.summary import (
+    MAX_SUMMARY_ITEMS,
+    TRUNCATION_MARKER,
+    ValueSummarizer,
+    summarize_value,
+    truncate_summary,
+)
 
 
 def define_path_dict_field():
@@ -81,6 +88,30 @@ def dataframe_input_schema(file_type, file_options):
         )
 
 
+class DataFrameSummarizer(ValueSummarizer):
+    '''Summarizes DataFrames by their shape and the dtypes of their first max_columns columns.'''
+
+    def __init__(self, max_columns=MAX_SUMMARY_ITEMS):
+        self.max_columns = check.int_param(max_columns, 'max_columns')
+
+    def summarize_value(self, value):
+        if not isinstance(value, pd.DataFrame):
+            return summarize_value(value)
+
+        columns = [
+            '{name}: {dtype}'.format(name=name, dtype=dtype)
+            for name, dtype in value.dtypes.iloc[: self.max_columns].items()
+        ]
+        if len(value.columns) > self.max_columns:
+            columns.append(TRUNCATION_MARKER)
+
+        return truncate_summary(
+            '<DataFrame of shape {rows}x{cols}: {columns}>'.format(
+                rows=value.shape[0], cols=value.shape[1], columns=', '.join(columns)
+            )
+        )
+
+
 DataFrame = as_dagster_type(
     pd.DataFrame,
     name='PandasDataFrame',
@@ -89,4 +120,5 @@ DataFrame = as_dagster_type(
     See http://pandas.pydata.org/''',
     input_schema=dataframe_input_schema,
     output_schema=dataframe_output_schema,
+    value_summarizer=DataFrameSummarizer(),
 )
@@ -0,0 +1,131 @@
+'''
+Serialization strategies that write numpy arrays and Arrow tables in their native buffer
+layout, so that reading them back does not copy their data.
+
+When the file object passed to deserialize_value is backed by a file on disk, as it is with
+FilePersistencePolicy and the filesystem intermediate store, or is itself a memory map, as it is
+with the mmap intermediate store, the values returned reference a read-only memory map of the
+file. Their data is paged in from the page cache as it is accessed, and outlives the file
+object. Arrays read this way cannot be modified in place, so solids that need to do so should
+copy them first.
+
+Attach them to a type with as_dagster_type:
+
+    NumpyArray = as_dagster_type(
+        np.ndarray, name='NumpyArray', serialization_strategy=NumpySerializationStrategy()
+    )
+'''
+
+import io
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dagster import check
+from dagster.core.types.marshal import SerializationStrategy
+
+_NPY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+def _map_file_obj(read_file_obj):
+    '''
+    A read-only memory map of the file, or None if the file object cannot be mapped. The map is
+    not closed explicitly, so that values which reference its buffer keep it alive.
+    '''
+    if isinstance(read_file_obj, mmap.mmap):
+        return read_file_obj
+
+    try:
+        fileno = read_file_obj.fileno()
+    except (AttributeError, IOError, ValueError, io.UnsupportedOperation):
+        return None
+
+    if not os.fstat(fileno).st_size:
+        # Empty files cannot be mapped
+        return None
+
+    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+class NumpySerializationStrategy(SerializationStrategy):
+    '''
+    Writes numpy arrays in the .npy format, and maps them back without copying their data.
+    Arrays of objects cannot be serialized, as they would have to be pickled.
+    '''
+
+    def serialize_value(self, value, write_file_obj):
+        check.inst_param(value, 'value', np.ndarray)
+        np.lib.format.write_array(write_file_obj, value, allow_pickle=False)
+
+    def deserialize_value(self, read_file_obj):
+        start = read_file_obj.tell()
+        version = np.lib.format.read_magic(read_file_obj)
+        if version not in _NPY_HEADER_READERS:
+            read_file_obj.seek(start)
+            return np.lib.format.read_array(read_file_obj, allow_pickle=False)
+
+        shape, fortran_order, dtype = _NPY_HEADER_READERS[version](read_file_obj)
+
+        mapped = _map_file_obj(read_file_obj)
+        if mapped is None:
+            read_file_obj.seek(start)
+            return np.lib.format.read_array(read_file_obj, allow_pickle=False)
+
+        count = 1
+        for dim in shape:
+            count *= dim
+
+        array = np.frombuffer(mapped, dtype=dtype, count=count, offset=read_file_obj.tell())
+        return array.reshape(shape, order='F' if fortran_order else 'C')
+
+
+class ArrowTableSerializationStrategy(SerializationStrategy):
+    '''
+    Writes pyarrow Tables in the Arrow IPC file format, and maps them back without copying
+    their data.
+    '''
+
+    def serialize_value(self, value, write_file_obj):
+        check.inst_param(value, 'value', pa.Table)
+
+        writer = pa.RecordBatchFileWriter(write_file_obj, value.schema)
+        try:
+            writer.write_table(value)
+        finally:
+            writer.close()
+
+    def deserialize_value(self, read_file_obj):
+        start = read_file_obj.tell()
+        mapped = _map_file_obj(read_file_obj)
+        if mapped is None:
+            source = pa.py_buffer(read_file_obj.read())
+        else:
+            source = pa.py_buffer(mapped).slice(start)
+        return pa.RecordBatchFileReader(source).read_all()
+
+
+class DataFrameArrowSerializationStrategy(ArrowTableSerializationStrategy):
+    '''
+    Writes pandas DataFrames as Arrow tables. Reading the table is zero-copy, but converting it
+    back to a DataFrame copies every column that pandas cannot represent over Arrow's buffers.
+    Only DataFrames whose columns Arrow can represent can be serialized.
+    '''
+
+    def serialize_value(self, value, write_file_obj):
+        check.inst_param(value, 'value', pd.DataFrame)
+        super(DataFrameArrowSerializationStrategy, self).serialize_value(
+            pa.Table.from_pandas(value), write_file_obj
+        )
+
+    def deserialize_value(self, read_file_obj):
+        return (
+            super(DataFrameArrowSerializationStrategy, self)
+            .deserialize_value(read_file_obj)
+            .to_pandas()
+        )
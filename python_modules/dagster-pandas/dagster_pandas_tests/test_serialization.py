@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.types.marshal import FilePersistencePolicy
+
+from dagster_pandas import (
+    ArrowTableSerializationStrategy,
+    DataFrameArrowSerializationStrategy,
+    NumpySerializationStrategy,
+)
+
+
+def _round_trip(serialization_strategy, value, tmpdir):
+    path = str(tmpdir.join('value'))
+    policy = FilePersistencePolicy()
+    policy.write_value(serialization_strategy, path, value)
+    return policy.read_value(serialization_strategy, path)
+
+
+def test_numpy_round_trip_is_memory_mapped(tmpdir):
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    read_array = _round_trip(NumpySerializationStrategy(), array, tmpdir)
+
+    assert np.array_equal(read_array, array)
+    assert read_array.dtype == array.dtype
+    assert not read_array.flags.owndata
+    assert not read_array.flags.writeable
+
+
+def test_numpy_round_trip_fortran_order(tmpdir):
+    array = np.asfortranarray(np.arange(6, dtype=np.int32).reshape(2, 3))
+    read_array = _round_trip(NumpySerializationStrategy(), array, tmpdir)
+
+    assert np.array_equal(read_array, array)
+    assert read_array.flags.f_contiguous
+
+
+def test_numpy_round_trip_empty(tmpdir):
+    array = np.zeros((0, 3))
+    assert _round_trip(NumpySerializationStrategy(), array, tmpdir).shape == (0, 3)
+
+
+def test_arrow_table_round_trip(tmpdir):
+    table = pa.Table.from_pandas(pd.DataFrame({'num': [1, 2, 3], 'name': ['a', 'b', 'c']}))
+    assert _round_trip(ArrowTableSerializationStrategy(), table, tmpdir).equals(table)
+
+
+def test_data_frame_arrow_round_trip(tmpdir):
+    df = pd.DataFrame({'num': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    assert _round_trip(DataFrameArrowSerializationStrategy(), df, tmpdir).equals(df)
+
+
+def test_numpy_type_in_mmap_intermediate_store(tmpdir):
+    NumpyArray = as_dagster_type(
+        np.ndarray, name='NumpyArray', serialization_strategy=NumpySerializationStrategy()
+    )
+
+    @lambda_solid(output=OutputDefinition(NumpyArray))
+    def return_array():
+        return np.arange(10)
+
+    @lambda_solid(inputs=[InputDefinition('array', NumpyArray)])
+    def sum_array(array):
+        return int(array.sum())
+
+    pipeline = PipelineDefinition(
+        name='numpy_pipeline',
+        solids=[return_array, sum_array],
+        dependencies={'sum_array': {'array': DependencyDefinition('return_array')}},
+    )
+
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'execution': {'intermediate_store': {'mmap': {'directory': str(tmpdir)}}}
+        },
+    )
+    assert result.success
+    assert result.result_for_solid('sum_array').transformed_value() == 45
+    assert not result.result_for_solid('return_array').transformed_value().flags.owndata
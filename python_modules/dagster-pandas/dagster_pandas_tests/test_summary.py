@@ -0,0 +1,17 @@
+import pandas as pd
+
+from dagster_pandas import DataFrame, DataFrameSummarizer
+
+
+def test_data_frame_summary():
+    df = pd.DataFrame({'num1': [1, 3], 'num2': [2.0, 4.0]})
+    assert DataFrame.value_summarizer.summarize_value(df) == (
+        '<DataFrame of shape 2x2: num1: int64, num2: float64>'
+    )
+
+
+def test_data_frame_summary_truncates_columns():
+    df = pd.DataFrame({'num{i}'.format(i=i): [i] for i in range(10)})
+    assert DataFrameSummarizer(max_columns=2).summarize_value(df) == (
+        '<DataFrame of shape 1x10: num0: int64, num1: int64, ...>'
+    )
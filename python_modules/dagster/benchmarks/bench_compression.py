@@ -0,0 +1,132 @@
+'''
+Reports the size and throughput of each compression codec on representative payloads.
+
+Run with:
+
+    python benchmarks/bench_compression.py [--repeat 5] [--level 1]
+
+Throughput is measured over the uncompressed pickle, including serialization, so that the
+baseline row (no codec) is the cost of pickling alone.
+'''
+
+import io
+import os
+import random
+import string
+import timeit
+
+import click
+
+from dagster.core.types.compression import CODECS
+from dagster.core.types.marshal import CompressedSerializationStrategy, PickleSerializationStrategy
+
+
+def _records_payload():
+    rng = random.Random(0)
+    return [
+        {
+            'id': i,
+            'name': 'customer {i}'.format(i=i),
+            'country': rng.choice(['US', 'DE', 'FR', 'JP', 'BR']),
+            'balance': round(rng.uniform(0, 10000), 2),
+            'tags': rng.sample(['new', 'churned', 'vip', 'trial', 'annual'], 2),
+        }
+        for i in range(50000)
+    ]
+
+
+def _text_payload():
+    rng = random.Random(0)
+    words = [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+        for _ in range(2000)
+    ]
+    return '\n'.join(' '.join(rng.choice(words) for _ in range(12)) for _ in range(50000))
+
+
+def _floats_payload():
+    rng = random.Random(0)
+    return [rng.random() for _ in range(500000)]
+
+
+def _random_bytes_payload():
+    return os.urandom(4 * 1024 * 1024)
+
+
+PAYLOADS = [
+    ('records', _records_payload),
+    ('text', _text_payload),
+    ('floats', _floats_payload),
+    ('random bytes', _random_bytes_payload),
+]
+
+
+def _serialize(strategy, value):
+    write_file_obj = io.BytesIO()
+    strategy.serialize_value(value, write_file_obj)
+    return write_file_obj.getvalue()
+
+
+def _best_time(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _megabytes_per_second(num_bytes, seconds):
+    return num_bytes / (1024.0 * 1024.0) / seconds
+
+
+def benchmark_payload(value, codec_names, level, repeat):
+    pickle_strategy = PickleSerializationStrategy()
+    raw_size = len(_serialize(pickle_strategy, value))
+
+    strategies = [('none', pickle_strategy)] + [
+        (codec_name, CompressedSerializationStrategy(pickle_strategy, codec_name, level))
+        for codec_name in codec_names
+    ]
+
+    rows = []
+    for codec_name, strategy in strategies:
+        data = _serialize(strategy, value)
+        write_seconds = _best_time(lambda: _serialize(strategy, value), repeat)
+        read_seconds = _best_time(
+            lambda: strategy.deserialize_value(io.BytesIO(data)), repeat  # pylint: disable=W0640
+        )
+        rows.append(
+            (
+                codec_name,
+                len(data),
+                float(raw_size) / len(data),
+                _megabytes_per_second(raw_size, write_seconds),
+                _megabytes_per_second(raw_size, read_seconds),
+            )
+        )
+    return raw_size, rows
+
+
+@click.command()
+@click.option('--repeat', default=3, help='Timings are the best of this many runs.')
+@click.option('--level', type=int, default=None, help='Compression level for every codec.')
+def main(repeat, level):
+    codec_names = sorted(name for name, codec in CODECS.items() if codec.is_available)
+    unavailable = sorted(set(CODECS.keys()) - set(codec_names))
+    if unavailable:
+        click.echo('Skipping unavailable codecs: {}'.format(', '.join(unavailable)))
+
+    for payload_name, payload_fn in PAYLOADS:
+        raw_size, rows = benchmark_payload(payload_fn(), codec_names, level, repeat)
+        click.echo('\n{name} ({size} bytes pickled)'.format(name=payload_name, size=raw_size))
+        click.echo(
+            '{:<6} {:>12} {:>7} {:>12} {:>12}'.format(
+                'codec', 'bytes', 'ratio', 'write MB/s', 'read MB/s'
+            )
+        )
+        for codec_name, size, ratio, write_rate, read_rate in rows:
+            click.echo(
+                '{:<6} {:>12} {:>7.2f} {:>12.1f} {:>12.1f}'.format(
+                    codec_name, size, ratio, write_rate, read_rate
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=E1120
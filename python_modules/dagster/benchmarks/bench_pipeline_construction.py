@@ -0,0 +1,127 @@
+'''
+Reports the time and memory it takes to construct pipelines of increasing size, and to build
+their environment types on first use.
+
+Run with:
+
+    python benchmarks/bench_pipeline_construction.py [--solids 100 --solids 1000] [--repeat 3]
+
+The pipelines are chains of aliases of a solid with config and an input, so that each solid
+has its own config types in the environment of the pipeline. Memory is the peak traced by
+tracemalloc while constructing a pipeline, which slows construction down, so it is measured
+separately from time.
+'''
+
+import timeit
+import tracemalloc
+
+import click
+
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    lambda_solid,
+    solid,
+)
+
+
+@lambda_solid(output=OutputDefinition(Int))
+def start():
+    return 0
+
+
+@solid(
+    inputs=[InputDefinition('num', Int)],
+    outputs=[OutputDefinition(Int)],
+    config_field=Field(Int, is_optional=True, default_value=1),
+)
+def add(context, num):
+    return num + context.solid_config
+
+
+def _solid_name(i):
+    return 'add_{i}'.format(i=i)
+
+
+def define_chain_pipeline(num_solids):
+    dependencies = {
+        SolidInstance('add', alias=_solid_name(0)): {'num': DependencyDefinition('start')}
+    }
+    for i in range(1, num_solids - 1):
+        dependencies[SolidInstance('add', alias=_solid_name(i))] = {
+            'num': DependencyDefinition(_solid_name(i - 1))
+        }
+
+    return PipelineDefinition(name='chain_pipeline', solids=[start, add], dependencies=dependencies)
+
+
+def _timed(fn):
+    start_time = timeit.default_timer()
+    result = fn()
+    return timeit.default_timer() - start_time, result
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_pipeline_construction(num_solids, repeat):
+    '''
+    Returns the seconds and peak bytes it takes to construct a pipeline of num_solids solids,
+    and to then build its environment type. Timings are the best of repeat constructions.
+    '''
+    construct_seconds = environment_seconds = float('inf')
+    for _ in range(repeat):
+        seconds, pipeline = _timed(lambda: define_chain_pipeline(num_solids))
+        construct_seconds = min(construct_seconds, seconds)
+        seconds, _ = _timed(lambda: pipeline.environment_type)
+        environment_seconds = min(environment_seconds, seconds)
+
+    construct_bytes, pipeline = _peak_bytes(lambda: define_chain_pipeline(num_solids))
+    environment_bytes, _ = _peak_bytes(lambda: pipeline.environment_type)
+
+    return construct_seconds, environment_seconds, construct_bytes, environment_bytes
+
+
+@click.command()
+@click.option(
+    '--solids',
+    multiple=True,
+    type=int,
+    default=[100, 1000, 10000],
+    help='Number of solids in a pipeline. May be given several times.',
+)
+@click.option('--repeat', default=3, help='Timings are the best of this many runs.')
+def main(solids, repeat):
+    click.echo(
+        '{:>8} {:>14} {:>14} {:>14} {:>14}'.format(
+            'solids', 'construct ms', 'environment ms', 'construct MB', 'environment MB'
+        )
+    )
+    for num_solids in solids:
+        construct_seconds, environment_seconds, construct_bytes, environment_bytes = (
+            benchmark_pipeline_construction(num_solids, repeat)
+        )
+        click.echo(
+            '{:>8} {:>14.1f} {:>14.1f} {:>14.1f} {:>14.1f}'.format(
+                num_solids,
+                construct_seconds * 1e3,
+                environment_seconds * 1e3,
+                construct_bytes / 1e6,
+                environment_bytes / 1e6,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=E1120
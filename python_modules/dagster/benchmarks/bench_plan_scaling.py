@@ -0,0 +1,148 @@
+'''
+Reports how the time and memory it takes to build an execution plan grow with the number of
+steps, so that plans of large generated pipelines stay linear.
+
+Run with:
+
+    python benchmarks/bench_plan_scaling.py [--steps 1000 --steps 10000] [--shape chain]
+
+Pipelines are synthetic DAGs of solids with a single output and no config, so that each solid
+is one step. Chains are as deep as they are long, and layers are 100 solids wide, with every
+solid depending on two solids of the layer before it. The plan cache is cleared before every
+build, and the environment types of the pipeline are built beforehand, so only the plan is
+measured. Time per step should stay flat as the number of steps grows.
+'''
+
+import timeit
+import tracemalloc
+
+import click
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    lambda_solid,
+)
+from dagster.core.execution import create_execution_plan
+from dagster.core.execution_plan.plan_cache import PLAN_CACHE
+
+LAYER_WIDTH = 100
+
+
+@lambda_solid(output=OutputDefinition(Int))
+def start():
+    return 0
+
+
+@lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+def add_one(num):
+    return num + 1
+
+
+@lambda_solid(
+    inputs=[InputDefinition('left', Int), InputDefinition('right', Int)],
+    output=OutputDefinition(Int),
+)
+def add(left, right):
+    return left + right
+
+
+def _solid_name(i):
+    return 'solid_{i}'.format(i=i)
+
+
+def define_chain_pipeline(num_steps):
+    dependencies = {}
+    for i in range(1, num_steps):
+        previous = 'start' if i == 1 else _solid_name(i - 1)
+        dependencies[SolidInstance('add_one', alias=_solid_name(i))] = {
+            'num': DependencyDefinition(previous)
+        }
+
+    return PipelineDefinition(
+        name='chain_pipeline', solids=[start, add_one], dependencies=dependencies
+    )
+
+
+def define_layered_pipeline(num_steps):
+    dependencies = {}
+    for i in range(1, num_steps):
+        if i <= LAYER_WIDTH:
+            left = right = 'start'
+        else:
+            layer_start = (i - 1) // LAYER_WIDTH * LAYER_WIDTH - LAYER_WIDTH + 1
+            left = _solid_name(layer_start + i % LAYER_WIDTH)
+            right = _solid_name(layer_start + (i + 1) % LAYER_WIDTH)
+        dependencies[SolidInstance('add', alias=_solid_name(i))] = {
+            'left': DependencyDefinition(left),
+            'right': DependencyDefinition(right),
+        }
+
+    return PipelineDefinition(
+        name='layered_pipeline', solids=[start, add], dependencies=dependencies
+    )
+
+
+SHAPES = {'chain': define_chain_pipeline, 'layered': define_layered_pipeline}
+
+
+def _build_plan(pipeline):
+    PLAN_CACHE.clear()
+    return create_execution_plan(pipeline)
+
+
+def benchmark_plan_build(pipeline, repeat):
+    '''
+    Returns the seconds and peak bytes it takes to build the plan of the pipeline, and the
+    number of steps of the plan.
+    '''
+    # Builds the environment types of the pipeline, which are not part of the plan
+    pipeline.environment_type  # pylint: disable=W0104
+
+    seconds = min(timeit.timeit(lambda: _build_plan(pipeline), number=1) for _ in range(repeat))
+
+    tracemalloc.start()
+    try:
+        plan = _build_plan(pipeline)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return seconds, peak_bytes, len(plan.steps)
+
+
+@click.command()
+@click.option(
+    '--steps',
+    multiple=True,
+    type=int,
+    default=[1000, 5000, 10000, 50000],
+    help='Number of steps in a plan. May be given several times.',
+)
+@click.option('--shape', type=click.Choice(sorted(SHAPES)), default='layered')
+@click.option('--repeat', default=3, help='Timings are the best of this many runs.')
+def main(steps, shape, repeat):
+    click.echo(
+        '{:>8} {:>12} {:>14} {:>12} {:>14}'.format(
+            'steps', 'build ms', 'us per step', 'peak MB', 'KB per step'
+        )
+    )
+    for num_steps in steps:
+        seconds, peak_bytes, plan_steps = benchmark_plan_build(SHAPES[shape](num_steps), repeat)
+        click.echo(
+            '{:>8} {:>12.1f} {:>14.1f} {:>12.1f} {:>14.2f}'.format(
+                plan_steps,
+                seconds * 1e3,
+                seconds / plan_steps * 1e6,
+                peak_bytes / 1e6,
+                peak_bytes / plan_steps / 1e3,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=E1120
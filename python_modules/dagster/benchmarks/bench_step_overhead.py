@@ -0,0 +1,93 @@
+'''
+Reports the overhead the framework adds to each step it executes, with and without
+execution: fast_path.
+
+Run with:
+
+    python benchmarks/bench_step_overhead.py [--steps 1000] [--repeat 5]
+
+The pipeline fans out from one solid to solids that each add one to its output, so that
+nearly all of the time is spent in the framework. Only the execution of the plan is timed, and
+log messages below ERROR are filtered out.
+'''
+
+import timeit
+
+import click
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    lambda_solid,
+)
+from dagster.core.execution import create_execution_plan, execute_plan
+
+
+@lambda_solid(output=OutputDefinition(Int))
+def start():
+    return 0
+
+
+@lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+def add_one(num):
+    return num + 1
+
+
+def define_fan_out_pipeline(num_steps):
+    return PipelineDefinition(
+        name='fan_out_pipeline',
+        solids=[start, add_one],
+        dependencies={
+            SolidInstance('add_one', alias='add_one_{i}'.format(i=i)): {
+                'num': DependencyDefinition('start')
+            }
+            for i in range(num_steps - 1)
+        },
+    )
+
+
+def _plan_executor(pipeline, fast_path):
+    environment_dict = {
+        'context': {'default': {'config': {'log_level': 'ERROR'}}},
+        'execution': {'fast_path': fast_path},
+    }
+    execution_plan = create_execution_plan(pipeline, environment_dict=environment_dict)
+    return (
+        lambda: execute_plan(execution_plan, environment_dict=environment_dict),
+        len(execution_plan.steps),
+    )
+
+
+def benchmark_step_overhead(pipeline, repeat):
+    '''
+    Returns the seconds per step without and with fast_path. The two modes are timed in turn,
+    so that both are measured under the same load.
+    '''
+    executors = [_plan_executor(pipeline, fast_path) for fast_path in [False, True]]
+
+    best_seconds = [float('inf')] * len(executors)
+    for _ in range(repeat):
+        for i, (execute_fn, _num_steps) in enumerate(executors):
+            best_seconds[i] = min(best_seconds[i], timeit.timeit(execute_fn, number=1))
+
+    return [seconds / num_steps for seconds, (_, num_steps) in zip(best_seconds, executors)]
+
+
+@click.command()
+@click.option('--steps', default=1000, help='Number of steps in the pipeline.')
+@click.option('--repeat', default=5, help='Timings are the best of this many runs.')
+def main(steps, repeat):
+    checked, fast = benchmark_step_overhead(define_fan_out_pipeline(steps), repeat)
+
+    click.echo('{:<12} {:>14}'.format('mode', 'us per step'))
+    click.echo('{:<12} {:>14.1f}'.format('checked', checked * 1e6))
+    click.echo('{:<12} {:>14.1f}'.format('fast_path', fast * 1e6))
+    click.echo('speedup {:.2f}x'.format(checked / fast))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=E1120
@@ -0,0 +1,253 @@
+'''
+Measures the overhead of the framework on the synthetic pipelines of synthetic_pipelines.py,
+and writes the results as json, so that the results of two commits can be compared.
+
+Run with:
+
+    python benchmarks/bench_suite.py [--solids 1000] [--repeat 3] [--output results.json]
+    python benchmarks/bench_suite.py --compare baseline.json [--threshold 10]
+
+For every shape of pipeline, the suite times:
+
+    construct   constructing the PipelineDefinition, per solid
+    config      evaluating an environment that configures every solid, per solid
+    plan        create_execution_plan, per step
+    execute     execute_plan with no-op solids, logging at ERROR, per step
+
+and, for the log_spew shape, the throughput of the log with an event callback that records
+every event at DEBUG, in a context with no other logger, so that the console is not timed:
+
+    events      execute_pipeline, per event received by the callback
+
+Caches are cleared before every measurement, and timings are the best of repeat runs. Every
+result is in microseconds, so that lower is better for all of them. With --compare, the
+results are compared to those of a previous run by name, and the suite exits with status 1 if
+any got slower by more than threshold percent.
+'''
+
+from collections import OrderedDict, namedtuple
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+import click
+
+from dagster import ExecutionContext, ExecutionMetadata, PipelineContextDefinition, execute_pipeline
+from dagster.core.execution import create_execution_plan, execute_plan
+from dagster.core.execution_plan.plan_cache import PLAN_CACHE
+from dagster.core.types.evaluator import EVALUATION_CACHE, evaluate_config_value
+
+from synthetic_pipelines import SHAPES, define_environment_dict, define_log_spew_pipeline
+
+BenchmarkResult = namedtuple('BenchmarkResult', 'name unit value')
+
+
+def _best_seconds(fn, repeat, setup_fn=None):
+    best = float('inf')
+    for _ in range(repeat):
+        if setup_fn:
+            setup_fn()
+        best = min(best, timeit.timeit(fn, number=1))
+    return best
+
+
+def _clear_caches():
+    PLAN_CACHE.clear()
+    EVALUATION_CACHE.clear()
+
+
+def benchmark_shape(shape, num_solids, repeat):
+    '''The BenchmarkResults of the construct, config, plan and execute measurements.'''
+    define_fn = SHAPES[shape]
+    pipeline = define_fn(num_solids)
+    num_solids = len(pipeline.solids)
+    environment_dict = define_environment_dict(pipeline)
+
+    results = []
+
+    def _result(measurement, unit, seconds, count):
+        results.append(
+            BenchmarkResult(
+                '{measurement}.{shape}'.format(measurement=measurement, shape=shape),
+                unit,
+                seconds / count * 1e6,
+            )
+        )
+
+    _result(
+        'construct',
+        'us_per_solid',
+        _best_seconds(lambda: define_fn(num_solids), repeat),
+        num_solids,
+    )
+
+    environment_type = pipeline.environment_type
+    _result(
+        'config',
+        'us_per_solid',
+        _best_seconds(
+            lambda: evaluate_config_value(environment_type, environment_dict),
+            repeat,
+            setup_fn=_clear_caches,
+        ),
+        num_solids,
+    )
+
+    execution_plan = create_execution_plan(pipeline, environment_dict=environment_dict)
+    num_steps = len(execution_plan.steps)
+    _result(
+        'plan',
+        'us_per_step',
+        _best_seconds(
+            lambda: create_execution_plan(pipeline, environment_dict=environment_dict),
+            repeat,
+            setup_fn=_clear_caches,
+        ),
+        num_steps,
+    )
+
+    _result(
+        'execute',
+        'us_per_step',
+        _best_seconds(
+            lambda: execute_plan(execution_plan, environment_dict=environment_dict), repeat
+        ),
+        num_steps,
+    )
+
+    return results
+
+
+def benchmark_event_throughput(num_solids, repeat):
+    '''The BenchmarkResult of the event throughput of the log_spew shape.'''
+    pipeline = define_log_spew_pipeline(
+        num_solids,
+        context_definitions={
+            'no_loggers': PipelineContextDefinition(
+                context_fn=lambda _info: ExecutionContext(loggers=[])
+            )
+        },
+    )
+    environment_dict = dict(define_environment_dict(pipeline), context={'no_loggers': {}})
+
+    best_seconds = float('inf')
+    num_events = 0
+    for _ in range(repeat):
+        events = []
+        seconds = timeit.timeit(
+            lambda: execute_pipeline(
+                pipeline,
+                environment_dict=environment_dict,
+                execution_metadata=ExecutionMetadata(event_callback=events.append),
+            ),
+            number=1,
+        )
+        best_seconds = min(best_seconds, seconds)
+        num_events = len(events)
+
+    return BenchmarkResult('events.log_spew', 'us_per_event', best_seconds / num_events * 1e6)
+
+
+def run_suite(num_solids, repeat):
+    '''The BenchmarkResults of every measurement of every shape.'''
+    results = []
+    for shape in sorted(SHAPES):
+        results.extend(benchmark_shape(shape, num_solids, repeat))
+    results.append(benchmark_event_throughput(num_solids, repeat))
+    return results
+
+
+def _git_commit():
+    try:
+        with open(os.devnull, 'w') as devnull:
+            return (
+                subprocess.check_output(
+                    ['git', 'rev-parse', 'HEAD'],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=devnull,
+                )
+                .decode('utf-8')
+                .strip()
+            )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def results_to_json(results, num_solids, repeat):
+    return {
+        'metadata': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'solids': num_solids,
+            'repeat': repeat,
+        },
+        'results': OrderedDict(
+            (result.name, {'unit': result.unit, 'value': result.value}) for result in results
+        ),
+    }
+
+
+def compare_results(results, baseline_json, threshold):
+    '''
+    Returns the (name, baseline value, value, percent change) of every result that is also in
+    the baseline, and the names of those that got slower by more than threshold percent.
+    '''
+    baseline_results = baseline_json['results']
+    comparisons = []
+    regressions = []
+    for result in results:
+        if result.name not in baseline_results:
+            continue
+        baseline_value = baseline_results[result.name]['value']
+        change = (result.value - baseline_value) / baseline_value * 100.0
+        comparisons.append((result.name, baseline_value, result.value, change))
+        if change > threshold:
+            regressions.append(result.name)
+    return comparisons, regressions
+
+
+@click.command()
+@click.option('--solids', default=1000, help='Number of solids in each pipeline.')
+@click.option('--repeat', default=3, help='Timings are the best of this many runs.')
+@click.option('--output', type=click.Path(), help='File to write the results to, as json.')
+@click.option('--compare', type=click.Path(exists=True), help='Results to compare to.')
+@click.option('--threshold', default=10.0, help='Percent slowdown reported as a regression.')
+def main(solids, repeat, output, compare, threshold):
+    results = run_suite(solids, repeat)
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results_to_json(results, solids, repeat), f, indent=2)
+
+    if not compare:
+        click.echo('{:<20} {:>14} {:>14}'.format('benchmark', 'value', 'unit'))
+        for result in results:
+            click.echo('{:<20} {:>14.2f} {:>14}'.format(result.name, result.value, result.unit))
+        return
+
+    with open(compare) as f:
+        comparisons, regressions = compare_results(results, json.load(f), threshold)
+
+    click.echo('{:<20} {:>14} {:>14} {:>10}'.format('benchmark', 'baseline', 'value', 'change'))
+    for name, baseline_value, value, change in comparisons:
+        click.echo(
+            '{:<20} {:>14.2f} {:>14.2f} {:>+9.1f}%{}'.format(
+                name, baseline_value, value, change, ' *' if name in regressions else ''
+            )
+        )
+
+    if regressions:
+        click.echo(
+            '{count} benchmarks got slower by more than {threshold}%'.format(
+                count=len(regressions), threshold=threshold
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=E1120
@@ -0,0 +1,178 @@
+'''
+Synthetic pipelines of a given number of no-op solids, in the shapes that stress the framework
+differently: wide fan-outs, deep chains, chains of diamonds, and the shape of the log_spew
+tutorial pipeline, which logs at every level from solids with several inputs and outputs.
+
+Every solid takes optional config, so that the environment type of a pipeline grows with it,
+and define_environment_dict builds an environment that configures every solid.
+'''
+
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    MultipleResults,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    solid,
+)
+
+CONFIG_FIELD = Field(Int, is_optional=True, default_value=0)
+
+
+@solid(outputs=[OutputDefinition(Int)], config_field=CONFIG_FIELD)
+def start(context):
+    return context.solid_config
+
+
+@solid(
+    inputs=[InputDefinition('num', Int)], outputs=[OutputDefinition(Int)], config_field=CONFIG_FIELD
+)
+def add_config(context, num):
+    return num + context.solid_config
+
+
+@solid(
+    inputs=[InputDefinition('left', Int), InputDefinition('right', Int)],
+    outputs=[OutputDefinition(Int)],
+    config_field=CONFIG_FIELD,
+)
+def add(context, left, right):
+    return left + right + context.solid_config
+
+
+def _name(prefix, i):
+    return '{prefix}_{i}'.format(prefix=prefix, i=i)
+
+
+def define_fan_out_pipeline(num_solids):
+    '''One solid, and num_solids - 1 solids that each depend on it.'''
+    return PipelineDefinition(
+        name='fan_out',
+        solids=[start, add_config],
+        dependencies={
+            SolidInstance('add_config', alias=_name('add', i)): {
+                'num': DependencyDefinition('start')
+            }
+            for i in range(num_solids - 1)
+        },
+    )
+
+
+def define_chain_pipeline(num_solids):
+    '''num_solids solids that each depend on the one before them.'''
+    return PipelineDefinition(
+        name='chain',
+        solids=[start, add_config],
+        dependencies={
+            SolidInstance('add_config', alias=_name('add', i)): {
+                'num': DependencyDefinition('start' if i == 0 else _name('add', i - 1))
+            }
+            for i in range(num_solids - 1)
+        },
+    )
+
+
+def define_diamond_pipeline(num_solids):
+    '''
+    Diamonds of three solids in series, the first two depending on the join of the diamond
+    before them and the last joining them, so that every level of the plan is two wide.
+    '''
+    dependencies = {}
+    previous_join = 'start'
+    for i in range((num_solids - 1) // 3):
+        dependencies[SolidInstance('add_config', alias=_name('left', i))] = {
+            'num': DependencyDefinition(previous_join)
+        }
+        dependencies[SolidInstance('add_config', alias=_name('right', i))] = {
+            'num': DependencyDefinition(previous_join)
+        }
+        dependencies[SolidInstance('add', alias=_name('join', i))] = {
+            'left': DependencyDefinition(_name('left', i)),
+            'right': DependencyDefinition(_name('right', i)),
+        }
+        previous_join = _name('join', i)
+
+    return PipelineDefinition(
+        name='diamond', solids=[start, add_config, add], dependencies=dependencies
+    )
+
+
+def _spew_solid(name, num_inputs, num_outputs, num_messages):
+    # The solids of dagster/tutorials/log_spew, without their sleeps
+    @solid(
+        name=name,
+        inputs=[InputDefinition(name='input_{}'.format(i)) for i in range(num_inputs)],
+        outputs=[OutputDefinition(name='output_{}'.format(i)) for i in range(num_outputs)],
+        config_field=CONFIG_FIELD,
+    )
+    def _spew(context, **_kwargs):
+        for i in range(num_messages):
+            if i % 100 == 0:
+                context.log.warning(
+                    'Warning message seq={i} from solid {name}'.format(i=i, name=name)
+                )
+            elif i % 10 == 0:
+                context.log.info('Info message seq={i} from solid {name}'.format(i=i, name=name))
+            else:
+                context.log.debug('Debug message seq={i} from solid {name}'.format(i=i, name=name))
+        return MultipleResults.from_dict({'output_{}'.format(i): 'foo' for i in range(num_outputs)})
+
+    return _spew
+
+
+def define_log_spew_pipeline(num_solids, num_messages=100, context_definitions=None):
+    '''
+    Copies of the five solids of the log_spew tutorial, wired as in the tutorial, each logging
+    num_messages messages: one in a hundred at WARNING, one in ten at INFO and the rest at DEBUG.
+    '''
+    solid_defs = [
+        _spew_solid('no_in_two_out', 0, 2, num_messages),
+        _spew_solid('one_in_one_out', 1, 1, num_messages),
+        _spew_solid('one_in_two_out', 1, 2, num_messages),
+        _spew_solid('two_in_one_out', 2, 1, num_messages),
+        _spew_solid('one_in_none_out', 1, 0, num_messages),
+    ]
+
+    dependencies = {}
+    for i in range(max(num_solids // 5, 1)):
+        solid_a, solid_b, solid_c, solid_d = [_name(letter, i) for letter in 'abcd']
+        dependencies[SolidInstance('no_in_two_out', alias=solid_a)] = {}
+        dependencies[SolidInstance('one_in_one_out', alias=solid_b)] = {
+            'input_0': DependencyDefinition(solid_a, 'output_0')
+        }
+        dependencies[SolidInstance('one_in_two_out', alias=solid_c)] = {
+            'input_0': DependencyDefinition(solid_a, 'output_1')
+        }
+        dependencies[SolidInstance('two_in_one_out', alias=solid_d)] = {
+            'input_0': DependencyDefinition(solid_b, 'output_0'),
+            'input_1': DependencyDefinition(solid_c, 'output_0'),
+        }
+        dependencies[SolidInstance('one_in_none_out', alias=_name('e', i))] = {
+            'input_0': DependencyDefinition(solid_d, 'output_0')
+        }
+
+    return PipelineDefinition(
+        name='log_spew',
+        solids=solid_defs,
+        dependencies=dependencies,
+        context_definitions=context_definitions,
+    )
+
+
+SHAPES = {
+    'fan_out': define_fan_out_pipeline,
+    'chain': define_chain_pipeline,
+    'diamond': define_diamond_pipeline,
+    'log_spew': define_log_spew_pipeline,
+}
+
+
+def define_environment_dict(pipeline, log_level='ERROR'):
+    '''An environment that configures every solid of the pipeline, logging at log_level.'''
+    return {
+        'context': {'default': {'config': {'log_level': log_level}}},
+        'solids': {solid.name: {'config': 1} for solid in pipeline.solids},
+    }
@@ -6,6 +6,8 @@ from dagster.core.execution import (
     SolidExecutionResult,
     execute_pipeline,
     execute_pipeline_iterator,
+    resume_pipeline,
+    resume_pipeline_iterator,
 )
 
 from dagster.core.execution_context import ExecutionContext, ExecutionMetadata
@@ -91,6 +93,8 @@ __all__ = [
     # Execution
     'execute_pipeline_iterator',
     'execute_pipeline',
+    'resume_pipeline_iterator',
+    'resume_pipeline',
     'ExecutionContext',
     'PipelineExecutionResult',
     'SolidExecutionResult',
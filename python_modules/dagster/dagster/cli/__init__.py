@@ -1,11 +1,12 @@
 import click
 
 from ..version import __version__
+from .cache import create_cache_cli
 from .pipeline import create_pipeline_cli
 
 
 def create_dagster_cli():
-    @click.group(commands={'pipeline': create_pipeline_cli()})
+    @click.group(commands={'pipeline': create_pipeline_cli(), 'cache': create_cache_cli()})
     @click.version_option(version=__version__)
     def group():
         pass
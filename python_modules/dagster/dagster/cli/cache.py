@@ -0,0 +1,91 @@
+from __future__ import print_function
+import datetime
+
+import click
+
+from dagster import check
+from dagster.core.execution_plan.step_cache import DEFAULT_STEP_CACHE_DIRECTORY, StepCache
+
+
+def create_cache_cli():
+    group = click.Group(name='cache')
+    group.add_command(info_command)
+    group.add_command(prune_command)
+    return group
+
+
+DIRECTORY_HELP = 'Directory of the step cache. Defaults to {directory}.'.format(
+    directory=DEFAULT_STEP_CACHE_DIRECTORY
+)
+
+
+@click.command(name='info', help='List the entries of the step cache, most recently used first.')
+@click.option('-d', '--directory', type=click.STRING, help=DIRECTORY_HELP)
+def info_command(directory):
+    execute_info_command(directory, click.echo)
+
+
+def execute_info_command(directory, print_fn):
+    check.opt_str_param(directory, 'directory')
+    check.callable_param(print_fn, 'print_fn')
+
+    step_cache = StepCache(directory)
+    entries = step_cache.entries()
+
+    print_fn('Step cache {directory}'.format(directory=step_cache.directory))
+    for entry in entries:
+        print_fn(
+            '{cache_key}  {pipeline_name} {step_key}  {size}  last used {last_used}'.format(
+                cache_key=entry.cache_key[:12],
+                pipeline_name=entry.pipeline_name,
+                step_key=entry.step_key,
+                size=format_size(entry.size_bytes),
+                last_used=datetime.datetime.fromtimestamp(entry.last_used).isoformat(),
+            )
+        )
+    print_fn(
+        '{num_entries} entries, {size} in total'.format(
+            num_entries=len(entries),
+            size=format_size(sum(entry.size_bytes for entry in entries)),
+        )
+    )
+
+
+@click.command(
+    name='prune',
+    help='Evict the least recently used entries of the step cache until it fits in a size.',
+)
+@click.option('-d', '--directory', type=click.STRING, help=DIRECTORY_HELP)
+@click.option(
+    '-s',
+    '--max-size-bytes',
+    type=click.INT,
+    help='Size to prune the cache to. Defaults to the default maximum size of the cache.',
+)
+@click.option('--all', 'prune_all', is_flag=True, help='Remove every entry of the cache.')
+def prune_command(directory, max_size_bytes, prune_all):
+    execute_prune_command(directory, 0 if prune_all else max_size_bytes, click.echo)
+
+
+def execute_prune_command(directory, max_size_bytes, print_fn):
+    check.opt_str_param(directory, 'directory')
+    check.opt_int_param(max_size_bytes, 'max_size_bytes')
+    check.callable_param(print_fn, 'print_fn')
+
+    evicted = StepCache(directory).prune(max_size_bytes)
+
+    print_fn(
+        'Evicted {num_entries} entries, freeing {size}'.format(
+            num_entries=len(evicted), size=format_size(sum(entry.size_bytes for entry in evicted))
+        )
+    )
+
+
+def format_size(size_bytes):
+    check.int_param(size_bytes, 'size_bytes')
+
+    for unit in ['B', 'KB', 'MB']:
+        if size_bytes < 1024:
+            return '{size}{unit}'.format(size=size_bytes, unit=unit)
+        size_bytes //= 1024
+    return '{size}GB'.format(size=size_bytes)
@@ -8,6 +8,8 @@ import os
 import click
 
 from dagster import PipelineDefinition, RepositoryDefinition, check
+from dagster.core.execution_plan.plan_cache import PLAN_CACHE
+from dagster.core.types.evaluator import clear_evaluation_cache
 
 from dagster.utils import load_yaml_from_path
 
@@ -233,6 +235,9 @@ class DynamicObject:
     def load(self):
         if self.loaded:
             reloader.reload(self.module)
+            # The cached plans and config evaluations reference the definitions loaded before
+            PLAN_CACHE.clear()
+            clear_evaluation_cache()
         self.loaded = True
 
         fn = getattr(self.module, self.fn_name)
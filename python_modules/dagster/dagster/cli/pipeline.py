@@ -9,7 +9,7 @@ import click
 from dagster import PipelineDefinition, check
 
 from dagster.core.definitions import Solid
-from dagster.core.execution import execute_pipeline_iterator
+from dagster.core.execution import execute_pipeline_iterator, resume_pipeline_iterator
 from dagster.core.execution_plan.create import solids_in_topological_order
 from dagster.graphviz import build_graphviz_graph
 from dagster.utils import load_yaml_from_glob_list
@@ -33,6 +33,7 @@ def create_pipeline_cli():
     group.add_command(print_command)
     group.add_command(graphviz_command)
     group.add_command(execute_command)
+    group.add_command(resume_command)
     group.add_command(scaffold_command)
     return group
 
@@ -315,6 +316,50 @@ def do_execute_command(pipeline, env_file_list, printer):
     process_results_for_console(pipeline_iter)
 
 
+@click.command(
+    name='resume',
+    help=(
+        'Resume a failed run of a pipeline executed with execution: resumable configured. '
+        'Only the solids that failed or did not get to run are executed, along with the '
+        'solids downstream of them.\n\n{instructions}'
+    ).format(instructions=get_pipeline_instructions('resume')),
+)
+@pipeline_target_command
+@click.option('--run-id', type=click.STRING, required=True, help='The id of the run to resume.')
+@click.option(
+    '-e',
+    '--env',
+    type=click.STRING,
+    multiple=True,
+    help=(
+        'Specify one or more environment files, as for dagster pipeline execute. The '
+        'environment must be the same as that of the run.'
+    ),
+)
+def resume_command(run_id, env, **kwargs):
+    check.invariant(isinstance(env, tuple))
+    env = list(env)
+    execute_resume_command(run_id, env, kwargs, click.echo)
+
+
+def execute_resume_command(run_id, env, cli_args, print_fn):
+    pipeline = create_pipeline_from_cli_args(cli_args)
+    do_resume_command(pipeline, run_id, env, print_fn)
+
+
+def do_resume_command(pipeline, run_id, env_file_list, printer):
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+    check.str_param(run_id, 'run_id')
+    env_file_list = check.opt_list_param(env_file_list, 'env_file_list', of_type=str)
+    check.callable_param(printer, 'printer')
+
+    env_config = load_yaml_from_glob_list(env_file_list) if env_file_list else {}
+
+    pipeline_iter = resume_pipeline_iterator(pipeline, run_id, env_config)
+
+    process_results_for_console(pipeline_iter)
+
+
 @click.command(
     name='scaffold_config',
     help='Scaffold the config for a pipeline.\n\n{instructions}'.format(
@@ -0,0 +1,67 @@
+'''
+Transform wrappers for solids whose bodies are defined with async def. These always produce
+an async generator transform_fn, which is executed by the asyncio engine.
+
+This module is only imported on python 3.6 and later.
+'''
+
+from functools import wraps
+
+from dagster import check
+from dagster.core.errors import DagsterInvalidDefinitionError
+from dagster.utils import is_async_generator_function
+
+from . import InputDefinition, OutputDefinition, Result
+from .decorators import results_for_return_value
+
+
+def create_async_lambda_solid_transform_wrapper(fn, input_defs, output_def):
+    check.callable_param(fn, 'fn')
+    check.list_param(input_defs, 'input_defs', of_type=InputDefinition)
+    check.inst_param(output_def, 'output_def', OutputDefinition)
+
+    if is_async_generator_function(fn):
+        raise DagsterInvalidDefinitionError(
+            (
+                'lambda_solid {name} is an async generator. A lambda_solid must return its '
+                'single output, use the solid decorator to yield results.'
+            ).format(name=fn.__name__)
+        )
+
+    input_names = [input_def.name for input_def in input_defs]
+
+    @wraps(fn)
+    async def transform(_context, inputs):
+        kwargs = {}
+        for input_name in input_names:
+            kwargs[input_name] = inputs[input_name]
+
+        result = await fn(**kwargs)
+        yield Result(value=result, output_name=output_def.name)
+
+    return transform
+
+
+def create_async_solid_transform_wrapper(fn, input_defs, output_defs):
+    check.callable_param(fn, 'fn')
+    check.list_param(input_defs, 'input_defs', of_type=InputDefinition)
+    check.list_param(output_defs, 'output_defs', of_type=OutputDefinition)
+
+    input_names = [input_def.name for input_def in input_defs]
+    fn_is_async_generator = is_async_generator_function(fn)
+
+    @wraps(fn)
+    async def transform(context, inputs):
+        kwargs = {}
+        for input_name in input_names:
+            kwargs[input_name] = inputs[input_name]
+
+        if fn_is_async_generator:
+            async for item in fn(context, **kwargs):
+                yield item
+        else:
+            result = await fn(context, **kwargs)
+            for item in results_for_return_value(result, output_defs):
+                yield item
+
+    return transform
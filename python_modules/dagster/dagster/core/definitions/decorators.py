@@ -7,6 +7,7 @@ from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 
 from dagster.core.types.field_utils import check_opt_field_param
+from dagster.utils import is_async_function
 
 from . import InputDefinition, OutputDefinition, Result, SolidDefinition
 
@@ -140,7 +141,8 @@ def lambda_solid(name=None, inputs=None, output=None, description=None):
     configuration and whose implementations do not require a context.
 
     Lambda solids take inputs and produce a single output. The body of the function
-    should return a single value.
+    should return a single value. It may be a coroutine function defined with ``async def``,
+    in which case the solid must be executed with the asyncio engine.
 
     Args:
         name (str): Name of solid.
@@ -188,6 +190,10 @@ def solid(name=None, inputs=None, outputs=None, config_field=None, description=N
        multiple outputs. Useful for solids that have multiple outputs.
     4. Yield :py:class:`Result`. Same as default transform behaviour.
 
+    The transform function may also be defined with ``async def``, either returning as above or
+    yielding :py:class:`Result` as an async generator. Such solids must be executed with the
+    asyncio engine, and require python 3.6 or later.
+
     Args:
         name (str): Name of solid.
         inputs (list[InputDefinition]): List of inputs.
@@ -277,6 +283,12 @@ def _create_lambda_solid_transform_wrapper(fn, input_defs, output_def):
     check.list_param(input_defs, 'input_defs', of_type=InputDefinition)
     check.inst_param(output_def, 'output_def', OutputDefinition)
 
+    if is_async_function(fn):
+        # Imported lazily as async solid bodies need syntax that python 2 cannot parse
+        from .async_decorators import create_async_lambda_solid_transform_wrapper
+
+        return create_async_lambda_solid_transform_wrapper(fn, input_defs, output_def)
+
     input_names = [input_def.name for input_def in input_defs]
 
     @wraps(fn)
@@ -296,6 +308,11 @@ def _create_solid_transform_wrapper(fn, input_defs, output_defs):
     check.list_param(input_defs, 'input_defs', of_type=InputDefinition)
     check.list_param(output_defs, 'output_defs', of_type=OutputDefinition)
 
+    if is_async_function(fn):
+        from .async_decorators import create_async_solid_transform_wrapper
+
+        return create_async_solid_transform_wrapper(fn, input_defs, output_defs)
+
     input_names = [input_def.name for input_def in input_defs]
 
     @wraps(fn)
@@ -310,46 +327,56 @@ def _create_solid_transform_wrapper(fn, input_defs, output_defs):
             for item in result:
                 yield item
         else:
-            if isinstance(result, Result):
-                yield result
-            elif isinstance(result, MultipleResults):
-                for item in result.results:
-                    yield item
-            elif len(output_defs) == 1:
-                yield Result(value=result, output_name=output_defs[0].name)
-            elif result is not None:
-                if not output_defs:
-                    raise DagsterInvariantViolationError(
-                        (
-                            'Solid unexpectedly returned output {result} of type {type_}. Solid is '
-                            'explicitly defined to return no results.'
-                        ).format(result=result, type_=type(result))
-                    )
-                else:
-                    raise DagsterInvariantViolationError(
-                        (
-                            'Solid unexpectedly returned output {result} of type {type_}. Should '
-                            'be a MultipleResults object, or a generator, containing or yielding '
-                            '{n_results} results: {{{expected_results}}}.'
-                        ).format(
-                            result=result,
-                            type_=type(result),
-                            n_results=len(output_defs),
-                            expected_results=', '.join(
-                                [
-                                    '\'{result_name}\': {runtime_type}'.format(
-                                        result_name=output_def.name,
-                                        runtime_type=output_def.runtime_type,
-                                    )
-                                    for output_def in output_defs
-                                ]
-                            ),
-                        )
-                    )
+            for item in results_for_return_value(result, output_defs):
+                yield item
 
     return transform
 
 
+def results_for_return_value(result, output_defs):
+    '''
+    Yields the Results for the value returned, rather than yielded, by the transform function of
+    a solid defined with the @solid decorator.
+    '''
+    check.list_param(output_defs, 'output_defs', of_type=OutputDefinition)
+
+    if isinstance(result, Result):
+        yield result
+    elif isinstance(result, MultipleResults):
+        for item in result.results:
+            yield item
+    elif len(output_defs) == 1:
+        yield Result(value=result, output_name=output_defs[0].name)
+    elif result is not None:
+        if not output_defs:
+            raise DagsterInvariantViolationError(
+                (
+                    'Solid unexpectedly returned output {result} of type {type_}. Solid is '
+                    'explicitly defined to return no results.'
+                ).format(result=result, type_=type(result))
+            )
+        else:
+            raise DagsterInvariantViolationError(
+                (
+                    'Solid unexpectedly returned output {result} of type {type_}. Should '
+                    'be a MultipleResults object, or a generator, containing or yielding '
+                    '{n_results} results: {{{expected_results}}}.'
+                ).format(
+                    result=result,
+                    type_=type(result),
+                    n_results=len(output_defs),
+                    expected_results=', '.join(
+                        [
+                            '\'{result_name}\': {runtime_type}'.format(
+                                result_name=output_def.name, runtime_type=output_def.runtime_type
+                            )
+                            for output_def in output_defs
+                        ]
+                    ),
+                )
+            )
+
+
 class FunctionValidationError(Exception):
     TYPES = {'vararg': 1, 'missing_name': 2, 'missing_positional': 3, 'extra': 4}
 
@@ -4,6 +4,8 @@ from dagster import check
 from dagster.utils import camelcase, single_item
 
 from dagster.core.system_config.objects import (
+    DEFAULT_STREAM_BUFFER_SIZE,
+    DEFAULT_TOP_ALLOCATIONS,
     ContextConfig,
     EnvironmentConfig,
     ExecutionConfig,
@@ -11,7 +13,17 @@ from dagster.core.system_config.objects import (
     SolidConfig,
 )
 
-from dagster.core.types import Bool, Field, List, NamedDict, NamedSelector, Dict
+from dagster.core.types import (
+    Bool,
+    Field,
+    Int,
+    List,
+    NamedDict,
+    NamedSelector,
+    Dict,
+    Path,
+    String,
+)
 from dagster.core.types.config import ConfigType, ConfigTypeAttributes
 from dagster.core.types.default_applier import apply_default_values
 from dagster.core.types.field_utils import check_opt_field_param, FieldImpl
@@ -311,9 +323,228 @@ def define_solid_dictionary_cls(name, creation_data):
     return SystemNamedDict(name, fields)
 
 
+def define_engine_config_cls(name):
+    check.str_param(name, 'name')
+    return SystemNamedSelector(
+        name,
+        {
+            'in_process': Field(Dict({})),
+            'multithread': Field(
+                Dict(
+                    {
+                        'max_workers': Field(
+                            Int,
+                            is_optional=True,
+                            description='Maximum number of steps to execute concurrently.',
+                        )
+                    }
+                )
+            ),
+            'multiprocess': Field(
+                Dict(
+                    {
+                        'max_workers': Field(
+                            Int,
+                            is_optional=True,
+                            description='Maximum number of worker processes.',
+                        )
+                    }
+                )
+            ),
+            'asyncio': Field(
+                Dict(
+                    {
+                        'max_concurrent_steps': Field(
+                            Int,
+                            is_optional=True,
+                            description='Maximum number of steps in flight at once. Unlimited '
+                            'by default.',
+                        )
+                    }
+                )
+            ),
+        },
+    )
+
+
 def define_execution_config_cls(name):
     check.str_param(name, 'name')
-    return NamedDict(name, {}, type_attributes=ConfigTypeAttributes(is_system_config=True))
+    return SystemNamedDict(
+        name,
+        fields={
+            'engine': Field(
+                define_engine_config_cls('{name}.Engine'.format(name=name)),
+                is_optional=True,
+                default_value={'in_process': {}},
+            ),
+            'intermediate_store': Field(
+                define_intermediate_store_config_cls('{name}.IntermediateStore'.format(name=name)),
+                is_optional=True,
+                default_value={'in_memory': {}},
+            ),
+            'cache': Field(
+                define_step_cache_config_cls('{name}.Cache'.format(name=name)),
+                is_optional=True,
+                description='Enables the cache of transform step outputs that persists across '
+                'runs.',
+            ),
+            'resumable': Field(
+                define_run_storage_config_cls('{name}.Resumable'.format(name=name)),
+                is_optional=True,
+                description='Persists every transform output under the run id, so that the run '
+                'can be resumed with resume_pipeline if it fails.',
+            ),
+            'stream_buffer_size': Field(
+                Int,
+                is_optional=True,
+                default_value=DEFAULT_STREAM_BUFFER_SIZE,
+                description='Maximum number of chunks of a streaming output produced ahead of '
+                'the solid consuming them. With 0 chunks are produced as they are consumed.',
+            ),
+            'compression': Field(
+                define_compression_config_cls('{name}.Compression'.format(name=name)),
+                is_optional=True,
+                description='Compresses every output written to disk: by the filesystem and '
+                'mmap intermediate stores, the step cache, resumable runs and the multiprocess '
+                'engine.',
+            ),
+            'fast_path': Field(
+                Bool,
+                is_optional=True,
+                default_value=False,
+                description='Executes steps without validating the arguments of the framework '
+                'calls made for every step and output, as the plan was validated when it was '
+                'built. Errors in solids are reported as they are otherwise.',
+            ),
+            'profile': Field(
+                define_profile_config_cls('{name}.Profile'.format(name=name)),
+                is_optional=True,
+                description='Profiles the selected steps with cProfile and tracemalloc, and '
+                'writes their profiles to a directory named after the run id.',
+            ),
+        },
+    )
+
+
+def define_compression_config_cls(name):
+    check.str_param(name, 'name')
+
+    def _level_config_cls():
+        return Dict(
+            {
+                'level': Field(
+                    Int, is_optional=True, description='Defaults to the default of the codec.'
+                )
+            }
+        )
+
+    return SystemNamedSelector(
+        name,
+        {
+            'zlib': Field(_level_config_cls()),
+            'gzip': Field(_level_config_cls()),
+            'bz2': Field(_level_config_cls()),
+            'lzma': Field(_level_config_cls(), description='Requires Python 3.'),
+            'zstd': Field(_level_config_cls(), description='Requires the zstandard package.'),
+        },
+    )
+
+
+def define_intermediate_store_config_cls(name):
+    check.str_param(name, 'name')
+
+    def _directory_config_cls():
+        return Dict(
+            {
+                'directory': Field(
+                    Path,
+                    is_optional=True,
+                    description='Defaults to a directory named after the run id in the '
+                    'dagster-intermediates directory of the system temporary directory.',
+                ),
+                'keep': Field(
+                    Bool,
+                    is_optional=True,
+                    default_value=False,
+                    description='Whether to keep the default directory once the run has ended, '
+                    'rather than removing it. Directories configured explicitly are always kept.',
+                ),
+            }
+        )
+
+    return SystemNamedSelector(
+        name,
+        {
+            'in_memory': Field(Dict({})),
+            'filesystem': Field(_directory_config_cls()),
+            'mmap': Field(_directory_config_cls()),
+        },
+    )
+
+
+def define_step_cache_config_cls(name):
+    check.str_param(name, 'name')
+    return SystemNamedDict(
+        name,
+        {
+            'directory': Field(
+                Path, is_optional=True, description='Defaults to ~/.dagster/step_cache.'
+            ),
+            'max_size_bytes': Field(
+                Int,
+                is_optional=True,
+                description='Least recently used entries are evicted beyond this size. '
+                'Defaults to 1GB.',
+            ),
+        },
+    )
+
+
+def define_profile_config_cls(name):
+    check.str_param(name, 'name')
+    return SystemNamedDict(
+        name,
+        {
+            'steps': Field(
+                List(String),
+                description='Keys of the steps to profile, or names of the solids to profile '
+                'every step of.',
+            ),
+            'cprofile': Field(
+                Bool,
+                is_optional=True,
+                default_value=True,
+                description='Writes the cProfile stats of every step to {step_key}.pstats.',
+            ),
+            'tracemalloc': Field(
+                Bool,
+                is_optional=True,
+                default_value=False,
+                description='Writes the source lines that allocated the most memory while every '
+                'step executed to {step_key}.allocations.txt. Requires Python 3.',
+            ),
+            'top_allocations': Field(
+                Int,
+                is_optional=True,
+                default_value=DEFAULT_TOP_ALLOCATIONS,
+                description='Number of source lines listed in {step_key}.allocations.txt.',
+            ),
+            'directory': Field(
+                Path,
+                is_optional=True,
+                description='Defaults to the dagster-profiles directory of the system temporary '
+                'directory.',
+            ),
+        },
+    )
+
+
+def define_run_storage_config_cls(name):
+    check.str_param(name, 'name')
+    return SystemNamedDict(
+        name,
+        {'directory': Field(Path, is_optional=True, description='Defaults to ~/.dagster/runs.')},
+    )
 
 
 def construct_environment_config(config_value):
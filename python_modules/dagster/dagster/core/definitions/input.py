@@ -16,9 +16,14 @@ class InputDefinition(object):
         expectations (List[ExpectationDefinition]):
             List of expectations that applies to the value passed to the solid.
         description (str): Description of the input. Optional.
+        is_streaming (bool): If True the transform receives an iterator over the chunks of the
+            streaming output the input depends on, each of type runtime_type. Expectations are
+            evaluated on every chunk.
     '''
 
-    def __init__(self, name, dagster_type=None, expectations=None, description=None):
+    def __init__(
+        self, name, dagster_type=None, expectations=None, description=None, is_streaming=False
+    ):
         ''
         self.name = check_valid_name(name)
 
@@ -28,6 +33,7 @@ class InputDefinition(object):
             expectations, 'expectations', of_type=ExpectationDefinition
         )
         self.description = check.opt_str_param(description, 'description')
+        self.is_streaming = check.bool_param(is_streaming, 'is_streaming')
 
     @property
     def descriptive_key(self):
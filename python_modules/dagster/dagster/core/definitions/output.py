@@ -16,9 +16,14 @@ class OutputDefinition(object):
         name (str): Name of the output. Defaults to "result".
         expectations List[ExpectationDefinition]: Expectations for this output.
         description (str): Description of the output. Optional.
+        is_streaming (bool): If True the value of the output is an iterable of chunks of type
+            runtime_type, which are passed to the streaming input that consumes the output as
+            they are produced. Expectations are evaluated on every chunk.
     '''
 
-    def __init__(self, dagster_type=None, name=None, expectations=None, description=None):
+    def __init__(
+        self, dagster_type=None, name=None, expectations=None, description=None, is_streaming=False
+    ):
         self.name = check_valid_name(check.opt_str_param(name, 'name', DEFAULT_OUTPUT))
 
         self.runtime_type = check.inst(resolve_to_runtime_type(dagster_type), RuntimeType)
@@ -27,6 +32,7 @@ class OutputDefinition(object):
             expectations, 'expectations', of_type=ExpectationDefinition
         )
         self.description = check.opt_str_param(description, 'description')
+        self.is_streaming = check.bool_param(is_streaming, 'is_streaming')
 
     @property
     def descriptive_key(self):
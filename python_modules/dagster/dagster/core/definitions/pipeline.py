@@ -1,8 +1,7 @@
 import six
 
-from toposort import toposort_flatten
-
 from dagster import check
+from dagster.utils.toposort import toposort_flatten
 
 from .environment_configs import (
     EnvironmentClassCreationData,
@@ -18,6 +17,7 @@ from .pipeline_creation import (
     create_execution_structure,
     construct_config_type_dictionary,
     construct_runtime_type_dictionary,
+    validate_config_type_names,
 )
 
 
@@ -100,27 +100,68 @@ class PipelineDefinition(object):
         self._solid_dict = pipeline_solid_dict
         self.dependency_structure = dependency_structure
 
-        self.environment_cls = define_environment_cls(
-            EnvironmentClassCreationData(
-                self.name,
-                list(self._solid_dict.values()),
-                context_definitions,
-                dependency_structure,
+        # The names of the solids in topological order, see solids_in_topological_order
+        self._topological_solid_names = None
+
+        self._solid_def_dict = {}
+        for solid in self._solid_dict.values():
+            self._solid_def_dict.setdefault(solid.definition.name, solid.definition)
+
+        # The environment and config types of a pipeline create classes for each of its solids,
+        # so they are only built once they are first used. The config types that users define
+        # are checked for conflicts now, so that those are still reported on definition.
+        validate_config_type_names(solids, self.context_definitions)
+        self._environment_cls = None
+        self._context_cls = None
+        self._config_type_dicts = None
+        self._runtime_type_dict = None
+
+    @property
+    def environment_cls(self):
+        if self._environment_cls is None:
+            self._environment_cls = define_environment_cls(
+                EnvironmentClassCreationData(
+                    self.name,
+                    list(self._solid_dict.values()),
+                    self.context_definitions,
+                    self.dependency_structure,
+                )
             )
-        )
-        self.environment_type = self.environment_cls.inst()
+        return self._environment_cls
 
-        self.context_cls = define_context_cls(self)
-        self.context_type = self.context_cls.inst()
+    @property
+    def environment_type(self):
+        return self.environment_cls.inst()
 
-        (
-            self._config_type_dict_by_name,
-            self._config_type_dict_by_key,
-        ) = construct_config_type_dictionary(
-            solids, self.context_definitions, self.environment_type
-        )
+    @property
+    def context_cls(self):
+        if self._context_cls is None:
+            self._context_cls = define_context_cls(self)
+        return self._context_cls
+
+    @property
+    def context_type(self):
+        return self.context_cls.inst()
 
-        self._runtime_type_dict = construct_runtime_type_dictionary(solids)
+    @property
+    def _config_type_dict_by_name(self):
+        return self._get_config_type_dicts()[0]
+
+    @property
+    def _config_type_dict_by_key(self):
+        return self._get_config_type_dicts()[1]
+
+    def _get_config_type_dicts(self):
+        if self._config_type_dicts is None:
+            self._config_type_dicts = construct_config_type_dictionary(
+                self.solid_defs, self.context_definitions, self.environment_type
+            )
+        return self._config_type_dicts
+
+    def _get_runtime_type_dict(self):
+        if self._runtime_type_dict is None:
+            self._runtime_type_dict = construct_runtime_type_dictionary(self.solid_defs)
+        return self._runtime_type_dict
 
     @property
     def display_name(self):
@@ -179,11 +220,11 @@ class PipelineDefinition(object):
 
     def has_runtime_type(self, name):
         check.str_param(name, 'name')
-        return name in self._runtime_type_dict
+        return name in self._get_runtime_type_dict()
 
     def runtime_type_named(self, name):
         check.str_param(name, 'name')
-        return self._runtime_type_dict[name]
+        return self._get_runtime_type_dict()[name]
 
     def all_config_types(self):
         return self._config_type_dict_by_key.values()
@@ -193,7 +234,7 @@ class PipelineDefinition(object):
         return name in self.context_definitions
 
     def all_runtime_types(self):
-        return self._runtime_type_dict.values()
+        return self._get_runtime_type_dict().values()
 
     @property
     def solid_defs(self):
@@ -202,46 +243,29 @@ class PipelineDefinition(object):
     def solid_def_named(self, name):
         check.str_param(name, 'name')
 
-        for solid in self.solids:
-            if solid.definition.name == name:
-                return solid.definition
+        if name not in self._solid_def_dict:
+            check.failed('{} not found'.format(name))
 
-        check.failed('{} not found'.format(name))
+        return self._solid_def_dict[name]
 
     def has_solid_def(self, name):
         check.str_param(name, 'name')
-
-        for solid in self.solids:
-            if solid.definition.name == name:
-                return True
-
-        return False
+        return name in self._solid_def_dict
 
 
 def _create_adjacency_lists(solids, dep_structure):
     check.list_param(solids, 'solids', Solid)
     check.inst_param(dep_structure, 'dep_structure', DependencyStructure)
 
-    visit_dict = {s.name: False for s in solids}
     forward_edges = {s.name: set() for s in solids}
     backward_edges = {s.name: set() for s in solids}
 
-    def visit(solid_name):
-        if visit_dict[solid_name]:
-            return
-
-        visit_dict[solid_name] = True
-
-        for output_handle in dep_structure.deps_of_solid(solid_name):
+    for s in solids:
+        for output_handle in dep_structure.deps_of_solid(s.name):
             forward_node = output_handle.solid.name
-            backward_node = solid_name
             if forward_node in forward_edges:
-                forward_edges[forward_node].add(backward_node)
-                backward_edges[backward_node].add(forward_node)
-                visit(forward_node)
-
-    for s in solids:
-        visit(s.name)
+                forward_edges[forward_node].add(s.name)
+                backward_edges[s.name].add(forward_node)
 
     return (forward_edges, backward_edges)
 
@@ -249,9 +273,11 @@ def _create_adjacency_lists(solids, dep_structure):
 def solids_in_topological_order(pipeline):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
 
-    _forward_edges, backward_edges = _create_adjacency_lists(
-        pipeline.solids, pipeline.dependency_structure
-    )
+    # pylint: disable=W0212
+    if pipeline._topological_solid_names is None:
+        _forward_edges, backward_edges = _create_adjacency_lists(
+            pipeline.solids, pipeline.dependency_structure
+        )
+        pipeline._topological_solid_names = toposort_flatten(backward_edges)
 
-    order = toposort_flatten(backward_edges, sort=True)
-    return [pipeline.solid_named(solid_name) for solid_name in order]
+    return [pipeline.solid_named(solid_name) for solid_name in pipeline._topological_solid_names]
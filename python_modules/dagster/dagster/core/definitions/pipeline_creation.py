@@ -132,6 +132,41 @@ def _validate_dependencies(dependencies, solid_dict, alias_lookup):
                     'Solid {dep.solid} does not have output {dep.output}'.format(dep=dep)
                 )
 
+    _validate_streaming_dependencies(dependencies, solid_dict)
+
+
+def _validate_streaming_dependencies(dependencies, solid_dict):
+    streaming_consumers = {}
+    for from_solid, dep_by_input in dependencies.items():
+        for from_input, dep in dep_by_input.items():
+            output_def = solid_dict[dep.solid].definition.output_def_named(dep.output)
+            if not output_def.is_streaming:
+                continue
+
+            if not solid_dict[from_solid].definition.input_def_named(from_input).is_streaming:
+                raise DagsterInvalidDefinitionError(
+                    (
+                        'Solid {dep.solid} output {dep.output} is streaming, so it must be '
+                        'consumed by a streaming input, but input {from_input} of solid '
+                        '{from_solid} is not streaming.'
+                    ).format(dep=dep, from_input=from_input, from_solid=from_solid)
+                )
+
+            if (dep.solid, dep.output) in streaming_consumers:
+                raise DagsterInvalidDefinitionError(
+                    (
+                        'Solid {dep.solid} output {dep.output} is streaming, so it can only be '
+                        'consumed once, but both {first} and {second} depend on it.'
+                    ).format(
+                        dep=dep,
+                        first=streaming_consumers[(dep.solid, dep.output)],
+                        second='{solid}.{input}'.format(solid=from_solid, input=from_input),
+                    )
+                )
+            streaming_consumers[(dep.solid, dep.output)] = '{solid}.{input}'.format(
+                solid=from_solid, input=from_input
+            )
+
 
 def iterate_solid_def_types(solid_def):
     if solid_def.config_field:
@@ -148,7 +183,7 @@ def _gather_all_config_types(solid_defs, context_definitions, environment_type):
         value_type=PipelineContextDefinition,
     )
 
-    check.inst_param(environment_type, 'environment_type', config.ConfigType)
+    check.opt_inst_param(environment_type, 'environment_type', config.ConfigType)
 
     for solid_def in solid_defs:
         for runtime_type in iterate_solid_def_types(solid_def):
@@ -160,8 +195,9 @@ def _gather_all_config_types(solid_defs, context_definitions, environment_type):
             for runtime_type in iterate_config_types(context_config_type):
                 yield runtime_type
 
-    for runtime_type in iterate_config_types(environment_type):
-        yield runtime_type
+    if environment_type is not None:
+        for runtime_type in iterate_config_types(environment_type):
+            yield runtime_type
 
 
 def construct_runtime_type_dictionary(solid_defs):
@@ -201,11 +237,35 @@ def construct_config_type_dictionary(solid_defs, context_definitions, environmen
     )
     check.inst_param(environment_type, 'environment_type', config.ConfigType)
 
+    return _construct_config_type_dictionary(
+        list(_gather_all_config_types(solid_defs, context_definitions, environment_type))
+        + list(_gather_all_schemas(solid_defs))
+    )
+
+
+def validate_config_type_names(solid_defs, context_definitions):
+    '''
+    Checks that the config types of the solids, contexts and runtime type schemas have unique
+    names, without building the environment type of the pipeline, the types of which are
+    generated from the names of its solids and contexts.
+    '''
+    check.list_param(solid_defs, 'solid_defs', SolidDefinition)
+    check.dict_param(
+        context_definitions,
+        'context_definitions',
+        key_type=str,
+        value_type=PipelineContextDefinition,
+    )
+
+    _construct_config_type_dictionary(
+        list(_gather_all_config_types(solid_defs, context_definitions, environment_type=None))
+        + list(_gather_all_schemas(solid_defs))
+    )
+
+
+def _construct_config_type_dictionary(all_types):
     type_dict_by_name = {t.name: t for t in ALL_CONFIG_BUILTINS}
     type_dict_by_key = {t.key: t for t in ALL_CONFIG_BUILTINS}
-    all_types = list(
-        _gather_all_config_types(solid_defs, context_definitions, environment_type)
-    ) + list(_gather_all_schemas(solid_defs))
     for config_type in all_types:
         name = config_type.name
         if name and name in type_dict_by_name:
@@ -1,8 +1,19 @@
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+import multiprocessing
+
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from .pipeline import PipelineDefinition
 
 
+class SolidDefIndexEntry(namedtuple('_SolidDefIndexEntry', 'solid_def pipeline_names')):
+    def __new__(cls, solid_def, pipeline_names):
+        return super(SolidDefIndexEntry, cls).__new__(
+            cls, solid_def, check.list_param(pipeline_names, 'pipeline_names', of_type=str)
+        )
+
+
 class RepositoryDefinition(object):
     '''Define a repository that contains a collection of pipelines.
 
@@ -37,6 +48,10 @@ class RepositoryDefinition(object):
 
         self._pipeline_cache = {}
 
+        # Maps the names of solid defs to SolidDefIndexEntry. Built once all pipelines have been
+        # constructed. A reloaded repository is a new definition, so it starts without one.
+        self._solid_def_index = None
+
         self.enforce_uniqueness = enforce_uniqueness
 
     def has_pipeline(self, name):
@@ -51,7 +66,7 @@ class RepositoryDefinition(object):
 
         Returns:
             PipelineDefinition: Instance of PipelineDefinition with that name.
-'''
+        '''
         check.str_param(name, 'name')
 
         if name in self._pipeline_cache:
@@ -106,26 +121,69 @@ class RepositoryDefinition(object):
         '''
         pipelines = list(self.iterate_over_pipelines())
 
-        self._construct_solid_defs(pipelines)
+        self._get_solid_def_index(pipelines)
 
         return pipelines
 
-    def _construct_solid_defs(self, pipelines):
-        solid_defs = {}
-        solid_to_pipeline = {}
+    def warm_up(self, max_workers=None):
+        '''Construct all pipelines in parallel, along with their config types, which are
+        otherwise built on first use, and index their solid definitions. Pipelines are
+        constructed on a pool of threads, so this is fastest for pipelines that do I/O to
+        define themselves.
+
+        Args:
+            max_workers (Optional[int]): Number of threads. Defaults to the number of cpus.
+        '''
+        check.opt_int_param(max_workers, 'max_workers')
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count()
+        check.param_invariant(max_workers > 0, 'max_workers', 'Must have at least one worker')
+
+        names = list(self.pipeline_dict.keys())
+        if not names:
+            return
+
+        pool = ThreadPool(min(max_workers, len(names)))
+        try:
+            pipelines = pool.map(self._warm_up_pipeline, names)
+        finally:
+            pool.close()
+            pool.join()
+
+        self._get_solid_def_index(pipelines)
+
+    def _warm_up_pipeline(self, name):
+        pipeline = self.get_pipeline(name)
+        pipeline.all_config_types()
+        pipeline.context_type  # pylint: disable=W0104
+        return pipeline
+
+    def _get_solid_def_index(self, pipelines=None):
+        if self._solid_def_index is None:
+            if pipelines is None:
+                pipelines = list(self.iterate_over_pipelines())
+            self._solid_def_index = self._construct_solid_def_index(pipelines)
+        return self._solid_def_index
+
+    def _construct_solid_def_index(self, pipelines):
+        solid_def_index = {}
         for pipeline in pipelines:
             for solid_def in pipeline.solid_defs:
-                if solid_def.name not in solid_defs:
-                    solid_defs[solid_def.name] = solid_def
-                    solid_to_pipeline[solid_def.name] = pipeline.name
-                elif self.enforce_uniqueness:
-                    if not solid_defs[solid_def.name] is solid_def:
-                        raise DagsterInvalidDefinitionError(
-                            'Trying to add duplicate solid def {} in {}, Already saw in {}'.format(
-                                solid_def.name, pipeline.name, solid_to_pipeline[solid_def.name]
-                            )
+                entry = solid_def_index.get(solid_def.name)
+                if entry is None:
+                    solid_def_index[solid_def.name] = SolidDefIndexEntry(solid_def, [pipeline.name])
+                    continue
+
+                if self.enforce_uniqueness and entry.solid_def is not solid_def:
+                    raise DagsterInvalidDefinitionError(
+                        'Trying to add duplicate solid def {} in {}, Already saw in {}'.format(
+                            solid_def.name, pipeline.name, entry.pipeline_names[0]
                         )
-        return solid_defs
+                    )
+                if pipeline.name not in entry.pipeline_names:
+                    entry.pipeline_names.append(pipeline.name)
+
+        return solid_def_index
 
     def get_solid_def(self, name):
         check.str_param(name, 'name')
@@ -138,18 +196,35 @@ class RepositoryDefinition(object):
                 )
             )
 
-        solid_defs = self._construct_solid_defs(self.get_all_pipelines())
+        solid_def_index = self._get_solid_def_index()
 
-        if name not in solid_defs:
+        if name not in solid_def_index:
             check.failed('could not find solid_def {}'.format(name))
 
-        return solid_defs[name]
+        return solid_def_index[name].solid_def
 
     def solid_def_named(self, name):
         check.str_param(name, 'name')
-        for pipeline in self.get_all_pipelines():
-            for solid in pipeline.solids:
-                if solid.definition.name == name:
-                    return solid.definition
 
-        check.failed('Did not find ' + name)
+        entry = self._get_solid_def_index().get(name)
+        if entry is None:
+            check.failed('Did not find ' + name)
+
+        return entry.solid_def
+
+    def get_pipeline_names_for_solid_def(self, name):
+        '''Return the names of the pipelines that contain solids of the solid def named "name".
+
+        Args:
+            name (str): Name of the solid def
+
+        Returns:
+            List[str]: Names of the pipelines, in the order of pipeline_dict.
+        '''
+        check.str_param(name, 'name')
+
+        entry = self._get_solid_def_index().get(name)
+        if entry is None:
+            check.failed('Did not find ' + name)
+
+        return list(entry.pipeline_names)
@@ -37,6 +37,7 @@ class SolidDefinition(object):
         input_defs (List[InputDefinition]): Inputs of the solid.
         transform_fn (callable): Callable with the signature (**info**: `TransformExecutionContext`,
             **inputs**: `Dict[str, Any]`) : `Iterable<Result>`
+            It may also be an async generator function, which requires the asyncio engine.
         outputs_defs (List[OutputDefinition]): Outputs of the solid.
         config_field (Field): How the solid configured.
         description (str): Description of the solid.
@@ -1,6 +1,7 @@
 from enum import Enum
 
 from dagster import check
+from dagster.utils.error import SerializableErrorInfo
 
 
 class DagsterExecutionFailureReason(Enum):
@@ -93,6 +94,20 @@ class DagsterExecutionStepExecutionError(DagsterUserCodeExecutionError):
     '''Indicates an error occured during the body of execution step execution'''
 
 
+class DagsterSubprocessExecutionError(DagsterError):
+    '''
+    Indicates that an error occurred while executing a step in a worker process. The
+    original exception cannot be marshalled back to the parent process, so the serialized
+    message and stack of the original error are attached instead.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        self.error_info = check.inst_param(
+            kwargs.pop('error_info'), 'error_info', SerializableErrorInfo
+        )
+        super(DagsterSubprocessExecutionError, self).__init__(*args, **kwargs)
+
+
 class InvalidSubplanErrorData(object):
     def __init__(self, *args, **kwargs):
         from dagster.core.execution_plan.objects import ExecutionStep
@@ -0,0 +1,408 @@
+'''
+A compact, append-only binary format for event records.
+
+Writing every event record as a line of json spends most of its time formatting and parsing
+the same keys, step keys and pipeline names over and over. In this format, a file starts with
+a short header and is followed by frames, each of which is a frame kind byte and the length of
+its payload, so that a reader can skip a frame without decoding it, and can tell a frame that
+is still being written from a complete one.
+
+Frames are either strings or records. The names that recur across the records of a run (run
+ids, pipeline names, solid names and step keys) are written once, as a string frame, the first
+time a record uses them, and records refer to them by the order in which they were written.
+Event types, levels and record classes are written as single byte codes. Messages, which
+differ between records, are written in full.
+
+Writers append to a file, and readers iterate the records of a file frame by frame, so a log
+can be read while it is still being written, and is never loaded in full.
+
+read_event_records also reads the logs that dagit wrote before this format, with a json
+object per line, so the .log files of earlier runs can be read along with the .events files
+of newer ones.
+'''
+
+import io
+import json
+import logging
+import os
+import struct
+
+import six
+
+from dagster import check
+from dagster.utils.error import SerializableErrorInfo
+from dagster.utils.logging import DEBUG, construct_single_handler_logger
+
+from .events import (
+    EVENT_CLS_LOOKUP,
+    EventRecord,
+    EventType,
+    ExecutionStepCacheHitRecord,
+    ExecutionStepEventRecord,
+    ExecutionStepSuccessRecord,
+    LogMessageRecord,
+    PipelineEventRecord,
+    StepMaterializationRecord,
+    construct_event_record_from_log_record,
+)
+
+EVENT_LOG_MAGIC = b'DGEL'
+
+EVENT_LOG_VERSION = 1
+
+_HEADER = struct.Struct('<4sB')
+
+_FRAME_HEADER = struct.Struct('<BI')
+
+_STRING_FRAME = 0
+
+_RECORD_FRAME = 1
+
+# record class code, event type code, level, timestamp
+_RECORD_HEADER = struct.Struct('<BBBd')
+
+_UINT = struct.Struct('<I')
+
+_DOUBLE = struct.Struct('<d')
+
+# The codes are written to logs, so the code of a member must never change, and the code of a
+# member that is removed must not be reused
+RECORD_CLASS_CODES = {
+    EventRecord: 0,
+    PipelineEventRecord: 1,
+    ExecutionStepEventRecord: 2,
+    ExecutionStepSuccessRecord: 3,
+    ExecutionStepCacheHitRecord: 4,
+    LogMessageRecord: 5,
+    StepMaterializationRecord: 6,
+}
+
+EVENT_TYPE_CODES = {
+    EventType.PIPELINE_START: 0,
+    EventType.PIPELINE_SUCCESS: 1,
+    EventType.PIPELINE_FAILURE: 2,
+    EventType.PIPELINE_PROCESS_START: 3,
+    EventType.PIPELINE_PROCESS_STARTED: 4,
+    EventType.EXECUTION_PLAN_STEP_SUCCESS: 5,
+    EventType.EXECUTION_PLAN_STEP_START: 6,
+    EventType.EXECUTION_PLAN_STEP_FAILURE: 7,
+    EventType.EXECUTION_PLAN_STEP_CACHE_HIT: 8,
+    EventType.STEP_MATERIALIZATION: 9,
+    EventType.UNCATEGORIZED: 10,
+}
+
+_RECORD_CLASSES_BY_CODE = {code: record_cls for record_cls, code in RECORD_CLASS_CODES.items()}
+
+_EVENT_TYPES_BY_CODE = {code: event_type for event_type, code in EVENT_TYPE_CODES.items()}
+
+# How the fields of each record class past the common ones are encoded. Names are interned,
+# text is written in full.
+_NAME = 'name'
+_TEXT = 'text'
+_FLOAT = 'float'
+
+_STEP_FIELDS = (
+    ('step_key', _NAME),
+    ('pipeline_name', _NAME),
+    ('solid_name', _NAME),
+    ('solid_definition_name', _NAME),
+)
+
+_RECORD_FIELDS = {
+    EventRecord: (),
+    PipelineEventRecord: (('pipeline_name', _NAME),),
+    ExecutionStepEventRecord: _STEP_FIELDS,
+    ExecutionStepSuccessRecord: _STEP_FIELDS + (('millis', _FLOAT),),
+    ExecutionStepCacheHitRecord: _STEP_FIELDS + (('cache_key', _TEXT),),
+    LogMessageRecord: (),
+    StepMaterializationRecord: _STEP_FIELDS + (('file_name', _TEXT), ('file_location', _TEXT)),
+}
+
+
+def _encode_text(text):
+    encoded = text.encode('utf-8')
+    return _UINT.pack(len(encoded)) + encoded
+
+
+class _PayloadReader(object):
+    def __init__(self, payload, names):
+        self._payload = payload
+        self._names = names
+        self._offset = 0
+
+    def unpack(self, struct_):
+        values = struct_.unpack_from(self._payload, self._offset)
+        self._offset += struct_.size
+        return values
+
+    def uint(self):
+        return self.unpack(_UINT)[0]
+
+    def text(self):
+        length = self.uint()
+        text = self._payload[self._offset : self._offset + length].decode('utf-8')
+        self._offset += length
+        return text
+
+    def name(self):
+        return self._names[self.uint()]
+
+    def float(self):
+        return self.unpack(_DOUBLE)[0]
+
+
+class EventLogWriter(object):
+    '''
+    Appends event records to a binary event log at path, creating it if it does not exist.
+
+    A writer opened on an existing log first reads the strings it defines, so that it can keep
+    appending to it. Only one writer may append to a log at a time. Every record is flushed
+    as it is written, so that readers see complete records.
+    '''
+
+    def __init__(self, path):
+        self.path = check.str_param(path, 'path')
+        self._name_ids = {}
+        self._file_obj = None
+
+    def _open(self):
+        if self._file_obj is not None:
+            return self._file_obj
+
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            reader = EventLogReader(self.path)
+            for _record in reader:
+                pass
+            self._name_ids = {name: name_id for name_id, name in enumerate(reader.names)}
+            # A frame left incomplete by a writer that was interrupted is dropped
+            self._file_obj = io.open(self.path, 'r+b')
+            self._file_obj.seek(reader.offset)
+            self._file_obj.truncate()
+        else:
+            self._file_obj = io.open(self.path, 'wb')
+
+        if not self._file_obj.tell():
+            self._file_obj.write(_HEADER.pack(EVENT_LOG_MAGIC, EVENT_LOG_VERSION))
+
+        return self._file_obj
+
+    def _name_id(self, file_obj, name):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            encoded = name.encode('utf-8')
+            file_obj.write(_FRAME_HEADER.pack(_STRING_FRAME, len(encoded)) + encoded)
+            name_id = self._name_ids[name] = len(self._name_ids)
+        return _UINT.pack(name_id)
+
+    def write(self, event_record):
+        check.inst_param(event_record, 'event_record', EventRecord)
+        record_cls = type(event_record)
+        if record_cls not in RECORD_CLASS_CODES:
+            check.failed(
+                'Cannot write records of class {name} to an event log'.format(
+                    name=record_cls.__name__
+                )
+            )
+
+        file_obj = self._open()
+
+        parts = [
+            _RECORD_HEADER.pack(
+                RECORD_CLASS_CODES[record_cls],
+                EVENT_TYPE_CODES[event_record.event_type],
+                event_record.level,
+                event_record.timestamp,
+            ),
+            self._name_id(file_obj, event_record.run_id),
+            _encode_text(event_record.message),
+            _encode_text(event_record.user_message),
+        ]
+
+        error_info = event_record.error_info
+        if error_info is None:
+            parts.append(_UINT.pack(0))
+        else:
+            parts.append(_UINT.pack(1))
+            parts.append(_encode_text(error_info.message))
+            parts.append(_UINT.pack(len(error_info.stack)))
+            parts.extend(_encode_text(line) for line in error_info.stack)
+
+        for field_name, kind in _RECORD_FIELDS[record_cls]:
+            value = getattr(event_record, field_name)
+            if kind == _NAME:
+                parts.append(self._name_id(file_obj, value))
+            elif kind == _TEXT:
+                parts.append(_encode_text(value))
+            else:
+                parts.append(_DOUBLE.pack(value))
+
+        payload = b''.join(parts)
+        file_obj.write(_FRAME_HEADER.pack(_RECORD_FRAME, len(payload)) + payload)
+        file_obj.flush()
+
+    def close(self):
+        if self._file_obj is not None:
+            self._file_obj.close()
+            self._file_obj = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class EventLogReader(object):
+    '''
+    Iterates the records of a binary event log at path, one frame at a time.
+
+    Iteration stops at the end of the last complete frame. Iterating the reader again yields
+    the records written since, so a reader can follow a log that is still being written.
+    '''
+
+    def __init__(self, path):
+        self.path = check.str_param(path, 'path')
+        self.names = []
+        self.offset = 0
+
+    def __iter__(self):
+        with io.open(self.path, 'rb') as file_obj:
+            file_obj.seek(self.offset)
+
+            if not self.offset:
+                header = file_obj.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                magic, version = _HEADER.unpack(header)
+                check.invariant(
+                    magic == EVENT_LOG_MAGIC, '{path} is not an event log'.format(path=self.path)
+                )
+                check.invariant(
+                    version == EVENT_LOG_VERSION,
+                    'Unsupported event log version {version} in {path}'.format(
+                        version=version, path=self.path
+                    ),
+                )
+                self.offset = _HEADER.size
+
+            while True:
+                frame_header = file_obj.read(_FRAME_HEADER.size)
+                if len(frame_header) < _FRAME_HEADER.size:
+                    return
+                frame_kind, length = _FRAME_HEADER.unpack(frame_header)
+                payload = file_obj.read(length)
+                if len(payload) < length:
+                    return
+                self.offset += _FRAME_HEADER.size + length
+
+                if frame_kind == _STRING_FRAME:
+                    self.names.append(payload.decode('utf-8'))
+                else:
+                    yield self._decode_record(payload)
+
+    def _decode_record(self, payload):
+        reader = _PayloadReader(payload, self.names)
+
+        record_code, event_type_code, level, timestamp = reader.unpack(_RECORD_HEADER)
+        record_cls = _RECORD_CLASSES_BY_CODE[record_code]
+        kwargs = {
+            'event_type': _EVENT_TYPES_BY_CODE[event_type_code],
+            'level': level,
+            'timestamp': timestamp,
+            'run_id': reader.name(),
+            'message': reader.text(),
+            'user_message': reader.text(),
+        }
+
+        if reader.uint():
+            message = reader.text()
+            kwargs['error_info'] = SerializableErrorInfo(
+                message, [reader.text() for _ in six.moves.range(reader.uint())]
+            )
+        else:
+            kwargs['error_info'] = None
+
+        for field_name, kind in _RECORD_FIELDS[record_cls]:
+            if kind == _NAME:
+                kwargs[field_name] = reader.name()
+            elif kind == _TEXT:
+                kwargs[field_name] = reader.text()
+            else:
+                kwargs[field_name] = reader.float()
+
+        return record_cls(**kwargs)
+
+
+# The keys of the fields of records in the json logs that differ from their names
+_JSON_KEYS = {'file_name': 'name', 'file_location': 'loc'}
+
+
+def _event_record_from_json(line):
+    record_dict = json.loads(line)
+    event_type = EventType(record_dict['event_type'])
+    record_cls = EVENT_CLS_LOOKUP[event_type]
+
+    error_info = record_dict['error_info']
+    kwargs = {
+        'event_type': event_type,
+        'level': record_dict['level'],
+        'timestamp': float(record_dict['timestamp']),
+        'run_id': record_dict['run_id'],
+        'message': record_dict['message'],
+        'user_message': record_dict['user_message'],
+        'error_info': SerializableErrorInfo(*error_info) if error_info else None,
+    }
+    for field_name, kind in _RECORD_FIELDS[record_cls]:
+        value = record_dict[_JSON_KEYS.get(field_name, field_name)]
+        kwargs[field_name] = float(value) if kind == _FLOAT else value
+
+    return record_cls(**kwargs)
+
+
+def _iterate_json_event_records(path):
+    with io.open(path, 'r', encoding='utf-8') as file_obj:
+        for line in file_obj:
+            if line.strip():
+                yield _event_record_from_json(line)
+
+
+def read_event_records(path):
+    '''
+    Iterates the records of the event log at path, which is either a binary event log or a log
+    with the json of a record per line.
+    '''
+    check.str_param(path, 'path')
+
+    with io.open(path, 'rb') as file_obj:
+        magic = file_obj.read(len(EVENT_LOG_MAGIC))
+
+    if magic and magic != EVENT_LOG_MAGIC:
+        return _iterate_json_event_records(path)
+    return iter(EventLogReader(path))
+
+
+class EventLogHandler(logging.Handler):
+    '''Appends the event records of the messages it handles to the binary event log at path.'''
+
+    def __init__(self, path):
+        super(EventLogHandler, self).__init__()
+        self.writer = EventLogWriter(path)
+
+    def emit(self, record):
+        try:
+            self.writer.write(construct_event_record_from_log_record(record))
+
+        # Need to catch Exception here, so disabling lint
+        except Exception as e:  # pylint: disable=W0703
+            logging.critical('Error during logging!')
+            logging.exception(str(e))
+
+    def close(self):
+        self.writer.close()
+        super(EventLogHandler, self).close()
+
+
+def construct_event_log_logger(path):
+    '''Record a stream of event records to the binary event log at path'''
+    check.str_param(path, 'path')
+    return construct_single_handler_logger('event-log-logger', DEBUG, EventLogHandler(path))
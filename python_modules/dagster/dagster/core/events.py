@@ -1,6 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 import json
+import logging
 
 from dagster import check
 
@@ -14,6 +15,7 @@ from dagster.utils.logging import (
     StructuredLoggerMessage,
     check_valid_level_param,
     construct_single_handler_logger,
+    get_record_message,
 )
 
 from .log import DagsterLog
@@ -30,6 +32,7 @@ class EventType(Enum):
     EXECUTION_PLAN_STEP_SUCCESS = 'EXECUTION_PLAN_STEP_SUCCESS'
     EXECUTION_PLAN_STEP_START = 'EXECUTION_PLAN_STEP_START'
     EXECUTION_PLAN_STEP_FAILURE = 'EXECUTION_PLAN_STEP_FAILURE'
+    EXECUTION_PLAN_STEP_CACHE_HIT = 'EXECUTION_PLAN_STEP_CACHE_HIT'
 
     STEP_MATERIALIZATION = 'STEP_MATERIALIZATION'
 
@@ -97,6 +100,16 @@ class ExecutionEvents(namedtuple('_ExecutionEvents', 'pipeline_name log')):
             error_info=json.dumps(serializable_error_info_from_exc_info(exc_info), sort_keys=True),
         )
 
+    def execution_plan_step_cache_hit(self, step_key, cache_key):
+        check.str_param(step_key, 'step_key')
+        check.str_param(cache_key, 'cache_key')
+        self.log.info(
+            'Loaded the outputs of {step_key} from the step cache'.format(step_key=step_key),
+            event_type=EventType.EXECUTION_PLAN_STEP_CACHE_HIT.value,
+            step_key=step_key,
+            cache_key=cache_key,
+        )
+
     def step_materialization(self, step_key, file_name, file_location):
         check.str_param(step_key, 'step_key')
         self.log.info(
@@ -124,6 +137,17 @@ def construct_event_type(event_type):
 
 
 class EventRecord(object):
+    # Runs can emit a great many records, so they are slotted to keep them small
+    __slots__ = (
+        '_error_info',
+        '_message',
+        '_level',
+        '_user_message',
+        '_event_type',
+        '_run_id',
+        '_timestamp',
+    )
+
     def __init__(self, error_info, message, level, user_message, event_type, run_id, timestamp):
         self._error_info = check.opt_inst_param(error_info, 'error_info', SerializableErrorInfo)
         self._message = check.str_param(message, 'message')
@@ -174,6 +198,8 @@ class EventRecord(object):
 
 
 class PipelineEventRecord(EventRecord):
+    __slots__ = ('_pipeline_name',)
+
     def __init__(self, pipeline_name, **kwargs):
         super(PipelineEventRecord, self).__init__(**kwargs)
         self._pipeline_name = check.str_param(pipeline_name, 'pipeline_name')
@@ -189,6 +215,8 @@ class PipelineEventRecord(EventRecord):
 
 
 class ExecutionStepEventRecord(EventRecord):
+    __slots__ = ('_step_key', '_pipeline_name', '_solid_name', '_solid_definition_name')
+
     def __init__(self, step_key, pipeline_name, solid_name, solid_definition_name, **kwargs):
         super(ExecutionStepEventRecord, self).__init__(**kwargs)
         self._step_key = check.str_param(step_key, 'step_key')
@@ -228,6 +256,8 @@ class ExecutionStepEventRecord(EventRecord):
 
 
 class ExecutionStepSuccessRecord(ExecutionStepEventRecord):
+    __slots__ = ('_millis',)
+
     def __init__(self, millis, **kwargs):
         super(ExecutionStepSuccessRecord, self).__init__(**kwargs)
         self._millis = check.float_param(millis, 'millis')
@@ -242,11 +272,30 @@ class ExecutionStepSuccessRecord(ExecutionStepEventRecord):
         return orig
 
 
+class ExecutionStepCacheHitRecord(ExecutionStepEventRecord):
+    __slots__ = ('_cache_key',)
+
+    def __init__(self, cache_key, **kwargs):
+        super(ExecutionStepCacheHitRecord, self).__init__(**kwargs)
+        self._cache_key = check.str_param(cache_key, 'cache_key')
+
+    @property
+    def cache_key(self):
+        return self._cache_key
+
+    def to_dict(self):
+        orig = super(ExecutionStepCacheHitRecord, self).to_dict()
+        orig['cache_key'] = self.cache_key
+        return orig
+
+
 class LogMessageRecord(EventRecord):
-    pass
+    __slots__ = ()
 
 
 class StepMaterializationRecord(ExecutionStepEventRecord):
+    __slots__ = ('_name', '_loc')
+
     def __init__(self, file_name, file_location, **kwargs):
         super(StepMaterializationRecord, self).__init__(**kwargs)
         self._name = check.str_param(file_name, 'file_name')
@@ -271,6 +320,7 @@ EVENT_CLS_LOOKUP = {
     EventType.EXECUTION_PLAN_STEP_FAILURE: ExecutionStepEventRecord,
     EventType.EXECUTION_PLAN_STEP_START: ExecutionStepEventRecord,
     EventType.EXECUTION_PLAN_STEP_SUCCESS: ExecutionStepSuccessRecord,
+    EventType.EXECUTION_PLAN_STEP_CACHE_HIT: ExecutionStepCacheHitRecord,
     EventType.PIPELINE_FAILURE: PipelineEventRecord,
     EventType.PIPELINE_START: PipelineEventRecord,
     EventType.PIPELINE_SUCCESS: PipelineEventRecord,
@@ -321,6 +371,8 @@ def logger_to_kwargs(logger_message):
         }
         if event_cls == ExecutionStepSuccessRecord:
             step_args['millis'] = logger_message.meta['millis']
+        if event_cls == ExecutionStepCacheHitRecord:
+            step_args['cache_key'] = logger_message.meta['cache_key']
         if event_cls == StepMaterializationRecord:
             step_args['file_name'] = logger_message.meta['file_name']
             step_args['file_location'] = logger_message.meta['file_location']
@@ -354,22 +406,24 @@ def construct_event_logger(event_record_callback):
     )
 
 
+def construct_event_record_from_log_record(record):
+    check.inst_param(record, 'record', logging.LogRecord)
+    return construct_event_record(
+        StructuredLoggerMessage(
+            name=record.name,
+            message=get_record_message(record),
+            level=record.levelno,
+            meta=record.dagster_meta,
+            record=record,
+        )
+    )
+
+
 def construct_json_event_logger(json_path):
     '''Record a stream of event records to json'''
     check.str_param(json_path, 'json_path')
     return construct_single_handler_logger(
         "json-event-record-logger",
         DEBUG,
-        JsonEventLoggerHandler(
-            json_path,
-            lambda record: construct_event_record(
-                StructuredLoggerMessage(
-                    name=record.name,
-                    message=record.msg,
-                    level=record.levelno,
-                    meta=record.dagster_meta,
-                    record=record,
-                )
-            ),
-        ),
+        JsonEventLoggerHandler(json_path, construct_event_record_from_log_record),
     )
@@ -22,7 +22,7 @@ import itertools
 
 from contextlib2 import ExitStack
 from dagster import check
-from dagster.utils import merge_dicts
+from dagster.utils import ASYNC_SOLIDS_SUPPORTED, merge_dicts, single_item
 
 from .definitions import DependencyDefinition, PipelineDefinition, Solid, SolidInstance
 
@@ -40,10 +40,13 @@ from .errors import DagsterInvariantViolationError
 
 from .events import construct_event_logger
 
+from .execution_summary import StepSummaryCollector, summarize_step_events
+
 from .execution_plan.create import (
     ExecutionPlanAddedOutputs,
     ExecutionPlanSubsetInfo,
     create_execution_plan_core,
+    validate_execution_plan,
 )
 
 from .execution_plan.objects import (
@@ -51,9 +54,27 @@ from .execution_plan.objects import (
     ExecutionStepEvent,
     ExecutionStepEventType,
     StepKind,
+    StepSuccessData,
 )
 
+from .execution_plan.intermediate_store import (
+    FilesystemIntermediateStore,
+    InMemoryIntermediateStore,
+    MmapIntermediateStore,
+    default_intermediate_store_directory,
+)
+from .execution_plan.multiprocess_engine import (
+    iterate_step_events_for_execution_plan_multiprocess,
+)
+from .execution_plan.multithread_engine import iterate_step_events_for_execution_plan_multithread
+from .execution_plan.run_storage import (
+    RunStorage,
+    check_run_storage_for_resume,
+    create_resume_subset_info,
+)
 from .execution_plan.simple_engine import iterate_step_events_for_execution_plan
+from .execution_plan.profiling import StepProfiler
+from .execution_plan.step_cache import StepCache
 
 from .init_context import InitContext, InitResourceContext
 
@@ -62,6 +83,7 @@ from .log import DagsterLog
 from .system_config.objects import EnvironmentConfig
 
 from .types.evaluator import EvaluationError, evaluate_config_value, friendly_string_for_error
+from .types.compression import Compression, get_codec
 from .types.marshal import FilePersistencePolicy
 
 
@@ -72,14 +94,28 @@ class PipelineExecutionResult(object):
         pipeline (PipelineDefinition): Pipeline that was executed
         context (ExecutionContext): ExecutionContext of that particular Pipeline run.
         result_list (list[SolidExecutionResult]): List of results for each pipeline solid.
+        output_values_retained (bool): Whether the step events still hold the output values.
+        step_summaries (list[StepExecutionSummary]):
+            Status and timing of every step that emitted step events, including those whose
+            step events were not retained.
     '''
 
-    def __init__(self, pipeline, run_id, step_event_list):
+    def __init__(
+        self, pipeline, run_id, step_event_list, output_values_retained=True, step_summaries=None
+    ):
         self.pipeline = check.inst_param(pipeline, 'pipeline', PipelineDefinition)
         self.run_id = check.str_param(run_id, 'run_id')
         self.step_event_list = check.list_param(
             step_event_list, 'step_event_list', of_type=ExecutionStepEvent
         )
+        self.output_values_retained = check.bool_param(
+            output_values_retained, 'output_values_retained'
+        )
+        self.step_summaries = (
+            summarize_step_events(step_event_list)
+            if step_summaries is None
+            else check.list_param(step_summaries, 'step_summaries')
+        )
 
         solid_result_dict = self._context_solid_result_dict(step_event_list)
 
@@ -105,6 +141,7 @@ class PipelineExecutionResult(object):
             solid_result_dict[solid_name] = SolidExecutionResult(
                 self.pipeline.solid_named(solid_name),
                 dict(step_events_by_solid_by_kind[solid_name]),
+                output_values_retained=self.output_values_retained,
             )
         return solid_result_dict
 
@@ -146,11 +183,14 @@ class SolidExecutionResult(object):
       solid (SolidDefinition): Solid for which this result is
     '''
 
-    def __init__(self, solid, step_events_by_kind):
+    def __init__(self, solid, step_events_by_kind, output_values_retained=True):
         self.solid = check.inst_param(solid, 'solid', Solid)
         self.step_events_by_kind = check.dict_param(
             step_events_by_kind, 'step_events_by_kind', key_type=StepKind, value_type=list
         )
+        self.output_values_retained = check.bool_param(
+            output_values_retained, 'output_values_retained'
+        )
 
     @property
     def transforms(self):
@@ -202,6 +242,8 @@ class SolidExecutionResult(object):
     def transformed_values(self):
         '''Return dictionary of transformed results, with keys being output names.
         Returns None if execution result isn't a success.'''
+        self._check_output_values_retained()
+
         if self.success and self.transforms:
             return {
                 result.success_data.output_name: result.success_data.value
@@ -222,6 +264,8 @@ class SolidExecutionResult(object):
                 )
             )
 
+        self._check_output_values_retained()
+
         if self.success:
             for result in self.transforms:
                 if result.success_data.output_name == output_name:
@@ -235,6 +279,15 @@ class SolidExecutionResult(object):
         else:
             return None
 
+    def _check_output_values_retained(self):
+        if not self.output_values_retained:
+            raise DagsterInvariantViolationError(
+                (
+                    'Output values of solid {solid} were not retained. Execute the pipeline '
+                    'with retain_output_values=True to access them.'
+                ).format(solid=self.solid.name)
+            )
+
     @property
     def dagster_error(self):
         '''Returns exception that happened during this solid's execution, if any'''
@@ -254,7 +307,12 @@ def check_execution_metadata_param(execution_metadata):
 
 
 def create_execution_plan(
-    pipeline, environment_dict=None, execution_metadata=None, subset_info=None, added_outputs=None
+    pipeline,
+    environment_dict=None,
+    execution_metadata=None,
+    subset_info=None,
+    added_outputs=None,
+    targets=None,
 ):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
@@ -262,12 +320,13 @@ def create_execution_plan(
     check.inst_param(execution_metadata, 'execution_metadata', ExecutionMetadata)
     check.opt_inst_param(subset_info, 'subset_info', ExecutionPlanSubsetInfo)
     check.opt_inst_param(added_outputs, 'added_outputs', ExecutionPlanAddedOutputs)
+    check.opt_list_param(targets, 'targets', of_type=str)
 
     with yield_pipeline_execution_context(
         pipeline, environment_dict, execution_metadata
     ) as pipeline_context:
         return create_execution_plan_core(
-            pipeline_context, execution_metadata, subset_info, added_outputs
+            pipeline_context, execution_metadata, subset_info, added_outputs, targets
         )
 
 
@@ -327,17 +386,142 @@ def with_maybe_gen(thing_or_gen):
     check.invariant(stopped, 'Must yield one item. Yielded more than one item')
 
 
-def _create_persistence_strategy(persistence_config):
+def _create_compression(compression_config):
+    check.opt_dict_param(compression_config, 'compression_config', key_type=str)
+
+    if compression_config is None:
+        return None
+
+    codec_name, codec_config = single_item(compression_config)
+    return Compression(get_codec(codec_name), codec_config.get('level'))
+
+
+def _create_persistence_strategy(persistence_config, compression):
     check.dict_param(persistence_config, 'persistence_config', key_type=str)
+    check.opt_inst_param(compression, 'compression', Compression)
 
     persistence_key, _config_value = list(persistence_config.items())[0]
 
     if persistence_key == 'file':
-        return FilePersistencePolicy()
+        return FilePersistencePolicy(compression)
     else:
         check.failed('Unsupported persistence key: {}'.format(persistence_key))
 
 
+def _create_intermediate_store(intermediate_store_config, run_id, compression):
+    check.dict_param(intermediate_store_config, 'intermediate_store_config', key_type=str)
+    check.str_param(run_id, 'run_id')
+    check.opt_inst_param(compression, 'compression', Compression)
+
+    store_key, store_config = single_item(intermediate_store_config)
+
+    if store_key == 'in_memory':
+        return InMemoryIntermediateStore()
+
+    directory = store_config.get('directory')
+    temporary = directory is None and not store_config['keep']
+    if directory is None:
+        directory = default_intermediate_store_directory(run_id)
+
+    if store_key == 'filesystem':
+        return FilesystemIntermediateStore(directory, compression, temporary)
+    elif store_key == 'mmap':
+        return MmapIntermediateStore(directory, compression, temporary)
+    else:
+        check.failed('Unsupported intermediate store key: {}'.format(store_key))
+
+
+def _create_step_cache(cache_config, compression):
+    check.opt_dict_param(cache_config, 'cache_config', key_type=str)
+    check.opt_inst_param(compression, 'compression', Compression)
+
+    if cache_config is None:
+        return None
+
+    return StepCache(
+        directory=cache_config.get('directory'),
+        max_size_bytes=cache_config.get('max_size_bytes'),
+        compression=compression,
+    )
+
+
+def _create_run_storage(resumable_config, run_id):
+    check.opt_dict_param(resumable_config, 'resumable_config', key_type=str)
+    check.str_param(run_id, 'run_id')
+
+    if resumable_config is None:
+        return None
+
+    return RunStorage(run_id, directory=resumable_config.get('directory'))
+
+
+def _create_step_profiler(profile_config, run_id):
+    check.opt_dict_param(profile_config, 'profile_config', key_type=str)
+    check.str_param(run_id, 'run_id')
+
+    if profile_config is None:
+        return None
+
+    return StepProfiler(
+        run_id,
+        steps=profile_config['steps'],
+        cprofile=profile_config['cprofile'],
+        tracemalloc=profile_config['tracemalloc'],
+        top_allocations=profile_config['top_allocations'],
+        directory=profile_config.get('directory'),
+    )
+
+
+def iterate_step_events_for_engine(
+    pipeline_context, execution_metadata, execution_plan, throw_on_user_error
+):
+    '''
+    Execute the plan with the engine selected in the execution section of the environment
+    config, yielding the resulting ExecutionStepEvents.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.inst_param(execution_metadata, 'execution_metadata', ExecutionMetadata)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.bool_param(throw_on_user_error, 'throw_on_user_error')
+
+    engine_key, engine_config = single_item(pipeline_context.environment_config.execution.engine)
+
+    if engine_key == 'in_process':
+        return iterate_step_events_for_execution_plan(
+            pipeline_context, execution_plan, throw_on_user_error
+        )
+    elif engine_key == 'multithread':
+        return iterate_step_events_for_execution_plan_multithread(
+            pipeline_context,
+            execution_plan,
+            throw_on_user_error,
+            max_workers=engine_config.get('max_workers'),
+        )
+    elif engine_key == 'multiprocess':
+        return iterate_step_events_for_execution_plan_multiprocess(
+            pipeline_context,
+            execution_metadata,
+            execution_plan,
+            throw_on_user_error,
+            max_workers=engine_config.get('max_workers'),
+        )
+    elif engine_key == 'asyncio':
+        if not ASYNC_SOLIDS_SUPPORTED:
+            raise DagsterInvariantViolationError('The asyncio engine requires python 3.6 or later')
+
+        # Imported lazily as the engine uses syntax that python 2 cannot parse
+        from .execution_plan.asyncio_engine import iterate_step_events_for_execution_plan_asyncio
+
+        return iterate_step_events_for_execution_plan_asyncio(
+            pipeline_context,
+            execution_plan,
+            throw_on_user_error,
+            max_concurrent_steps=engine_config.get('max_concurrent_steps'),
+        )
+    else:
+        check.failed('Unsupported engine key: {}'.format(engine_key))
+
+
 @contextmanager
 def yield_pipeline_execution_context(pipeline_def, environment_dict, execution_metadata):
     check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
@@ -366,9 +550,13 @@ def yield_pipeline_execution_context(pipeline_def, environment_dict, execution_m
             execution_context,
             execution_metadata.run_id,
         ) as resources:
-            yield construct_pipeline_execution_context(
+            pipeline_context = construct_pipeline_execution_context(
                 execution_metadata, execution_context, pipeline_def, resources, environment_config
             )
+            try:
+                yield pipeline_context
+            finally:
+                pipeline_context.intermediate_store.release()
 
 
 def construct_pipeline_execution_context(
@@ -382,6 +570,7 @@ def construct_pipeline_execution_context(
     loggers = _create_loggers(execution_metadata, execution_context)
     tags = get_tags(execution_context, execution_metadata, pipeline)
     log = DagsterLog(execution_metadata.run_id, tags, loggers)
+    compression = _create_compression(environment_config.execution.compression)
 
     return PipelineExecutionContext(
         PipelineExecutionContextData(
@@ -391,7 +580,19 @@ def construct_pipeline_execution_context(
             event_callback=execution_metadata.event_callback,
             environment_config=environment_config,
             persistence_strategy=_create_persistence_strategy(
-                environment_config.context.persistence
+                environment_config.context.persistence, compression
+            ),
+            intermediate_store=_create_intermediate_store(
+                environment_config.execution.intermediate_store,
+                execution_metadata.run_id,
+                compression,
+            ),
+            step_cache=_create_step_cache(environment_config.execution.cache, compression),
+            run_storage=_create_run_storage(
+                environment_config.execution.resumable, execution_metadata.run_id
+            ),
+            step_profiler=_create_step_profiler(
+                environment_config.execution.profile, execution_metadata.run_id
             ),
         ),
         tags=tags,
@@ -470,6 +671,7 @@ def execute_pipeline_iterator(
     throw_on_user_error=True,
     execution_metadata=None,
     solid_subset=None,
+    targets=None,
 ):
     '''Returns iterator that yields :py:class:`SolidExecutionResult` for each
     solid executed in the pipeline.
@@ -480,53 +682,252 @@ def execute_pipeline_iterator(
     Parameters:
       pipeline (PipelineDefinition): pipeline to run
       execution (ExecutionContext): execution context of the run
+      targets (List[str]):
+        If passed, only the steps needed to compute these outputs and the materializations
+        configured in the environment are executed. Each target is either the name of a solid,
+        for all of its outputs, or "solid_name.output_name".
     '''
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
     check.bool_param(throw_on_user_error, 'throw_on_user_error')
     execution_metadata = check_execution_metadata_param(execution_metadata)
     check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
+    check.opt_list_param(targets, 'targets', of_type=str)
 
     with yield_pipeline_execution_context(
         get_subset_pipeline(pipeline, solid_subset), environment_dict, execution_metadata
     ) as pipeline_context:
+        for step_event in _iterate_step_events_for_run(
+            pipeline_context, execution_metadata, throw_on_user_error, targets
+        ):
+            yield step_event
 
-        pipeline_context.events.pipeline_start()
 
-        execution_plan = create_execution_plan_core(pipeline_context, execution_metadata)
+def _iterate_step_events_for_run(
+    pipeline_context, execution_metadata, throw_on_user_error, targets
+):
+    pipeline_context.events.pipeline_start()
 
-        steps = execution_plan.topological_steps()
+    execution_plan = create_execution_plan_core(
+        pipeline_context, execution_metadata, targets=targets
+    )
 
-        if not steps:
-            pipeline_context.log.debug(
-                'Pipeline {pipeline} has no nodes and no execution will happen'.format(
-                    pipeline=pipeline.display_name
-                )
-            )
-            pipeline_context.events.pipeline_success()
-            return
+    for step_event in _iterate_step_events_for_pipeline(
+        pipeline_context, execution_metadata, execution_plan, throw_on_user_error
+    ):
+        yield step_event
 
+
+def _iterate_step_events_for_pipeline(
+    pipeline_context, execution_metadata, execution_plan, throw_on_user_error
+):
+    _prepare_run_storage(pipeline_context)
+
+    steps = execution_plan.topological_steps()
+
+    if not steps:
         pipeline_context.log.debug(
-            'About to execute the compute node graph in the following order {order}'.format(
-                order=[step.key for step in steps]
+            'Pipeline {pipeline} has no nodes and no execution will happen'.format(
+                pipeline=pipeline_context.pipeline_def.display_name
             )
         )
+        pipeline_context.events.pipeline_success()
+        return
 
-        check.invariant(len(steps[0].step_inputs) == 0)
+    pipeline_context.log.debug(
+        'About to execute the compute node graph in the following order {order}'.format(
+            order=[step.key for step in steps]
+        )
+    )
 
-        pipeline_success = True
+    check.invariant(len(steps[0].step_inputs) == 0)
 
-        for step_event in iterate_step_events_for_execution_plan(
-            pipeline_context, execution_plan, throw_on_user_error
+    pipeline_success = True
+
+    for step_event in iterate_step_events_for_engine(
+        pipeline_context, execution_metadata, execution_plan, throw_on_user_error
+    ):
+        if step_event.is_step_failure:
+            pipeline_success = False
+        yield step_event
+
+    if pipeline_success:
+        pipeline_context.events.pipeline_success()
+    else:
+        pipeline_context.events.pipeline_failure()
+
+
+def _prepare_run_storage(pipeline_context):
+    if pipeline_context.run_storage is None:
+        return
+
+    pipeline_context.run_storage.write_manifest(pipeline_context.pipeline_def.name)
+    pipeline_context.log.info(
+        'Persisting transform outputs of run {run_id} to {run_directory}'.format(
+            run_id=pipeline_context.run_id,
+            run_directory=pipeline_context.run_storage.run_directory,
+        )
+    )
+
+
+def resume_pipeline_iterator(
+    pipeline, run_id, environment_dict=None, throw_on_user_error=True, execution_metadata=None
+):
+    '''Returns iterator that yields :py:class:`ExecutionStepEvent` for each step executed
+    in resuming a run.
+
+    The run must have been executed with execution: resumable configured, and environment_dict
+    must configure the pipeline as it was configured for that run. Only the solids that
+    failed or did not get to run are executed, along with the solids downstream of them.
+    Their inputs from the solids that succeeded are read from the outputs persisted in the run.
+
+    Parameters:
+      pipeline (PipelineDefinition): pipeline of the run
+      run_id (str): id of the run to resume
+      environment_dict (dict): The enviroment that parameterized the run
+      execution_metadata (ExecutionMetadata):
+        Tags, loggers and event callback for the resumed execution. Its run_id must be None
+        or the id of the run.
+    '''
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+    check.str_param(run_id, 'run_id')
+    environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
+    check.bool_param(throw_on_user_error, 'throw_on_user_error')
+    check.opt_inst_param(execution_metadata, 'execution_metadata', ExecutionMetadata)
+
+    # The resumed execution continues the run, so that it can be resumed again in turn
+    execution_metadata = (execution_metadata or ExecutionMetadata())._replace(run_id=run_id)
+
+    with yield_pipeline_execution_context(
+        pipeline, environment_dict, execution_metadata
+    ) as pipeline_context:
+        pipeline_context.events.pipeline_start()
+
+        run_storage = pipeline_context.run_storage
+        if run_storage is None:
+            raise DagsterInvariantViolationError(
+                'Resuming run {run_id} of pipeline {pipeline} requires execution: resumable '
+                'to be configured.'.format(run_id=run_id, pipeline=pipeline.name)
+            )
+
+        check_run_storage_for_resume(pipeline_context, run_storage)
+
+        full_execution_plan = create_execution_plan_core(pipeline_context, execution_metadata)
+        subset_info = create_resume_subset_info(full_execution_plan, run_storage)
+
+        pipeline_context.log.info(
+            'Resuming run {run_id} with steps {step_keys}'.format(
+                run_id=run_id, step_keys=sorted(subset_info.subset)
+            )
+        )
+
+        execution_plan = create_execution_plan_core(
+            pipeline_context, execution_metadata, subset_info=subset_info
+        )
+
+        # So that steps which fail again are not treated as having succeeded on the next resume
+        for step in execution_plan.steps:
+            run_storage.clear_step(step.key)
+
+        for step_event in _iterate_step_events_for_pipeline(
+            pipeline_context, execution_metadata, execution_plan, throw_on_user_error
         ):
-            if step_event.is_step_failure:
-                pipeline_success = False
             yield step_event
 
-        if pipeline_success:
-            pipeline_context.events.pipeline_success()
-        else:
-            pipeline_context.events.pipeline_failure()
+
+def resume_pipeline(
+    pipeline, run_id, environment_dict=None, throw_on_user_error=True, execution_metadata=None
+):
+    '''
+    "Synchronous" version of :py:func:`resume_pipeline_iterator`.
+
+    Returns:
+      PipelineExecutionResult
+    '''
+    step_events = list(
+        resume_pipeline_iterator(
+            pipeline,
+            run_id,
+            environment_dict=environment_dict,
+            throw_on_user_error=throw_on_user_error,
+            execution_metadata=execution_metadata,
+        )
+    )
+    return PipelineExecutionResult(pipeline, run_id, step_events)
+
+
+def _without_output_value(step_event):
+    if step_event.success_data is None:
+        return step_event
+    return step_event._replace(
+        success_data=StepSuccessData(output_name=step_event.success_data.output_name)
+    )
+
+
+def terminal_solid_names(pipeline):
+    '''
+    The names of the solids of the pipeline that no other solid depends on, for example to pass
+    as the retained_outputs of :py:func:`execute_pipeline`.
+    '''
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+    return [
+        solid.name
+        for solid in pipeline.solids
+        if not pipeline.dependency_structure.depended_by_of_solid(solid.name)
+    ]
+
+
+def _resolve_retained_outputs(pipeline, retained_outputs):
+    '''The (solid_name, output_name) pairs of the outputs named by retained_outputs.'''
+    retained_output_keys = set()
+
+    for retained_output in retained_outputs:
+        solid_name, _, output_name = retained_output.partition('.')
+
+        if not pipeline.has_solid(solid_name):
+            raise DagsterInvariantViolationError(
+                'Retained output {retained_output} of pipeline {pipeline_name} names solid '
+                '{solid_name}, which does not exist.'.format(
+                    retained_output=retained_output,
+                    pipeline_name=pipeline.name,
+                    solid_name=solid_name,
+                )
+            )
+
+        solid = pipeline.solid_named(solid_name)
+
+        if output_name and not solid.has_output(output_name):
+            raise DagsterInvariantViolationError(
+                'Retained output {retained_output} of pipeline {pipeline_name} names output '
+                '{output_name}, which solid {solid_name} does not have.'.format(
+                    retained_output=retained_output,
+                    pipeline_name=pipeline.name,
+                    output_name=output_name,
+                    solid_name=solid_name,
+                )
+            )
+
+        for name in [output_name] if output_name else [o.name for o in solid.output_defs]:
+            retained_output_keys.add((solid_name, name))
+
+    return retained_output_keys
+
+
+def _retained_step_events(step_events, retain_output_values, retained_output_keys):
+    '''
+    The step events that the result of execute_pipeline keeps: every step event, without its
+    output value unless retain_output_values, or, if retained_output_keys is passed, only the
+    failures and the events of the transforms of the retained outputs.
+    '''
+    for step_event in step_events:
+        if retained_output_keys is None:
+            yield step_event if retain_output_values else _without_output_value(step_event)
+        elif step_event.is_step_failure or (
+            step_event.step.kind == StepKind.TRANSFORM
+            and (step_event.step.solid.name, step_event.success_data.output_name)
+            in retained_output_keys
+        ):
+            yield step_event
 
 
 def execute_pipeline(
@@ -535,6 +936,9 @@ def execute_pipeline(
     throw_on_user_error=True,
     execution_metadata=None,
     solid_subset=None,
+    retain_output_values=True,
+    targets=None,
+    retained_outputs=None,
 ):
     '''
     "Synchronous" version of :py:func:`execute_pipeline_iterator`.
@@ -548,6 +952,18 @@ def execute_pipeline(
       throw_on_user_error (bool):
         throw_on_user_error makes the function throw when an error is encoutered rather than
         returning the py:class:`SolidExecutionResult` in an error-state.
+      retain_output_values (bool):
+        If False, output values are dropped from the step events as they are produced, so
+        they can be garbage collected as soon as no downstream step needs them. The result
+        then only reports success and errors.
+      targets (List[str]):
+        If passed, only the steps needed to compute these outputs and the materializations
+        configured in the environment are executed. See :py:func:`execute_pipeline_iterator`.
+      retained_outputs (List[str]):
+        If passed, the result only keeps the values of these outputs, named like targets, and
+        the step events of failed steps. Every other step event is dropped as the run streams,
+        so memory does not grow with the length of the pipeline. The step_summaries of the
+        result still cover every step. See :py:func:`terminal_solid_names`.
 
 
     Returns:
@@ -559,22 +975,55 @@ def execute_pipeline(
     check.bool_param(throw_on_user_error, 'throw_on_user_error')
     execution_metadata = check_execution_metadata_param(execution_metadata)
     check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
+    check.bool_param(retain_output_values, 'retain_output_values')
+    check.opt_list_param(targets, 'targets', of_type=str)
+    check.opt_list_param(retained_outputs, 'retained_outputs', of_type=str)
+    check.param_invariant(
+        retain_output_values or retained_outputs is None,
+        'retained_outputs',
+        'Cannot retain outputs when retain_output_values is False',
+    )
+
+    retained_output_keys = (
+        _resolve_retained_outputs(pipeline, retained_outputs)
+        if retained_outputs is not None
+        else None
+    )
+
+    summary_collector = StepSummaryCollector()
+    with yield_pipeline_execution_context(
+        get_subset_pipeline(pipeline, solid_subset), environment_dict, execution_metadata
+    ) as pipeline_context:
+        step_event_list = list(
+            _retained_step_events(
+                _summarized_step_events(
+                    _iterate_step_events_for_run(
+                        pipeline_context, execution_metadata, throw_on_user_error, targets
+                    ),
+                    summary_collector,
+                ),
+                retain_output_values,
+                retained_output_keys,
+            )
+        )
+        # The engine records how long each step took as it completes
+        step_summaries = summary_collector.summaries(pipeline_context.step_timings)
 
     return PipelineExecutionResult(
         pipeline,
         execution_metadata.run_id,
-        list(
-            execute_pipeline_iterator(
-                pipeline=pipeline,
-                environment_dict=environment_dict,
-                throw_on_user_error=throw_on_user_error,
-                execution_metadata=execution_metadata,
-                solid_subset=solid_subset,
-            )
-        ),
+        step_event_list,
+        output_values_retained=retain_output_values,
+        step_summaries=step_summaries,
     )
 
 
+def _summarized_step_events(step_events, summary_collector):
+    for step_event in step_events:
+        summary_collector.add_step_event(step_event)
+        yield step_event
+
+
 class PipelineConfigEvaluationError(Exception):
     def __init__(self, pipeline, errors, config_value, *args, **kwargs):
         self.pipeline = check.inst_param(pipeline, 'pipeline', PipelineDefinition)
@@ -634,9 +1083,17 @@ def execute_plan(
     with yield_pipeline_execution_context(
         execution_plan.pipeline_def, environment_dict, execution_metadata
     ) as pipeline_context:
+        if pipeline_context.environment_config.execution.fast_path:
+            # The plan may have been created without fast_path
+            validate_execution_plan(execution_plan)
+
+        _prepare_run_storage(pipeline_context)
         return list(
-            iterate_step_events_for_execution_plan(
-                pipeline_context, execution_plan, throw_on_user_error=throw_on_user_error
+            iterate_step_events_for_engine(
+                pipeline_context,
+                execution_metadata,
+                execution_plan,
+                throw_on_user_error=throw_on_user_error,
             )
         )
 
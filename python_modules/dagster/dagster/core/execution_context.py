@@ -228,12 +228,18 @@ class AbstractTransformExecutionContext(six.with_metaclass(ABCMeta)):  # pylint:
 class PipelineExecutionContextData(
     namedtuple(
         '_PipelineExecutionContextData',
-        'run_id resources environment_config persistence_strategy pipeline_def event_callback',
+        (
+            'run_id resources environment_config persistence_strategy intermediate_store '
+            'pipeline_def event_callback step_cache run_storage step_profiler step_timings'
+        ),
     )
 ):
     '''
     PipelineContextData is the data that remains context throughtout the entire execution
     of a pipeline.
+
+    step_timings maps the keys of the steps executed in this process to how long they took to
+    compute, in milliseconds, and is filled in by the engine as steps complete.
     '''
 
     def __new__(
@@ -244,9 +250,22 @@ class PipelineExecutionContextData(
         persistence_strategy,
         pipeline_def,
         event_callback=None,
+        step_cache=None,
+        run_storage=None,
+        intermediate_store=None,
+        step_profiler=None,
+        step_timings=None,
     ):
+        from .execution_plan.intermediate_store import InMemoryIntermediateStore, IntermediateStore
+        from .execution_plan.profiling import StepProfiler
+        from .execution_plan.run_storage import RunStorage
+        from .execution_plan.step_cache import StepCache
+
         from .definitions.pipeline import PipelineDefinition
 
+        if intermediate_store is None:
+            intermediate_store = InMemoryIntermediateStore()
+
         return super(PipelineExecutionContextData, cls).__new__(
             cls,
             run_id=check.str_param(run_id, 'run_id'),
@@ -257,8 +276,17 @@ class PipelineExecutionContextData(
             persistence_strategy=check.inst_param(
                 persistence_strategy, 'persistence_strategy', PersistenceStrategy
             ),
+            intermediate_store=check.inst_param(
+                intermediate_store, 'intermediate_store', IntermediateStore
+            ),
             pipeline_def=check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition),
             event_callback=check.opt_callable_param(event_callback, 'event_callback'),
+            step_cache=check.opt_inst_param(step_cache, 'step_cache', StepCache),
+            run_storage=check.opt_inst_param(run_storage, 'run_storage', RunStorage),
+            step_profiler=check.opt_inst_param(step_profiler, 'step_profiler', StepProfiler),
+            step_timings=check.opt_dict_param(
+                step_timings, 'step_timings', key_type=str, value_type=float
+            ),
         )
 
     @property
@@ -282,7 +310,8 @@ class PipelineExecutionContext(object):
         from .execution_plan.objects import ExecutionStep
 
         check.inst_param(step, 'step', ExecutionStep)
-        tags = merge_dicts(self.tags, step.tags)
+        # The tags of the run take precedence over those of the step
+        tags = merge_dicts(merge_dicts(self.tags, step.tags), self.tags)
         log = DagsterLog(self.run_id, tags, self.log.loggers)
         return StepExecutionContext(self._pipeline_context_data, tags, log, step)
 
@@ -318,6 +347,26 @@ class PipelineExecutionContext(object):
     def persistence_strategy(self):
         return self._pipeline_context_data.persistence_strategy
 
+    @property
+    def intermediate_store(self):
+        return self._pipeline_context_data.intermediate_store
+
+    @property
+    def step_cache(self):
+        return self._pipeline_context_data.step_cache
+
+    @property
+    def run_storage(self):
+        return self._pipeline_context_data.run_storage
+
+    @property
+    def step_profiler(self):
+        return self._pipeline_context_data.step_profiler
+
+    @property
+    def step_timings(self):
+        return self._pipeline_context_data.step_timings
+
     @property
     def pipeline_def(self):
         return self._pipeline_context_data.pipeline_def
@@ -0,0 +1,257 @@
+'''
+An execution engine that executes the steps of an execution plan as tasks on a single asyncio
+event loop.
+
+Transform steps of solids defined with async def are awaited, so any number of network- or
+database-bound steps can be in flight at once within one process. All other steps, including
+the transforms of synchronous solids, run directly on the event loop and block it while they
+execute. Use the multithread or multiprocess engines for pipelines of blocking solids.
+
+The engine runs its own event loop, so it cannot be used from code that is already running
+within an event loop on the same thread.
+
+This module is only imported on python 3.6 and later.
+'''
+
+import asyncio
+
+from dagster import check
+from dagster.core.errors import DagsterError
+from dagster.utils.timing import time_execution_scope
+from dagster.core.execution_context import (
+    PipelineExecutionContext,
+    StepExecutionContext,
+    TransformExecutionContext,
+)
+
+from .dependency_tracker import StepDependencyTracker
+from .objects import ExecutionPlan, StepOutputHandle
+from .simple_engine import (
+    all_inputs_covered,
+    check_step_output_value,
+    compute_consumer_counts,
+    create_input_values,
+    create_step_event,
+    create_step_failure_event,
+    evaluate_step_inputs,
+    execution_step_error_boundary,
+    iterate_cached_step_events,
+    iterate_step_events_for_step,
+    log_inputs_not_covered,
+    log_step_output,
+    release_consumed_inputs,
+)
+from .run_storage import record_step_success
+from .step_cache import lookup_cached_step_events, store_step_events
+from .transform import is_async_transform_step, log_omitted_outputs, step_output_value_for_result
+
+# Put on the event queue once every step has completed
+_DONE = object()
+
+
+def iterate_step_events_for_execution_plan_asyncio(
+    pipeline_context, execution_plan, throw_on_user_error, max_concurrent_steps=None
+):
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.bool_param(throw_on_user_error, 'throw_on_user_error')
+    check.opt_int_param(max_concurrent_steps, 'max_concurrent_steps')
+    check.param_invariant(
+        max_concurrent_steps is None or max_concurrent_steps > 0,
+        'max_concurrent_steps',
+        'Must allow at least one step to execute',
+    )
+
+    if not execution_plan.topological_steps():
+        return
+
+    loop = asyncio.new_event_loop()
+    scheduler = None
+    try:
+        # Created on the loop, as before python 3.10 queues bind to the current event loop
+        event_queue = loop.run_until_complete(_create_queue())
+        scheduler = loop.create_task(
+            _execute_steps(pipeline_context, execution_plan, event_queue, max_concurrent_steps)
+        )
+
+        # The loop only runs while we wait for the next event, so steps do not run ahead of
+        # the consumer of this iterator by more than the events already queued
+        while True:
+            step_event = loop.run_until_complete(event_queue.get())
+            if step_event is _DONE:
+                break
+
+            if throw_on_user_error and step_event.is_step_failure:
+                step_event.reraise_user_error()
+
+            yield step_event
+
+        # Raise any framework error that ended execution early
+        scheduler.result()
+    finally:
+        _shutdown_loop(loop, scheduler)
+
+
+async def _create_queue():
+    return asyncio.Queue()
+
+
+def _shutdown_loop(loop, scheduler):
+    try:
+        if scheduler is not None and not scheduler.done():
+            scheduler.cancel()
+            # The scheduler cancels the steps still in flight
+            loop.run_until_complete(asyncio.gather(scheduler, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+async def _execute_steps(pipeline_context, execution_plan, event_queue, max_concurrent_steps):
+    tracker = StepDependencyTracker(execution_plan)
+    consumer_counts = compute_consumer_counts(execution_plan)
+    results = {}
+    running = {}
+
+    def _has_capacity():
+        return max_concurrent_steps is None or len(running) < max_concurrent_steps
+
+    try:
+        while True:
+            while tracker.has_ready_steps() and _has_capacity():
+                step = tracker.pop_ready_step()
+                step_context = pipeline_context.for_step(step)
+
+                if not all_inputs_covered(step, results):
+                    log_inputs_not_covered(step_context, results)
+                    release_consumed_inputs(step, consumer_counts, results)
+                    tracker.mark_complete(step.key)
+                    continue
+
+                task = asyncio.ensure_future(
+                    _execute_step(
+                        step_context,
+                        create_input_values(step, results),
+                        consumer_counts,
+                        results,
+                        event_queue,
+                    )
+                )
+                running[task] = step
+
+            if not running:
+                break
+
+            done, _pending = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                # Step failures are reported as events, so this only raises for framework errors
+                task.result()
+                release_consumed_inputs(step, consumer_counts, results)
+                tracker.mark_complete(step.key)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        event_queue.put_nowait(_DONE)
+
+
+async def _execute_step(step_context, input_values, consumer_counts, results, event_queue):
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+
+    step = step_context.step
+
+    def _handle_step_event(step_event):
+        if step_event.is_successful_output:
+            output_handle = StepOutputHandle(step, step_event.success_data.output_name)
+            # Results are only retained while a downstream step still needs them
+            if consumer_counts[output_handle]:
+                results[output_handle] = step_event
+        event_queue.put_nowait(step_event)
+
+    if is_async_transform_step(step):
+        step_events = _iterate_step_events_for_async_step(step_context, input_values)
+        try:
+            async for step_event in step_events:
+                _handle_step_event(step_event)
+        finally:
+            await step_events.aclose()
+    else:
+        for step_event in iterate_step_events_for_step(step_context, input_values):
+            _handle_step_event(step_event)
+
+
+async def _iterate_step_events_for_async_step(step_context, inputs):
+    '''
+    The counterpart of iterate_step_events_for_step for the transform steps of solids defined
+    with async def.
+    '''
+    step = step_context.step
+
+    with time_execution_scope() as timer_result:
+        cache_key, cached_step_events = lookup_cached_step_events(step_context, inputs)
+    if cached_step_events is not None:
+        for step_event in iterate_cached_step_events(
+            step_context, cached_step_events, timer_result.millis
+        ):
+            yield step_event
+        return
+
+    step_events = []
+    output_names = []
+    try:
+        evaluated_inputs = evaluate_step_inputs(step_context, inputs)
+
+        step_output_values = _iterate_step_output_values_within_boundary(
+            step_context, evaluated_inputs
+        )
+        seen_outputs = set()
+        try:
+            async for step_output_value in step_output_values:
+                check_step_output_value(step, step_output_value, seen_outputs)
+                seen_outputs.add(step_output_value.output_name)
+
+                step_event = create_step_event(step_context, step_output_value)
+                log_step_output(step_context, step_event)
+                yield step_event
+                output_names.append(step_event.success_data.output_name)
+                if cache_key is not None:
+                    step_events.append(step_event)
+        finally:
+            await step_output_values.aclose()
+    except DagsterError as dagster_error:
+        yield create_step_failure_event(step_context, dagster_error)
+        return
+
+    if cache_key is not None:
+        store_step_events(step_context, cache_key, step_events)
+
+    record_step_success(step_context, output_names)
+
+
+async def _iterate_step_output_values_within_boundary(step_context, evaluated_inputs):
+    error_str = 'Error occured during step {key}'.format(key=step_context.step.key)
+    with execution_step_error_boundary(step_context, error_str):
+        async for step_output_value in _execute_core_transform(
+            step_context.for_transform(), evaluated_inputs
+        ):
+            yield step_output_value
+
+
+async def _execute_core_transform(transform_context, inputs):
+    check.inst_param(transform_context, 'transform_context', TransformExecutionContext)
+
+    solid = transform_context.step.solid
+
+    transform_context.log.debug(
+        'Executing core transform for solid {solid}.'.format(solid=solid.name)
+    )
+
+    all_results = []
+    async for result in solid.definition.transform_fn(transform_context, inputs):
+        step_output_value = step_output_value_for_result(transform_context, result)
+        yield step_output_value
+        all_results.append(step_output_value)
+
+    log_omitted_outputs(transform_context, all_results)
@@ -0,0 +1,156 @@
+'''
+The steps of an execution plan and the dependencies between them, packed into arrays indexed by
+dense integer ids.
+
+Plans of large pipelines hold tens of thousands of steps, and walking them through the dicts
+and sets of string keys of ExecutionPlan costs a hash of a key for every edge. Here every step
+of the plan has an id, its index in plan.steps, and every output of a step has an id, assigned
+step after step in the order of their outputs. The inputs, dependencies and dependents of the
+steps are stored as index arrays in compressed sparse row form: the ids for step i are
+ids[offsets[i]:offsets[i + 1]].
+
+ExecutionPlan builds this as it is created, and its topological order and the dependency tracker
+of the engines are views over it.
+'''
+
+from array import array
+from itertools import chain
+
+from toposort import CircularDependencyError
+
+from dagster import check
+from dagster.utils.toposort import toposort
+
+# The output id of inputs whose output is not produced by a step of the plan
+NO_OUTPUT = -1
+
+
+def _csr(rows):
+    '''The offsets and flattened ids of a list of lists of ids.'''
+    offsets = array('l', [0])
+    num_ids = 0
+    for row in rows:
+        num_ids += len(row)
+        offsets.append(num_ids)
+    return offsets, array('l', chain.from_iterable(rows))
+
+
+class CompactExecutionPlan(object):
+    __slots__ = (
+        'step_keys',
+        'step_ids',
+        'output_step_ids',
+        'output_names',
+        'output_offsets',
+        'input_offsets',
+        'input_output_ids',
+        'dep_offsets',
+        'dep_step_ids',
+        'dependent_offsets',
+        'dependent_step_ids',
+        'topological_order',
+        'topological_positions',
+        'level_offsets',
+    )
+
+    def __init__(self, steps):
+        check.list_param(steps, 'steps')
+
+        self.step_keys = [step.key for step in steps]
+        self.step_ids = {step_key: step_id for step_id, step_key in enumerate(self.step_keys)}
+
+        self.output_step_ids = array('l')
+        self.output_names = []
+        self.output_offsets = array('l', [0])
+        # Only used while packing the inputs, whose handles name outputs by step key and name
+        output_ids = {}
+        for step_id, step in enumerate(steps):
+            for step_output in step.step_outputs:
+                output_ids[(step.key, step_output.name)] = len(self.output_names)
+                self.output_step_ids.append(step_id)
+                self.output_names.append(step_output.name)
+            self.output_offsets.append(len(self.output_names))
+
+        input_rows = []
+        dep_rows = []
+        dependent_rows = [[] for _ in steps]
+        for step_id, step in enumerate(steps):
+            input_row = []
+            for step_input in step.step_inputs:
+                handle = step_input.prev_output_handle
+                input_row.append(output_ids.get((handle.step.key, handle.output_name), NO_OUTPUT))
+            dep_row = sorted(
+                set(
+                    self.output_step_ids[output_id]
+                    for output_id in input_row
+                    if output_id != NO_OUTPUT
+                )
+            )
+            for dep_step_id in dep_row:
+                dependent_rows[dep_step_id].append(step_id)
+            input_rows.append(input_row)
+            dep_rows.append(dep_row)
+
+        self.input_offsets, self.input_output_ids = _csr(input_rows)
+        self.dep_offsets, self.dep_step_ids = _csr(dep_rows)
+        self.dependent_offsets, self.dependent_step_ids = _csr(dependent_rows)
+
+        self._sort_topologically(dep_rows)
+
+    def _sort_topologically(self, dep_rows):
+        try:
+            levels = toposort({step_id: set(dep_row) for step_id, dep_row in enumerate(dep_rows)})
+        except CircularDependencyError as e:
+            raise CircularDependencyError(
+                {
+                    self.step_keys[step_id]: set(self.step_keys[dep_id] for dep_id in dep_ids)
+                    for step_id, dep_ids in e.data.items()
+                }
+            )
+
+        # The levels of dagster.utils.toposort over the step keys: the steps of a level are
+        # sorted by key rather than by id
+        self.topological_order = array('l')
+        self.level_offsets = array('l', [0])
+        for level in levels:
+            self.topological_order.extend(sorted(level, key=self.step_keys.__getitem__))
+            self.level_offsets.append(len(self.topological_order))
+
+        self.topological_positions = array('l', [0]) * len(self.step_keys)
+        for position, step_id in enumerate(self.topological_order):
+            self.topological_positions[step_id] = position
+
+    @property
+    def num_steps(self):
+        return len(self.step_keys)
+
+    @property
+    def num_outputs(self):
+        return len(self.output_names)
+
+    def num_deps_by_step_id(self):
+        '''A fresh array of the number of steps that every step depends on.'''
+        offsets = self.dep_offsets
+        return array('l', (offsets[i + 1] - offsets[i] for i in range(len(self.step_keys))))
+
+    def output_ids_of(self, step_id):
+        return range(self.output_offsets[step_id], self.output_offsets[step_id + 1])
+
+    def input_output_ids_of(self, step_id):
+        '''The ids of the outputs that the inputs of the step read, or NO_OUTPUT.'''
+        return self.input_output_ids[self.input_offsets[step_id] : self.input_offsets[step_id + 1]]
+
+    def deps_of(self, step_id):
+        return self.dep_step_ids[self.dep_offsets[step_id] : self.dep_offsets[step_id + 1]]
+
+    def dependents_of(self, step_id):
+        return self.dependent_step_ids[
+            self.dependent_offsets[step_id] : self.dependent_offsets[step_id + 1]
+        ]
+
+    def topological_levels(self):
+        '''The step ids of every level of the topological order.'''
+        return [
+            self.topological_order[self.level_offsets[i] : self.level_offsets[i + 1]]
+            for i in range(len(self.level_offsets) - 1)
+        ]
@@ -33,8 +33,12 @@ from .objects import (
     StepKind,
 )
 
+from .plan_cache import PLAN_CACHE
+
 from .plan_subset import ExecutionPlanSubsetInfo, ExecutionPlanAddedOutputs, OutputStepFactoryEntry
 
+from .run_storage import create_run_storage_added_outputs
+
 from .transform import create_transform_step
 
 
@@ -61,13 +65,105 @@ class PlanBuilder:
 
 
 def create_execution_plan_core(
-    pipeline_context, execution_metadata, subset_info=None, added_outputs=None
+    pipeline_context, execution_metadata, subset_info=None, added_outputs=None, targets=None
 ):
     check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
     check.inst_param(execution_metadata, 'execution_metadata', ExecutionMetadata)
     check.opt_inst_param(subset_info, 'subset_info', ExecutionPlanSubsetInfo)
     check.opt_inst_param(added_outputs, 'added_output', ExecutionPlanAddedOutputs)
+    check.opt_list_param(targets, 'targets', of_type=str)
+
+    execution_plan, step_output_map = PLAN_CACHE.get_or_create(
+        pipeline_context.pipeline_def,
+        pipeline_context.environment_config,
+        lambda: _create_full_execution_plan(pipeline_context),
+    )
+    if execution_plan.pipeline_def is not pipeline_context.pipeline_def:
+        # Cached for another definition of the same pipeline. Its steps are unchanged, so its
+        # compact form is reused rather than built again
+        execution_plan = execution_plan._replace(pipeline_def=pipeline_context.pipeline_def)
+
+    if targets is not None:
+        execution_plan = _prune_to_targets(
+            pipeline_context,
+            execution_plan,
+            _resolve_target_step_keys(pipeline_context, step_output_map, execution_plan, targets),
+        )
 
+    if pipeline_context.run_storage:
+        # Added before subsetting, so that subsets of the plan can include the marshal steps
+        execution_plan = _create_augmented_subplan(
+            pipeline_context,
+            execution_plan,
+            added_outputs=create_run_storage_added_outputs(pipeline_context, execution_plan.steps),
+        )
+
+    if subset_info or added_outputs:
+        execution_plan = _create_augmented_subplan(
+            pipeline_context, execution_plan, subset_info, added_outputs
+        )
+
+    if pipeline_context.environment_config.execution.fast_path:
+        validate_execution_plan(execution_plan)
+
+    return execution_plan
+
+
+def validate_execution_plan(execution_plan):
+    '''
+    Checks that every step of the plan is registered under its key, and that every step input
+    receives an output of a step in the plan. With execution: fast_path steps are executed
+    without checking the arguments of the calls made for every step, so plans are validated
+    once, as they are created, instead.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    for key, step in execution_plan.step_dict.items():
+        if step.key != key:
+            raise DagsterInvariantViolationError(
+                'Step {step_key} is registered under key {key} in the execution plan.'.format(
+                    step_key=step.key, key=key
+                )
+            )
+
+        upstream_keys = set()
+        for step_input in step.step_inputs:
+            prev_output_handle = step_input.prev_output_handle
+            upstream_key = prev_output_handle.step.key
+            if not execution_plan.has_step(upstream_key):
+                raise DagsterInvariantViolationError(
+                    (
+                        'Input {input_name} of step {step_key} receives an output of step '
+                        '{upstream_key}, which is not in the execution plan.'
+                    ).format(input_name=step_input.name, step_key=key, upstream_key=upstream_key)
+                )
+            if not execution_plan.get_step_by_key(upstream_key).has_step_output(
+                prev_output_handle.output_name
+            ):
+                raise DagsterInvariantViolationError(
+                    (
+                        'Input {input_name} of step {step_key} receives output {output_name} of '
+                        'step {upstream_key}, which has no such output.'
+                    ).format(
+                        input_name=step_input.name,
+                        step_key=key,
+                        output_name=prev_output_handle.output_name,
+                        upstream_key=upstream_key,
+                    )
+                )
+            upstream_keys.add(upstream_key)
+
+        if execution_plan.deps.get(key) != upstream_keys:
+            raise DagsterInvariantViolationError(
+                'The dependencies of step {step_key} in the execution plan do not match the '
+                'steps its inputs receive outputs of.'.format(step_key=key)
+            )
+
+    return execution_plan
+
+
+def _create_full_execution_plan(pipeline_context):
+    '''The plan of every step of the pipeline, along with the map of its solid outputs.'''
     plan_builder = PlanBuilder()
 
     for solid in solids_in_topological_order(pipeline_context.pipeline_def):
@@ -87,14 +183,10 @@ def create_execution_plan_core(
             output_handle = solid.output_handle(output_def.name)
             plan_builder.step_output_map[output_handle] = subplan.terminal_step_output_handle
 
-    execution_plan = create_execution_plan_from_steps(pipeline_context, plan_builder.steps)
-
-    if subset_info or added_outputs:
-        return _create_augmented_subplan(
-            pipeline_context, execution_plan, subset_info, added_outputs
-        )
-    else:
-        return execution_plan
+    return (
+        create_execution_plan_from_steps(pipeline_context, plan_builder.steps),
+        plan_builder.step_output_map,
+    )
 
 
 def create_execution_plan_from_steps(pipeline_context, steps):
@@ -121,13 +213,84 @@ def create_execution_plan_from_steps(pipeline_context, steps):
     return ExecutionPlan(pipeline_context.pipeline_def, step_dict, deps)
 
 
+def _resolve_target_step_keys(pipeline_context, step_output_map, execution_plan, targets):
+    '''
+    The keys of the steps that produce the outputs named by targets, after their expectations,
+    along with the keys of every materialization step, as materializations are requested by
+    the environment.
+    '''
+    pipeline_def = pipeline_context.pipeline_def
+
+    target_step_keys = set(
+        step.key for step in execution_plan.steps if step.kind == StepKind.MATERIALIZATION_THUNK
+    )
+
+    for target in targets:
+        solid_name, _, output_name = target.partition('.')
+
+        if not pipeline_def.has_solid(solid_name):
+            raise DagsterInvariantViolationError(
+                'Target {target} of pipeline {pipeline_name} names solid {solid_name}, which '
+                'does not exist.'.format(
+                    target=target, pipeline_name=pipeline_def.name, solid_name=solid_name
+                )
+            )
+
+        solid = pipeline_def.solid_named(solid_name)
+
+        if output_name and not solid.has_output(output_name):
+            raise DagsterInvariantViolationError(
+                'Target {target} of pipeline {pipeline_name} names output {output_name}, which '
+                'solid {solid_name} does not have.'.format(
+                    target=target,
+                    pipeline_name=pipeline_def.name,
+                    output_name=output_name,
+                    solid_name=solid_name,
+                )
+            )
+
+        output_names = [output_name] if output_name else [o.name for o in solid.output_defs]
+        for name in output_names:
+            step_output_handle = step_output_map[solid.output_handle(name)]
+            target_step_keys.add(step_output_handle.step.key)
+
+    return target_step_keys
+
+
+def _prune_to_targets(pipeline_context, execution_plan, target_step_keys):
+    '''
+    Drops every step of the plan that no target step depends on, walking the dependencies of
+    the plan backward from the target steps.
+    '''
+    needed_step_keys = set()
+    pending_step_keys = list(target_step_keys)
+
+    while pending_step_keys:
+        step_key = pending_step_keys.pop()
+        if step_key in needed_step_keys:
+            continue
+
+        needed_step_keys.add(step_key)
+        pending_step_keys.extend(execution_plan.deps[step_key])
+
+    return create_execution_plan_from_steps(
+        pipeline_context,
+        [step for step in execution_plan.steps if step.key in needed_step_keys],
+    )
+
+
 def create_subplan_for_input(pipeline_context, solid, prev_step_output_handle, input_def):
     check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
     check.inst_param(solid, 'solid', Solid)
     check.inst_param(prev_step_output_handle, 'prev_step_output_handle', StepOutputHandle)
     check.inst_param(input_def, 'input_def', InputDefinition)
 
-    if pipeline_context.environment_config.expectations.evaluate and input_def.expectations:
+    # The expectations of streaming inputs are evaluated on every chunk as it is consumed
+    if (
+        pipeline_context.environment_config.expectations.evaluate
+        and input_def.expectations
+        and not input_def.is_streaming
+    ):
         return create_expectations_subplan(
             pipeline_context,
             solid,
@@ -0,0 +1,61 @@
+import heapq
+
+from dagster import check
+
+from .objects import ExecutionPlan
+
+
+class StepDependencyTracker(object):
+    '''
+    Tracks, for every step of an execution plan, the upstream steps that have not yet
+    completed. Engines that do not execute the plan level by level use this to find
+    the steps that are ready to run as soon as their dependencies complete.
+
+    Ready steps are handed out in topological order so that execution order is
+    deterministic when steps complete one at a time.
+
+    Steps are tracked by their ids in the compact form of the plan: the count of pending
+    dependencies of every step is kept in an array, and the ready steps in a heap of their
+    positions in the topological order.
+    '''
+
+    def __init__(self, execution_plan):
+        self.execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        self._compact = execution_plan.compact
+        self._pending_counts = self._compact.num_deps_by_step_id()
+        self._completed = bytearray(self._compact.num_steps)
+
+        self._ready_positions = [
+            position
+            for position, step_id in enumerate(self._compact.topological_order)
+            if not self._pending_counts[step_id]
+        ]
+        heapq.heapify(self._ready_positions)
+
+    def has_ready_steps(self):
+        return bool(self._ready_positions)
+
+    def pop_ready_step(self):
+        check.invariant(self._ready_positions, 'No steps are ready for execution')
+        position = heapq.heappop(self._ready_positions)
+        return self.execution_plan.steps[self._compact.topological_order[position]]
+
+    def mark_complete(self, step_key):
+        '''
+        Record that the step has completed, whether it succeeded, failed or was skipped,
+        making any step whose upstream steps have now all completed ready.
+        '''
+        check.str_param(step_key, 'step_key')
+
+        step_id = self._compact.step_ids.get(step_key)
+        if step_id is None or self._completed[step_id]:
+            return
+        self._completed[step_id] = 1
+
+        for dependent_step_id in self._compact.dependents_of(step_id):
+            self._pending_counts[dependent_step_id] -= 1
+            if not self._pending_counts[dependent_step_id]:
+                heapq.heappush(
+                    self._ready_positions, self._compact.topological_positions[dependent_step_id]
+                )
@@ -1,3 +1,5 @@
+import logging
+
 from dagster import check
 
 from dagster.core.execution_context import StepExecutionContext, PipelineExecutionContext
@@ -33,19 +35,18 @@ def _create_expectation_lambda(solid, inout_def, expectation_def, internal_outpu
         value = inputs[EXPECTATION_INPUT]
         expectation_context = step_context.for_expectation(inout_def, expectation_def)
         expt_result = expectation_def.expectation_fn(step_context, value)
-        if expt_result.success:
+        if expectation_context.log.is_enabled_for(logging.DEBUG):
             expectation_context.log.debug(
-                'Expectation {key} succeeded on {value}.'.format(
-                    key=step_context.step.key, value=value
+                'Expectation {key} {outcome} on {value}.'.format(
+                    key=step_context.step.key,
+                    outcome='succeeded' if expt_result.success else 'failed',
+                    value=inout_def.runtime_type.value_summarizer.summarize_value(value),
                 )
             )
+
+        if expt_result.success:
             yield StepOutputValue(output_name=internal_output_name, value=inputs[EXPECTATION_INPUT])
         else:
-            expectation_context.log.debug(
-                'Expectation {key} failed on {value}.'.format(
-                    key=step_context.step.key, value=value
-                )
-            )
             raise DagsterExpectationFailedError(expectation_context, value)
 
     return _do_expectation
@@ -124,7 +125,12 @@ def decorate_with_expectations(pipeline_context, solid, transform_step, output_d
     check.inst_param(transform_step, 'transform_step', ExecutionStep)
     check.inst_param(output_def, 'output_def', OutputDefinition)
 
-    if pipeline_context.environment_config.expectations.evaluate and output_def.expectations:
+    # The expectations of streaming outputs are evaluated on every chunk as it is produced
+    if (
+        pipeline_context.environment_config.expectations.evaluate
+        and output_def.expectations
+        and not output_def.is_streaming
+    ):
         return create_expectations_subplan(
             pipeline_context,
             solid,
@@ -0,0 +1,175 @@
+'''
+Intermediate stores hold the values of the outputs of execution steps.
+
+The step events of an execution carry an IntermediateHandle rather than the value itself, and
+the value is only resolved when a downstream step or a SolidExecutionResult needs it. With the
+in memory store, which is the default, handles simply reference the value. With the filesystem
+and mmap stores every output is serialized through the SerializationStrategy of its runtime
+type as soon as it is emitted, and is deserialized again whenever its handle is resolved, so
+only the values of the steps currently executing are kept in memory. The files are compressed
+if execution: compression is configured.
+
+The default directory of the filesystem and mmap stores, named after the run id, is removed once
+the pipeline context of the run exits and the handles in the result of the pipeline are no
+longer referenced, unless keep is configured, as for runs that are inspected afterwards. A
+directory that is configured explicitly is never removed.
+'''
+
+from abc import ABCMeta, abstractmethod
+from collections import namedtuple
+import atexit
+import mmap
+import os
+import shutil
+import tempfile
+import weakref
+
+import six
+
+from dagster import check
+from dagster.core.types.compression import Compression
+from dagster.core.types.marshal import (
+    SerializationStrategy,
+    deserialize_from_file,
+    deserialize_from_file_obj,
+    serialize_to_file,
+)
+from dagster.core.types.runtime import RuntimeType
+from dagster.core.types.summary import ValueSummarizer
+from dagster.utils import mkdir_p
+
+
+def default_intermediate_store_directory(run_id):
+    check.str_param(run_id, 'run_id')
+    return os.path.join(tempfile.gettempdir(), 'dagster-intermediates', run_id)
+
+
+class TemporaryIntermediatesDirectory(object):
+    '''
+    A directory of intermediate values that is removed once nothing references it: neither the
+    store or engine of the run that writes to it, which release it when the run ends, nor the
+    handles to the values in it, such as those kept in a PipelineExecutionResult. Directories
+    that are still referenced when the interpreter exits are removed then.
+    '''
+
+    def __init__(self, path):
+        self.path = check.str_param(path, 'path')
+        if hasattr(weakref, 'finalize'):
+            weakref.finalize(self, shutil.rmtree, path, True)
+        else:  # Python 2
+            atexit.register(shutil.rmtree, path, True)
+
+
+@six.add_metaclass(ABCMeta)
+class IntermediateHandle:
+    @abstractmethod
+    def get_value(self):
+        '''Resolve the value this handle refers to.'''
+
+    @abstractmethod
+    def summarize_value(self, value_summarizer):
+        '''Describe the value for logging, without resolving it if that is expensive.'''
+
+
+class InMemoryIntermediateHandle(
+    namedtuple('_InMemoryIntermediateHandle', 'value'), IntermediateHandle
+):
+    def get_value(self):
+        return self.value
+
+    def summarize_value(self, value_summarizer):
+        check.inst_param(value_summarizer, 'value_summarizer', ValueSummarizer)
+        return value_summarizer.summarize_value(self.value)
+
+
+class FileIntermediateHandle(
+    namedtuple('_FileIntermediateHandle', 'path serialization_strategy directory'),
+    IntermediateHandle,
+):
+    def __new__(cls, path, serialization_strategy, directory=None):
+        return super(FileIntermediateHandle, cls).__new__(
+            cls,
+            check.str_param(path, 'path'),
+            check.inst_param(
+                serialization_strategy, 'serialization_strategy', SerializationStrategy
+            ),
+            # Only referenced so that the directory is not removed while the handle is in use
+            check.opt_inst_param(directory, 'directory', TemporaryIntermediatesDirectory),
+        )
+
+    def get_value(self):
+        return deserialize_from_file(self.serialization_strategy, self.path)
+
+    def summarize_value(self, _value_summarizer):
+        return '<value stored in {path}>'.format(path=self.path)
+
+
+class MmapIntermediateHandle(FileIntermediateHandle):
+    def get_value(self):
+        with open(self.path, 'rb') as read_obj:
+            if not os.fstat(read_obj.fileno()).st_size:
+                # Empty files cannot be mapped
+                return deserialize_from_file_obj(self.serialization_strategy, read_obj)
+
+            # The map is not closed explicitly, so that values which reference its buffer
+            # keep it alive
+            mapped = mmap.mmap(read_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return deserialize_from_file_obj(self.serialization_strategy, mapped)
+
+
+@six.add_metaclass(ABCMeta)
+class IntermediateStore:
+    @abstractmethod
+    def set_value(self, key, runtime_type, value):
+        '''Store the value of an output under key, returning an IntermediateHandle to it.'''
+
+    def release(self):
+        '''Called when the pipeline context of the run exits.'''
+
+
+class InMemoryIntermediateStore(IntermediateStore):
+    def set_value(self, key, runtime_type, value):
+        check.str_param(key, 'key')
+        check.inst_param(runtime_type, 'runtime_type', RuntimeType)
+        return InMemoryIntermediateHandle(value)
+
+
+class FilesystemIntermediateStore(IntermediateStore):
+    handle_cls = FileIntermediateHandle
+
+    def __init__(self, directory, compression=None, temporary=False):
+        '''
+        A temporary directory is removed once the store is released and no handle to the values
+        in it is referenced anymore.
+        '''
+        self.directory = check.str_param(directory, 'directory')
+        self.compression = check.opt_inst_param(compression, 'compression', Compression)
+        self._temporary_directory = (
+            TemporaryIntermediatesDirectory(directory)
+            if check.bool_param(temporary, 'temporary')
+            else None
+        )
+
+    def set_value(self, key, runtime_type, value):
+        check.str_param(key, 'key')
+        check.inst_param(runtime_type, 'runtime_type', RuntimeType)
+
+        mkdir_p(self.directory)
+        path = os.path.join(self.directory, key)
+        serialize_to_file(runtime_type.serialization_strategy, value, path, self.compression)
+        return self.handle_cls(
+            path, runtime_type.serialization_strategy, directory=self._temporary_directory
+        )
+
+    def release(self):
+        self._temporary_directory = None
+
+
+class MmapIntermediateStore(FilesystemIntermediateStore):
+    '''
+    Stores values in files like the filesystem store, but memory maps the files to read them,
+    so that serialization strategies can return values backed by the page cache.
+    '''
+
+    handle_cls = MmapIntermediateHandle
@@ -1,6 +1,7 @@
 from dagster import check
 
 from dagster.core.definitions import Solid, OutputDefinition
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution_context import PipelineExecutionContext
 
 from dagster.core.types.runtime import RuntimeType
@@ -52,9 +53,19 @@ def decorate_with_output_materializations(pipeline_context, solid, output_def, s
     if not (solid_config and solid_config.outputs):
         return subplan
 
+    output_specs = list(configs_for_output(solid, solid_config, output_def))
+
+    if output_specs and output_def.is_streaming:
+        raise DagsterInvariantViolationError(
+            (
+                'Solid {solid_name} output {output_name} is streaming, so it cannot be '
+                'materialized from config. Its chunks can only be consumed by a streaming input.'
+            ).format(solid_name=solid.name, output_name=output_def.name)
+        )
+
     new_steps = []
 
-    for mat_count, output_spec in enumerate(configs_for_output(solid, solid_config, output_def)):
+    for mat_count, output_spec in enumerate(output_specs):
         new_steps.append(
             ExecutionStep(
                 pipeline_context=pipeline_context,
@@ -0,0 +1,445 @@
+'''
+An execution engine that runs the steps of an execution plan in a pool of worker processes.
+
+Each step is executed in a worker with execute_marshalling: the worker builds a subset plan
+containing just that step, unmarshals its inputs from the outputs that upstream workers
+persisted, and marshals its own outputs for downstream workers. Intermediate values
+therefore move between workers through the PersistenceStrategy and the
+SerializationStrategy of their runtime types rather than through the parent process. This
+sidesteps the GIL for CPU-bound solids.
+
+Workers are forked from the parent so that the pipeline definition, which generally
+cannot be pickled, is inherited rather than sent to them. As every step is executed
+through execute_marshalling, every step of the plan must be addressable by key in the
+full execution plan of the pipeline. The exception are the steps that subset plans inject to
+provide the values of inputs, which are executed in the parent process instead.
+
+The parent process does not deserialize the outputs that workers persist. The step events it
+yields carry handles to their files, which are only read when a value is asked for, as by
+SolidExecutionResult.transformed_value. The files are removed with their directory once the run
+has ended and no handle to them is referenced anymore.
+
+A worker that dies while it executes a step, for instance when it is killed for running out
+of memory, takes the task of the step with it, and the pool never reports on the task. Workers
+report their pid when they start a step, and whenever no step completed for
+WORKER_LIVENESS_CHECK_SECONDS the steps of the workers that are gone are failed.
+'''
+
+from collections import namedtuple
+import multiprocessing
+import os
+import sys
+import tempfile
+
+import six
+from six.moves import queue
+
+from dagster import check
+from dagster.utils import merge_dicts
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+from dagster.core.errors import DagsterInvariantViolationError, DagsterSubprocessExecutionError
+from dagster.core.execution_context import ExecutionMetadata, PipelineExecutionContext
+
+from .dependency_tracker import StepDependencyTracker
+from .intermediate_store import FileIntermediateHandle, TemporaryIntermediatesDirectory
+from .objects import (
+    ExecutionPlan,
+    ExecutionStepEvent,
+    StepFailureData,
+    StepKind,
+    StepOutputHandle,
+    StepSuccessData,
+)
+from .plan_subset import MarshalledOutput
+from .simple_engine import (
+    all_inputs_covered,
+    compute_consumer_counts,
+    iterate_step_events_for_step,
+    log_inputs_not_covered,
+    release_consumed_inputs,
+)
+from .streaming import has_streaming_outputs
+
+WORKER_LIVENESS_CHECK_SECONDS = 1.0
+
+
+def default_max_workers():
+    return multiprocessing.cpu_count()
+
+
+def _get_fork_context():
+    # Workers must be forked so that they inherit the pipeline definition. Older versions
+    # of python are stuck with the default, which is fork on Unix-like platforms.
+    if hasattr(multiprocessing, 'get_context'):
+        return multiprocessing.get_context('fork')
+    return multiprocessing
+
+
+def _create_started_queue(context):
+    # Written to synchronously, so that a worker that dies right after starting a step has
+    # reported it
+    if hasattr(context, 'SimpleQueue'):
+        return context.SimpleQueue()
+
+    from multiprocessing.queues import SimpleQueue  # Python 2
+
+    return SimpleQueue()
+
+
+class _StepOutputMessage(namedtuple('_StepOutputMessage', 'output_name')):
+    pass
+
+
+class _StepFailureMessage(namedtuple('_StepFailureMessage', 'error_info')):
+    pass
+
+
+class _WorkerResult(namedtuple('_WorkerResult', 'step_key messages framework_error_info')):
+    pass
+
+
+# Set by _initialize_worker in each forked worker process
+_WORKER_STATE = {}
+
+
+def _initialize_worker(pipeline_def, environment_dict, execution_metadata, started_queue):
+    _WORKER_STATE['pipeline_def'] = pipeline_def
+    _WORKER_STATE['environment_dict'] = environment_dict
+    _WORKER_STATE['execution_metadata'] = execution_metadata
+    _WORKER_STATE['started_queue'] = started_queue
+
+
+def _error_info_for_dagster_error(dagster_error):
+    if dagster_error.is_user_code_error and dagster_error.original_exc_info:
+        return serializable_error_info_from_exc_info(dagster_error.original_exc_info)
+    return serializable_error_info_from_exc_info((type(dagster_error), dagster_error, None))
+
+
+def _execute_step_in_worker(step_key, inputs_to_marshal, outputs_to_marshal):
+    # circular dep
+    from dagster.core.execution import execute_marshalling
+
+    _WORKER_STATE['started_queue'].put((step_key, os.getpid()))
+
+    try:
+        step_events = execute_marshalling(
+            _WORKER_STATE['pipeline_def'],
+            [step_key],
+            inputs_to_marshal={step_key: inputs_to_marshal},
+            outputs_to_marshal={step_key: outputs_to_marshal},
+            environment_dict=_WORKER_STATE['environment_dict'],
+            execution_metadata=_WORKER_STATE['execution_metadata'],
+            throw_on_user_error=False,
+        )
+    except:  # pylint: disable=W0702
+        return _WorkerResult(step_key, [], serializable_error_info_from_exc_info(sys.exc_info()))
+
+    messages = []
+    for step_event in step_events:
+        if step_event.is_step_failure:
+            # Failures of the injected marshalling steps are reported as failures of the
+            # step itself
+            messages.append(
+                _StepFailureMessage(
+                    _error_info_for_dagster_error(step_event.failure_data.dagster_error)
+                )
+            )
+        elif step_event.step.key == step_key:
+            messages.append(_StepOutputMessage(step_event.success_data.output_name))
+
+    return _WorkerResult(step_key, messages, None)
+
+
+# Injected into subset plans, so not addressable in the plans that workers build
+_INJECTED_STEP_KINDS = set([StepKind.UNMARSHAL_INPUT, StepKind.VALUE_THUNK])
+
+
+def _execute_injected_step(pipeline_context, step, outputs_to_marshal):
+    # These steps have no inputs and only provide a value, so they are cheap to execute here
+    check.invariant(not step.step_inputs)
+
+    messages = []
+    for step_event in iterate_step_events_for_step(pipeline_context.for_step(step), {}):
+        if step_event.is_step_failure:
+            messages.append(
+                _StepFailureMessage(
+                    _error_info_for_dagster_error(step_event.failure_data.dagster_error)
+                )
+            )
+            continue
+
+        output_name = step_event.success_data.output_name
+        (marshalled_output,) = [
+            marshalled_output
+            for marshalled_output in outputs_to_marshal
+            if marshalled_output.output_name == output_name
+        ]
+        pipeline_context.persistence_strategy.write_value(
+            step.step_output_named(output_name).runtime_type.serialization_strategy,
+            marshalled_output.marshalling_key,
+            step_event.success_data.value,
+        )
+        messages.append(_StepOutputMessage(output_name))
+
+    return _WorkerResult(step.key, messages, None)
+
+
+def _in_process_environment_dict(environment_dict):
+    # Each worker executes its step in process, otherwise it would start its own pool. Outputs
+    # move between workers through the persistence strategy, so workers keep them in memory
+    # rather than in the intermediates directory of the run, which they would remove as they exit
+    execution = merge_dicts(
+        dict(environment_dict.get('execution') or {}),
+        {'engine': {'in_process': {}}, 'intermediate_store': {'in_memory': {}}},
+    )
+    return merge_dicts(dict(environment_dict), {'execution': execution})
+
+
+def _marshalling_key(intermediates_dir, step_key, output_name):
+    return os.path.join(
+        intermediates_dir,
+        '{step_key}.{output_name}'.format(step_key=step_key, output_name=output_name),
+    )
+
+
+def iterate_step_events_for_execution_plan_multiprocess(
+    pipeline_context, execution_metadata, execution_plan, throw_on_user_error, max_workers=None
+):
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.inst_param(execution_metadata, 'execution_metadata', ExecutionMetadata)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.bool_param(throw_on_user_error, 'throw_on_user_error')
+    check.opt_int_param(max_workers, 'max_workers')
+    if max_workers is None:
+        max_workers = default_max_workers()
+    check.param_invariant(max_workers > 0, 'max_workers', 'Must have at least one worker')
+
+    steps = execution_plan.topological_steps()
+    if not steps:
+        return
+
+    for step in steps:
+        if has_streaming_outputs(step):
+            raise DagsterInvariantViolationError(
+                (
+                    'Step {key} has a streaming output. Streams cannot be passed between '
+                    'processes, so pipelines with streaming outputs cannot be executed with the '
+                    'multiprocess engine.'
+                ).format(key=step.key)
+            )
+
+    tracker = StepDependencyTracker(execution_plan)
+    consumer_counts = compute_consumer_counts(execution_plan)
+    all_results = {}
+
+    intermediates_directory = TemporaryIntermediatesDirectory(
+        tempfile.mkdtemp(prefix='dagster-{run_id}-'.format(run_id=pipeline_context.run_id))
+    )
+    intermediates_dir = intermediates_directory.path
+
+    fork_context = _get_fork_context()
+    result_queue = queue.Queue()
+    started_queue = _create_started_queue(fork_context)
+    pool = fork_context.Pool(
+        processes=min(max_workers, len(steps)),
+        initializer=_initialize_worker,
+        initargs=(
+            pipeline_context.pipeline_def,
+            _in_process_environment_dict(pipeline_context.environment_dict),
+            execution_metadata,
+            started_queue,
+        ),
+    )
+
+    pipeline_context.log.debug(
+        'Executing {num_steps} steps with {num_workers} worker processes. Intermediates are '
+        'persisted in {intermediates_dir}'.format(
+            num_steps=len(steps),
+            num_workers=min(max_workers, len(steps)),
+            intermediates_dir=intermediates_dir,
+        )
+    )
+
+    # The pid of the worker executing each step that has started and not completed
+    worker_pids = {}
+    completed_step_keys = set()
+
+    def _apply_async_kwargs(step_key):
+        if six.PY2:
+            return {'callback': result_queue.put}
+
+        def _error_callback(exc):
+            # Called when the result of the task could not be sent back to the parent process
+            result_queue.put(
+                _WorkerResult(
+                    step_key,
+                    [
+                        _StepFailureMessage(
+                            serializable_error_info_from_exc_info(
+                                (type(exc), exc, getattr(exc, '__traceback__', None))
+                            )
+                        )
+                    ],
+                    None,
+                )
+            )
+
+        return {'callback': result_queue.put, 'error_callback': _error_callback}
+
+    def _dispatch_ready_steps():
+        submitted = 0
+        while tracker.has_ready_steps():
+            step = tracker.pop_ready_step()
+
+            if not all_inputs_covered(step, all_results):
+                log_inputs_not_covered(pipeline_context.for_step(step), all_results)
+                release_consumed_inputs(step, consumer_counts, all_results)
+                tracker.mark_complete(step.key)
+                continue
+
+            inputs_to_marshal = {
+                step_input.name: _marshalling_key(
+                    intermediates_dir,
+                    step_input.prev_output_handle.step.key,
+                    step_input.prev_output_handle.output_name,
+                )
+                for step_input in step.step_inputs
+            }
+            outputs_to_marshal = [
+                MarshalledOutput(
+                    step_output.name,
+                    _marshalling_key(intermediates_dir, step.key, step_output.name),
+                )
+                for step_output in step.step_outputs
+            ]
+
+            if step.kind in _INJECTED_STEP_KINDS:
+                result_queue.put(_execute_injected_step(pipeline_context, step, outputs_to_marshal))
+            else:
+                pool.apply_async(
+                    _execute_step_in_worker,
+                    (step.key, inputs_to_marshal, outputs_to_marshal),
+                    **_apply_async_kwargs(step.key)
+                )
+            submitted += 1
+
+        return submitted
+
+    def _results_of_dead_workers():
+        while not started_queue.empty():
+            step_key, pid = started_queue.get()
+            if step_key not in completed_step_keys:
+                worker_pids[step_key] = pid
+
+        live_pids = set(
+            process.pid
+            for process in pool._pool  # pylint: disable=W0212
+            if process.exitcode is None
+        )
+        return [
+            _WorkerResult(
+                step_key,
+                [
+                    _StepFailureMessage(
+                        SerializableErrorInfo(
+                            'Worker process {pid} executing step {step_key} exited '
+                            'unexpectedly'.format(pid=pid, step_key=step_key),
+                            [],
+                        )
+                    )
+                ],
+                None,
+            )
+            for step_key, pid in sorted(worker_pids.items())
+            if pid not in live_pids
+        ]
+
+    completed = False
+    worker_died = False
+    try:
+        in_flight = _dispatch_ready_steps()
+
+        while in_flight:
+            try:
+                worker_results = [result_queue.get(timeout=WORKER_LIVENESS_CHECK_SECONDS)]
+            except queue.Empty:
+                worker_results = _results_of_dead_workers()
+                worker_died = worker_died or bool(worker_results)
+
+            for worker_result in worker_results:
+                if worker_result.step_key in completed_step_keys:
+                    # Already failed as its worker died
+                    continue
+                completed_step_keys.add(worker_result.step_key)
+                worker_pids.pop(worker_result.step_key, None)
+                in_flight -= 1
+
+                if worker_result.framework_error_info:
+                    raise DagsterSubprocessExecutionError(
+                        'Error executing step {step_key} in worker process: {message}'.format(
+                            step_key=worker_result.step_key,
+                            message=worker_result.framework_error_info.message,
+                        ),
+                        error_info=worker_result.framework_error_info,
+                    )
+
+                step = execution_plan.get_step_by_key(worker_result.step_key)
+
+                for message in worker_result.messages:
+                    step_event = _create_step_event_from_message(
+                        intermediates_directory, step, message
+                    )
+
+                    if throw_on_user_error and step_event.is_step_failure:
+                        step_event.reraise_user_error()
+
+                    yield step_event
+
+                    if step_event.is_successful_output:
+                        output_handle = StepOutputHandle(step, step_event.success_data.output_name)
+                        if consumer_counts[output_handle]:
+                            all_results[output_handle] = step_event
+
+                release_consumed_inputs(step, consumer_counts, all_results)
+                tracker.mark_complete(worker_result.step_key)
+                in_flight += _dispatch_ready_steps()
+
+        completed = True
+    finally:
+        # The pool waits on the tasks lost with a dead worker when it is closed
+        if completed and not worker_died:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+
+
+def _create_step_event_from_message(intermediates_directory, step, message):
+    if isinstance(message, _StepFailureMessage):
+        return ExecutionStepEvent.step_failure_event(
+            step=step,
+            failure_data=StepFailureData(
+                dagster_error=DagsterSubprocessExecutionError(
+                    'Error occured during step {step_key} in worker process: {message}'.format(
+                        step_key=step.key, message=message.error_info.message
+                    ),
+                    error_info=check.inst(message.error_info, SerializableErrorInfo),
+                )
+            ),
+        )
+
+    check.inst(message, _StepOutputMessage)
+
+    step_output = step.step_output_named(message.output_name)
+    return ExecutionStepEvent.step_output_event(
+        step=step,
+        success_data=StepSuccessData(
+            output_name=message.output_name,
+            intermediate_handle=FileIntermediateHandle(
+                _marshalling_key(intermediates_directory.path, step.key, message.output_name),
+                step_output.runtime_type.serialization_strategy,
+                directory=intermediates_directory,
+            ),
+        ),
+    )
@@ -0,0 +1,166 @@
+'''
+An execution engine that runs the steps of an execution plan on a bounded pool of
+worker threads.
+
+Rather than executing the plan level by level, the engine tracks the outstanding
+upstream steps of every step and dispatches a step to the pool as soon as all of the
+steps it depends on have completed. All step events are funneled back to the calling
+thread, so consumers see the same iterator contract as the in-process engine. This is
+best suited to I/O-bound pipelines, as solids that hold the GIL will not run in parallel.
+'''
+
+from collections import namedtuple
+import multiprocessing
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+from dagster import check
+
+from dagster.core.execution_context import PipelineExecutionContext
+
+from .dependency_tracker import StepDependencyTracker
+from .objects import ExecutionPlan, ExecutionStepEvent, ExecutionStepEventType, StepOutputHandle
+from .simple_engine import (
+    all_inputs_covered,
+    compute_consumer_counts,
+    create_input_values,
+    iterate_step_events_for_step,
+    log_inputs_not_covered,
+    release_consumed_inputs,
+)
+
+
+def default_max_workers():
+    # Mirrors the default of concurrent.futures.ThreadPoolExecutor in python 3.8+. Steps
+    # are expected to be I/O bound so we oversubscribe the cores.
+    return min(32, multiprocessing.cpu_count() + 4)
+
+
+class _StepDone(namedtuple('_StepDone', 'step_key')):
+    pass
+
+
+class _WorkerFailure(namedtuple('_WorkerFailure', 'step_key exc_info')):
+    pass
+
+
+def _execute_steps_in_worker(work_queue, event_queue, shutdown):
+    while True:
+        work = work_queue.get()
+        if work is None or shutdown.is_set():
+            return
+
+        step_context, input_values = work
+        try:
+            for step_event in iterate_step_events_for_step(step_context, input_values):
+                event_queue.put(step_event)
+        except Exception:  # pylint: disable=W0703
+            # Errors in user code are captured as step failures by iterate_step_events_for_step.
+            # Anything that makes it here is a framework error that must surface in the
+            # calling thread.
+            event_queue.put(_WorkerFailure(step_context.step.key, sys.exc_info()))
+
+        event_queue.put(_StepDone(step_context.step.key))
+
+
+def iterate_step_events_for_execution_plan_multithread(
+    pipeline_context, execution_plan, throw_on_user_error, max_workers=None
+):
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.bool_param(throw_on_user_error, 'throw_on_user_error')
+    check.opt_int_param(max_workers, 'max_workers')
+    if max_workers is None:
+        max_workers = default_max_workers()
+    check.param_invariant(max_workers > 0, 'max_workers', 'Must have at least one worker')
+
+    steps = execution_plan.topological_steps()
+    if not steps:
+        return
+
+    tracker = StepDependencyTracker(execution_plan)
+    consumer_counts = compute_consumer_counts(execution_plan)
+    all_results = {}
+
+    work_queue = queue.Queue()
+    event_queue = queue.Queue()
+    shutdown = threading.Event()
+
+    workers = []
+    for _ in range(min(max_workers, len(steps))):
+        worker = threading.Thread(
+            target=_execute_steps_in_worker, args=(work_queue, event_queue, shutdown)
+        )
+        worker.daemon = True
+        worker.start()
+        workers.append(worker)
+
+    pipeline_context.log.debug(
+        'Executing {num_steps} steps with {num_workers} worker threads'.format(
+            num_steps=len(steps), num_workers=len(workers)
+        )
+    )
+
+    def _dispatch_ready_steps():
+        '''
+        Submit ready steps to the worker pool. Steps whose inputs were not all emitted
+        upstream (e.g. because of a failure or an unfired optional output) are skipped,
+        which in turn may make their own dependents ready. Returns the number of submitted
+        steps.
+        '''
+        submitted = 0
+        while tracker.has_ready_steps():
+            step = tracker.pop_ready_step()
+            step_context = pipeline_context.for_step(step)
+
+            if not all_inputs_covered(step, all_results):
+                log_inputs_not_covered(step_context, all_results)
+                release_consumed_inputs(step, consumer_counts, all_results)
+                tracker.mark_complete(step.key)
+                continue
+
+            work_queue.put((step_context, create_input_values(step, all_results)))
+            submitted += 1
+
+        return submitted
+
+    try:
+        in_flight = _dispatch_ready_steps()
+
+        while in_flight:
+            item = event_queue.get()
+
+            if isinstance(item, _WorkerFailure):
+                six.reraise(*item.exc_info)
+
+            if isinstance(item, _StepDone):
+                in_flight -= 1
+                release_consumed_inputs(
+                    execution_plan.get_step_by_key(item.step_key), consumer_counts, all_results
+                )
+                tracker.mark_complete(item.step_key)
+                in_flight += _dispatch_ready_steps()
+                continue
+
+            step_event = check.inst(item, ExecutionStepEvent)
+
+            if throw_on_user_error and step_event.is_step_failure:
+                step_event.reraise_user_error()
+
+            yield step_event
+
+            if step_event.event_type == ExecutionStepEventType.STEP_OUTPUT:
+                output_handle = StepOutputHandle(
+                    step_event.step, step_event.success_data.output_name
+                )
+                if consumer_counts[output_handle]:
+                    all_results[output_handle] = step_event
+    finally:
+        shutdown.set()
+        for _ in workers:
+            work_queue.put(None)
+        for worker in workers:
+            worker.join()
@@ -1,17 +1,18 @@
 from collections import namedtuple
 from enum import Enum
 
-import toposort
 import six
 
 from dagster import check
-from dagster.utils import merge_dicts
 from dagster.core.execution_context import PipelineExecutionContext
 from dagster.core.definitions import Solid, PipelineDefinition
 
 from dagster.core.errors import DagsterError
 from dagster.core.types.runtime import RuntimeType
 
+from .compact_plan import CompactExecutionPlan
+from .intermediate_store import InMemoryIntermediateHandle, IntermediateHandle
+
 
 class StepOutputValue(namedtuple('_StepOutputValue', 'output_name value')):
     def __new__(cls, output_name, value):
@@ -28,7 +29,9 @@ class StepOutputHandle(namedtuple('_StepOutputHandle', 'step output_name')):
             output_name=check.str_param(output_name, 'output_name'),
         )
 
-    # Make this hashable so it be a key in a dictionary
+    # Handles are keys of the intermediate results of the engines, so they are hashed on every
+    # lookup. Hashing the tuple of the key and name reuses the hashes cached on both strings.
+    __slots__ = ()
 
     def __str__(self):
         return 'StepOutputHandle' '(step="{step.key}", output_name="{output_name}")'.format(
@@ -41,18 +44,42 @@ class StepOutputHandle(namedtuple('_StepOutputHandle', 'step output_name')):
         )
 
     def __hash__(self):
-        return hash(self.step.key + self.output_name)
+        return hash((self.step.key, self.output_name))
 
     def __eq__(self, other):
         return self.step.key == other.step.key and self.output_name == other.output_name
 
+    def __ne__(self, other):
+        return not self == other
+
+
+class StepSuccessData(namedtuple('_StepSuccessData', 'output_name intermediate_handle')):
+    '''
+    Either the value of the output or an IntermediateHandle to it from the intermediate store
+    must be passed. The value is only resolved from the handle when it is accessed.
+    '''
+
+    def __new__(cls, output_name, value=None, intermediate_handle=None):
+        check.param_invariant(
+            value is None or intermediate_handle is None,
+            'intermediate_handle',
+            'Cannot pass both a value and an intermediate handle',
+        )
+        if intermediate_handle is None:
+            intermediate_handle = InMemoryIntermediateHandle(value)
 
-class StepSuccessData(namedtuple('_StepSuccessData', 'output_name value')):
-    def __new__(cls, output_name, value):
         return super(StepSuccessData, cls).__new__(
-            cls, output_name=check.str_param(output_name, 'output_name'), value=value
+            cls,
+            output_name=check.str_param(output_name, 'output_name'),
+            intermediate_handle=check.inst_param(
+                intermediate_handle, 'intermediate_handle', IntermediateHandle
+            ),
         )
 
+    @property
+    def value(self):
+        return self.intermediate_handle.get_value()
+
 
 class StepFailureData(namedtuple('_StepFailureData', 'dagster_error')):
     def __new__(cls, dagster_error):
@@ -125,6 +152,8 @@ class StepKind(Enum):
 
 
 class StepInput(namedtuple('_StepInput', 'name runtime_type prev_output_handle')):
+    __slots__ = ()
+
     def __new__(cls, name, runtime_type, prev_output_handle):
         return super(StepInput, cls).__new__(
             cls,
@@ -137,6 +166,8 @@ class StepInput(namedtuple('_StepInput', 'name runtime_type prev_output_handle')
 
 
 class StepOutput(namedtuple('_StepOutput', 'name runtime_type')):
+    __slots__ = ()
+
     def __new__(cls, name, runtime_type):
         return super(StepOutput, cls).__new__(
             cls,
@@ -148,12 +179,20 @@ class StepOutput(namedtuple('_StepOutput', 'name runtime_type')):
 class ExecutionStep(
     namedtuple(
         '_ExecutionStep',
-        (
-            'pipeline_context key step_inputs step_input_dict step_outputs step_output_dict '
-            'compute_fn kind solid tags'
-        ),
+        'pipeline_name key step_inputs step_outputs compute_fn kind solid extra_tags',
     )
 ):
+    '''
+    Steps take the name of their pipeline from the context they are created in, but do not keep
+    a reference to it, so that a plan can be executed in other runs than the one it was created
+    for. The tags of the run are only merged into those of the step when it executes.
+
+    Steps only hold the tags they are created with, which are shared rather than copied, and
+    their full tags are built when they are read, as the fresh dict that callers may update.
+    '''
+
+    __slots__ = ()
+
     def __new__(
         cls, pipeline_context, key, step_inputs, step_outputs, compute_fn, kind, solid, tags=None
     ):
@@ -162,37 +201,39 @@ class ExecutionStep(
         # check.param_invariant('solid_definition' in tags, 'tags', 'Step must have solid tag')
         # check.p[tdict_param(tags, 'tags', key_type=str, value_type=str)
 
+        check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+
         return super(ExecutionStep, cls).__new__(
             cls,
-            pipeline_context=check.inst_param(
-                pipeline_context, 'pipeline_context', PipelineExecutionContext
-            ),
+            pipeline_name=pipeline_context.pipeline_def.name,
             key=check.str_param(key, 'key'),
             step_inputs=check.list_param(step_inputs, 'step_inputs', of_type=StepInput),
-            step_input_dict={si.name: si for si in step_inputs},
             step_outputs=check.list_param(step_outputs, 'step_outputs', of_type=StepOutput),
-            step_output_dict={so.name: so for so in step_outputs},
             compute_fn=check.callable_param(compute_fn, 'compute_fn'),
             kind=check.inst_param(kind, 'kind', StepKind),
             solid=check.inst_param(solid, 'solid', Solid),
-            tags=merge_dicts(
-                merge_dicts(
-                    {
-                        'step_key': key,
-                        'pipeline': pipeline_context.pipeline_def.name,
-                        'solid': solid.name,
-                        'solid_definition': solid.definition.name,
-                    },
-                    check.opt_dict_param(tags, 'tags'),
-                ),
-                pipeline_context.tags,
-            ),
+            extra_tags=check.opt_dict_param(tags, 'tags') or None,
         )
 
     @property
-    def pipeline_name(self):
-        return self.pipeline_context.pipeline_def.name
-        # return self.tags['pipeline']
+    def tags(self):
+        tags = {
+            'step_key': self.key,
+            'pipeline': self.pipeline_name,
+            'solid': self.solid.name,
+            'solid_definition': self.solid.definition.name,
+        }
+        if self.extra_tags:
+            tags.update(self.extra_tags)
+        return tags
+
+    @property
+    def step_input_dict(self):
+        return {si.name: si for si in self.step_inputs}
+
+    @property
+    def step_output_dict(self):
+        return {so.name: so for so in self.step_outputs}
 
     @property
     def solid_name(self):
@@ -216,32 +257,33 @@ class ExecutionStep(
         )
 
     def with_new_inputs(self, step_inputs):
-        return ExecutionStep(
-            pipeline_context=self.pipeline_context,
-            key=self.key,
-            step_inputs=step_inputs,
-            step_outputs=self.step_outputs,
-            compute_fn=self.compute_fn,
-            kind=self.kind,
-            solid=self.solid,
-            tags=self.tags,
-        )
+        check.list_param(step_inputs, 'step_inputs', of_type=StepInput)
+        return self._replace(step_inputs=step_inputs)
+
+    # Steps have few inputs and outputs, so they are looked up by name in their lists rather than
+    # in dicts kept with every step
 
     def has_step_output(self, name):
         check.str_param(name, 'name')
-        return name in self.step_output_dict
+        return any(step_output.name == name for step_output in self.step_outputs)
 
     def step_output_named(self, name):
         check.str_param(name, 'name')
-        return self.step_output_dict[name]
+        for step_output in self.step_outputs:
+            if step_output.name == name:
+                return step_output
+        raise KeyError(name)
 
     def has_step_input(self, name):
         check.str_param(name, 'name')
-        return name in self.step_input_dict
+        return any(step_input.name == name for step_input in self.step_inputs)
 
     def step_input_named(self, name):
         check.str_param(name, 'name')
-        return self.step_input_dict[name]
+        for step_input in self.step_inputs:
+            if step_input.name == name:
+                return step_input
+        raise KeyError(name)
 
 
 class ExecutionValueSubplan(
@@ -271,16 +313,22 @@ class ExecutionValueSubplan(
         return ExecutionValueSubplan([], terminal_step_output_handle)
 
 
-class ExecutionPlan(namedtuple('_ExecutionPlan', 'pipeline_def step_dict, deps, steps')):
+class ExecutionPlan(namedtuple('_ExecutionPlan', 'pipeline_def step_dict, deps, steps compact')):
+    '''
+    compact is the CompactExecutionPlan of the steps of the plan. Engines, the run storage and
+    dagit all walk the steps of a plan in order, and the order is a view over it.
+    '''
+
     def __new__(cls, pipeline_def, step_dict, deps):
+        check.dict_param(step_dict, 'step_dict', key_type=str, value_type=ExecutionStep)
+        steps = list(step_dict.values())
         return super(ExecutionPlan, cls).__new__(
             cls,
             pipeline_def=check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition),
-            step_dict=check.dict_param(
-                step_dict, 'step_dict', key_type=str, value_type=ExecutionStep
-            ),
+            step_dict=step_dict,
             deps=check.dict_param(deps, 'deps', key_type=str, value_type=set),
-            steps=list(step_dict.values()),
+            steps=steps,
+            compact=CompactExecutionPlan(steps),
         )
 
     def has_step(self, key):
@@ -292,15 +340,10 @@ class ExecutionPlan(namedtuple('_ExecutionPlan', 'pipeline_def step_dict, deps,
         return self.step_dict[key]
 
     def topological_steps(self):
-        return list(self._topological_steps())
-
-    def _topological_steps(self):
-        for step_key in toposort.toposort_flatten(self.deps):
-            yield self.step_dict[step_key]
+        return [self.steps[step_id] for step_id in self.compact.topological_order]
 
     def topological_step_levels(self):
-        return list(self._topological_step_levels())
-
-    def _topological_step_levels(self):
-        for step_key_level in toposort.toposort(self.deps):
-            yield [self.step_dict[step_key] for step_key in step_key_level]
+        return [
+            [self.steps[step_id] for step_id in step_id_level]
+            for step_id_level in self.compact.topological_levels()
+        ]
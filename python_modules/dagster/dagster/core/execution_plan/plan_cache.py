@@ -0,0 +1,124 @@
+'''
+A cache of the execution plans built for pipelines.
+
+Building a plan walks the solids of the pipeline in topological order and creates the steps for
+their transforms, expectations, materializations and inputs from config, which for large
+pipelines can take as long as executing them. Steps do not reference the run they were created
+for, so the plan built for one run of a pipeline is reused by later runs whose environments
+build the same steps. Only the plan of the full pipeline is cached: pruning it to targets,
+adding the steps that persist outputs to the run storage and subsetting it are done for every
+run.
+
+Plans are keyed by a fingerprint of the structure of the pipeline and by a fingerprint of the
+sections of the environment config that the steps of a plan are built from, so that a pipeline
+defined anew from the same solid definitions, as by the functions that define the pipelines of
+a repository, reuses the plans of the pipelines defined before it. The least recently used plans
+are evicted once the cache holds max_size plans.
+'''
+
+from collections import namedtuple
+import hashlib
+import json
+
+from dagster import check
+from dagster.core.definitions import PipelineDefinition
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.utils.lru_cache import LRUCache
+
+DEFAULT_PLAN_CACHE_SIZE = 32
+
+
+def pipeline_fingerprint(pipeline_def):
+    '''
+    A digest of the structure of the pipeline that the steps of a plan are built from: the name
+    of every solid and its definition, the types of the inputs and outputs of the definitions,
+    and the dependencies between the solids. Steps call the functions of the definitions they
+    were built from, so definitions are told apart by identity as well as by name.
+    '''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+
+    structure = {
+        'name': pipeline_def.name,
+        'solids': sorted(
+            [
+                solid.name,
+                solid.definition.name,
+                id(solid.definition),
+                [
+                    [input_def.name, input_def.runtime_type.name]
+                    for input_def in solid.definition.input_defs
+                ],
+                [
+                    [output_def.name, output_def.runtime_type.name]
+                    for output_def in solid.definition.output_defs
+                ],
+            ]
+            for solid in pipeline_def.solids
+        ),
+        'dependencies': sorted(
+            [
+                input_handle.solid.name,
+                input_handle.input_def.name,
+                output_handle.solid.name,
+                output_handle.output_def.name,
+            ]
+            for input_handle, output_handle in pipeline_def.dependency_structure.items()
+        ),
+    }
+
+    return hashlib.sha1(json.dumps(structure, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def environment_fingerprint(environment_config):
+    '''
+    A digest of the parts of the environment config that the steps of a plan depend on: the
+    inputs and outputs configured for solids, and the expectations and execution sections.
+    '''
+    check.inst_param(environment_config, 'environment_config', EnvironmentConfig)
+
+    plan_config = {
+        'solids': {
+            name: {'inputs': solid_config.inputs, 'outputs': solid_config.outputs}
+            for name, solid_config in environment_config.solids.items()
+        },
+        'expectations': environment_config.expectations._asdict(),
+        'execution': environment_config.execution._asdict(),
+    }
+
+    # Values that are not json serializable are compared by their repr
+    return hashlib.sha1(
+        json.dumps(plan_config, sort_keys=True, default=repr).encode('utf-8')
+    ).hexdigest()
+
+
+_PlanCacheEntry = namedtuple('_PlanCacheEntry', 'pipeline_def plan')
+
+
+class ExecutionPlanCache(LRUCache):
+    def __init__(self, max_size=DEFAULT_PLAN_CACHE_SIZE):
+        super(ExecutionPlanCache, self).__init__(max_size)
+
+    def get_or_create(self, pipeline_def, environment_config, create_plan_fn):
+        '''
+        The plan cached for the pipeline and environment, or the plan returned by
+        create_plan_fn, which is then cached. The cached plan may have been built for another
+        pipeline with the same structure. Plans are built outside of the lock of the cache, so
+        the same plan may be built concurrently by several runs.
+        '''
+        check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        check.callable_param(create_plan_fn, 'create_plan_fn')
+
+        # The entry holds on to the pipeline, and so to the solid definitions whose ids are
+        # fingerprinted, so that their ids cannot be reused while it is cached
+        key = (pipeline_fingerprint(pipeline_def), environment_fingerprint(environment_config))
+
+        entry = self.get(key)
+        if entry is not None:
+            return entry.plan
+
+        plan = create_plan_fn()
+        self.put(key, _PlanCacheEntry(pipeline_def, plan))
+        return plan
+
+
+PLAN_CACHE = ExecutionPlanCache()
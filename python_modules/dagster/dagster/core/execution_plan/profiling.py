@@ -0,0 +1,214 @@
+'''
+Opt-in profiling of the steps selected in the execution: profile section of the environment
+config, by step key or by solid name.
+
+A profiled step runs under cProfile, tracemalloc or both. Its profile is written to the
+directory of the run, as {step_key}.pstats for cProfile, which pstats and snakeviz read, and as
+{step_key}.allocations.txt for tracemalloc, listing the source lines that allocated the most
+memory while the step executed. A materialization event is logged for every file written.
+
+The profile covers the execution of the step's compute function, which includes the handling
+of the outputs it emits by the framework, as the compute function of a step is a generator
+resumed once those outputs are handled.
+
+cProfile profiles the thread that executes the step, so steps executed concurrently by the
+multithread engine are profiled separately, but only one step at a time is profiled with
+cProfile on a thread: when the asyncio engine interleaves steps, a step that starts while
+another is being profiled is not. tracemalloc traces every thread of the process, so the
+allocations of steps that executed concurrently are attributed to each of them. Steps
+executed by the multiprocess engine are profiled by its workers, which write to the same
+directory.
+'''
+
+from contextlib import contextmanager
+import cProfile
+import os
+import tempfile
+import threading
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution_context import StepExecutionContext
+from dagster.core.system_config.objects import DEFAULT_TOP_ALLOCATIONS
+from dagster.utils import mkdir_p
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+_HAS_TRACEMALLOC = tracemalloc is not None
+
+DEFAULT_PROFILE_DIRECTORY = os.path.join(tempfile.gettempdir(), 'dagster-profiles')
+
+
+class StepProfiler(object):
+    '''
+    Selects the steps to profile and writes their profiles in the directory named after the run
+    id in directory.
+    '''
+
+    def __init__(
+        self, run_id, steps, cprofile=True, tracemalloc=False, top_allocations=None, directory=None
+    ):
+        # pylint: disable=W0621
+        check.str_param(run_id, 'run_id')
+        self.steps = frozenset(check.list_param(steps, 'steps', of_type=str))
+        self.cprofile = check.bool_param(cprofile, 'cprofile')
+        self.tracemalloc = check.bool_param(tracemalloc, 'tracemalloc')
+        check.opt_int_param(top_allocations, 'top_allocations')
+        if top_allocations is None:
+            top_allocations = DEFAULT_TOP_ALLOCATIONS
+        self.top_allocations = top_allocations
+        self.run_directory = os.path.join(
+            check.opt_str_param(directory, 'directory', DEFAULT_PROFILE_DIRECTORY), run_id
+        )
+
+        if self.tracemalloc and not _HAS_TRACEMALLOC:
+            raise DagsterInvariantViolationError('Profiling with tracemalloc requires Python 3.')
+
+    def should_profile(self, step):
+        return step.key in self.steps or step.solid.name in self.steps
+
+    def pstats_path(self, step_key):
+        check.str_param(step_key, 'step_key')
+        return os.path.join(self.run_directory, '{step_key}.pstats'.format(step_key=step_key))
+
+    def allocations_path(self, step_key):
+        check.str_param(step_key, 'step_key')
+        return os.path.join(
+            self.run_directory, '{step_key}.allocations.txt'.format(step_key=step_key)
+        )
+
+
+class _TracemallocSession(object):
+    '''
+    Starts tracemalloc when the first of the steps that are profiled concurrently starts, and
+    stops it once the last one is done, unless it was already tracing.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._num_steps = 0
+        self._started = False
+
+    def start(self):
+        with self._lock:
+            if self._num_steps == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self._num_steps += 1
+
+    def stop(self):
+        with self._lock:
+            self._num_steps -= 1
+            if self._num_steps == 0 and self._started:
+                tracemalloc.stop()
+                self._started = False
+
+
+_TRACEMALLOC_SESSION = _TracemallocSession()
+
+# Whether a step is being profiled with cProfile on the thread
+_CPROFILE_STATE = threading.local()
+
+
+def _start_cprofile(step_context):
+    if getattr(_CPROFILE_STATE, 'active', False):
+        step_context.log.warning(
+            'Not profiling {step_key} with cProfile, as another step is being profiled on the '
+            'same thread.'.format(step_key=step_context.step.key)
+        )
+        return None
+
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as e:
+        # Raised on Python 3.12 and later when another profiler is active
+        step_context.log.warning(
+            'Not profiling {step_key} with cProfile: {error}'.format(
+                step_key=step_context.step.key, error=e
+            )
+        )
+        return None
+
+    _CPROFILE_STATE.active = True
+    return profile
+
+
+def _stop_cprofile(profile):
+    profile.disable()
+    _CPROFILE_STATE.active = False
+
+
+def _take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+
+
+def _write_allocations(path, step_key, statistics):
+    with open(path, 'w') as allocations_file:
+        allocations_file.write(
+            'Top {num} allocation sites of {step_key}, by memory allocated and not freed while '
+            'it executed\n\n'.format(num=len(statistics), step_key=step_key)
+        )
+        for stat in statistics:
+            allocations_file.write('{stat}\n'.format(stat=stat))
+
+
+def _write_profile(step_context, step_profiler, profile, statistics):
+    step_key = step_context.step.key
+    paths = []
+    try:
+        mkdir_p(step_profiler.run_directory)
+        if profile is not None:
+            profile.dump_stats(step_profiler.pstats_path(step_key))
+            paths.append(step_profiler.pstats_path(step_key))
+        if statistics is not None:
+            _write_allocations(step_profiler.allocations_path(step_key), step_key, statistics)
+            paths.append(step_profiler.allocations_path(step_key))
+    except (IOError, OSError) as e:
+        # The step itself is not failed for its profile
+        step_context.log.warning(
+            'Could not write the profile of {step_key}: {error}'.format(step_key=step_key, error=e)
+        )
+
+    for path in paths:
+        step_context.events.step_materialization(step_key, os.path.basename(path), path)
+
+
+@contextmanager
+def profile_step_scope(step_context):
+    '''Profiles the body of the scope if the step of the context is selected for profiling.'''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+
+    step_profiler = step_context.step_profiler
+    if step_profiler is None or not step_profiler.should_profile(step_context.step):
+        yield
+        return
+
+    snapshot = None
+    if step_profiler.tracemalloc:
+        _TRACEMALLOC_SESSION.start()
+        snapshot = _take_snapshot()
+
+    profile = _start_cprofile(step_context) if step_profiler.cprofile else None
+
+    statistics = None
+    try:
+        yield
+    finally:
+        if profile is not None:
+            _stop_cprofile(profile)
+
+        if snapshot is not None:
+            statistics = [
+                stat
+                for stat in _take_snapshot().compare_to(snapshot, 'lineno')
+                if stat.size_diff > 0
+            ][: step_profiler.top_allocations]
+            _TRACEMALLOC_SESSION.stop()
+
+        _write_profile(step_context, step_profiler, profile, statistics)
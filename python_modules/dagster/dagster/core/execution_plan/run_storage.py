@@ -0,0 +1,271 @@
+'''
+Persists the outputs of every transform step of a run under its run id, so that a run that
+failed can be resumed from the steps that failed or did not get to run.
+
+Every transform output is marshalled to a file in the directory of the run by a marshal step
+added to the execution plan. Each step that succeeds also records the names of the outputs it
+emitted, so that resuming can tell a step that did not emit an output apart from one whose
+output was never persisted.
+
+Runs are resumed at the granularity of solids. A solid is rerun unless every one of its steps
+succeeded and the outputs of its transform were persisted, and every solid downstream of a
+rerun solid is rerun as well. The inputs that rerun solids receive from solids that are not
+rerun are unmarshalled from the persisted outputs of their transforms. Streaming outputs are
+never persisted, so solids with streaming outputs are always rerun.
+'''
+
+from collections import defaultdict
+import json
+import os
+
+from dagster import check
+from dagster.core.definitions import solids_in_topological_order
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution_context import PipelineExecutionContext, StepExecutionContext
+from dagster.utils import mkdir_p
+
+from .objects import ExecutionPlan, ExecutionStep, StepKind
+from .plan_subset import ExecutionPlanAddedOutputs, ExecutionPlanSubsetInfo, MarshalledOutput
+from .streaming import is_streaming_output
+
+DEFAULT_RUN_STORAGE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.dagster', 'runs')
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+
+class RunStorage(object):
+    '''
+    Stores the persisted outputs of a run in the intermediates directory of the directory named
+    after its run id, and a file for every step that succeeded in its steps directory.
+    '''
+
+    def __init__(self, run_id, directory=None):
+        self.run_id = check.str_param(run_id, 'run_id')
+        self.directory = check.opt_str_param(directory, 'directory', DEFAULT_RUN_STORAGE_DIRECTORY)
+        self.run_directory = os.path.join(self.directory, run_id)
+
+    def _step_path(self, step_key):
+        return os.path.join(self.run_directory, 'steps', step_key + '.json')
+
+    def has_run(self):
+        return os.path.exists(os.path.join(self.run_directory, MANIFEST_FILE_NAME))
+
+    def get_pipeline_name(self):
+        with open(os.path.join(self.run_directory, MANIFEST_FILE_NAME), 'r') as manifest_file:
+            return str(json.load(manifest_file)['pipeline_name'])
+
+    def write_manifest(self, pipeline_name):
+        check.str_param(pipeline_name, 'pipeline_name')
+
+        mkdir_p(os.path.join(self.run_directory, 'intermediates'))
+        mkdir_p(os.path.join(self.run_directory, 'steps'))
+        _write_json_atomically(
+            os.path.join(self.run_directory, MANIFEST_FILE_NAME), {'pipeline_name': pipeline_name}
+        )
+
+    def intermediate_path(self, step_key, output_name):
+        check.str_param(step_key, 'step_key')
+        check.str_param(output_name, 'output_name')
+        return os.path.join(
+            self.run_directory,
+            'intermediates',
+            '{step_key}.{output_name}'.format(step_key=step_key, output_name=output_name),
+        )
+
+    def has_intermediate(self, step_key, output_name):
+        return os.path.exists(self.intermediate_path(step_key, output_name))
+
+    def mark_step_succeeded(self, step_key, output_names):
+        check.str_param(step_key, 'step_key')
+        check.list_param(output_names, 'output_names', of_type=str)
+        _write_json_atomically(self._step_path(step_key), {'output_names': sorted(output_names)})
+
+    def clear_step(self, step_key):
+        check.str_param(step_key, 'step_key')
+        try:
+            os.remove(self._step_path(step_key))
+        except OSError:
+            pass
+
+    def get_step_output_names(self, step_key):
+        '''The names of the outputs emitted by a step that succeeded, or None if it did not.'''
+        check.str_param(step_key, 'step_key')
+        try:
+            with open(self._step_path(step_key), 'r') as step_file:
+                return [str(output_name) for output_name in json.load(step_file)['output_names']]
+        except (IOError, OSError, ValueError):
+            return None
+
+
+def _write_json_atomically(path, obj):
+    # Readers never see a partially written file, even if the run is killed
+    staging_path = path + '.staging'
+    with open(staging_path, 'w') as staging_file:
+        json.dump(obj, staging_file)
+    os.rename(staging_path, path)
+
+
+def record_step_success(step_context, output_names):
+    '''Record that a step succeeded if the run persists its outputs.'''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.list_param(output_names, 'output_names', of_type=str)
+
+    if step_context.run_storage is not None:
+        step_context.run_storage.mark_step_succeeded(step_context.step.key, output_names)
+
+
+def create_run_storage_added_outputs(pipeline_context, steps):
+    '''Marshals every output of every transform step in steps to the run storage.'''
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.list_param(steps, 'steps', of_type=ExecutionStep)
+
+    run_storage = pipeline_context.run_storage
+    return ExecutionPlanAddedOutputs.with_output_marshalling(
+        {
+            step.key: [
+                MarshalledOutput(
+                    step_output.name, run_storage.intermediate_path(step.key, step_output.name)
+                )
+                for step_output in step.step_outputs
+                # Streams can only be iterated once, by the solid that consumes them
+                if not is_streaming_output(step, step_output.name)
+            ]
+            for step in steps
+            if step.kind == StepKind.TRANSFORM
+        }
+    )
+
+
+def _source_transform_output_handle(step_output_handle):
+    # Output expectations and materializations pass the output of the transform through
+    while step_output_handle.step.kind != StepKind.TRANSFORM:
+        check.invariant(
+            step_output_handle.step.step_inputs,
+            'Step {step_key} does not pass through the output of a transform'.format(
+                step_key=step_output_handle.step.key
+            ),
+        )
+        step_output_handle = step_output_handle.step.step_inputs[0].prev_output_handle
+    return step_output_handle
+
+
+def _marshalled_inputs_for_solid(upstream_inputs, rerun_solids, run_storage):
+    '''
+    Maps the step inputs of a rerun solid that receive values from solids that are not rerun
+    to the persisted outputs they unmarshal, or returns None if one of those outputs was not
+    emitted in the run.
+    '''
+    marshalled_inputs = {}
+    for step, step_input in upstream_inputs:
+        if step_input.prev_output_handle.step.solid.name in rerun_solids:
+            continue
+
+        source_handle = _source_transform_output_handle(step_input.prev_output_handle)
+        source_step_key = source_handle.step.key
+        # No output names are recorded for the steps that were skipped in the run
+        output_names = run_storage.get_step_output_names(source_step_key)
+        if output_names is None or source_handle.output_name not in output_names:
+            return None
+
+        marshalled_inputs[(step.key, step_input.name)] = run_storage.intermediate_path(
+            source_step_key, source_handle.output_name
+        )
+    return marshalled_inputs
+
+
+def create_resume_subset_info(execution_plan, run_storage):
+    '''
+    Creates the subset of the plan that resumes a run: the steps of every solid that must be
+    rerun, with unmarshal steps for the inputs they receive from solids that are not rerun.
+
+    Solids that were skipped in the run, because a solid they depend on did not emit an output,
+    are skipped again, along with every solid downstream of them.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.inst_param(run_storage, 'run_storage', RunStorage)
+
+    steps_by_solid = defaultdict(list)
+    for step in execution_plan.topological_steps():
+        steps_by_solid[step.solid.name].append(step)
+
+    def _was_emitted(step_output_handle):
+        output_names = run_storage.get_step_output_names(step_output_handle.step.key)
+        return output_names is not None and step_output_handle.output_name in output_names
+
+    def _is_complete(solid_name):
+        for step in steps_by_solid[solid_name]:
+            if not all(
+                _was_emitted(step_input.prev_output_handle) for step_input in step.step_inputs
+            ):
+                # Skipped in the run, as a step upstream of it did not emit one of its inputs
+                continue
+
+            output_names = run_storage.get_step_output_names(step.key)
+            if output_names is None:
+                return False
+
+            if step.kind == StepKind.TRANSFORM:
+                for output_name in output_names:
+                    if not run_storage.has_intermediate(step.key, output_name):
+                        return False
+        return True
+
+    rerun_solids = set()
+    skipped_solids = set()
+    step_keys = []
+    marshalled_inputs = defaultdict(dict)
+
+    for solid in solids_in_topological_order(execution_plan.pipeline_def):
+        upstream_inputs = [
+            (step, step_input)
+            for step in steps_by_solid[solid.name]
+            for step_input in step.step_inputs
+            if step_input.prev_output_handle.step.solid.name != solid.name
+        ]
+        upstream_solids = set(
+            step_input.prev_output_handle.step.solid.name for _, step_input in upstream_inputs
+        )
+
+        if upstream_solids & skipped_solids:
+            skipped_solids.add(solid.name)
+            continue
+
+        if not upstream_solids & rerun_solids and _is_complete(solid.name):
+            continue
+
+        solid_marshalled_inputs = _marshalled_inputs_for_solid(
+            upstream_inputs, rerun_solids, run_storage
+        )
+        if solid_marshalled_inputs is None:
+            skipped_solids.add(solid.name)
+            continue
+
+        rerun_solids.add(solid.name)
+        step_keys.extend(step.key for step in steps_by_solid[solid.name])
+        for (step_key, input_name), marshalling_key in solid_marshalled_inputs.items():
+            marshalled_inputs[step_key][input_name] = marshalling_key
+
+    return ExecutionPlanSubsetInfo.with_input_marshalling(step_keys, dict(marshalled_inputs))
+
+
+def check_run_storage_for_resume(pipeline_context, run_storage):
+    check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
+    check.inst_param(run_storage, 'run_storage', RunStorage)
+
+    if not run_storage.has_run():
+        raise DagsterInvariantViolationError(
+            'No persisted outputs found for run {run_id} in {directory}. Only runs executed '
+            'with execution: resumable configured can be resumed.'.format(
+                run_id=run_storage.run_id, directory=run_storage.directory
+            )
+        )
+
+    pipeline_name = run_storage.get_pipeline_name()
+    if pipeline_name != pipeline_context.pipeline_def.name:
+        raise DagsterInvariantViolationError(
+            'Run {run_id} was a run of pipeline {run_pipeline}, not {pipeline}.'.format(
+                run_id=run_storage.run_id,
+                run_pipeline=pipeline_name,
+                pipeline=pipeline_context.pipeline_def.name,
+            )
+        )
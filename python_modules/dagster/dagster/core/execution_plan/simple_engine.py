@@ -1,4 +1,6 @@
+from collections import defaultdict
 from contextlib import contextmanager
+import logging
 import sys
 
 from future.utils import raise_from
@@ -19,6 +21,7 @@ from dagster.core.errors import (
 
 from dagster.core.execution_context import PipelineExecutionContext, StepExecutionContext
 
+from .intermediate_store import InMemoryIntermediateHandle
 from .objects import (
     ExecutionPlan,
     ExecutionStep,
@@ -29,15 +32,37 @@ from .objects import (
     StepSuccessData,
     StepFailureData,
 )
+from .profiling import profile_step_scope
+from .run_storage import record_step_success
+from .step_cache import lookup_cached_step_events, store_step_events
+from .streaming import (
+    create_chunk_stream,
+    is_streaming_input,
+    is_streaming_output,
+    iterate_input_chunks,
+)
 
 
-def _all_inputs_covered(step, results):
+def all_inputs_covered(step, results):
     for step_input in step.step_inputs:
         if step_input.prev_output_handle not in results:
             return False
     return True
 
 
+def log_inputs_not_covered(step_context, results):
+    step = step_context.step
+    result_keys = set(results.keys())
+    expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
+
+    step_context.log.debug(
+        (
+            'Not all inputs covered for {step}. Not executing. Keys in result: '
+            '{result_keys}. Outputs need for inputs {expected_outputs}'
+        ).format(expected_outputs=expected_outputs, step=step.key, result_keys=result_keys)
+    )
+
+
 def iterate_step_events_for_execution_plan(pipeline_context, execution_plan, throw_on_user_error):
     check.inst_param(pipeline_context, 'pipeline_context', PipelineExecutionContext)
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
@@ -45,35 +70,31 @@ def iterate_step_events_for_execution_plan(pipeline_context, execution_plan, thr
 
     step_levels = execution_plan.topological_step_levels()
 
-    # It would be good to implement a reference tracking algorithm here so we could
-    # garbage collection results that are no longer needed by any steps
+    # Results are only retained while a downstream step still needs them
     # https://github.com/dagster-io/dagster/issues/811
+    consumer_counts = compute_consumer_counts(execution_plan)
     all_results = {}
 
+    fast_path = pipeline_context.environment_config.execution.fast_path
+
     for step_level in step_levels:
         for step in step_level:
             step_context = pipeline_context.for_step(step)
 
-            if not _all_inputs_covered(step, all_results):
-                result_keys = set(all_results.keys())
-                expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
-
-                step_context.log.debug(
-                    (
-                        'Not all inputs covered for {step}. Not executing. Keys in result: '
-                        '{result_keys}. Outputs need for inputs {expected_outputs}'
-                    ).format(
-                        expected_outputs=expected_outputs, step=step.key, result_keys=result_keys
-                    )
-                )
+            if not all_inputs_covered(step, all_results):
+                log_inputs_not_covered(step_context, all_results)
+                release_consumed_inputs(step, consumer_counts, all_results)
                 continue
 
-            input_values = _create_input_values(step, all_results)
+            step_events = iterate_step_events_for_step(
+                step_context, create_input_values(step, all_results)
+            )
+            if not fast_path:
+                check.generator(step_events)
 
-            for step_event in check.generator(
-                iterate_step_events_for_step(step_context, input_values)
-            ):
-                check.inst(step_event, ExecutionStepEvent)
+            for step_event in step_events:
+                if not fast_path:
+                    check.inst(step_event, ExecutionStepEvent)
 
                 if throw_on_user_error and step_event.is_step_failure:
                     step_event.reraise_user_error()
@@ -82,10 +103,43 @@ def iterate_step_events_for_execution_plan(pipeline_context, execution_plan, thr
 
                 if step_event.event_type == ExecutionStepEventType.STEP_OUTPUT:
                     output_handle = StepOutputHandle(step, step_event.success_data.output_name)
-                    all_results[output_handle] = step_event
+                    if consumer_counts[output_handle]:
+                        all_results[output_handle] = step_event
 
+            release_consumed_inputs(step, consumer_counts, all_results)
 
-def _create_input_values(step, prev_level_results):
+
+def compute_consumer_counts(execution_plan):
+    '''
+    Count the steps in the plan that consume each step output. Engines use this to drop
+    their reference to an output as soon as its last consumer has executed, so that peak
+    memory is bounded by the working set rather than by every output of the run.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    consumer_counts = defaultdict(int)
+    for step in execution_plan.steps:
+        for step_input in step.step_inputs:
+            consumer_counts[step_input.prev_output_handle] += 1
+    return consumer_counts
+
+
+def release_consumed_inputs(step, consumer_counts, results):
+    '''
+    Called once a step has executed or been skipped. Removes every output the step consumed
+    that no other pending step needs from results, and returns the released output handles.
+    '''
+    released = []
+    for step_input in step.step_inputs:
+        output_handle = step_input.prev_output_handle
+        consumer_counts[output_handle] -= 1
+        if consumer_counts[output_handle] == 0:
+            results.pop(output_handle, None)
+            released.append(output_handle)
+    return released
+
+
+def create_input_values(step, prev_level_results):
     input_values = {}
     for step_input in step.step_inputs:
         prev_output_handle = step_input.prev_output_handle
@@ -98,23 +152,88 @@ def iterate_step_events_for_step(step_context, inputs):
     check.inst_param(step_context, 'step_context', StepExecutionContext)
     check.dict_param(inputs, 'inputs', key_type=str)
 
+    with time_execution_scope() as timer_result:
+        cache_key, cached_step_events = lookup_cached_step_events(step_context, inputs)
+    if cached_step_events is not None:
+        for step_event in iterate_cached_step_events(
+            step_context, cached_step_events, timer_result.millis
+        ):
+            yield step_event
+        return
+
+    if step_context.environment_config.execution.fast_path:
+        step_event_iterator = _execute_step_fast(step_context, inputs)
+    else:
+        step_event_iterator = check.generator(_execute_steps_core_loop(step_context, inputs))
+
+    step_events = []
+    output_names = []
     try:
-        for step_event in check.generator(_execute_steps_core_loop(step_context, inputs)):
-            step_context.log.info(
-                'Step {step} emitted {value} for output {output}'.format(
-                    step=step_context.step.key,
-                    value=repr(step_event.success_data.value),
-                    output=step_event.success_data.output_name,
-                )
-            )
+        for step_event in step_event_iterator:
+            log_step_output(step_context, step_event)
             yield step_event
+            output_names.append(step_event.success_data.output_name)
+            if cache_key is not None:
+                step_events.append(step_event)
     except DagsterError as dagster_error:
-        step_context.log.error(str(dagster_error))
-        yield ExecutionStepEvent.step_failure_event(
-            step=step_context.step, failure_data=StepFailureData(dagster_error=dagster_error)
-        )
+        yield create_step_failure_event(step_context, dagster_error)
         return
 
+    if cache_key is not None:
+        store_step_events(step_context, cache_key, step_events)
+
+    record_step_success(step_context, output_names)
+
+
+def iterate_cached_step_events(step_context, cached_step_events, millis):
+    '''
+    Yields the step events of a step that were loaded from the step cache in millis. The step is
+    reported as succeeded, as an executed step is, so that it is shown as done.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.list_param(cached_step_events, 'cached_step_events', of_type=ExecutionStepEvent)
+    check.float_param(millis, 'millis')
+
+    for step_event in cached_step_events:
+        log_step_output(step_context, step_event)
+        yield step_event
+
+    step_context.step_timings[step_context.step.key] = millis
+    step_context.events.execution_plan_step_success(step_context.step.key, millis)
+    record_step_success(
+        step_context, [step_event.success_data.output_name for step_event in cached_step_events]
+    )
+
+
+def log_step_output(step_context, step_event):
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.inst_param(step_event, 'step_event', ExecutionStepEvent)
+
+    # Summarizing the value can be expensive, so it is skipped if the message is not logged
+    if not step_context.log.is_enabled_for(logging.INFO):
+        return
+
+    output_name = step_event.success_data.output_name
+    step_context.log.info(
+        'Step {step} emitted {value} for output {output}'.format(
+            step=step_context.step.key,
+            value=step_event.success_data.intermediate_handle.summarize_value(
+                step_context.step.step_output_named(output_name).runtime_type.value_summarizer
+            ),
+            output=output_name,
+        )
+    )
+
+
+def create_step_failure_event(step_context, dagster_error):
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.inst_param(dagster_error, 'dagster_error', DagsterError)
+
+    step_context.log.error(str(dagster_error))
+    return ExecutionStepEvent.step_failure_event(
+        step=step_context.step, failure_data=StepFailureData(dagster_error=dagster_error)
+    )
+
 
 def _error_check_step_output_values(step, step_output_values):
     check.inst_param(step, 'step', ExecutionStep)
@@ -122,40 +241,44 @@ def _error_check_step_output_values(step, step_output_values):
 
     seen_outputs = set()
     for step_output_value in step_output_values:
-        if not step.has_step_output(step_output_value.output_name):
-            output_names = list(
-                [output_def.name for output_def in step.solid.definition.output_defs]
-            )
-            raise DagsterInvariantViolationError(
-                'Core transform for {step.solid.name} returned an output '
-                '{step_output_value.output_name} that does not exist. The available '
-                'outputs are {output_names}'.format(
-                    step=step, step_output_value=step_output_value, output_names=output_names
-                )
-            )
+        check_step_output_value(step, step_output_value, seen_outputs)
+        yield step_output_value
+        seen_outputs.add(step_output_value.output_name)
 
-        if step_output_value.output_name in seen_outputs:
-            raise DagsterInvariantViolationError(
-                'Core transform for {step.solid.name} returned an output '
-                '{step_output_value.output_name} multiple times'.format(
-                    step=step, step_output_value=step_output_value
-                )
+
+def check_step_output_value(step, step_output_value, seen_outputs):
+    '''
+    Raise if the step does not have the output or if it was already emitted, as recorded in
+    seen_outputs.
+    '''
+    check.inst_param(step, 'step', ExecutionStep)
+    check.inst_param(step_output_value, 'step_output_value', StepOutputValue)
+    check.inst_param(seen_outputs, 'seen_outputs', set)
+
+    if not step.has_step_output(step_output_value.output_name):
+        output_names = list([output_def.name for output_def in step.solid.definition.output_defs])
+        raise DagsterInvariantViolationError(
+            'Core transform for {step.solid.name} returned an output '
+            '{step_output_value.output_name} that does not exist. The available '
+            'outputs are {output_names}'.format(
+                step=step, step_output_value=step_output_value, output_names=output_names
             )
+        )
 
-        yield step_output_value
-        seen_outputs.add(step_output_value.output_name)
+    if step_output_value.output_name in seen_outputs:
+        raise DagsterInvariantViolationError(
+            'Core transform for {step.solid.name} returned an output '
+            '{step_output_value.output_name} multiple times'.format(
+                step=step, step_output_value=step_output_value
+            )
+        )
 
 
 def _execute_steps_core_loop(step_context, inputs):
     check.inst_param(step_context, 'step_context', StepExecutionContext)
     check.dict_param(inputs, 'inputs', key_type=str)
 
-    evaluated_inputs = {}
-    # do runtime type checks of inputs versus step inputs
-    for input_name, input_value in inputs.items():
-        evaluated_inputs[input_name] = _get_evaluated_input(
-            step_context.step, input_name, input_value
-        )
+    evaluated_inputs = evaluate_step_inputs(step_context, inputs)
 
     step_output_value_iterator = check.generator(
         _iterate_step_output_values_within_boundary(step_context, evaluated_inputs)
@@ -165,23 +288,92 @@ def _execute_steps_core_loop(step_context, inputs):
         _error_check_step_output_values(step_context.step, step_output_value_iterator)
     ):
 
-        yield _create_step_event(step_context.step, step_output_value)
+        yield create_step_event(step_context, step_output_value)
 
 
-def _create_step_event(step, step_output_value):
-    check.inst_param(step, 'step', ExecutionStep)
+def _execute_step_fast(step_context, inputs):
+    '''
+    The counterpart of _execute_steps_core_loop for execution: fast_path. The steps and their
+    inputs were validated when the plan was built, so the values the step emits are turned into
+    events without validating the arguments of every call made for them along the way.
+    '''
+    step = step_context.step
+    seen_outputs = set()
+
+    for step_output_value in _iterate_step_output_values_within_boundary(
+        step_context, _evaluate_step_inputs(step_context, inputs)
+    ):
+        output_name = step_output_value.output_name
+        if output_name in seen_outputs or not step.has_step_output(output_name):
+            # Raises the error for the output
+            check_step_output_value(step, step_output_value, seen_outputs)
+        seen_outputs.add(output_name)
+
+        # _make skips the validation in the constructors of the event and its data
+        yield ExecutionStepEvent._make(
+            (
+                ExecutionStepEventType.STEP_OUTPUT,
+                step,
+                StepSuccessData._make(
+                    (output_name, _store_step_output(step_context, step_output_value))
+                ),
+                None,
+            )
+        )
+
+
+def evaluate_step_inputs(step_context, inputs):
+    '''
+    Do runtime type checks of inputs versus step inputs. Streaming inputs are type checked
+    chunk by chunk as the step iterates over them.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.dict_param(inputs, 'inputs', key_type=str)
+
+    return _evaluate_step_inputs(step_context, inputs)
+
+
+def _evaluate_step_inputs(step_context, inputs):
+    step = step_context.step
+    evaluated_inputs = {}
+    for input_name, input_value in inputs.items():
+        if is_streaming_input(step, input_name):
+            evaluated_inputs[input_name] = iterate_input_chunks(
+                step_context, input_name, input_value
+            )
+        else:
+            evaluated_inputs[input_name] = _get_evaluated_input(step, input_name, input_value)
+    return evaluated_inputs
+
+
+def create_step_event(step_context, step_output_value):
+    '''Type check the value of an output and put it in the intermediate store.'''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
     check.inst_param(step_output_value, 'step_output_value', StepOutputValue)
 
+    return ExecutionStepEvent.step_output_event(
+        step=step_context.step,
+        success_data=StepSuccessData(
+            output_name=step_output_value.output_name,
+            intermediate_handle=_store_step_output(step_context, step_output_value),
+        ),
+    )
+
+
+def _store_step_output(step_context, step_output_value):
+    step = step_context.step
     step_output = step.step_output_named(step_output_value.output_name)
 
-    try:
-        return ExecutionStepEvent.step_output_event(
-            step=step,
-            success_data=StepSuccessData(
-                output_name=step_output_value.output_name,
-                value=step_output.runtime_type.coerce_runtime_value(step_output_value.value),
-            ),
+    if is_streaming_output(step, step_output_value.output_name):
+        # Streams are consumed as they are produced, so they never go in the intermediate store
+        return InMemoryIntermediateHandle(
+            create_chunk_stream(
+                step_context, step_output_value.output_name, step_output_value.value
+            )
         )
+
+    try:
+        value = step_output.runtime_type.coerce_runtime_value(step_output_value.value)
     except DagsterRuntimeCoercionError as e:
         raise DagsterInvariantViolationError(
             (
@@ -195,6 +387,25 @@ def _create_step_event(step, step_output_value):
             )
         )
 
+    try:
+        return step_context.intermediate_store.set_value(
+            '{step_key}.{output_name}'.format(
+                step_key=step.key, output_name=step_output_value.output_name
+            ),
+            step_output.runtime_type,
+            value,
+        )
+    except Exception as e:  # pylint: disable=W0703
+        raise_from(
+            DagsterInvariantViolationError(
+                'Could not store output {output_name} of step {step_key} in the intermediate '
+                'store: {error}'.format(
+                    output_name=step_output_value.output_name, step_key=step.key, error=e
+                )
+            ),
+            e,
+        )
+
 
 def _get_evaluated_input(step, input_name, input_value):
     check.inst_param(step, 'step', ExecutionStep)
@@ -223,7 +434,7 @@ def _iterate_step_output_values_within_boundary(step_context, evaluated_inputs):
     check.dict_param(evaluated_inputs, 'evaluated_inputs', key_type=str)
 
     error_str = 'Error occured during step {key}'.format(key=step_context.step.key)
-    with _execution_step_error_boundary(step_context, error_str):
+    with execution_step_error_boundary(step_context, error_str):
         gen = check.opt_generator(step_context.step.compute_fn(step_context, evaluated_inputs))
 
         if gen is not None:
@@ -232,7 +443,7 @@ def _iterate_step_output_values_within_boundary(step_context, evaluated_inputs):
 
 
 @contextmanager
-def _execution_step_error_boundary(step_context, msg, **kwargs):
+def execution_step_error_boundary(step_context, msg, **kwargs):
     '''
     Wraps the execution of user-space code in an error boundary. This places a uniform
     policy around an user code invoked by the framework. This ensures that all user
@@ -240,18 +451,24 @@ def _execution_step_error_boundary(step_context, msg, **kwargs):
     trace of the user error is preserved, so that it can be reported without confusing
     framework code in the stack trace, if a tool author wishes to do so. This has
     been especially help in a notebooking context.
+
+    Steps selected in the profile section of the execution config are profiled within it.
     '''
     check.inst_param(step_context, 'step_context', StepExecutionContext)
     check.str_param(msg, 'msg')
 
     step = step_context.step
     step_context.events.execution_plan_step_start(step.key)
+    timer_result = None
     try:
-        with time_execution_scope() as timer_result:
+        with profile_step_scope(step_context), time_execution_scope() as timer_result:
             yield
 
+        step_context.step_timings[step.key] = timer_result.millis
         step_context.events.execution_plan_step_success(step.key, timer_result.millis)
     except Exception as e:  # pylint: disable=W0703
+        if timer_result is not None:
+            step_context.step_timings[step.key] = timer_result.millis
         step_context.events.execution_plan_step_failure(step.key, sys.exc_info())
 
         stack_trace = get_formatted_stack_trace(e)
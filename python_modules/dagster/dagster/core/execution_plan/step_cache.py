@@ -0,0 +1,350 @@
+'''
+An opt-in, on-disk cache of the outputs of transform steps that persists across runs.
+
+A transform step is keyed on a fingerprint of the source of its solid's transform function,
+its solid config and the values of its inputs. When a step with a matching key has succeeded
+before, its outputs are loaded through the SerializationStrategy of their runtime types
+rather than executing the transform again.
+
+Only the source of the transform function itself is fingerprinted, not the source of any
+function it calls. Steps whose source is unavailable, whose inputs cannot be serialized, or
+that have streaming inputs or outputs are never cached.
+
+The cache is bounded in size. Whenever an entry is added, the least recently used entries are
+evicted until the cache fits in its maximum size again.
+'''
+
+from collections import namedtuple
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from dagster import check
+from dagster.core.execution_context import StepExecutionContext
+from dagster.core.types.compression import Compression
+from dagster.core.types.marshal import (
+    SerializationStrategy,
+    deserialize_from_file,
+    serialize_to_file,
+)
+from dagster.utils import mkdir_p
+
+from .objects import ExecutionStepEvent, StepKind, StepSuccessData
+from .streaming import has_streaming_inputs, has_streaming_outputs
+
+DEFAULT_STEP_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.dagster', 'step_cache')
+
+DEFAULT_STEP_CACHE_MAX_SIZE_BYTES = 1024 * 1024 * 1024
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+
+class StepCacheEntry(
+    namedtuple(
+        '_StepCacheEntry', 'cache_key pipeline_name step_key output_names size_bytes last_used'
+    )
+):
+    def __new__(cls, cache_key, pipeline_name, step_key, output_names, size_bytes, last_used):
+        return super(StepCacheEntry, cls).__new__(
+            cls,
+            check.str_param(cache_key, 'cache_key'),
+            check.str_param(pipeline_name, 'pipeline_name'),
+            check.str_param(step_key, 'step_key'),
+            check.list_param(output_names, 'output_names', of_type=str),
+            check.int_param(size_bytes, 'size_bytes'),
+            check.float_param(last_used, 'last_used'),
+        )
+
+
+class StepCache(object):
+    '''
+    Stores each entry in a directory named after its cache key, holding one file per output
+    and a manifest. The modification time of the manifest records when the entry was last used.
+    '''
+
+    def __init__(self, directory=None, max_size_bytes=None, compression=None):
+        self.directory = check.opt_str_param(directory, 'directory', DEFAULT_STEP_CACHE_DIRECTORY)
+        check.opt_int_param(max_size_bytes, 'max_size_bytes')
+        if max_size_bytes is None:
+            max_size_bytes = DEFAULT_STEP_CACHE_MAX_SIZE_BYTES
+        self.max_size_bytes = max_size_bytes
+        self.compression = check.opt_inst_param(compression, 'compression', Compression)
+
+    def _entry_dir(self, cache_key):
+        return os.path.join(self.directory, cache_key)
+
+    def get_entry(self, cache_key):
+        check.str_param(cache_key, 'cache_key')
+
+        entry_dir = self._entry_dir(cache_key)
+        manifest_path = os.path.join(entry_dir, MANIFEST_FILE_NAME)
+        try:
+            with open(manifest_path, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+            last_used = os.path.getmtime(manifest_path)
+            size_bytes = _directory_size(entry_dir)
+        except (IOError, OSError, ValueError):
+            # Missing, or removed concurrently
+            return None
+
+        return StepCacheEntry(
+            cache_key=cache_key,
+            pipeline_name=str(manifest['pipeline_name']),
+            step_key=str(manifest['step_key']),
+            output_names=[str(output_name) for output_name in manifest['output_names']],
+            size_bytes=size_bytes,
+            last_used=last_used,
+        )
+
+    def entries(self):
+        '''All entries in the cache, the most recently used first.'''
+        if not os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        for cache_key in os.listdir(self.directory):
+            entry = self.get_entry(cache_key)
+            if entry:
+                entries.append(entry)
+        return sorted(entries, key=lambda entry: entry.last_used, reverse=True)
+
+    def total_size_bytes(self):
+        return sum(entry.size_bytes for entry in self.entries())
+
+    def touch(self, cache_key):
+        check.str_param(cache_key, 'cache_key')
+        os.utime(os.path.join(self._entry_dir(cache_key), MANIFEST_FILE_NAME), None)
+
+    def read_output(self, cache_key, output_name, serialization_strategy):
+        check.str_param(cache_key, 'cache_key')
+        check.str_param(output_name, 'output_name')
+        check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+
+        return deserialize_from_file(
+            serialization_strategy, os.path.join(self._entry_dir(cache_key), output_name)
+        )
+
+    def write_entry(self, cache_key, pipeline_name, step_key, output_values):
+        '''
+        Add an entry, then evict least recently used entries if the cache is over its size.
+
+        Args:
+            output_values (Dict[str, Tuple[SerializationStrategy, Any]])
+        '''
+        check.str_param(cache_key, 'cache_key')
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.str_param(step_key, 'step_key')
+        check.dict_param(output_values, 'output_values', key_type=str, value_type=tuple)
+
+        mkdir_p(self.directory)
+
+        # Written to a temporary directory first so that readers never see a partial entry
+        staging_dir = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+        try:
+            for output_name, (serialization_strategy, value) in output_values.items():
+                serialize_to_file(
+                    serialization_strategy,
+                    value,
+                    os.path.join(staging_dir, output_name),
+                    self.compression,
+                )
+
+            with open(os.path.join(staging_dir, MANIFEST_FILE_NAME), 'w') as manifest_file:
+                json.dump(
+                    {
+                        'pipeline_name': pipeline_name,
+                        'step_key': step_key,
+                        'output_names': sorted(output_values.keys()),
+                        'created': time.time(),
+                    },
+                    manifest_file,
+                )
+
+            self.remove_entry(cache_key)
+            os.rename(staging_dir, self._entry_dir(cache_key))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.prune()
+
+    def remove_entry(self, cache_key):
+        check.str_param(cache_key, 'cache_key')
+        shutil.rmtree(self._entry_dir(cache_key), ignore_errors=True)
+
+    def prune(self, max_size_bytes=None):
+        '''
+        Evict least recently used entries until the cache is no larger than max_size_bytes,
+        which defaults to the maximum size of the cache. Returns the evicted entries.
+        '''
+        check.opt_int_param(max_size_bytes, 'max_size_bytes')
+        if max_size_bytes is None:
+            max_size_bytes = self.max_size_bytes
+
+        entries = self.entries()
+        total_size_bytes = sum(entry.size_bytes for entry in entries)
+
+        evicted = []
+        while entries and total_size_bytes > max_size_bytes:
+            entry = entries.pop()
+            self.remove_entry(entry.cache_key)
+            total_size_bytes -= entry.size_bytes
+            evicted.append(entry)
+        return evicted
+
+
+def _directory_size(path):
+    size_bytes = 0
+    for file_name in os.listdir(path):
+        size_bytes += os.path.getsize(os.path.join(path, file_name))
+    return size_bytes
+
+
+class _HashingFile(object):
+    '''A write-only file object that feeds everything written to it into a hash.'''
+
+    def __init__(self):
+        self.hasher = hashlib.sha256()
+
+    def write(self, data):
+        self.hasher.update(data)
+
+
+def _transform_fn_source(transform_fn):
+    # Solids created with the decorators wrap the user's function
+    while hasattr(transform_fn, '__wrapped__'):
+        transform_fn = transform_fn.__wrapped__
+
+    try:
+        return inspect.getsource(transform_fn)
+    except (IOError, OSError, TypeError):
+        return None
+
+
+def compute_step_cache_key(step_context, inputs):
+    '''
+    Returns the cache key of a transform step given the values of its inputs, or None if the
+    step cannot be cached.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.dict_param(inputs, 'inputs', key_type=str)
+
+    step = step_context.step
+    if step.kind != StepKind.TRANSFORM:
+        return None
+
+    if has_streaming_inputs(step) or has_streaming_outputs(step):
+        # Streams can only be iterated once, so they cannot be hashed or stored
+        return None
+
+    source = _transform_fn_source(step.solid.definition.transform_fn)
+    if source is None:
+        return None
+
+    solid_config = step_context.for_transform().solid_config
+
+    hasher = hashlib.sha256()
+    for part in [
+        step.solid.definition.name,
+        source,
+        json.dumps(solid_config, sort_keys=True, default=repr),
+        json.dumps([step_output.name for step_output in step.step_outputs]),
+    ]:
+        hasher.update(part.encode('utf-8'))
+
+    for input_name in sorted(inputs.keys()):
+        hashing_file = _HashingFile()
+        try:
+            step.step_input_named(input_name).runtime_type.serialization_strategy.serialize_value(
+                inputs[input_name], hashing_file
+            )
+        except Exception:  # pylint: disable=W0703
+            step_context.log.debug(
+                'Not caching step {step_key} as input {input_name} cannot be serialized'.format(
+                    step_key=step.key, input_name=input_name
+                )
+            )
+            return None
+        hasher.update(input_name.encode('utf-8'))
+        hasher.update(hashing_file.hasher.digest())
+
+    return hasher.hexdigest()
+
+
+def lookup_cached_step_events(step_context, inputs):
+    '''
+    Returns a tuple of the cache key of the step, which is None if the step cannot be cached,
+    and the step events of a previous execution of the step, which are None if there is none.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+
+    step_cache = step_context.step_cache
+    if step_cache is None:
+        return None, None
+
+    cache_key = compute_step_cache_key(step_context, inputs)
+    if cache_key is None:
+        return None, None
+
+    step = step_context.step
+    entry = step_cache.get_entry(cache_key)
+    if entry is None:
+        return cache_key, None
+
+    try:
+        step_events = [
+            ExecutionStepEvent.step_output_event(
+                step=step,
+                success_data=StepSuccessData(
+                    output_name=output_name,
+                    value=step_cache.read_output(
+                        cache_key,
+                        output_name,
+                        step.step_output_named(output_name).runtime_type.serialization_strategy,
+                    ),
+                ),
+            )
+            for output_name in entry.output_names
+        ]
+        step_cache.touch(cache_key)
+    except Exception:  # pylint: disable=W0703
+        step_context.log.warning(
+            'Could not load cached outputs of step {step_key}, executing it instead'.format(
+                step_key=step.key
+            )
+        )
+        return cache_key, None
+
+    step_context.events.execution_plan_step_cache_hit(step.key, cache_key)
+    return cache_key, step_events
+
+
+def store_step_events(step_context, cache_key, step_events):
+    '''Store the outputs of a step that succeeded under its cache key.'''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.str_param(cache_key, 'cache_key')
+    check.list_param(step_events, 'step_events', of_type=ExecutionStepEvent)
+
+    step = step_context.step
+    try:
+        step_context.step_cache.write_entry(
+            cache_key,
+            step_context.pipeline_def.name,
+            step.key,
+            {
+                step_event.success_data.output_name: (
+                    step.step_output_named(
+                        step_event.success_data.output_name
+                    ).runtime_type.serialization_strategy,
+                    step_event.success_data.value,
+                )
+                for step_event in step_events
+            },
+        )
+    except Exception:  # pylint: disable=W0703
+        step_context.log.warning(
+            'Could not cache the outputs of step {step_key}'.format(step_key=step.key)
+        )
@@ -0,0 +1,296 @@
+'''
+Streaming outputs pass an iterator of chunks from a solid to the solid that consumes them,
+rather than a single value produced in full before the consumer starts.
+
+The transform of the producing solid emits an iterable of chunks for a streaming output, and
+its step completes as soon as it has. The chunks are only produced once the consuming step
+starts iterating over its streaming input: a thread then pulls chunks from the producer into a
+buffer bounded by execution: stream_buffer_size, blocking the producer whenever the buffer is
+full, so that the producer runs at most that many chunks ahead of the consumer. With a buffer
+size of 0 chunks are produced in the consuming thread as they are requested.
+
+Every chunk is type checked against the type of the output and of the input, and the
+expectations of the output and of the input are evaluated on every chunk, rather than by
+expectation steps. Errors raised while producing chunks, including expectation failures, fail
+the consuming step.
+
+A stream can only be iterated once, so a streaming output must be consumed by exactly one
+streaming input, and cannot be materialized, cached or persisted for resumption.
+'''
+
+import logging
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+from future.utils import raise_from
+
+from dagster import check
+from dagster.core.errors import (
+    DagsterError,
+    DagsterExecutionStepExecutionError,
+    DagsterExpectationFailedError,
+    DagsterInvariantViolationError,
+    DagsterRuntimeCoercionError,
+    DagsterTypeError,
+)
+from dagster.core.execution_context import StepExecutionContext
+
+from .objects import ExecutionStep, StepKind
+
+# How often a producer blocked on a full buffer checks whether the consumer stopped iterating
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+def is_streaming_output(step, output_name):
+    check.inst_param(step, 'step', ExecutionStep)
+    check.str_param(output_name, 'output_name')
+
+    return (
+        step.kind == StepKind.TRANSFORM
+        and step.solid.definition.output_def_named(output_name).is_streaming
+    )
+
+
+def is_streaming_input(step, input_name):
+    check.inst_param(step, 'step', ExecutionStep)
+    check.str_param(input_name, 'input_name')
+
+    return (
+        step.kind == StepKind.TRANSFORM
+        and step.solid.definition.input_def_named(input_name).is_streaming
+    )
+
+
+def has_streaming_outputs(step):
+    check.inst_param(step, 'step', ExecutionStep)
+    return any(is_streaming_output(step, step_output.name) for step_output in step.step_outputs)
+
+
+def has_streaming_inputs(step):
+    check.inst_param(step, 'step', ExecutionStep)
+    return any(is_streaming_input(step, step_input.name) for step_input in step.step_inputs)
+
+
+class _Chunk(object):
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _ProducerError(object):
+    __slots__ = ['exc_info']
+
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+
+_END = object()
+
+
+class ChunkStream(object):
+    '''
+    The value of a streaming output. Iterating over it yields the chunks of the output, which
+    are produced as they are consumed.
+    '''
+
+    def __init__(self, chunks, buffer_size, description):
+        self._chunks = check.generator_param(chunks, 'chunks')
+        self.buffer_size = check.int_param(buffer_size, 'buffer_size')
+        check.param_invariant(buffer_size >= 0, 'buffer_size', 'Cannot be negative')
+        self.description = check.str_param(description, 'description')
+        self._iterated = False
+
+    def __repr__(self):
+        return '<stream of {description}>'.format(description=self.description)
+
+    def __iter__(self):
+        if self._iterated:
+            raise DagsterInvariantViolationError(
+                'The stream of {description} has already been iterated. The chunks of a '
+                'streaming output can only be consumed once.'.format(description=self.description)
+            )
+        self._iterated = True
+
+        if self.buffer_size == 0:
+            return self._chunks
+
+        return self._iterate_buffered()
+
+    def _iterate_buffered(self):
+        buffer_queue = queue.Queue(maxsize=self.buffer_size)
+        stopped = threading.Event()
+
+        producer = threading.Thread(
+            target=_produce_chunks, args=(self._chunks, buffer_queue, stopped)
+        )
+        producer.daemon = True
+        producer.start()
+
+        try:
+            while True:
+                item = buffer_queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _ProducerError):
+                    six.reraise(*item.exc_info)
+                yield item.value
+        finally:
+            # The consumer stopped iterating, either because the stream is exhausted or
+            # because it failed or returned early. Unblock and stop the producer.
+            stopped.set()
+            while producer.is_alive():
+                try:
+                    buffer_queue.get(timeout=_PUT_TIMEOUT_SECONDS)
+                except queue.Empty:
+                    pass
+            producer.join()
+
+
+def _put_until_stopped(buffer_queue, item, stopped):
+    while not stopped.is_set():
+        try:
+            buffer_queue.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_chunks(chunks, buffer_queue, stopped):
+    try:
+        for chunk in chunks:
+            if not _put_until_stopped(buffer_queue, _Chunk(chunk), stopped):
+                return
+    except Exception:  # pylint: disable=W0703
+        _put_until_stopped(buffer_queue, _ProducerError(sys.exc_info()), stopped)
+        return
+    finally:
+        chunks.close()
+
+    _put_until_stopped(buffer_queue, _END, stopped)
+
+
+def _evaluate_expectations(step_context, inout_def, chunk):
+    for expectation_def in inout_def.expectations:
+        expectation_context = step_context.for_expectation(inout_def, expectation_def)
+        expt_result = expectation_def.expectation_fn(step_context, chunk)
+        if not expt_result.success:
+            if expectation_context.log.is_enabled_for(logging.DEBUG):
+                expectation_context.log.debug(
+                    'Expectation {name} of {key} {inout_name} failed on chunk {value}.'.format(
+                        name=expectation_def.name,
+                        key=inout_def.descriptive_key,
+                        inout_name=inout_def.name,
+                        value=inout_def.runtime_type.value_summarizer.summarize_value(chunk),
+                    )
+                )
+            raise DagsterExpectationFailedError(expectation_context, chunk)
+
+
+def _checked_output_chunks(step_context, output_def, chunks):
+    step = step_context.step
+    evaluate_expectations = step_context.environment_config.expectations.evaluate
+
+    try:
+        for chunk in chunks:
+            try:
+                chunk = output_def.runtime_type.coerce_runtime_value(chunk)
+            except DagsterRuntimeCoercionError as e:
+                raise DagsterInvariantViolationError(
+                    (
+                        'Solid {solid_name} streaming output {output_name} chunk {chunk} type '
+                        'failure: {error_msg}.'
+                    ).format(
+                        solid_name=step.solid.name,
+                        output_name=output_def.name,
+                        chunk=chunk,
+                        error_msg=','.join(e.args),
+                    )
+                )
+
+            if evaluate_expectations:
+                _evaluate_expectations(step_context, output_def, chunk)
+
+            yield chunk
+    except DagsterError:
+        raise
+    except Exception as e:  # pylint: disable=W0703
+        raise_from(
+            DagsterExecutionStepExecutionError(
+                'Error occured producing the chunks of streaming output {output_name} of step '
+                '{key}'.format(output_name=output_def.name, key=step.key),
+                user_exception=e,
+                original_exc_info=sys.exc_info(),
+            ),
+            e,
+        )
+
+
+def create_chunk_stream(step_context, output_name, value):
+    '''
+    Wraps the iterable of chunks a transform emitted for a streaming output in a ChunkStream
+    that type checks them and evaluates the expectations of the output on them.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.str_param(output_name, 'output_name')
+
+    step = step_context.step
+    output_def = step.solid.definition.output_def_named(output_name)
+
+    if isinstance(value, six.string_types) or not hasattr(value, '__iter__'):
+        raise DagsterInvariantViolationError(
+            (
+                'Solid {solid_name} output {output_name} is a streaming output, so its value must '
+                'be an iterable of chunks. Got {value}.'
+            ).format(solid_name=step.solid.name, output_name=output_name, value=repr(value))
+        )
+
+    return ChunkStream(
+        _checked_output_chunks(step_context, output_def, iter(value)),
+        step_context.environment_config.execution.stream_buffer_size,
+        'output {output_name} of step {key}'.format(output_name=output_name, key=step.key),
+    )
+
+
+def iterate_input_chunks(step_context, input_name, value):
+    '''
+    Iterates over the chunks received by a streaming input, type checking them and evaluating
+    the expectations of the input on them. Values of outputs that are not streaming, such as
+    values from config, are iterated over as chunks.
+    '''
+    check.inst_param(step_context, 'step_context', StepExecutionContext)
+    check.str_param(input_name, 'input_name')
+
+    step = step_context.step
+    input_def = step.solid.definition.input_def_named(input_name)
+    evaluate_expectations = step_context.environment_config.expectations.evaluate
+
+    for chunk in value:
+        try:
+            chunk = input_def.runtime_type.coerce_runtime_value(chunk)
+        except DagsterRuntimeCoercionError as evaluate_error:
+            raise_from(
+                DagsterTypeError(
+                    (
+                        'Solid {solid_name} streaming input {input_name} received chunk {chunk} '
+                        'which does not pass the typecheck for Dagster type {type_name}. '
+                        'Step {key}'
+                    ).format(
+                        solid_name=step.solid.name,
+                        input_name=input_name,
+                        chunk=chunk,
+                        type_name=input_def.runtime_type.name,
+                        key=step.key,
+                    )
+                ),
+                evaluate_error,
+            )
+
+        if evaluate_expectations:
+            _evaluate_expectations(step_context, input_def, chunk)
+
+        yield chunk
@@ -1,7 +1,11 @@
+import logging
+
 from dagster import check
 from dagster.core.definitions import Result, Solid
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution_context import TransformExecutionContext, PipelineExecutionContext
+from dagster.core.types.summary import summarize_value
+from dagster.utils import is_async_generator, is_async_generator_function
 
 from .objects import ExecutionStep, StepInput, StepKind, StepOutput, StepOutputValue
 
@@ -11,6 +15,11 @@ def create_transform_step(pipeline_context, solid, step_inputs):
     check.inst_param(solid, 'solid', Solid)
     check.list_param(step_inputs, 'step_inputs', of_type=StepInput)
 
+    if pipeline_context.environment_config.execution.fast_path:
+        execute_core_transform = _execute_core_transform_fast
+    else:
+        execute_core_transform = _execute_core_transform
+
     return ExecutionStep(
         pipeline_context=pipeline_context,
         key='{solid.name}.transform'.format(solid=solid),
@@ -19,7 +28,7 @@ def create_transform_step(pipeline_context, solid, step_inputs):
             StepOutput(name=output_def.name, runtime_type=output_def.runtime_type)
             for output_def in solid.definition.output_defs
         ],
-        compute_fn=lambda step_context, inputs: _execute_core_transform(
+        compute_fn=lambda step_context, inputs: execute_core_transform(
             step_context.for_transform(), inputs
         ),
         kind=StepKind.TRANSFORM,
@@ -27,11 +36,39 @@ def create_transform_step(pipeline_context, solid, step_inputs):
     )
 
 
+def is_async_transform_step(step):
+    '''True for transform steps of solids whose transform_fn is an async generator function.'''
+    check.inst_param(step, 'step', ExecutionStep)
+    return step.kind == StepKind.TRANSFORM and is_async_generator_function(
+        step.solid.definition.transform_fn
+    )
+
+
 def _yield_transform_results(transform_context, inputs):
     check.inst_param(transform_context, 'transform_context', TransformExecutionContext)
+
+    for result in _iterate_transform_fn(transform_context, inputs):
+        yield step_output_value_for_result(transform_context, result)
+
+
+def _iterate_transform_fn(transform_context, inputs):
     step = transform_context.step
     gen = step.solid.definition.transform_fn(transform_context, inputs)
 
+    check_transform_fn_return(step, gen)
+
+    if is_async_generator(gen):
+        raise DagsterInvariantViolationError(
+            (
+                'Transform for solid {solid_name} is asynchronous. Solids defined with async '
+                'def must be executed with the asyncio engine.'
+            ).format(solid_name=step.solid.name)
+        )
+
+    return () if gen is None else gen
+
+
+def check_transform_fn_return(step, gen):
     if isinstance(gen, Result):
         raise DagsterInvariantViolationError(
             (
@@ -41,24 +78,44 @@ def _yield_transform_results(transform_context, inputs):
             ).format(solid_name=step.solid.name)
         )
 
-    if gen is None:
-        return
 
-    for result in gen:
-        if not isinstance(result, Result):
-            raise DagsterInvariantViolationError(
-                (
-                    'Transform for solid {solid_name} yielded {result} rather an '
-                    'an instance of the Result class.'
-                ).format(result=repr(result), solid_name=step.solid.name)
-            )
+def step_output_value_for_result(transform_context, result):
+    check.inst_param(transform_context, 'transform_context', TransformExecutionContext)
 
-        transform_context.log.info(
-            'Solid {solid} emitted output "{output}" value {value}'.format(
-                solid=step.solid.name, output=result.output_name, value=repr(result.value)
-            )
+    check_transform_result(transform_context.step, result)
+    _log_transform_result(transform_context, result)
+    return StepOutputValue(output_name=result.output_name, value=result.value)
+
+
+def check_transform_result(step, result):
+    if not isinstance(result, Result):
+        raise DagsterInvariantViolationError(
+            (
+                'Transform for solid {solid_name} yielded {result} rather an '
+                'an instance of the Result class.'
+            ).format(result=repr(result), solid_name=step.solid.name)
         )
-        yield StepOutputValue(output_name=result.output_name, value=result.value)
+
+
+def _log_transform_result(transform_context, result):
+    # Summarizing the value can be expensive, so it is skipped if the message is not logged
+    if not transform_context.log.is_enabled_for(logging.INFO):
+        return
+
+    step = transform_context.step
+    # Results for outputs the solid does not define are only rejected after they are logged
+    value_summary = (
+        step.step_output_named(result.output_name).runtime_type.value_summarizer.summarize_value(
+            result.value
+        )
+        if step.has_step_output(result.output_name)
+        else summarize_value(result.value)
+    )
+    transform_context.log.info(
+        'Solid {solid} emitted output "{output}" value {value}'.format(
+            solid=step.solid.name, output=result.output_name, value=value_summary
+        )
+    )
 
 
 def _execute_core_transform(transform_context, inputs):
@@ -81,8 +138,41 @@ def _execute_core_transform(transform_context, inputs):
         yield step_output_value
         all_results.append(step_output_value)
 
-    if len(all_results) != len(solid.definition.output_defs):
-        emitted_result_names = {r.output_name for r in all_results}
+    log_omitted_outputs(transform_context, all_results)
+
+
+def _execute_core_transform_fast(transform_context, inputs):
+    '''
+    The counterpart of _execute_core_transform for execution: fast_path, which does not
+    validate its arguments nor create StepOutputValues through their validating constructor.
+    '''
+    step = transform_context.step
+
+    transform_context.log.debug(
+        'Executing core transform for solid {solid}.'.format(solid=step.solid.name)
+    )
+
+    emitted_output_names = []
+    for result in _iterate_transform_fn(transform_context, inputs):
+        check_transform_result(step, result)
+        _log_transform_result(transform_context, result)
+        yield StepOutputValue._make((result.output_name, result.value))
+        emitted_output_names.append(result.output_name)
+
+    _log_omitted_outputs(transform_context, emitted_output_names)
+
+
+def log_omitted_outputs(transform_context, all_results):
+    check.inst_param(transform_context, 'transform_context', TransformExecutionContext)
+    check.list_param(all_results, 'all_results', of_type=StepOutputValue)
+
+    _log_omitted_outputs(transform_context, [r.output_name for r in all_results])
+
+
+def _log_omitted_outputs(transform_context, emitted_output_names):
+    solid = transform_context.step.solid
+    if len(emitted_output_names) != len(solid.definition.output_defs):
+        emitted_result_names = set(emitted_output_names)
         solid_output_names = {output_def.name for output_def in solid.definition.output_defs}
         omitted_outputs = solid_output_names.difference(emitted_result_names)
         transform_context.log.info(
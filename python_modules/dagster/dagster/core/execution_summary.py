@@ -0,0 +1,112 @@
+'''
+Summaries of the steps executed in a run: whether they succeeded, the outputs they produced and
+how long they took, without their output values.
+
+execute_pipeline records a summary for every step that emits step events, so that runs whose
+results only retain some output values still report on every step. Durations are the step
+timings the engine records as steps complete, which are only known for the steps executed in
+this process: steps executed by the workers of the multiprocess engine have no duration.
+'''
+
+from collections import OrderedDict, namedtuple
+
+from dagster import check
+
+from .execution_plan.objects import ExecutionStepEvent, StepKind
+
+
+class StepExecutionSummary(
+    namedtuple(
+        '_StepExecutionSummary',
+        'step_key solid_name kind success output_names error_message millis',
+    )
+):
+    '''The status and timing of a step executed in a run.
+
+    Attributes:
+        step_key (str): Key of the step
+        solid_name (str): Name of the solid the step belongs to
+        kind (StepKind): Kind of the step
+        success (bool): Whether the step completed without failing
+        output_names (List[str]): Names of the outputs the step produced, in order
+        error_message (Optional[str]): Message of the error the step failed with, or of the
+            exception raised by user code
+        millis (Optional[float]): How long the step took to compute, if it was timed
+    '''
+
+    def __new__(cls, step_key, solid_name, kind, success, output_names, error_message, millis):
+        return super(StepExecutionSummary, cls).__new__(
+            cls,
+            step_key=check.str_param(step_key, 'step_key'),
+            solid_name=check.str_param(solid_name, 'solid_name'),
+            kind=check.inst_param(kind, 'kind', StepKind),
+            success=check.bool_param(success, 'success'),
+            output_names=check.list_param(output_names, 'output_names', of_type=str),
+            error_message=check.opt_str_param(error_message, 'error_message'),
+            millis=check.opt_float_param(millis, 'millis'),
+        )
+
+
+class _StepState(object):
+    __slots__ = ('solid_name', 'kind', 'output_names', 'error_message')
+
+    def __init__(self, solid_name, kind):
+        self.solid_name = solid_name
+        self.kind = kind
+        self.output_names = []
+        self.error_message = None
+
+
+class StepSummaryCollector(object):
+    '''
+    Builds the StepExecutionSummary of every step from the step events of a run, which can be
+    dropped once they are added.
+    '''
+
+    def __init__(self):
+        self._steps = OrderedDict()
+
+    def add_step_event(self, step_event):
+        check.inst_param(step_event, 'step_event', ExecutionStepEvent)
+
+        step = step_event.step
+        state = self._steps.get(step.key)
+        if state is None:
+            state = self._steps[step.key] = _StepState(step.solid.name, step.kind)
+
+        if step_event.is_step_failure:
+            error = step_event.failure_data.dagster_error
+            # The message of the error raised by user code rather than that of its wrapper
+            user_exception = getattr(error, 'user_exception', None)
+            state.error_message = str(user_exception if user_exception is not None else error)
+        else:
+            state.output_names.append(step_event.success_data.output_name)
+
+    def summaries(self, step_timings=None):
+        '''
+        The summaries of the steps, in the order they first emitted a step event, with their
+        durations in step_timings, by step key.
+        '''
+        step_timings = check.opt_dict_param(step_timings, 'step_timings', key_type=str)
+        return [
+            StepExecutionSummary(
+                step_key=step_key,
+                solid_name=state.solid_name,
+                kind=state.kind,
+                success=state.error_message is None,
+                output_names=list(state.output_names),
+                error_message=state.error_message,
+                millis=step_timings.get(step_key),
+            )
+            for step_key, state in self._steps.items()
+        ]
+
+
+def summarize_step_events(step_events):
+    '''The StepExecutionSummary of the steps of a list of step events, without durations.'''
+    check.list_param(step_events, 'step_events', of_type=ExecutionStepEvent)
+
+    collector = StepSummaryCollector()
+    for step_event in step_events:
+        collector.add_step_event(step_event)
+    return collector.summaries()
@@ -8,6 +8,17 @@ from dagster import check
 
 DAGSTER_META_KEY = 'dagster_meta'
 
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+# Set by DagsterLog on every message, ahead of the run id and tags
+SYNTHESIZED_PROPS = ('orig_message', 'log_message_id')
+
 
 def _kv_message(all_items):
     return ' '.join(
@@ -18,6 +29,44 @@ def _kv_message(all_items):
     )
 
 
+class StructuredLogMessage(object):
+    '''
+    The message DagsterLog passes to loggers: every prop of the message formatted as key=value
+    pairs. It is only formatted when it is converted to a string, which is when a handler
+    formats the record, so that messages which are not emitted are never formatted.
+
+    serialized_static_props is the preformatted run id and tags of the DagsterLog, or None if
+    all_props has to be formatted in full.
+    '''
+
+    __slots__ = ['_all_props', '_message_props', '_serialized_static_props', '_message']
+
+    def __init__(self, all_props, message_props, serialized_static_props):
+        self._all_props = all_props
+        self._message_props = message_props
+        self._serialized_static_props = serialized_static_props
+        self._message = None
+
+    def __str__(self):
+        if self._message is None:
+            if self._serialized_static_props is None:
+                self._message = _kv_message(self._all_props.items())
+            else:
+                self._message = ' '.join(
+                    part
+                    for part in [
+                        _kv_message((key, self._all_props[key]) for key in SYNTHESIZED_PROPS),
+                        self._serialized_static_props,
+                        _kv_message(self._message_props.items()),
+                    ]
+                    if part
+                )
+        return self._message
+
+    def __repr__(self):
+        return repr(str(self))
+
+
 class DagsterLog:
     def __init__(self, run_id, tags, loggers):
 
@@ -25,8 +74,29 @@ class DagsterLog:
         self.tags = check.dict_param(tags, 'tags')
         self.loggers = check.list_param(loggers, 'loggers', of_type=logging.Logger)
 
+        # The run id and tags are the same for every message, so they are only formatted once
+        self._static_props = dict(itertools.chain([('run_id', run_id)], tags.items()))
+        if any(key in self._static_props for key in SYNTHESIZED_PROPS):
+            self._serialized_static_props = None
+        else:
+            self._serialized_static_props = _kv_message(self._static_props.items())
+
+    def is_enabled_for(self, level):
+        '''
+        Whether any of the loggers emits messages of the level, so that messages which are
+        expensive to compute can be skipped when they would not be logged.
+        '''
+        check.int_param(level, 'level')
+        return any(logger.isEnabledFor(level) for logger in self.loggers)
+
     def _log(self, method, orig_message, message_props):
         check.str_param(method, 'method')
+
+        # Nothing is done for messages that no logger is enabled for
+        loggers = [logger for logger in self.loggers if logger.isEnabledFor(LOG_LEVELS[method])]
+        if not loggers:
+            return
+
         check.str_param(orig_message, 'orig_message')
         check.dict_param(message_props, 'message_props')
 
@@ -43,19 +113,26 @@ class DagsterLog:
 
         log_message_id = str(uuid.uuid4())
 
-        synth_props = {
-            'orig_message': orig_message,
-            'log_message_id': log_message_id,
-            'run_id': self.run_id,
-        }
+        synth_props = {'orig_message': orig_message, 'log_message_id': log_message_id}
 
         # We first generate all props for the purpose of producing the semi-structured
-        # log message via _kv_messsage
+        # log message via StructuredLogMessage
         all_props = dict(
-            itertools.chain(synth_props.items(), self.tags.items(), message_props.items())
+            itertools.chain(synth_props.items(), self._static_props.items(), message_props.items())
         )
 
-        message_with_structured_props = _kv_message(all_props.items())
+        if self._serialized_static_props is not None and all(
+            key not in self._static_props for key in message_props
+        ):
+            serialized_static_props = self._serialized_static_props
+        else:
+            # Props of the message override the tags in place, so the message is formatted in
+            # full
+            serialized_static_props = None
+
+        message_with_structured_props = StructuredLogMessage(
+            all_props, message_props, serialized_static_props
+        )
 
         # So here we use the arbitrary key DAGSTER_META_KEY to store a dictionary of
         # all the meta information that dagster injects into log message.
@@ -69,7 +146,7 @@ class DagsterLog:
         #     message_with_structured_props, extra={DAGSTER_META_KEY: all_props}
         # )
 
-        for logger in self.loggers:
+        for logger in loggers:
             logger_method = check.is_callable(getattr(logger, method))
             logger_method(message_with_structured_props, extra={DAGSTER_META_KEY: all_props})
 
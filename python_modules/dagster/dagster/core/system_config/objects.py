@@ -4,11 +4,23 @@ from dagster import check
 
 DEFAULT_CONTEXT_NAME = 'default'
 
+DEFAULT_STREAM_BUFFER_SIZE = 16
+
+DEFAULT_TOP_ALLOCATIONS = 25
+
 
 def _default_persistence_config():
     return {'file': {}}
 
 
+def _default_engine_config():
+    return {'in_process': {}}
+
+
+def _default_intermediate_store_config():
+    return {'in_memory': {}}
+
+
 # lifted from https://bit.ly/2HcQAuv
 class ContextConfig(namedtuple('_ContextConfig', 'name config resources persistence')):
     def __new__(cls, name=None, config=None, resources=None, persistence=None):
@@ -70,7 +82,42 @@ class ExpectationsConfig(namedtuple('_ExpecationsConfig', 'evaluate')):
         )
 
 
-class ExecutionConfig(namedtuple('_ExecutionConfig', '')):
-    def __new__(cls):
-
-        return super(ExecutionConfig, cls).__new__(cls)
+class ExecutionConfig(
+    namedtuple(
+        '_ExecutionConfig',
+        (
+            'engine intermediate_store cache resumable compression stream_buffer_size fast_path '
+            'profile'
+        ),
+    )
+):
+    def __new__(
+        cls,
+        engine=None,
+        intermediate_store=None,
+        cache=None,
+        resumable=None,
+        compression=None,
+        stream_buffer_size=None,
+        fast_path=False,
+        profile=None,
+    ):
+        return super(ExecutionConfig, cls).__new__(
+            cls,
+            _default_engine_config()
+            if engine is None
+            else check.dict_param(engine, 'engine', key_type=str),
+            _default_intermediate_store_config()
+            if intermediate_store is None
+            else check.dict_param(intermediate_store, 'intermediate_store', key_type=str),
+            None if cache is None else check.dict_param(cache, 'cache', key_type=str),
+            None if resumable is None else check.dict_param(resumable, 'resumable', key_type=str),
+            None
+            if compression is None
+            else check.dict_param(compression, 'compression', key_type=str),
+            DEFAULT_STREAM_BUFFER_SIZE
+            if stream_buffer_size is None
+            else check.int_param(stream_buffer_size, 'stream_buffer_size'),
+            check.bool_param(fast_path, 'fast_path'),
+            None if profile is None else check.dict_param(profile, 'profile', key_type=str),
+        )
@@ -0,0 +1,274 @@
+'''
+Stream compression of serialized values.
+
+Compressed files start with a header naming the codec that compressed them, so they can be
+read back without knowing how they were written, and files without the header are read as
+they are. zlib, gzip and bz2 are always available, lzma on Python 3, and zstd when the
+zstandard package is installed.
+'''
+
+from collections import namedtuple
+import bz2
+import io
+import struct
+import zlib
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSED_HEADER_MAGIC = b'DAGSTER.Z1'
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _zlib_compressor(level):
+    return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level)
+
+
+def _gzip_compressor(level):
+    return zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+
+
+def _bz2_compressor(level):
+    return bz2.BZ2Compressor(9 if level is None else level)
+
+
+def _lzma_compressor(level):
+    return lzma.LZMACompressor(preset=level)
+
+
+def _zstd_compressor(level):
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+
+
+class Codec(namedtuple('_Codec', 'name compressor_fn decompressor_fn requires')):
+    '''
+    A compression codec. compressor_fn takes the compression level, which is None for the
+    default level of the codec, and decompressor_fn takes no arguments. Both return objects
+    with the interface of the compression objects of the zlib module, or of the decompressors
+    of the bz2 and lzma modules, which bound their output with max_length as well.
+    '''
+
+    def __new__(cls, name, compressor_fn, decompressor_fn, requires=None):
+        return super(Codec, cls).__new__(
+            cls,
+            check.str_param(name, 'name'),
+            check.callable_param(compressor_fn, 'compressor_fn'),
+            check.callable_param(decompressor_fn, 'decompressor_fn'),
+            check.opt_str_param(requires, 'requires'),
+        )
+
+    @property
+    def is_available(self):
+        return self.requires is None
+
+
+CODECS = {
+    codec.name: codec
+    for codec in [
+        Codec('zlib', _zlib_compressor, zlib.decompressobj),
+        Codec('gzip', _gzip_compressor, lambda: zlib.decompressobj(16 + zlib.MAX_WBITS)),
+        Codec('bz2', _bz2_compressor, bz2.BZ2Decompressor),
+        Codec(
+            'lzma',
+            _lzma_compressor,
+            lambda: lzma.LZMADecompressor(),  # pylint: disable=W0108
+            requires=None if lzma else 'Python 3',
+        ),
+        Codec(
+            'zstd',
+            _zstd_compressor,
+            lambda: zstandard.ZstdDecompressor().decompressobj(),
+            requires=None if zstandard else 'the zstandard package',
+        ),
+    ]
+}
+
+
+def get_codec(name):
+    check.str_param(name, 'name')
+
+    if name not in CODECS:
+        raise DagsterInvariantViolationError(
+            'Unknown compression codec {name}. Available codecs are {codecs}.'.format(
+                name=name, codecs=', '.join(sorted(CODECS.keys()))
+            )
+        )
+
+    codec = CODECS[name]
+    if not codec.is_available:
+        raise DagsterInvariantViolationError(
+            'Compression codec {name} requires {requires}.'.format(
+                name=name, requires=codec.requires
+            )
+        )
+    return codec
+
+
+class Compression(namedtuple('_Compression', 'codec level')):
+    '''A codec and the level to compress with, which is None for the default of the codec.'''
+
+    def __new__(cls, codec, level=None):
+        return super(Compression, cls).__new__(
+            cls, check.inst_param(codec, 'codec', Codec), check.opt_int_param(level, 'level')
+        )
+
+
+class _CompressedWriter(io.RawIOBase):
+    def __init__(self, write_file_obj, compressor):
+        super(_CompressedWriter, self).__init__()
+        self._write_file_obj = write_file_obj
+        self._compressor = compressor
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        data = self._compressor.compress(bytes(b))
+        if data:
+            self._write_file_obj.write(data)
+        return len(b)
+
+    def close(self):
+        if not self.closed:
+            data = self._compressor.flush()
+            if data:
+                self._write_file_obj.write(data)
+        super(_CompressedWriter, self).close()
+
+
+class _DecompressedReader(io.RawIOBase):
+    '''
+    Decompresses at most CHUNK_SIZE bytes at a time where the decompressor can bound its output,
+    so that a small chunk of a highly compressed file is not inflated in memory all at once.
+    '''
+
+    def __init__(self, read_file_obj, decompressor):
+        super(_DecompressedReader, self).__init__()
+        self._read_file_obj = read_file_obj
+        self._decompressor = decompressor
+        # Compressed data read from the file that the decompressor has not consumed yet
+        self._input = b''
+        self._pending = b''
+        self._offset = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def _decompress_with_unconsumed_tail(self):
+        # zlib and gzip
+        if not self._input:
+            self._input = self._read_file_obj.read(CHUNK_SIZE)
+            if not self._input:
+                self._eof = True
+                return self._decompressor.flush()
+
+        data = self._decompressor.decompress(self._input, CHUNK_SIZE)
+        self._input = self._decompressor.unconsumed_tail
+        return data
+
+    def _decompress_with_needs_input(self):
+        # bz2 and lzma, which buffer the input they have not consumed themselves
+        if self._decompressor.eof:
+            self._eof = True
+            return b''
+
+        chunk = b''
+        if self._decompressor.needs_input:
+            chunk = self._read_file_obj.read(CHUNK_SIZE)
+            if not chunk:
+                self._eof = True
+                return b''
+
+        return self._decompressor.decompress(chunk, CHUNK_SIZE)
+
+    def _decompress_unbounded(self):
+        # zstd, and bz2 on Python 2
+        chunk = self._read_file_obj.read(CHUNK_SIZE)
+        if chunk:
+            return self._decompressor.decompress(chunk)
+
+        self._eof = True
+        flush = getattr(self._decompressor, 'flush', None)
+        return flush() if flush else b''
+
+    def _decompress(self):
+        if hasattr(self._decompressor, 'unconsumed_tail'):
+            return self._decompress_with_unconsumed_tail()
+        elif hasattr(self._decompressor, 'needs_input'):
+            return self._decompress_with_needs_input()
+        return self._decompress_unbounded()
+
+    def readinto(self, b):
+        while self._offset == len(self._pending):
+            if self._eof:
+                return 0
+
+            self._pending = self._decompress()
+            self._offset = 0
+
+        size = min(len(b), len(self._pending) - self._offset)
+        b[:size] = self._pending[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+
+def write_compressed_header(write_file_obj, codec):
+    check.inst_param(codec, 'codec', Codec)
+
+    name = codec.name.encode('ascii')
+    write_file_obj.write(COMPRESSED_HEADER_MAGIC + struct.pack('B', len(name)) + name)
+
+
+def read_compressed_header(read_file_obj):
+    '''
+    Reads the header of a compressed file, returning its codec, or returns None and leaves the
+    position of the file where it was if it has no header.
+    '''
+    start = read_file_obj.tell()
+    if read_file_obj.read(len(COMPRESSED_HEADER_MAGIC)) != COMPRESSED_HEADER_MAGIC:
+        read_file_obj.seek(start)
+        return None
+
+    (name_length,) = struct.unpack('B', read_file_obj.read(1))
+    return get_codec(read_file_obj.read(name_length).decode('ascii'))
+
+
+def compressing_file_obj(write_file_obj, compression):
+    '''
+    Writes the header of compression to write_file_obj, then returns a file object that
+    compresses everything written to it into write_file_obj. It must be closed to flush the
+    compressed stream, which leaves write_file_obj open.
+    '''
+    check.inst_param(compression, 'compression', Compression)
+
+    write_compressed_header(write_file_obj, compression.codec)
+    return io.BufferedWriter(
+        _CompressedWriter(write_file_obj, compression.codec.compressor_fn(compression.level)),
+        CHUNK_SIZE,
+    )
+
+
+def decompressing_file_obj(read_file_obj):
+    '''
+    Returns a file object that reads the decompressed contents of read_file_obj if it starts
+    with a compressed header, or read_file_obj itself if it does not.
+    '''
+    codec = read_compressed_header(read_file_obj)
+    if codec is None:
+        return read_file_obj
+
+    return io.BufferedReader(_DecompressedReader(read_file_obj, codec.decompressor_fn()))
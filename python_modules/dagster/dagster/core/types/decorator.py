@@ -2,6 +2,7 @@ from dagster import check
 from .config_schema import InputSchema, OutputSchema
 from .marshal import SerializationStrategy, PickleSerializationStrategy
 from .runtime import PythonObjectType, RuntimeType
+from .summary import ValueSummarizer
 
 
 def _create_object_type_class(**kwargs):
@@ -20,6 +21,7 @@ def _decorate_as_dagster_type(
     input_schema=None,
     output_schema=None,
     serialization_strategy=None,
+    value_summarizer=None,
 ):
     _ObjectType = _create_object_type_class(
         key=key,
@@ -29,6 +31,7 @@ def _decorate_as_dagster_type(
         input_schema=input_schema,
         output_schema=output_schema,
         serialization_strategy=serialization_strategy,
+        value_summarizer=value_summarizer,
     )
 
     type_inst = _ObjectType.inst()
@@ -82,6 +85,7 @@ def as_dagster_type(
     input_schema=None,
     output_schema=None,
     serialization_strategy=None,
+    value_summarizer=None,
 ):
     check.type_param(existing_type, 'existing_type')
     check.opt_str_param(name, 'name')
@@ -89,6 +93,7 @@ def as_dagster_type(
     check.opt_inst_param(input_schema, 'input_schema', InputSchema)
     check.opt_inst_param(output_schema, 'output_schema', OutputSchema)
     check.opt_inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+    check.opt_inst_param(value_summarizer, 'value_summarizer', ValueSummarizer)
 
     if serialization_strategy is None:
         serialization_strategy = PickleSerializationStrategy()
@@ -103,4 +108,5 @@ def as_dagster_type(
         input_schema=input_schema,
         output_schema=output_schema,
         serialization_strategy=serialization_strategy,
+        value_summarizer=value_summarizer,
     )
@@ -1,5 +1,6 @@
 from collections import namedtuple
 from enum import Enum
+import uuid
 
 import six
 
@@ -7,6 +8,7 @@ from dagster import check
 
 from dagster.core.errors import DagsterError
 from dagster.utils import single_item, make_readonly_value
+from dagster.utils.lru_cache import LRUCache
 
 from .config import ConfigType
 from .default_applier import apply_default_values
@@ -78,6 +80,14 @@ class EvaluationStack(namedtuple('_EvaluationStack', 'config_type entries')):
             if isinstance(entry, EvaluationStackPathEntry)
         ]
 
+    @property
+    def path(self):
+        '''The field names and list indices that address the value of the stack.'''
+        return [
+            entry.field_name if isinstance(entry, EvaluationStackPathEntry) else entry.list_index
+            for entry in self.entries
+        ]
+
     @property
     def type_in_context(self):
         ttype = self.entries[-1].config_type if self.entries else self.config_type
@@ -250,8 +260,116 @@ def hard_create_config_value(config_type, config_value):
     return result.value
 
 
+# Environment configs are evaluated on every execution and on every validation of the config
+# in dagit, and can be large, so the results of evaluating them are cached
+DEFAULT_EVALUATION_CACHE_SIZE = 128
+
+EVALUATION_CACHE = LRUCache(DEFAULT_EVALUATION_CACHE_SIZE)
+
+
+class _UncacheableConfigValue(Exception):
+    pass
+
+
+def _config_value_key(config_value):
+    '''
+    A hashable copy of the config value, equal for config values with the same content. The
+    types of scalars are part of the key, as 1, 1.0 and True are equal but not equally valid.
+    Values that are not built of dicts, lists and scalars are not cached.
+    '''
+    if config_value is None or isinstance(
+        config_value, six.string_types + six.integer_types + (float, bool)
+    ):
+        return (type(config_value), config_value)
+    elif isinstance(config_value, dict):
+        return (
+            dict,
+            frozenset(
+                (_config_value_key(key), _config_value_key(value))
+                for key, value in config_value.items()
+            ),
+        )
+    elif isinstance(config_value, list):
+        return (list, tuple(_config_value_key(item) for item in config_value))
+    else:
+        raise _UncacheableConfigValue()
+
+
+def clear_evaluation_cache():
+    EVALUATION_CACHE.clear()
+
+
 def evaluate_config_value(config_type, config_value):
+    '''
+    Validates the config value against the config type and applies its defaults. Results are
+    cached by config type and by the content of the config value, so evaluating the same config
+    again is nearly free. The values of results are read-only, so they can be shared.
+    '''
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    try:
+        # Config types are compared by identity, and are kept alive by the cache
+        key = (config_type, _config_value_key(config_value))
+    except _UncacheableConfigValue:
+        return _evaluate_config_value(config_type, config_value)
+
+    result = EVALUATION_CACHE.get(key)
+    if result is None:
+        result = _evaluate_config_value(config_type, config_value)
+        EVALUATION_CACHE.put(key, result)
+
+    # The errors are copied, as they are the only mutable part of the result
+    return result._replace(errors=list(result.errors))
+
+
+class IncrementalValidationResult(namedtuple('_IncrementalValidationResult', 'errors token')):
+    def __new__(cls, errors, token):
+        return super(IncrementalValidationResult, cls).__new__(
+            cls,
+            check.list_param(errors, 'errors', of_type=EvaluationError),
+            check.str_param(token, 'token'),
+        )
+
+
+# The config types and errors of the config values validated by validate_config_value_incremental,
+# by the tokens returned with them
+DEFAULT_VALIDATION_TOKEN_CACHE_SIZE = 128
+
+VALIDATION_TOKEN_CACHE = LRUCache(DEFAULT_VALIDATION_TOKEN_CACHE_SIZE)
+
+
+def validate_config_value_incremental(
+    config_type, config_value, changed_path=None, previous_token=None
+):
+    '''
+    Validates a config value that is being edited, such as the config in dagit's editor, and
+    returns its errors with a token. The next edit, if it changes only the subtree at
+    changed_path, is validated by passing that token as previous_token: only the changed subtree
+    is validated again, and the errors of the rest of the config value are reused without
+    visiting it. Without changed_path, or if the token has expired, the config value is validated
+    in full. Defaults are not applied.
+    '''
     check.inst_param(config_type, 'config_type', ConfigType)
+    check.opt_list_param(changed_path, 'changed_path', of_type=six.string_types + six.integer_types)
+    check.opt_str_param(previous_token, 'previous_token')
+
+    previous = (
+        VALIDATION_TOKEN_CACHE.get(previous_token)
+        if previous_token is not None and changed_path is not None
+        else None
+    )
+    # Config types are compared by identity, as in the evaluation cache
+    if previous is not None and previous[0] is config_type:
+        errors = validate_config_incremental(config_type, config_value, previous[1], changed_path)
+    else:
+        errors = validate_config(config_type, config_value)
+
+    token = str(uuid.uuid4())
+    VALIDATION_TOKEN_CACHE.put(token, (config_type, errors))
+    return IncrementalValidationResult(errors=list(errors), token=token)
+
+
+def _evaluate_config_value(config_type, config_value):
     errors = validate_config(config_type, config_value)
     if errors:
         return EvaluateValueResult(success=False, value=None, errors=errors)
@@ -271,6 +389,101 @@ def validate_config(config_type, config_value):
     )
 
 
+def validate_config_incremental(config_type, config_value, previous_errors, changed_path):
+    '''
+    The errors of a config value that differs from a config value with previous_errors only in
+    the subtree at changed_path, a list of field names and list indices. List indices may also
+    be given as strings of digits.
+
+    Errors are addressed by their evaluation stacks, so the previous errors outside of the
+    changed subtree still hold, and only the changed subtree is validated again. If the path
+    leaves the config value, for instance because a field was removed, or passes through a
+    selector whose field changed, the deepest subtree that it reaches is validated instead.
+    '''
+    check.inst_param(config_type, 'config_type', ConfigType)
+    check.list_param(previous_errors, 'previous_errors', of_type=EvaluationError)
+    check.list_param(changed_path, 'changed_path', of_type=six.string_types + six.integer_types)
+
+    stack = EvaluationStack(config_type=config_type, entries=[])
+    # The ids of the previous errors of the ancestors of the changed subtree that concern the
+    # branch it is on, which no longer hold once the branch reaches the subtree
+    branch_errors = set()
+
+    for component in changed_path:
+        if config_type.is_nullable and config_value is not None:
+            config_type = config_type.inner_type
+
+        if config_type.is_list:
+            list_index = _list_index(component)
+            if (
+                list_index is None
+                or not isinstance(config_value, list)
+                or list_index >= len(config_value)
+            ):
+                break
+
+            config_type = config_type.inner_type
+            config_value = config_value[list_index]
+            stack = stack_with_list_index(stack, list_index)
+
+        elif config_type.has_fields:
+            if (
+                not isinstance(config_value, dict)
+                or component not in config_type.fields
+                or component not in config_value
+                or (config_type.is_selector and len(config_value) != 1)
+            ):
+                break
+
+            if config_type.is_selector:
+                # The selector holds only the field on the path, so the errors of the selector
+                # itself and of any field it held before are gone
+                branch_errors.update(
+                    id(error)
+                    for error in previous_errors
+                    if _is_off_branch(error.stack.path, stack.path, component)
+                )
+            else:
+                branch_errors.update(
+                    id(error)
+                    for error in previous_errors
+                    if error.stack.path == stack.path
+                    and getattr(error.error_data, 'field_name', None) == component
+                )
+
+            field_def = config_type.fields[component]
+            config_type = field_def.config_type
+            config_value = config_value[component]
+            stack = stack_with_field(stack, component, field_def)
+
+        else:
+            break
+
+    changed_path = stack.path
+    errors = [
+        error
+        for error in previous_errors
+        if id(error) not in branch_errors and error.stack.path[: len(changed_path)] != changed_path
+    ]
+    errors.extend(_validate_config(config_type, config_value, stack))
+    return errors
+
+
+def _is_off_branch(error_path, path, component):
+    return error_path[: len(path)] == path and (
+        len(error_path) == len(path) or error_path[len(path)] != component
+    )
+
+
+def _list_index(component):
+    if isinstance(component, six.integer_types):
+        return component
+    elif component.isdigit():
+        return int(component)
+    else:
+        return None
+
+
 def _validate_config(config_type, config_value, stack):
     check.inst_param(config_type, 'config_type', ConfigType)
     check.inst_param(stack, 'stack', EvaluationStack)
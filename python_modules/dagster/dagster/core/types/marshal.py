@@ -5,6 +5,8 @@ import six
 
 from dagster import check
 
+from .compression import Compression, compressing_file_obj, decompressing_file_obj, get_codec
+
 
 @six.add_metaclass(ABCMeta)
 class SerializationStrategy:
@@ -25,6 +27,31 @@ class PickleSerializationStrategy(SerializationStrategy):
         return pickle.load(read_file_obj)
 
 
+class CompressedSerializationStrategy(SerializationStrategy):
+    '''
+    Compresses the stream written by another serialization strategy. codec is one of zlib,
+    gzip, bz2, lzma or zstd, and level is the compression level, which defaults to the default
+    of the codec.
+    '''
+
+    def __init__(self, serialization_strategy, codec='zlib', level=None):
+        self.serialization_strategy = check.inst_param(
+            serialization_strategy, 'serialization_strategy', SerializationStrategy
+        )
+        self.compression = Compression(get_codec(check.str_param(codec, 'codec')), level)
+
+    def serialize_value(self, value, write_file_obj):
+        compressed_obj = compressing_file_obj(write_file_obj, self.compression)
+        try:
+            return self.serialization_strategy.serialize_value(value, compressed_obj)
+        finally:
+            compressed_obj.close()
+
+    def deserialize_value(self, read_file_obj):
+        # Also reads values that were written uncompressed, or compressed with another codec
+        return self.serialization_strategy.deserialize_value(decompressing_file_obj(read_file_obj))
+
+
 @six.add_metaclass(ABCMeta)
 class PersistenceStrategy:
     @abstractmethod
@@ -37,11 +64,14 @@ class PersistenceStrategy:
 
 
 class FilePersistencePolicy(PersistenceStrategy):
+    def __init__(self, compression=None):
+        self.compression = check.opt_inst_param(compression, 'compression', Compression)
+
     def write_value(self, serialization_strategy, key, value):
         check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
         check.str_param(key, 'key')
 
-        return serialize_to_file(serialization_strategy, value, key)
+        return serialize_to_file(serialization_strategy, value, key, self.compression)
 
     def read_value(self, serialization_strategy, key):
         check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
@@ -49,17 +79,33 @@ class FilePersistencePolicy(PersistenceStrategy):
         return deserialize_from_file(serialization_strategy, key)
 
 
-def serialize_to_file(serialization_strategy, value, write_path):
+def serialize_to_file(serialization_strategy, value, write_path, compression=None):
     check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
     check.str_param(write_path, 'write_path')
+    check.opt_inst_param(compression, 'compression', Compression)
+
+    if compression is not None:
+        serialization_strategy = CompressedSerializationStrategy(
+            serialization_strategy, compression.codec.name, compression.level
+        )
 
     with open(write_path, 'wb') as write_obj:
         return serialization_strategy.serialize_value(value, write_obj)
 
 
 def deserialize_from_file(serialization_strategy, read_path):
+    '''Reads a value written by serialize_to_file, whether or not it was compressed.'''
     check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
     check.str_param(read_path, 'read_path')
 
     with open(read_path, 'rb') as read_obj:
-        return serialization_strategy.deserialize_value(read_obj)
+        return deserialize_from_file_obj(serialization_strategy, read_obj)
+
+
+def deserialize_from_file_obj(serialization_strategy, read_file_obj):
+    check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+
+    if isinstance(serialization_strategy, CompressedSerializationStrategy):
+        return serialization_strategy.deserialize_value(read_file_obj)
+
+    return serialization_strategy.deserialize_value(decompressing_file_obj(read_file_obj))
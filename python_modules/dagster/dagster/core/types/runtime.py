@@ -14,6 +14,7 @@ from .config import Nullable as ConfigNullable
 from .config_schema import InputSchema, OutputSchema
 
 from .marshal import SerializationStrategy, PickleSerializationStrategy
+from .summary import DefaultValueSummarizer, ValueSummarizer
 from .dagster_type import check_dagster_type_param
 from .wrapping import WrappingListType, WrappingNullableType
 
@@ -36,6 +37,7 @@ class RuntimeType(object):
         input_schema=None,
         output_schema=None,
         serialization_strategy=None,
+        value_summarizer=None,
     ):
 
         type_obj = type(self)
@@ -58,6 +60,9 @@ class RuntimeType(object):
             SerializationStrategy,
             PickleSerializationStrategy(),
         )
+        self.value_summarizer = check.opt_inst_param(
+            value_summarizer, 'value_summarizer', ValueSummarizer, DefaultValueSummarizer()
+        )
 
         self.is_builtin = check.bool_param(is_builtin, 'is_builtin')
 
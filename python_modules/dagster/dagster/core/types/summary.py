@@ -0,0 +1,120 @@
+'''
+Summaries of runtime values for log messages.
+
+The engine logs every value a step emits. Formatting values with repr can be as expensive as
+the step itself for large values, so values are logged as summaries instead, whose cost and
+length are bounded: collections are summarized by their length and their first few items, and
+other values by their repr, truncated. Runtime types can summarize their values differently
+with a ValueSummarizer, for instance to describe a table by its shape and columns.
+'''
+
+from abc import ABCMeta, abstractmethod
+
+import six
+
+from dagster import check
+
+MAX_SUMMARY_LENGTH = 200
+
+MAX_SUMMARY_ITEMS = 5
+
+TRUNCATION_MARKER = '...'
+
+
+@six.add_metaclass(ABCMeta)
+class ValueSummarizer:
+    @abstractmethod
+    def summarize_value(self, value):
+        '''
+        A short description of the value for log messages. It should take time independent of
+        the size of the value.
+        '''
+
+
+class DefaultValueSummarizer(ValueSummarizer):
+    def __init__(self, max_length=MAX_SUMMARY_LENGTH, max_items=MAX_SUMMARY_ITEMS):
+        self.max_length = check.int_param(max_length, 'max_length')
+        self.max_items = check.int_param(max_items, 'max_items')
+
+    def summarize_value(self, value):
+        return summarize_value(value, self.max_length, self.max_items)
+
+
+def truncate_summary(summary, max_length=MAX_SUMMARY_LENGTH):
+    check.str_param(summary, 'summary')
+    check.int_param(max_length, 'max_length')
+
+    if len(summary) <= max_length:
+        return summary
+    return summary[: max(max_length - len(TRUNCATION_MARKER), 0)] + TRUNCATION_MARKER
+
+
+def _head(iterable, max_items):
+    head = []
+    for item in iterable:
+        if len(head) == max_items:
+            break
+        head.append(item)
+    return head
+
+
+def _summarize_item(value, max_length):
+    # Items of collections are only summarized shallowly, so that the cost of the summary
+    # does not depend on how deeply the collection is nested
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        return '<{type_name} of length {length}>'.format(
+            type_name=type(value).__name__, length=len(value)
+        )
+    return _summarize_scalar(value, max_length)
+
+
+def _summarize_scalar(value, max_length):
+    if isinstance(value, (six.string_types, six.binary_type)) and len(value) > max_length:
+        # Only the start of long strings is formatted
+        return truncate_summary(repr(value[:max_length]), max_length)
+    return truncate_summary(repr(value), max_length)
+
+
+def summarize_value(value, max_length=MAX_SUMMARY_LENGTH, max_items=MAX_SUMMARY_ITEMS):
+    '''
+    Summarizes dicts, lists, tuples and sets by their length and their first max_items items,
+    and other values by their repr, truncated to max_length characters.
+    '''
+    check.int_param(max_length, 'max_length')
+    check.int_param(max_items, 'max_items')
+
+    if isinstance(value, dict):
+        items = [
+            '{key}: {value}'.format(
+                key=_summarize_item(key, max_length), value=_summarize_item(item, max_length)
+            )
+            for key, item in _head(six.iteritems(value), max_items)
+        ]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = [_summarize_item(item, max_length) for item in _head(value, max_items)]
+    else:
+        return _summarize_scalar(value, max_length)
+
+    if len(value) <= max_items:
+        return truncate_summary(_join_items(value, items), max_length)
+
+    return truncate_summary(
+        '<{type_name} of length {length}: {items}>'.format(
+            type_name=type(value).__name__,
+            length=len(value),
+            items=_join_items(value, items + [TRUNCATION_MARKER]),
+        ),
+        max_length,
+    )
+
+
+def _join_items(value, items):
+    if not items:
+        return repr(value)
+    if isinstance(value, list):
+        return '[{items}]'.format(items=', '.join(items))
+    if isinstance(value, tuple):
+        return '({items}{comma})'.format(
+            items=', '.join(items), comma=',' if len(items) == 1 else ''
+        )
+    return '{{{items}}}'.format(items=', '.join(items))
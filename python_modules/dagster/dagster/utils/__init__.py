@@ -3,6 +3,7 @@ import errno
 import inspect
 import os
 import re
+import sys
 import yaml
 
 from dagster import check
@@ -86,6 +87,26 @@ def merge_dicts(left, right):
     return result
 
 
+# Solid bodies defined with async def are only supported from python 3.6, which introduced
+# async generators
+ASYNC_SOLIDS_SUPPORTED = sys.version_info >= (3, 6)
+
+
+def is_async_function(fn):
+    '''True for coroutine functions and async generator functions.'''
+    if not ASYNC_SOLIDS_SUPPORTED:
+        return False
+    return inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn)
+
+
+def is_async_generator_function(fn):
+    return ASYNC_SOLIDS_SUPPORTED and inspect.isasyncgenfunction(fn)
+
+
+def is_async_generator(obj):
+    return ASYNC_SOLIDS_SUPPORTED and inspect.isasyncgen(obj)
+
+
 class frozendict(dict):
     def __readonly__(self, *args, **kwargs):
         raise RuntimeError("Cannot modify ReadOnlyDict")
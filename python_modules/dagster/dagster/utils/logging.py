@@ -7,6 +7,7 @@ from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 import traceback
 
 import coloredlogs
+import six
 
 from dagster import check
 
@@ -28,6 +29,7 @@ class JsonFileHandler(logging.Handler):
     def emit(self, record):
         try:
             log_dict = copy.copy(record.__dict__)
+            log_dict['msg'] = get_record_message(record)
 
             # This horrific monstrosity is to maintain backwards compatability
             # with the old behavior of the JsonFileHandler, which the clarify
@@ -96,7 +98,7 @@ class StructuredLoggerHandler(logging.Handler):
             self.callback(
                 StructuredLoggerMessage(
                     name=record.name,
-                    message=record.msg,
+                    message=get_record_message(record),
                     level=record.levelno,
                     meta=record.dagster_meta,
                     record=record,
@@ -108,6 +110,15 @@ class StructuredLoggerHandler(logging.Handler):
             logging.exception(str(e))
 
 
+def get_record_message(record):
+    '''
+    The message of a record, without the arguments of the record applied. DagsterLog logs
+    messages that are only formatted when they are converted to a string.
+    '''
+    check.inst_param(record, 'record', logging.LogRecord)
+    return record.msg if isinstance(record.msg, six.string_types) else str(record.msg)
+
+
 def check_valid_level_param(level):
     check.param_invariant(
         level in VALID_LEVELS,
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+import threading
+
+from dagster import check
+
+
+class LRUCache(object):
+    '''
+    A thread-safe mapping that holds at most max_size entries, evicting the least recently used
+    entry once it is full. It counts its hits and misses.
+    '''
+
+    def __init__(self, max_size):
+        self.max_size = check.int_param(max_size, 'max_size')
+        check.param_invariant(max_size > 0, 'max_size', 'Must be positive')
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._entries.pop(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self._entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_MISSING = object()
@@ -45,5 +45,7 @@ def time_execution_scope():
     '''
 
     timer_result = TimerResult()
-    yield timer_result
-    timer_result.end_time = time_fn()
+    try:
+        yield timer_result
+    finally:
+        timer_result.end_time = time_fn()
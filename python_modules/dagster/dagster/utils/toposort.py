@@ -0,0 +1,57 @@
+from collections import defaultdict
+
+from toposort import CircularDependencyError
+
+from dagster import check
+
+
+def toposort(data):
+    '''
+    Sorts the items of a dependency dict, which maps items to the sets of items they depend on,
+    into levels: the first level holds the items that depend on nothing, and every later level
+    the items whose dependencies are all in earlier levels. Items are sorted within levels.
+
+    This matches the levels of toposort.toposort, which recomputes the dependencies left for
+    every item at every level, and so takes quadratic time for long chains. This takes time
+    linear in the number of items and dependencies. Like toposort.toposort, it raises
+    toposort.CircularDependencyError, with the items left unsorted and their dependencies left
+    unsorted, if the dependencies are circular.
+    '''
+    check.dict_param(data, 'data')
+
+    num_deps = {}
+    dependents = defaultdict(list)
+    for item, deps in data.items():
+        num_deps[item] = 0
+        for dep in deps:
+            if dep != item:
+                num_deps[item] += 1
+                dependents[dep].append(item)
+
+    for dep in list(dependents.keys()):
+        num_deps.setdefault(dep, 0)
+
+    levels = []
+    level = sorted(item for item, count in num_deps.items() if count == 0)
+    while level:
+        levels.append(level)
+        next_level = []
+        for item in level:
+            for dependent in dependents[item]:
+                num_deps[dependent] -= 1
+                if num_deps[dependent] == 0:
+                    next_level.append(dependent)
+        level = sorted(next_level)
+
+    if sum(len(level) for level in levels) != len(num_deps):
+        unsorted = set(item for item, count in num_deps.items() if count > 0)
+        raise CircularDependencyError(
+            {item: set(data.get(item, ())) & unsorted for item in unsorted}
+        )
+
+    return levels
+
+
+def toposort_flatten(data):
+    '''The items of toposort(data), level after level.'''
+    return [item for level in toposort(data) for item in level]
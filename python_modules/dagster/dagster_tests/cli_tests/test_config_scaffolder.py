@@ -68,7 +68,37 @@ def test_basic_solids_config():
         },
         'solids': {'required_field_solid': {'config': {'required_int': 0}}},
         'expectations': {'evaluate': True},
-        'execution': {},
+        'execution': {
+            'cache': {'directory': 'path/to/something', 'max_size_bytes': 0},
+            'compression': {
+                'bz2': {'level': 0},
+                'gzip': {'level': 0},
+                'lzma': {'level': 0},
+                'zlib': {'level': 0},
+                'zstd': {'level': 0},
+            },
+            'engine': {
+                'asyncio': {'max_concurrent_steps': 0},
+                'in_process': {},
+                'multiprocess': {'max_workers': 0},
+                'multithread': {'max_workers': 0},
+            },
+            'fast_path': True,
+            'intermediate_store': {
+                'filesystem': {'directory': 'path/to/something', 'keep': True},
+                'in_memory': {},
+                'mmap': {'directory': 'path/to/something', 'keep': True},
+            },
+            'profile': {
+                'cprofile': True,
+                'directory': 'path/to/something',
+                'steps': [],
+                'top_allocations': 0,
+                'tracemalloc': True,
+            },
+            'resumable': {'directory': 'path/to/something'},
+            'stream_buffer_size': 0,
+        },
     }
 
 
@@ -105,5 +135,35 @@ def test_two_contexts():
         },
         'solids': {},
         'expectations': {'evaluate': True},
-        'execution': {},
+        'execution': {
+            'cache': {'directory': 'path/to/something', 'max_size_bytes': 0},
+            'compression': {
+                'bz2': {'level': 0},
+                'gzip': {'level': 0},
+                'lzma': {'level': 0},
+                'zlib': {'level': 0},
+                'zstd': {'level': 0},
+            },
+            'engine': {
+                'asyncio': {'max_concurrent_steps': 0},
+                'in_process': {},
+                'multiprocess': {'max_workers': 0},
+                'multithread': {'max_workers': 0},
+            },
+            'fast_path': True,
+            'intermediate_store': {
+                'filesystem': {'directory': 'path/to/something', 'keep': True},
+                'in_memory': {},
+                'mmap': {'directory': 'path/to/something', 'keep': True},
+            },
+            'profile': {
+                'cprofile': True,
+                'directory': 'path/to/something',
+                'steps': [],
+                'top_allocations': 0,
+                'tracemalloc': True,
+            },
+            'resumable': {'directory': 'path/to/something'},
+            'stream_buffer_size': 0,
+        },
     }
@@ -53,6 +53,22 @@ def test_pipeline_types():
     assert not pipeline_def.has_config_type('SomeName')
 
 
+def test_config_types_built_on_first_use():
+    @solid(config_field=Field(Dict({'a_field': Field(String)})))
+    def configured_solid(_context):
+        pass
+
+    pipeline_def = PipelineDefinition(name='lazy_pipeline', solids=[configured_solid])
+    assert pipeline_def._environment_cls is None  # pylint: disable=W0212
+    assert pipeline_def._config_type_dicts is None  # pylint: disable=W0212
+
+    environment_type = pipeline_def.environment_type
+    assert environment_type is pipeline_def.environment_type
+    assert pipeline_def.context_type is pipeline_def.context_type
+    assert pipeline_def.has_config_type('LazyPipeline.SolidsConfigDictionary')
+    assert pipeline_def.config_type_named('LazyPipeline.Environment') is environment_type
+
+
 def test_mapper_errors():
     @lambda_solid
     def solid_a():
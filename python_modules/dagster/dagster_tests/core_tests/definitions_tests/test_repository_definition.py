@@ -2,6 +2,8 @@ from collections import defaultdict
 
 import pytest
 
+import dagster.check as check
+
 from dagster import (
     DagsterInvalidDefinitionError,
     DagsterInvariantViolationError,
@@ -112,3 +114,79 @@ def test_dupe_solid_repo_definition_unforced():
 
     with pytest.raises(DagsterInvariantViolationError):
         repo.get_solid_def('first')
+
+
+def test_solid_def_index():
+    @lambda_solid
+    def shared():
+        pass
+
+    @lambda_solid
+    def only_first():
+        pass
+
+    called = defaultdict(int)
+
+    def _define_pipeline(name, solids):
+        called[name] += 1
+        return PipelineDefinition(name=name, solids=solids)
+
+    repo = RepositoryDefinition(
+        'indexed_repo',
+        pipeline_dict={
+            'first': lambda: _define_pipeline('first', [shared, only_first]),
+            'second': lambda: _define_pipeline('second', [shared]),
+        },
+    )
+
+    assert repo.solid_def_named('only_first') is only_first
+    assert repo.get_solid_def('shared') is shared
+    assert repo.get_pipeline_names_for_solid_def('shared') == ['first', 'second']
+    assert repo.get_pipeline_names_for_solid_def('only_first') == ['first']
+    assert repo.get_all_pipelines()
+    assert called == {'first': 1, 'second': 1}
+
+    with pytest.raises(check.CheckError):
+        repo.solid_def_named('nope')
+
+
+def test_warm_up():
+    called = defaultdict(int)
+    repo = RepositoryDefinition(
+        name='some_repo',
+        pipeline_dict={
+            name: (lambda name=name: create_single_node_pipeline(name, called))
+            for name in ['foo', 'bar', 'baz']
+        },
+    )
+
+    repo.warm_up(max_workers=2)
+    assert called == {'foo': 1, 'bar': 1, 'baz': 1}
+
+    foo_pipeline = repo.get_pipeline('foo')
+    # pylint: disable=W0212
+    assert foo_pipeline._environment_cls is not None
+    assert foo_pipeline._config_type_dicts is not None
+    assert repo.get_solid_def('baz_solid').name == 'baz_solid'
+    assert called == {'foo': 1, 'bar': 1, 'baz': 1}
+
+
+def test_warm_up_dupe_solid():
+    @lambda_solid(name='same')
+    def noop():
+        pass
+
+    @lambda_solid(name='same')
+    def noop2():
+        pass
+
+    repo = RepositoryDefinition(
+        'error_repo',
+        pipeline_dict={
+            'first': lambda: PipelineDefinition(name='first', solids=[noop]),
+            'second': lambda: PipelineDefinition(name='second', solids=[noop2]),
+        },
+    )
+
+    with pytest.raises(DagsterInvalidDefinitionError):
+        repo.warm_up()
@@ -0,0 +1,176 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionContext,
+    InputDefinition,
+    OutputDefinition,
+    PipelineContextDefinition,
+    PipelineDefinition,
+    Result,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.events import EventType, construct_event_logger
+from dagster.core.execution import create_execution_plan, execute_plan
+
+ASYNCIO_ENV = {'execution': {'engine': {'asyncio': {}}}}
+
+
+def define_async_diamond_pipeline():
+    @lambda_solid
+    async def return_two():
+        await asyncio.sleep(0)
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    async def add_three(num):
+        await asyncio.sleep(0)
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    async def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='async_diamond_execution',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def test_asyncio_diamond():
+    result = execute_pipeline(define_async_diamond_pipeline(), environment_dict=ASYNCIO_ENV)
+    assert result.success
+    assert result.result_for_solid('add_three').transformed_value() == 5
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_asyncio_single_step_at_a_time_matches_topological_order():
+    execution_plan = create_execution_plan(define_async_diamond_pipeline())
+    step_events = execute_plan(
+        execution_plan,
+        environment_dict={'execution': {'engine': {'asyncio': {'max_concurrent_steps': 1}}}},
+    )
+    assert [step_event.step.key for step_event in step_events] == [
+        step.key for step in execution_plan.topological_steps()
+    ]
+
+
+def test_asyncio_runs_steps_concurrently():
+    started = []
+    num_solids = 50
+
+    def _define_waiting_solid(index):
+        @lambda_solid(name='wait_{index}'.format(index=index))
+        async def _wait():
+            started.append(index)
+            # Only completes once every solid has started
+            while len(started) < num_solids:
+                await asyncio.sleep(0.001)
+            return index
+
+        return _wait
+
+    pipeline = PipelineDefinition(
+        name='concurrent_async_pipeline',
+        solids=[_define_waiting_solid(index) for index in range(num_solids)],
+    )
+
+    result = execute_pipeline(pipeline, environment_dict=ASYNCIO_ENV)
+    assert result.success
+    assert result.result_for_solid('wait_49').transformed_value() == 49
+
+
+def test_asyncio_async_generator_solid():
+    @solid(outputs=[OutputDefinition(name='first'), OutputDefinition(name='second')])
+    async def emit_two(_context):
+        yield Result(1, 'first')
+        await asyncio.sleep(0)
+        yield Result(2, 'second')
+
+    @solid
+    async def return_result(_context):
+        return Result(3)
+
+    pipeline = PipelineDefinition(name='async_generator_pipeline', solids=[emit_two, return_result])
+
+    result = execute_pipeline(pipeline, environment_dict=ASYNCIO_ENV)
+    assert result.success
+    assert result.result_for_solid('emit_two').transformed_values == {'first': 1, 'second': 2}
+    assert result.result_for_solid('return_result').transformed_value() == 3
+
+
+def test_asyncio_failure_skips_downstream():
+    events = defaultdict(list)
+
+    @lambda_solid
+    async def throw():
+        await asyncio.sleep(0)
+        raise Exception('bad programmer')
+
+    @lambda_solid
+    async def return_one():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    async def downstream(num):
+        return num
+
+    pipeline = PipelineDefinition(
+        name='failing_asyncio',
+        solids=[throw, return_one, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw')}},
+        context_definitions={
+            'default': PipelineContextDefinition(
+                context_fn=lambda _: ExecutionContext(
+                    loggers=[
+                        construct_event_logger(
+                            lambda record: events[record.event_type].append(record)
+                        )
+                    ]
+                )
+            )
+        },
+    )
+
+    result = execute_pipeline(pipeline, environment_dict=ASYNCIO_ENV, throw_on_user_error=False)
+    assert not result.success
+    assert result.result_for_solid('return_one').transformed_value() == 1
+    assert not result.result_for_solid('throw').success
+    assert 'downstream' not in result.solid_result_dict
+
+    assert len(events[EventType.EXECUTION_PLAN_STEP_START]) == 2
+    assert len(events[EventType.EXECUTION_PLAN_STEP_SUCCESS]) == 1
+    (failure_event,) = events[EventType.EXECUTION_PLAN_STEP_FAILURE]
+    assert failure_event.step_key == 'throw.transform'
+
+    with pytest.raises(Exception, match='bad programmer'):
+        execute_pipeline(pipeline, environment_dict=ASYNCIO_ENV)
+
+
+def test_async_solid_requires_asyncio_engine():
+    @lambda_solid
+    async def return_one():
+        return 1
+
+    pipeline = PipelineDefinition(name='async_in_process', solids=[return_one])
+
+    result = execute_pipeline(pipeline, throw_on_user_error=False)
+    assert not result.success
+    assert 'asyncio engine' in str(result.result_for_solid('return_one').dagster_error)
@@ -0,0 +1,127 @@
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    lambda_solid,
+)
+from dagster.core.execution import create_execution_plan
+from dagster.core.execution_plan.compact_plan import NO_OUTPUT
+from dagster.core.execution_plan.dependency_tracker import StepDependencyTracker
+from dagster.core.execution_plan.objects import StepOutputHandle
+from dagster.utils.toposort import toposort
+
+
+def define_diamond_pipeline():
+    @lambda_solid(output=OutputDefinition(Int))
+    def start():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    @lambda_solid(
+        inputs=[InputDefinition('left', Int), InputDefinition('right', Int)],
+        output=OutputDefinition(Int),
+    )
+    def add(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='diamond_pipeline',
+        solids=[start, add_one, add],
+        dependencies={
+            SolidInstance('add_one', alias='left'): {'num': DependencyDefinition('start')},
+            SolidInstance('add_one', alias='right'): {'num': DependencyDefinition('start')},
+            'add': {'left': DependencyDefinition('left'), 'right': DependencyDefinition('right')},
+        },
+    )
+
+
+def test_compact_plan_indexes_steps():
+    execution_plan = create_execution_plan(define_diamond_pipeline())
+    compact = execution_plan.compact
+
+    assert compact is execution_plan.compact
+    assert compact.step_keys == [step.key for step in execution_plan.steps]
+    assert compact.num_outputs == sum(len(step.step_outputs) for step in execution_plan.steps)
+
+    for step_id, step in enumerate(execution_plan.steps):
+        assert compact.step_ids[step.key] == step_id
+
+        output_ids = list(compact.input_output_ids_of(step_id))
+        assert NO_OUTPUT not in output_ids
+        assert [
+            (compact.step_keys[compact.output_step_ids[output_id]], compact.output_names[output_id])
+            for output_id in output_ids
+        ] == [
+            (step_input.prev_output_handle.step.key, step_input.prev_output_handle.output_name)
+            for step_input in step.step_inputs
+        ]
+
+        dep_keys = set(compact.step_keys[dep_id] for dep_id in compact.deps_of(step_id))
+        assert dep_keys == execution_plan.deps[step.key]
+        for dependent_id in compact.dependents_of(step_id):
+            assert step.key in execution_plan.deps[compact.step_keys[dependent_id]]
+
+    assert [
+        [step.key for step in level] for level in execution_plan.topological_step_levels()
+    ] == toposort(execution_plan.deps)
+
+
+def test_dependency_tracker():
+    execution_plan = create_execution_plan(define_diamond_pipeline())
+    tracker = StepDependencyTracker(execution_plan)
+
+    step = tracker.pop_ready_step()
+    assert step.key == 'start.transform'
+    assert not tracker.has_ready_steps()
+
+    # Completing a step twice, or a step that is not in the plan, changes nothing
+    tracker.mark_complete(step.key)
+    tracker.mark_complete(step.key)
+    tracker.mark_complete('not_a_step')
+    assert [tracker.pop_ready_step().key for _ in range(2)] == [
+        'left.transform',
+        'right.transform',
+    ]
+    assert not tracker.has_ready_steps()
+
+    tracker.mark_complete('right.transform')
+    assert not tracker.has_ready_steps()
+    tracker.mark_complete('left.transform')
+    assert tracker.pop_ready_step().key == 'add.transform'
+
+
+def test_step_tags_built_on_read():
+    execution_plan = create_execution_plan(define_diamond_pipeline())
+    step = execution_plan.get_step_by_key('left.transform')
+
+    assert step.extra_tags is None
+    tags = step.tags
+    assert tags == {
+        'step_key': 'left.transform',
+        'pipeline': 'diamond_pipeline',
+        'solid': 'left',
+        'solid_definition': 'add_one',
+    }
+
+    tags['solid'] = 'changed'
+    assert step.tags['solid'] == 'left'
+
+
+def test_step_output_handles_as_keys():
+    execution_plan = create_execution_plan(define_diamond_pipeline())
+    step = execution_plan.get_step_by_key('add.transform')
+
+    values = {step_input.prev_output_handle: step_input.name for step_input in step.step_inputs}
+    for upstream_key, name in [('left.transform', 'left'), ('right.transform', 'right')]:
+        handle = StepOutputHandle(execution_plan.get_step_by_key(upstream_key), 'result')
+        assert values[handle] == name
+
+    assert StepOutputHandle(step, 'result') != StepOutputHandle(
+        execution_plan.get_step_by_key('left.transform'), 'result'
+    )
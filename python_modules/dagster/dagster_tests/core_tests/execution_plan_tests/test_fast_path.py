@@ -0,0 +1,119 @@
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    Result,
+    SolidDefinition,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution import create_execution_plan, execute_plan
+from dagster.core.execution_plan.objects import ExecutionPlan
+
+FAST_PATH_ENV = {'execution': {'fast_path': True}}
+
+
+def define_two_output_pipeline():
+    @solid(outputs=[OutputDefinition(Int, 'num'), OutputDefinition(Int, 'other_num')])
+    def return_two(_info):
+        yield Result(1, 'num')
+        yield Result(2, 'other_num')
+
+    @lambda_solid(inputs=[InputDefinition('num', Int), InputDefinition('other_num', Int)])
+    def add(num, other_num):
+        return num + other_num
+
+    return PipelineDefinition(
+        name='two_output_pipeline',
+        solids=[return_two, add],
+        dependencies={
+            'add': {
+                'num': DependencyDefinition('return_two', 'num'),
+                'other_num': DependencyDefinition('return_two', 'other_num'),
+            }
+        },
+    )
+
+
+@pytest.mark.parametrize('engine_key', ['in_process', 'multithread', 'asyncio'])
+def test_fast_path_execution(engine_key):
+    result = execute_pipeline(
+        define_two_output_pipeline(),
+        environment_dict={'execution': {'engine': {engine_key: {}}, 'fast_path': True}},
+    )
+    assert result.success
+    assert result.result_for_solid('return_two').transformed_value('num') == 1
+    assert result.result_for_solid('return_two').transformed_value('other_num') == 2
+    assert result.result_for_solid('add').transformed_value() == 3
+
+
+def _single_solid_pipeline(transform_fn, output_defs=None):
+    return PipelineDefinition(
+        name='single_solid_pipeline',
+        solids=[
+            SolidDefinition(
+                name='yield_results',
+                inputs=[],
+                outputs=output_defs if output_defs is not None else [OutputDefinition(Int)],
+                transform_fn=transform_fn,
+            )
+        ],
+    )
+
+
+def test_fast_path_undefined_output():
+    def _transform(_context, _inputs):
+        yield Result(1, 'nope')
+
+    with pytest.raises(DagsterInvariantViolationError, match='output nope that does not exist'):
+        execute_pipeline(_single_solid_pipeline(_transform), environment_dict=FAST_PATH_ENV)
+
+
+def test_fast_path_output_emitted_twice():
+    def _transform(_context, _inputs):
+        yield Result(1)
+        yield Result(2)
+
+    with pytest.raises(DagsterInvariantViolationError, match='multiple times'):
+        execute_pipeline(_single_solid_pipeline(_transform), environment_dict=FAST_PATH_ENV)
+
+
+def test_fast_path_not_a_result():
+    def _transform(_context, _inputs):
+        yield 1
+
+    with pytest.raises(DagsterInvariantViolationError, match='rather an an instance of the Result'):
+        execute_pipeline(_single_solid_pipeline(_transform), environment_dict=FAST_PATH_ENV)
+
+
+def test_fast_path_output_type_check():
+    def _transform(_context, _inputs):
+        yield Result('one')
+
+    result = execute_pipeline(
+        _single_solid_pipeline(_transform),
+        environment_dict=FAST_PATH_ENV,
+        throw_on_user_error=False,
+    )
+    assert not result.success
+    assert 'type failure' in str(result.result_for_solid('yield_results').dagster_error)
+
+
+def test_fast_path_rejects_invalid_plan():
+    pipeline = define_two_output_pipeline()
+    execution_plan = create_execution_plan(pipeline, environment_dict=FAST_PATH_ENV)
+
+    # The step that add.transform receives its inputs from is missing
+    add_step = execution_plan.get_step_by_key('add.transform')
+    invalid_plan = ExecutionPlan(
+        pipeline, {add_step.key: add_step}, {add_step.key: set(['return_two.transform'])}
+    )
+
+    with pytest.raises(DagsterInvariantViolationError, match='not in the execution plan'):
+        execute_plan(invalid_plan, environment_dict=FAST_PATH_ENV)
@@ -0,0 +1,192 @@
+import gc
+import weakref
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionContext,
+    InputDefinition,
+    PipelineContextDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.check import CheckError
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution import create_execution_plan, terminal_solid_names
+from dagster.core.execution_plan.objects import StepOutputHandle
+from dagster.core.execution_plan.simple_engine import (
+    compute_consumer_counts,
+    release_consumed_inputs,
+)
+
+
+class Payload(object):
+    def __init__(self, num):
+        self.num = num
+
+
+def define_release_pipeline(payload_refs, released_checks):
+    @lambda_solid
+    def produce():
+        payload = Payload(1)
+        payload_refs.append(weakref.ref(payload))
+        return payload
+
+    @lambda_solid(inputs=[InputDefinition('payload')])
+    def consume(payload):
+        return payload.num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def check_released(num):
+        gc.collect()
+        released_checks.append(payload_refs[0]() is None)
+        return num
+
+    return PipelineDefinition(
+        name='release_pipeline',
+        solids=[produce, consume, check_released],
+        dependencies={
+            'consume': {'payload': DependencyDefinition('produce')},
+            'check_released': {'num': DependencyDefinition('consume')},
+        },
+    )
+
+
+def test_consumer_counts():
+    execution_plan = create_execution_plan(define_release_pipeline([], []))
+    consumer_counts = compute_consumer_counts(execution_plan)
+
+    produce_step = execution_plan.get_step_by_key('produce.transform')
+    consume_step = execution_plan.get_step_by_key('consume.transform')
+    produce_handle = StepOutputHandle(produce_step, 'result')
+
+    assert consumer_counts[produce_handle] == 1
+    assert consumer_counts[StepOutputHandle(consume_step, 'result')] == 1
+    assert (
+        consumer_counts[
+            StepOutputHandle(execution_plan.get_step_by_key('check_released.transform'), 'result')
+        ]
+        == 0
+    )
+
+    results = {produce_handle: object()}
+    assert release_consumed_inputs(consume_step, consumer_counts, results) == [produce_handle]
+    assert results == {}
+
+
+def test_intermediate_freed_after_last_consumer():
+    payload_refs = []
+    released_checks = []
+    result = execute_pipeline(
+        define_release_pipeline(payload_refs, released_checks), retain_output_values=False
+    )
+    assert result.success
+    assert released_checks == [True]
+
+    with pytest.raises(DagsterInvariantViolationError, match='not retained'):
+        result.result_for_solid('check_released').transformed_value()
+
+
+def test_retained_output_values():
+    payload_refs = []
+    released_checks = []
+    result = execute_pipeline(define_release_pipeline(payload_refs, released_checks))
+    assert result.success
+
+    # The result holds on to every output value, so the payload outlives its consumer
+    assert released_checks == [False]
+    assert result.result_for_solid('produce').transformed_value() is payload_refs[0]()
+    assert result.result_for_solid('check_released').transformed_value() == 2
+
+
+def test_retained_outputs():
+    payload_refs = []
+    released_checks = []
+    pipeline = define_release_pipeline(payload_refs, released_checks)
+    assert terminal_solid_names(pipeline) == ['check_released']
+
+    result = execute_pipeline(pipeline, retained_outputs=terminal_solid_names(pipeline))
+    assert result.success
+
+    # Only the values of the retained outputs outlive their consumers
+    assert released_checks == [True]
+    assert result.result_for_solid('check_released').transformed_value() == 2
+    assert [step_event.step.key for step_event in result.step_event_list] == [
+        'check_released.transform'
+    ]
+    with pytest.raises(DagsterInvariantViolationError, match='Did not find result'):
+        result.result_for_solid('produce')
+
+    # Every step is still summarized
+    assert [
+        (summary.step_key, summary.success, summary.output_names)
+        for summary in result.step_summaries
+    ] == [
+        ('produce.transform', True, ['result']),
+        ('consume.transform', True, ['result']),
+        ('check_released.transform', True, ['result']),
+    ]
+    assert all(summary.millis is not None for summary in result.step_summaries)
+
+
+def test_retained_outputs_keep_failures():
+    @lambda_solid
+    def produce():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def fail(num):
+        raise Exception('failed with {num}'.format(num=num))
+
+    pipeline = PipelineDefinition(
+        name='failing_pipeline',
+        solids=[produce, fail],
+        dependencies={'fail': {'num': DependencyDefinition('produce')}},
+    )
+
+    result = execute_pipeline(pipeline, throw_on_user_error=False, retained_outputs=['produce'])
+    assert not result.success
+    assert result.result_for_solid('produce').transformed_value() == 1
+    assert result.result_for_solid('fail').dagster_error
+
+    fail_summary = result.step_summaries[-1]
+    assert fail_summary.step_key == 'fail.transform'
+    assert not fail_summary.success
+    assert 'failed with 1' in fail_summary.error_message
+    assert fail_summary.millis is not None
+
+
+def test_step_summaries_timed_without_loggers():
+    @lambda_solid
+    def produce():
+        return 1
+
+    pipeline = PipelineDefinition(
+        name='unlogged_pipeline',
+        solids=[produce],
+        context_definitions={
+            'default': PipelineContextDefinition(
+                context_fn=lambda _info: ExecutionContext(loggers=[])
+            )
+        },
+    )
+
+    result = execute_pipeline(pipeline)
+    assert result.success
+    assert [summary.step_key for summary in result.step_summaries] == ['produce.transform']
+    assert result.step_summaries[0].millis is not None
+
+
+def test_invalid_retained_outputs():
+    pipeline = define_release_pipeline([], [])
+
+    with pytest.raises(DagsterInvariantViolationError, match='names solid nope'):
+        execute_pipeline(pipeline, retained_outputs=['nope'])
+
+    with pytest.raises(DagsterInvariantViolationError, match='names output nope'):
+        execute_pipeline(pipeline, retained_outputs=['produce.nope'])
+
+    with pytest.raises(CheckError):
+        execute_pipeline(pipeline, retain_output_values=False, retained_outputs=['produce'])
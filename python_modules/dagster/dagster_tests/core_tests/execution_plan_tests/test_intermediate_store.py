@@ -0,0 +1,133 @@
+import gc
+import os
+import shutil
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution_plan.intermediate_store import (
+    FileIntermediateHandle,
+    InMemoryIntermediateHandle,
+    MmapIntermediateHandle,
+    default_intermediate_store_directory,
+)
+
+
+def define_two_step_pipeline():
+    @lambda_solid
+    def return_list():
+        return [1, 2, 3]
+
+    @lambda_solid(inputs=[InputDefinition('nums')])
+    def sum_list(nums):
+        return sum(nums)
+
+    return PipelineDefinition(
+        name='two_step_pipeline',
+        solids=[return_list, sum_list],
+        dependencies={'sum_list': {'nums': DependencyDefinition('return_list')}},
+    )
+
+
+def _transform_handle(result, solid_name):
+    (transform_event,) = result.result_for_solid(solid_name).transforms
+    return transform_event.success_data.intermediate_handle
+
+
+def test_in_memory_intermediate_store_by_default():
+    result = execute_pipeline(define_two_step_pipeline())
+    assert result.success
+    assert isinstance(_transform_handle(result, 'return_list'), InMemoryIntermediateHandle)
+    assert result.result_for_solid('sum_list').transformed_value() == 6
+
+
+@pytest.mark.parametrize(
+    'store_key,handle_cls',
+    [('filesystem', FileIntermediateHandle), ('mmap', MmapIntermediateHandle)],
+)
+@pytest.mark.parametrize('engine_key', ['in_process', 'multithread'])
+def test_file_intermediate_stores(tmpdir, store_key, handle_cls, engine_key):
+    result = execute_pipeline(
+        define_two_step_pipeline(),
+        environment_dict={
+            'execution': {
+                'intermediate_store': {store_key: {'directory': str(tmpdir)}},
+                'engine': {engine_key: {}},
+            }
+        },
+    )
+    assert result.success
+
+    handle = _transform_handle(result, 'return_list')
+    assert isinstance(handle, handle_cls)
+    assert handle.path == os.path.join(str(tmpdir), 'return_list.transform.result')
+    assert result.result_for_solid('return_list').transformed_value() == [1, 2, 3]
+    assert result.result_for_solid('sum_list').transformed_value() == 6
+
+    # Values are only read from the store when they are accessed
+    os.unlink(handle.path)
+    with pytest.raises(IOError):
+        result.result_for_solid('return_list').transformed_value()
+
+
+@pytest.mark.parametrize('store_key', ['filesystem', 'mmap'])
+def test_default_directory_removed(store_key):
+    result = execute_pipeline(
+        define_two_step_pipeline(),
+        environment_dict={'execution': {'intermediate_store': {store_key: {}}}},
+    )
+    assert result.success
+
+    # The values in the result can be read once the run has ended
+    directory = default_intermediate_store_directory(result.run_id)
+    assert os.path.isdir(directory)
+    assert result.result_for_solid('sum_list').transformed_value() == 6
+
+    del result
+    gc.collect()
+    assert not os.path.exists(directory)
+
+
+def test_default_directory_kept():
+    result = execute_pipeline(
+        define_two_step_pipeline(),
+        environment_dict={'execution': {'intermediate_store': {'filesystem': {'keep': True}}}},
+    )
+    assert result.success
+
+    directory = default_intermediate_store_directory(result.run_id)
+    del result
+    gc.collect()
+    try:
+        assert sorted(os.listdir(directory)) == [
+            'return_list.transform.result',
+            'sum_list.transform.result',
+        ]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_file_intermediate_store_unserializable_output(tmpdir):
+    @lambda_solid
+    def return_generator():
+        return (num for num in range(3))
+
+    pipeline = PipelineDefinition(name='unserializable_pipeline', solids=[return_generator])
+
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'execution': {'intermediate_store': {'filesystem': {'directory': str(tmpdir)}}}
+        },
+        throw_on_user_error=False,
+    )
+    assert not result.success
+    assert 'Could not store output result' in str(
+        result.result_for_solid('return_generator').dagster_error
+    )
@@ -0,0 +1,161 @@
+import os
+import signal
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.errors import DagsterSubprocessExecutionError
+from dagster.core.execution_plan.intermediate_store import FileIntermediateHandle
+from dagster.core.types.decorator import dagster_type
+
+MULTIPROCESS_ENV = {'execution': {'engine': {'multiprocess': {'max_workers': 2}}}}
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='diamond_execution',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def test_multiprocess_diamond():
+    result = execute_pipeline(define_diamond_pipeline(), environment_dict=MULTIPROCESS_ENV)
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_multiprocess_executes_in_worker_process():
+    @lambda_solid
+    def return_pid():
+        return os.getpid()
+
+    pipeline = PipelineDefinition(name='pid_pipeline', solids=[return_pid])
+    result = execute_pipeline(pipeline, environment_dict=MULTIPROCESS_ENV)
+    assert result.success
+    assert result.result_for_solid('return_pid').transformed_value() != os.getpid()
+
+
+@dagster_type
+class Counter(object):
+    def __init__(self, count):
+        self.count = count
+
+
+def test_multiprocess_custom_type_intermediates():
+    @lambda_solid(output=OutputDefinition(Counter))
+    def start():
+        return Counter(1)
+
+    @lambda_solid(inputs=[InputDefinition('counter', Counter)], output=OutputDefinition(Counter))
+    def increment(counter):
+        return Counter(counter.count + 1)
+
+    pipeline = PipelineDefinition(
+        name='custom_type_pipeline',
+        solids=[start, increment],
+        dependencies={'increment': {'counter': DependencyDefinition('start')}},
+    )
+
+    result = execute_pipeline(pipeline, environment_dict=MULTIPROCESS_ENV)
+    assert result.success
+    assert result.result_for_solid('increment').transformed_value().count == 2
+
+
+def test_multiprocess_failure():
+    @lambda_solid
+    def throw():
+        raise Exception('bad programmer')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        return num
+
+    pipeline = PipelineDefinition(
+        name='failing_multiprocess',
+        solids=[throw, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw')}},
+    )
+
+    result = execute_pipeline(
+        pipeline, environment_dict=MULTIPROCESS_ENV, throw_on_user_error=False
+    )
+    assert not result.success
+    dagster_error = result.result_for_solid('throw').dagster_error
+    assert isinstance(dagster_error, DagsterSubprocessExecutionError)
+    assert 'bad programmer' in dagster_error.error_info.message
+    assert 'downstream' not in result.solid_result_dict
+
+    with pytest.raises(DagsterSubprocessExecutionError, match='bad programmer'):
+        execute_pipeline(pipeline, environment_dict=MULTIPROCESS_ENV)
+
+
+def test_multiprocess_outputs_read_lazily():
+    result = execute_pipeline(define_diamond_pipeline(), environment_dict=MULTIPROCESS_ENV)
+    assert result.success
+
+    (transform,) = result.result_for_solid('adder').transforms
+    intermediate_handle = transform.success_data.intermediate_handle
+    assert isinstance(intermediate_handle, FileIntermediateHandle)
+    assert os.path.exists(intermediate_handle.path)
+    assert intermediate_handle.get_value() == 11
+
+
+def test_multiprocess_killed_worker():
+    @lambda_solid
+    def die():
+        os.kill(os.getpid(), signal.SIGKILL)
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        return num
+
+    @lambda_solid
+    def survive():
+        return 1
+
+    pipeline = PipelineDefinition(
+        name='killed_worker_pipeline',
+        solids=[die, downstream, survive],
+        dependencies={'downstream': {'num': DependencyDefinition('die')}},
+    )
+
+    result = execute_pipeline(
+        pipeline, environment_dict=MULTIPROCESS_ENV, throw_on_user_error=False
+    )
+    assert not result.success
+    dagster_error = result.result_for_solid('die').dagster_error
+    assert isinstance(dagster_error, DagsterSubprocessExecutionError)
+    assert 'exited unexpectedly' in dagster_error.error_info.message
+    assert 'downstream' not in result.solid_result_dict
+    assert result.result_for_solid('survive').transformed_value() == 1
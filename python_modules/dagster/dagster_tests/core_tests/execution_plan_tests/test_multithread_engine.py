@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution import create_execution_plan, execute_plan
+from dagster.core.execution_plan.objects import StepKind
+
+MULTITHREAD_ENV = {'execution': {'engine': {'multithread': {'max_workers': 2}}}}
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='diamond_execution',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def test_multithread_diamond():
+    result = execute_pipeline(define_diamond_pipeline(), environment_dict=MULTITHREAD_ENV)
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_multithread_single_worker_matches_topological_order():
+    pipeline = define_diamond_pipeline()
+    execution_plan = create_execution_plan(pipeline)
+    step_events = execute_plan(
+        execution_plan,
+        environment_dict={'execution': {'engine': {'multithread': {'max_workers': 1}}}},
+    )
+    assert [step_event.step.key for step_event in step_events] == [
+        step.key for step in execution_plan.topological_steps()
+    ]
+
+
+def test_multithread_runs_independent_steps_concurrently():
+    left_started = threading.Event()
+    right_started = threading.Event()
+
+    @lambda_solid
+    def left():
+        left_started.set()
+        # Only returns True if right runs at the same time as left
+        return right_started.wait(5)
+
+    @lambda_solid
+    def right():
+        right_started.set()
+        return left_started.wait(5)
+
+    pipeline = PipelineDefinition(name='concurrent_pipeline', solids=[left, right])
+
+    result = execute_pipeline(pipeline, environment_dict=MULTITHREAD_ENV)
+    assert result.success
+    assert result.result_for_solid('left').transformed_value() is True
+    assert result.result_for_solid('right').transformed_value() is True
+
+
+def test_multithread_skips_downstream_of_failure():
+    @lambda_solid
+    def throw():
+        raise Exception('bad programmer')
+
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        return num
+
+    pipeline = PipelineDefinition(
+        name='failing_multithread',
+        solids=[throw, return_one, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw')}},
+    )
+
+    result = execute_pipeline(pipeline, environment_dict=MULTITHREAD_ENV, throw_on_user_error=False)
+    assert not result.success
+    assert result.result_for_solid('return_one').transformed_value() == 1
+    assert not result.result_for_solid('throw').success
+    assert 'downstream' not in result.solid_result_dict
+
+    with pytest.raises(Exception, match='bad programmer'):
+        execute_pipeline(pipeline, environment_dict=MULTITHREAD_ENV)
+
+
+def test_multithread_step_events():
+    step_events = execute_plan(
+        create_execution_plan(define_diamond_pipeline()), environment_dict=MULTITHREAD_ENV
+    )
+    assert len(step_events) == 4
+    assert all(step_event.kind == StepKind.TRANSFORM for step_event in step_events)
+    assert all(step_event.is_successful_output for step_event in step_events)
@@ -0,0 +1,180 @@
+from dagster import (
+    DependencyDefinition,
+    ExecutionMetadata,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.execution import create_environment_config, create_execution_plan
+from dagster.core.execution_plan.plan_cache import (
+    PLAN_CACHE,
+    ExecutionPlanCache,
+    environment_fingerprint,
+    pipeline_fingerprint,
+)
+
+
+def define_tagged_pipeline(seen_tags):
+    @lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    @solid(inputs=[InputDefinition('num', Int)])
+    def record_tag(context, num):
+        seen_tags.append(context.get_tag('run_tag'))
+        return num
+
+    return PipelineDefinition(
+        name='tagged_pipeline',
+        solids=[add_one, record_tag],
+        dependencies={'record_tag': {'num': DependencyDefinition('add_one')}},
+    )
+
+
+def _input_env(num):
+    return {'solids': {'add_one': {'inputs': {'num': {'value': num}}}}}
+
+
+def test_plan_reused_across_runs():
+    seen_tags = []
+    pipeline = define_tagged_pipeline(seen_tags)
+    PLAN_CACHE.clear()
+
+    for run_tag in ['first', 'second']:
+        result = execute_pipeline(
+            pipeline,
+            environment_dict=_input_env(1),
+            execution_metadata=ExecutionMetadata(tags={'run_tag': run_tag}),
+        )
+        assert result.success
+        assert result.result_for_solid('record_tag').transformed_value() == 2
+
+    assert PLAN_CACHE.misses == 1
+    assert PLAN_CACHE.hits == 1
+    # The cached plan executes with the tags of the run it is reused by
+    assert seen_tags == ['first', 'second']
+
+
+def test_plan_rebuilt_for_different_inputs():
+    seen_tags = []
+    pipeline = define_tagged_pipeline(seen_tags)
+    PLAN_CACHE.clear()
+
+    results = [
+        execute_pipeline(
+            pipeline,
+            environment_dict=_input_env(num),
+            execution_metadata=ExecutionMetadata(tags={'run_tag': 'a_tag'}),
+        )
+        for num in [1, 2]
+    ]
+    assert [result.result_for_solid('record_tag').transformed_value() for result in results] == [
+        2,
+        3,
+    ]
+    assert PLAN_CACHE.misses == 2
+    assert PLAN_CACHE.hits == 0
+
+
+def test_plan_reused_for_pipeline_defined_again():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    def _define_pipeline():
+        return PipelineDefinition(
+            name='defined_again',
+            solids=[return_one, add_one],
+            dependencies={'add_one': {'num': DependencyDefinition('return_one')}},
+        )
+
+    PLAN_CACHE.clear()
+    for _ in range(2):
+        pipeline = _define_pipeline()
+        execution_plan = create_execution_plan(pipeline)
+        assert execution_plan.pipeline_def is pipeline
+
+    assert PLAN_CACHE.misses == 1
+    assert PLAN_CACHE.hits == 1
+    assert execute_pipeline(pipeline).result_for_solid('add_one').transformed_value() == 2
+
+
+def test_pipeline_fingerprint():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    def _fingerprint(solids, upstream_solid_name):
+        return pipeline_fingerprint(
+            PipelineDefinition(
+                name='a_pipeline',
+                solids=solids,
+                dependencies={'add_one': {'num': DependencyDefinition(upstream_solid_name)}},
+            )
+        )
+
+    solids = [return_one, return_two, add_one]
+    assert _fingerprint(solids, 'return_one') == _fingerprint(list(reversed(solids)), 'return_one')
+    assert _fingerprint(solids, 'return_one') != _fingerprint(solids, 'return_two')
+
+    # Pipelines with solids of the same names but other definitions have other fingerprints
+    tagged_pipeline = define_tagged_pipeline([])
+    assert pipeline_fingerprint(tagged_pipeline) == pipeline_fingerprint(tagged_pipeline)
+    assert pipeline_fingerprint(tagged_pipeline) != pipeline_fingerprint(define_tagged_pipeline([]))
+
+
+def test_environment_fingerprint():
+    pipeline = define_tagged_pipeline([])
+
+    def _fingerprint(environment_dict):
+        return environment_fingerprint(create_environment_config(pipeline, environment_dict))
+
+    assert _fingerprint(_input_env(1)) == _fingerprint(_input_env(1))
+    assert _fingerprint(_input_env(1)) != _fingerprint(_input_env(2))
+    assert _fingerprint(_input_env(1)) != _fingerprint(
+        dict(_input_env(1), expectations={'evaluate': False})
+    )
+    # Only the sections that steps are built from are fingerprinted
+    assert _fingerprint(_input_env(1)) == _fingerprint(
+        dict(_input_env(1), context={'default': {'config': {'log_level': 'ERROR'}}})
+    )
+
+
+def test_plan_cache_eviction():
+    pipeline = define_tagged_pipeline([])
+    cache = ExecutionPlanCache(max_size=2)
+
+    def _get(num):
+        return cache.get_or_create(
+            pipeline,
+            create_environment_config(pipeline, _input_env(num)),
+            lambda: create_execution_plan(pipeline, _input_env(num)),
+        )
+
+    one_plan = _get(1)
+    _get(2)
+    assert _get(1) is one_plan
+    _get(3)
+    assert len(cache) == 2
+    assert cache.misses == 3
+
+    # 2 was the least recently used plan
+    assert _get(1) is one_plan
+    _get(2)
+    assert cache.misses == 4
@@ -0,0 +1,61 @@
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    lambda_solid,
+)
+from dagster.core.definitions import solids_in_topological_order
+from dagster.core.execution import create_execution_plan
+
+
+def define_chain_pipeline(length):
+    @lambda_solid(output=OutputDefinition(Int))
+    def start():
+        return 0
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='chain_pipeline',
+        solids=[start, add_one],
+        dependencies={
+            SolidInstance('add_one', alias='add_one_{i}'.format(i=i)): {
+                'num': DependencyDefinition('start' if i == 0 else 'add_one_{i}'.format(i=i - 1))
+            }
+            for i in range(length)
+        },
+    )
+
+
+def test_deep_chain_order():
+    # Deeper than the recursion limit
+    length = 2000
+    pipeline = define_chain_pipeline(length)
+    expected_names = ['start'] + ['add_one_{i}'.format(i=i) for i in range(length)]
+
+    assert [solid.name for solid in solids_in_topological_order(pipeline)] == expected_names
+
+    execution_plan = create_execution_plan(pipeline)
+    assert [step.key for step in execution_plan.topological_steps()] == [
+        '{name}.transform'.format(name=name) for name in expected_names
+    ]
+    assert [[step.key for step in level] for level in execution_plan.topological_step_levels()] == [
+        ['{name}.transform'.format(name=name)] for name in expected_names
+    ]
+
+
+def test_topological_steps_are_copies():
+    execution_plan = create_execution_plan(define_chain_pipeline(2))
+
+    steps = execution_plan.topological_steps()
+    steps.pop()
+    levels = execution_plan.topological_step_levels()
+    levels[0].pop()
+
+    assert len(execution_plan.topological_steps()) == 3
+    assert [len(level) for level in execution_plan.topological_step_levels()] == [1, 1, 1]
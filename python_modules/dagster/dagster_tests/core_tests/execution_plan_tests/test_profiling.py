@@ -0,0 +1,100 @@
+import os
+import pstats
+import sys
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.events import EventType
+from dagster.core.execution import ExecutionMetadata
+
+
+def define_profiled_pipeline():
+    @lambda_solid
+    def allocate():
+        return [str(i) for i in range(10000)]
+
+    @lambda_solid(inputs=[InputDefinition('strings')])
+    def count(strings):
+        return len(strings)
+
+    return PipelineDefinition(
+        name='profiled_pipeline',
+        solids=[allocate, count],
+        dependencies={'count': {'strings': DependencyDefinition('allocate')}},
+    )
+
+
+def _execute_profiled(profile_config):
+    events = []
+    result = execute_pipeline(
+        define_profiled_pipeline(),
+        environment_dict={'execution': {'profile': profile_config}},
+        execution_metadata=ExecutionMetadata(event_callback=events.append),
+    )
+    assert result.success
+    materializations = [
+        event for event in events if event.event_type == EventType.STEP_MATERIALIZATION
+    ]
+    return result, materializations
+
+
+def test_profile_selected_solid(tmpdir):
+    result, materializations = _execute_profiled({'steps': ['allocate'], 'directory': str(tmpdir)})
+
+    run_directory = os.path.join(str(tmpdir), result.run_id)
+    assert os.listdir(run_directory) == ['allocate.transform.pstats']
+
+    stats = pstats.Stats(os.path.join(run_directory, 'allocate.transform.pstats'))
+    assert any(function_name == 'allocate' for _, _, function_name in stats.stats)
+
+    assert [
+        (event.step_key, event.file_name, event.file_location) for event in materializations
+    ] == [
+        (
+            'allocate.transform',
+            'allocate.transform.pstats',
+            os.path.join(run_directory, 'allocate.transform.pstats'),
+        )
+    ]
+
+
+@pytest.mark.skipif(sys.version_info < (3,), reason='tracemalloc requires Python 3')
+def test_profile_allocations_of_selected_step(tmpdir):
+    import tracemalloc
+
+    result, materializations = _execute_profiled(
+        {
+            'steps': ['count.transform'],
+            'cprofile': False,
+            'tracemalloc': True,
+            'top_allocations': 5,
+            'directory': str(tmpdir),
+        }
+    )
+
+    run_directory = os.path.join(str(tmpdir), result.run_id)
+    assert os.listdir(run_directory) == ['count.transform.allocations.txt']
+    assert [event.file_name for event in materializations] == ['count.transform.allocations.txt']
+
+    with open(os.path.join(run_directory, 'count.transform.allocations.txt')) as allocations_file:
+        lines = allocations_file.read().splitlines()
+    assert lines[0].startswith('Top ')
+    assert len(lines) <= 2 + 5
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_no_profile_unless_selected(tmpdir):
+    result, materializations = _execute_profiled(
+        {'steps': ['not_a_step'], 'directory': str(tmpdir)}
+    )
+
+    assert not os.path.exists(os.path.join(str(tmpdir), result.run_id))
+    assert not materializations
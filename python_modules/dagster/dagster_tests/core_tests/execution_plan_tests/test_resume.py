@@ -0,0 +1,240 @@
+from collections import defaultdict
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExpectationDefinition,
+    ExpectationResult,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    Result,
+    execute_pipeline,
+    lambda_solid,
+    resume_pipeline,
+    solid,
+)
+from dagster.core.errors import DagsterInvariantViolationError
+
+
+def define_resumable_pipeline(calls, failing):
+    @lambda_solid(
+        output=OutputDefinition(
+            expectations=[
+                ExpectationDefinition(
+                    name='positive',
+                    expectation_fn=lambda _info, value: ExpectationResult(value > 0),
+                ),
+                ExpectationDefinition(
+                    name='small', expectation_fn=lambda _info, value: ExpectationResult(value < 10)
+                ),
+            ]
+        )
+    )
+    def return_one():
+        calls['return_one'] += 1
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        calls['add_one'] += 1
+        if 'add_one' in failing:
+            raise Exception('add_one failed')
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_two(num):
+        calls['add_two'] += 1
+        return num + 2
+
+    @lambda_solid
+    def return_ten():
+        calls['return_ten'] += 1
+        return 10
+
+    return PipelineDefinition(
+        name='resumable_pipeline',
+        solids=[return_one, add_one, add_two, return_ten],
+        dependencies={
+            'add_one': {'num': DependencyDefinition('return_one')},
+            'add_two': {'num': DependencyDefinition('add_one')},
+        },
+    )
+
+
+def _resumable_environment(tmpdir):
+    return {'execution': {'resumable': {'directory': str(tmpdir)}}}
+
+
+def test_resume_failed_run(tmpdir):
+    calls = defaultdict(int)
+    failing = set(['add_one'])
+    pipeline = define_resumable_pipeline(calls, failing)
+
+    result = execute_pipeline(
+        pipeline, environment_dict=_resumable_environment(tmpdir), throw_on_user_error=False
+    )
+    assert not result.success
+    assert dict(calls) == {'return_one': 1, 'add_one': 1, 'return_ten': 1}
+
+    failing.clear()
+    resumed = resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+    assert resumed.success
+    assert resumed.run_id == result.run_id
+    assert dict(calls) == {'return_one': 1, 'add_one': 2, 'add_two': 1, 'return_ten': 1}
+    assert set(resumed.solid_result_dict.keys()) == set(['add_one', 'add_two'])
+    assert resumed.result_for_solid('add_two').transformed_value() == 4
+
+    # Every solid has now succeeded, so there is nothing left to run
+    resumed = resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+    assert resumed.success
+    assert not resumed.solid_result_dict
+    assert dict(calls) == {'return_one': 1, 'add_one': 2, 'add_two': 1, 'return_ten': 1}
+
+
+def test_resume_solid_that_failed_again(tmpdir):
+    calls = defaultdict(int)
+    failing = set(['add_one'])
+    pipeline = define_resumable_pipeline(calls, failing)
+
+    result = execute_pipeline(
+        pipeline, environment_dict=_resumable_environment(tmpdir), throw_on_user_error=False
+    )
+    resumed = resume_pipeline(
+        pipeline, result.run_id, _resumable_environment(tmpdir), throw_on_user_error=False
+    )
+    assert not resumed.success
+
+    failing.clear()
+    resumed = resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+    assert resumed.success
+    assert resumed.result_for_solid('add_two').transformed_value() == 4
+    assert dict(calls) == {'return_one': 1, 'add_one': 3, 'add_two': 1, 'return_ten': 1}
+
+
+def test_resume_skips_solids_missing_outputs(tmpdir):
+    calls = defaultdict(int)
+    failing = set(['on_left'])
+
+    @solid(outputs=[OutputDefinition(name='left'), OutputDefinition(name='right')])
+    def branch(_context):
+        calls['branch'] += 1
+        yield Result(1, 'left')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def on_left(num):
+        calls['on_left'] += 1
+        if 'on_left' in failing:
+            raise Exception('on_left failed')
+        return num
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def on_right(num):
+        calls['on_right'] += 1
+        return num
+
+    pipeline = PipelineDefinition(
+        name='branching_pipeline',
+        solids=[branch, on_left, on_right],
+        dependencies={
+            'on_left': {'num': DependencyDefinition('branch', 'left')},
+            'on_right': {'num': DependencyDefinition('branch', 'right')},
+        },
+    )
+
+    result = execute_pipeline(
+        pipeline, environment_dict=_resumable_environment(tmpdir), throw_on_user_error=False
+    )
+    assert not result.success
+
+    failing.clear()
+    resumed = resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+    assert resumed.success
+    assert set(resumed.solid_result_dict.keys()) == set(['on_left'])
+    assert dict(calls) == {'branch': 1, 'on_left': 2}
+
+
+def test_resume_skips_solids_downstream_of_skipped_solids(tmpdir):
+    calls = defaultdict(int)
+    failing = set(['on_left'])
+
+    @solid(outputs=[OutputDefinition(name='left'), OutputDefinition(name='right')])
+    def branch(_context):
+        calls['branch'] += 1
+        yield Result(1, 'left')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def on_left(num):
+        calls['on_left'] += 1
+        if 'on_left' in failing:
+            raise Exception('on_left failed')
+        return num
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def on_right(num):
+        calls['on_right'] += 1
+        return num
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def join(left, right):
+        calls['join'] += 1
+        return left + right
+
+    pipeline = PipelineDefinition(
+        name='joining_pipeline',
+        solids=[branch, on_left, on_right, join],
+        dependencies={
+            'on_left': {'num': DependencyDefinition('branch', 'left')},
+            'on_right': {'num': DependencyDefinition('branch', 'right')},
+            'join': {
+                'left': DependencyDefinition('on_left'),
+                'right': DependencyDefinition('on_right'),
+            },
+        },
+    )
+
+    result = execute_pipeline(
+        pipeline, environment_dict=_resumable_environment(tmpdir), throw_on_user_error=False
+    )
+    assert not result.success
+
+    # on_right was skipped in the run, so join is skipped again once on_left is rerun
+    failing.clear()
+    resumed = resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+    assert resumed.success
+    assert set(resumed.solid_result_dict.keys()) == set(['on_left'])
+    assert dict(calls) == {'branch': 1, 'on_left': 2}
+
+
+def test_resume_requires_resumable_run(tmpdir):
+    pipeline = define_resumable_pipeline(defaultdict(int), set())
+    result = execute_pipeline(pipeline)
+
+    with pytest.raises(DagsterInvariantViolationError, match='requires execution: resumable'):
+        resume_pipeline(pipeline, result.run_id)
+
+    with pytest.raises(DagsterInvariantViolationError, match='No persisted outputs'):
+        resume_pipeline(pipeline, result.run_id, _resumable_environment(tmpdir))
+
+    result = execute_pipeline(pipeline, environment_dict=_resumable_environment(tmpdir))
+    other_pipeline = PipelineDefinition(name='other_pipeline', solids=[])
+    with pytest.raises(DagsterInvariantViolationError, match='not other_pipeline'):
+        resume_pipeline(other_pipeline, result.run_id, _resumable_environment(tmpdir))
+
+
+def test_resume_multiprocess(tmpdir):
+    failing = set(['add_one'])
+    pipeline = define_resumable_pipeline(defaultdict(int), failing)
+    environment_dict = {
+        'execution': {'resumable': {'directory': str(tmpdir)}, 'engine': {'multiprocess': {}}}
+    }
+
+    result = execute_pipeline(pipeline, environment_dict, throw_on_user_error=False)
+    assert not result.success
+
+    failing.clear()
+    resumed = resume_pipeline(pipeline, result.run_id, environment_dict)
+    assert resumed.success
+    assert set(resumed.solid_result_dict.keys()) == set(['add_one', 'add_two'])
+    assert resumed.result_for_solid('add_two').transformed_value() == 4
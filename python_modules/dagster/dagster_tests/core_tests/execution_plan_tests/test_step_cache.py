@@ -0,0 +1,159 @@
+from collections import defaultdict
+import os
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionContext,
+    Field,
+    InputDefinition,
+    Int,
+    PipelineContextDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.cli.cache import execute_info_command, execute_prune_command
+from dagster.core.events import EventType, construct_event_logger
+from dagster.core.execution_plan.step_cache import StepCache
+from dagster.core.types.marshal import PickleSerializationStrategy
+
+
+def define_cached_pipeline(calls, events):
+    @solid(config_field=Field(Int))
+    def return_config(context):
+        calls['return_config'] += 1
+        return context.solid_config
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        calls['add_one'] += 1
+        return num + 1
+
+    @lambda_solid
+    def return_two():
+        calls['return_two'] += 1
+        return 2
+
+    return PipelineDefinition(
+        name='cached_pipeline',
+        solids=[return_config, add_one, return_two],
+        dependencies={'add_one': {'num': DependencyDefinition('return_config')}},
+        context_definitions={
+            'default': PipelineContextDefinition(
+                context_fn=lambda _: ExecutionContext(
+                    loggers=[
+                        construct_event_logger(
+                            lambda record: events[record.event_type].append(record)
+                        )
+                    ]
+                )
+            )
+        },
+    )
+
+
+def _cached_environment(cache_dir, config_value):
+    return {
+        'solids': {'return_config': {'config': config_value}},
+        'execution': {'cache': {'directory': cache_dir}},
+    }
+
+
+def test_step_cache_hit(tmpdir):
+    cache_dir = str(tmpdir)
+    calls = defaultdict(int)
+
+    events = defaultdict(list)
+    result = execute_pipeline(
+        define_cached_pipeline(calls, events), environment_dict=_cached_environment(cache_dir, 1)
+    )
+    assert result.success
+    assert dict(calls) == {'return_config': 1, 'add_one': 1, 'return_two': 1}
+    assert len(events[EventType.EXECUTION_PLAN_STEP_START]) == 3
+    assert not events[EventType.EXECUTION_PLAN_STEP_CACHE_HIT]
+
+    events = defaultdict(list)
+    result = execute_pipeline(
+        define_cached_pipeline(calls, events), environment_dict=_cached_environment(cache_dir, 1)
+    )
+    assert result.success
+    assert result.result_for_solid('add_one').transformed_value() == 2
+    assert dict(calls) == {'return_config': 1, 'add_one': 1, 'return_two': 1}
+    assert not events[EventType.EXECUTION_PLAN_STEP_START]
+    assert sorted(
+        record.step_key for record in events[EventType.EXECUTION_PLAN_STEP_CACHE_HIT]
+    ) == ['add_one.transform', 'return_config.transform', 'return_two.transform']
+    # The cached steps are still reported as succeeded
+    assert sorted(record.step_key for record in events[EventType.EXECUTION_PLAN_STEP_SUCCESS]) == [
+        'add_one.transform',
+        'return_config.transform',
+        'return_two.transform',
+    ]
+
+
+def test_step_cache_miss_on_changed_config_and_inputs(tmpdir):
+    cache_dir = str(tmpdir)
+    calls = defaultdict(int)
+    events = defaultdict(list)
+
+    execute_pipeline(
+        define_cached_pipeline(calls, events), environment_dict=_cached_environment(cache_dir, 1)
+    )
+    result = execute_pipeline(
+        define_cached_pipeline(calls, events), environment_dict=_cached_environment(cache_dir, 5)
+    )
+    assert result.success
+    assert result.result_for_solid('add_one').transformed_value() == 6
+    # The config of return_config changed, and with it the input of add_one
+    assert dict(calls) == {'return_config': 2, 'add_one': 2, 'return_two': 1}
+
+
+def test_step_cache_not_used_by_default(tmpdir):
+    calls = defaultdict(int)
+    environment_dict = {'solids': {'return_config': {'config': 1}}}
+
+    execute_pipeline(define_cached_pipeline(calls, defaultdict(list)), environment_dict)
+    execute_pipeline(define_cached_pipeline(calls, defaultdict(list)), environment_dict)
+    assert dict(calls) == {'return_config': 2, 'add_one': 2, 'return_two': 2}
+
+
+def test_step_cache_lru_eviction(tmpdir):
+    step_cache = StepCache(str(tmpdir), max_size_bytes=1024 * 1024)
+    strategy = PickleSerializationStrategy()
+
+    for cache_key in ['a', 'b', 'c']:
+        step_cache.write_entry(
+            cache_key, 'pipeline', cache_key + '.transform', {'result': (strategy, cache_key)}
+        )
+        # Make the order of use unambiguous
+        os.utime(os.path.join(str(tmpdir), cache_key, 'manifest.json'), (0, ord(cache_key)))
+
+    step_cache.touch('a')
+    assert [entry.cache_key for entry in step_cache.entries()] == ['a', 'c', 'b']
+    assert step_cache.read_output('c', 'result', strategy) == 'c'
+
+    entry_size = step_cache.get_entry('a').size_bytes
+    evicted = step_cache.prune(max_size_bytes=entry_size)
+    assert [entry.cache_key for entry in evicted] == ['b', 'c']
+    assert [entry.cache_key for entry in step_cache.entries()] == ['a']
+    assert step_cache.total_size_bytes() == entry_size
+
+
+def test_step_cache_cli(tmpdir):
+    cache_dir = str(tmpdir)
+    execute_pipeline(
+        define_cached_pipeline(defaultdict(int), defaultdict(list)),
+        environment_dict=_cached_environment(cache_dir, 1),
+    )
+
+    lines = []
+    execute_info_command(cache_dir, lines.append)
+    assert len(lines) == 5
+    assert 'cached_pipeline add_one.transform' in '\n'.join(lines)
+    assert lines[-1].startswith('3 entries')
+
+    lines = []
+    execute_prune_command(cache_dir, 0, lines.append)
+    assert lines[0].startswith('Evicted 3 entries')
+    assert not StepCache(cache_dir).entries()
@@ -0,0 +1,207 @@
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExpectationDefinition,
+    ExpectationResult,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInstance,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+
+
+def define_streaming_pipeline(produced, num_chunks=10, consume=None):
+    @lambda_solid(output=OutputDefinition(Int, is_streaming=True))
+    def produce_chunks():
+        for num in range(num_chunks):
+            produced.append(num)
+            yield num
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Int, is_streaming=True)])
+    def sum_chunks(chunks):
+        if consume:
+            return consume(chunks)
+        return sum(chunks)
+
+    return PipelineDefinition(
+        name='streaming_pipeline',
+        solids=[produce_chunks, sum_chunks],
+        dependencies={'sum_chunks': {'chunks': DependencyDefinition('produce_chunks')}},
+    )
+
+
+@pytest.mark.parametrize('buffer_size', [0, 1, 16])
+@pytest.mark.parametrize('engine_key', ['in_process', 'multithread', 'asyncio'])
+def test_streaming_output(engine_key, buffer_size):
+    produced = []
+    result = execute_pipeline(
+        define_streaming_pipeline(produced),
+        environment_dict={
+            'execution': {'engine': {engine_key: {}}, 'stream_buffer_size': buffer_size}
+        },
+    )
+    assert result.success
+    assert result.result_for_solid('sum_chunks').transformed_value() == 45
+    assert produced == list(range(10))
+
+
+def test_streaming_backpressure():
+    produced = []
+    buffer_size = 2
+
+    def _consume(chunks):
+        total = 0
+        for consumed, chunk in enumerate(chunks, 1):
+            # Buffered chunks, and the chunk blocked waiting for room in the buffer
+            assert len(produced) - consumed <= buffer_size + 1
+            total += chunk
+        return total
+
+    result = execute_pipeline(
+        define_streaming_pipeline(produced, num_chunks=100, consume=_consume),
+        environment_dict={'execution': {'stream_buffer_size': buffer_size}},
+    )
+    assert result.success
+    assert result.result_for_solid('sum_chunks').transformed_value() == sum(range(100))
+
+
+def test_consumer_stops_early():
+    produced = []
+
+    def _consume(chunks):
+        return next(iter(chunks))
+
+    result = execute_pipeline(
+        define_streaming_pipeline(produced, num_chunks=1000, consume=_consume),
+        environment_dict={'execution': {'stream_buffer_size': 4}},
+    )
+    assert result.success
+    assert result.result_for_solid('sum_chunks').transformed_value() == 0
+    assert len(produced) < 1000
+
+
+def test_streaming_chunk_type_check():
+    @lambda_solid(output=OutputDefinition(Int, is_streaming=True))
+    def produce_chunks():
+        yield 1
+        yield 'two'
+
+    @lambda_solid(inputs=[InputDefinition('chunks', is_streaming=True)])
+    def list_chunks(chunks):
+        return list(chunks)
+
+    pipeline = PipelineDefinition(
+        name='bad_chunk_pipeline',
+        solids=[produce_chunks, list_chunks],
+        dependencies={'list_chunks': {'chunks': DependencyDefinition('produce_chunks')}},
+    )
+
+    result = execute_pipeline(pipeline, throw_on_user_error=False)
+    assert not result.success
+    assert result.result_for_solid('produce_chunks').success
+    assert 'streaming output result chunk two type failure' in str(
+        result.result_for_solid('list_chunks').dagster_error
+    )
+
+
+def test_streaming_chunk_expectations():
+    checked = []
+
+    def _positive(_info, value):
+        checked.append(value)
+        return ExpectationResult(value > 0)
+
+    @lambda_solid(
+        output=OutputDefinition(
+            Int,
+            is_streaming=True,
+            expectations=[ExpectationDefinition(name='positive', expectation_fn=_positive)],
+        )
+    )
+    def produce_chunks():
+        for num in [3, 2, 1, 0, -1]:
+            yield num
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Int, is_streaming=True)])
+    def sum_chunks(chunks):
+        return sum(chunks)
+
+    pipeline = PipelineDefinition(
+        name='expectation_pipeline',
+        solids=[produce_chunks, sum_chunks],
+        dependencies={'sum_chunks': {'chunks': DependencyDefinition('produce_chunks')}},
+    )
+
+    result = execute_pipeline(pipeline, throw_on_user_error=False)
+    assert not result.success
+    assert checked == [3, 2, 1, 0]
+    assert not result.result_for_solid('sum_chunks').success
+
+    checked[:] = []
+    result = execute_pipeline(pipeline, environment_dict={'expectations': {'evaluate': False}})
+    assert result.success
+    assert not checked
+    assert result.result_for_solid('sum_chunks').transformed_value() == 5
+
+
+def test_streaming_output_requires_streaming_input():
+    @lambda_solid(output=OutputDefinition(is_streaming=True))
+    def produce_chunks():
+        yield 1
+
+    @lambda_solid(inputs=[InputDefinition('chunks')])
+    def take_list(chunks):
+        return chunks
+
+    @lambda_solid(inputs=[InputDefinition('chunks', is_streaming=True)])
+    def take_stream(chunks):
+        return list(chunks)
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='must be consumed by a streaming'):
+        PipelineDefinition(
+            solids=[produce_chunks, take_list],
+            dependencies={'take_list': {'chunks': DependencyDefinition('produce_chunks')}},
+        )
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='can only be consumed once'):
+        PipelineDefinition(
+            solids=[produce_chunks, take_stream],
+            dependencies={
+                'take_stream': {'chunks': DependencyDefinition('produce_chunks')},
+                SolidInstance('take_stream', alias='take_stream_again'): {
+                    'chunks': DependencyDefinition('produce_chunks')
+                },
+            },
+        )
+
+
+def test_streaming_input_from_value():
+    @lambda_solid
+    def return_list():
+        return [1, 2, 3]
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Int, is_streaming=True)])
+    def sum_chunks(chunks):
+        return sum(chunks)
+
+    pipeline = PipelineDefinition(
+        name='list_to_stream_pipeline',
+        solids=[return_list, sum_chunks],
+        dependencies={'sum_chunks': {'chunks': DependencyDefinition('return_list')}},
+    )
+    result = execute_pipeline(pipeline)
+    assert result.success
+    assert result.result_for_solid('sum_chunks').transformed_value() == 6
+
+
+def test_streaming_multiprocess_unsupported():
+    with pytest.raises(DagsterInvariantViolationError, match='multiprocess engine'):
+        execute_pipeline(
+            define_streaming_pipeline([]),
+            environment_dict={'execution': {'engine': {'multiprocess': {}}}},
+        )
@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExpectationDefinition,
+    ExpectationResult,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    Result,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution import create_execution_plan
+from dagster.utils.test import get_temp_file_name
+
+
+def define_wide_pipeline(executed):
+    def _executed(name, value):
+        executed.append(name)
+        return value
+
+    @lambda_solid(
+        output=OutputDefinition(
+            Int,
+            expectations=[
+                ExpectationDefinition(
+                    name='positive',
+                    expectation_fn=lambda _info, value: ExpectationResult(value > 0),
+                )
+            ],
+        )
+    )
+    def source():
+        return _executed('source', 1)
+
+    @solid(outputs=[OutputDefinition(Int, 'left'), OutputDefinition(Int, 'right')])
+    def split(_info):
+        executed.append('split')
+        yield Result(2, 'left')
+        yield Result(3, 'right')
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)])
+    def report_a(num):
+        return _executed('report_a', num + 10)
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)])
+    def report_b(num):
+        return _executed('report_b', num + 20)
+
+    @lambda_solid(inputs=[InputDefinition('left', Int)])
+    def report_c(left):
+        return _executed('report_c', left + 30)
+
+    return PipelineDefinition(
+        name='wide_pipeline',
+        solids=[source, split, report_a, report_b, report_c],
+        dependencies={
+            'report_a': {'num': DependencyDefinition('source')},
+            'report_b': {'num': DependencyDefinition('split', 'right')},
+            'report_c': {'left': DependencyDefinition('split', 'left')},
+        },
+    )
+
+
+def test_targets_prune_plan():
+    pipeline = define_wide_pipeline([])
+
+    full_plan = create_execution_plan(pipeline)
+    assert full_plan.has_step('report_b.transform')
+    assert full_plan.has_step('source.output.result.expectation.positive')
+
+    plan = create_execution_plan(pipeline, targets=['report_a'])
+    assert set(plan.step_dict.keys()) == set(
+        [
+            'source.transform',
+            'source.output.result.expectation.positive',
+            'source.output.result.expectations.join',
+            'report_a.transform',
+        ]
+    )
+
+    plan = create_execution_plan(pipeline, targets=['split.right'])
+    assert set(plan.step_dict.keys()) == set(['split.transform'])
+
+
+def test_execute_targets():
+    executed = []
+    result = execute_pipeline(define_wide_pipeline(executed), targets=['report_b'])
+    assert result.success
+    assert executed == ['split', 'report_b']
+    assert result.result_for_solid('report_b').transformed_value() == 23
+
+    with pytest.raises(DagsterInvariantViolationError, match='Did not find result'):
+        result.result_for_solid('report_a')
+
+
+def test_targets_keep_materializations():
+    executed = []
+    with get_temp_file_name() as path:
+        result = execute_pipeline(
+            define_wide_pipeline(executed),
+            environment_dict={
+                'solids': {'report_c': {'outputs': [{'result': {'json': {'path': path}}}]}}
+            },
+            targets=['report_a'],
+        )
+        assert result.success
+        assert sorted(executed) == ['report_a', 'report_c', 'source', 'split']
+
+        with open(path, 'r') as ff:
+            assert json.loads(ff.read()) == {'value': 32}
+
+
+def test_empty_targets():
+    executed = []
+    result = execute_pipeline(define_wide_pipeline(executed), targets=[])
+    assert result.success
+    assert executed == []
+
+
+def test_unknown_targets():
+    pipeline = define_wide_pipeline([])
+
+    with pytest.raises(DagsterInvariantViolationError, match='names solid nope'):
+        create_execution_plan(pipeline, targets=['nope'])
+
+    with pytest.raises(DagsterInvariantViolationError, match='names output nope'):
+        create_execution_plan(pipeline, targets=['split.nope'])
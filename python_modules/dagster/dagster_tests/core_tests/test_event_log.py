@@ -0,0 +1,192 @@
+import io
+import json
+import logging
+
+from dagster import ExecutionContext, PipelineContextDefinition, PipelineDefinition, lambda_solid
+from dagster import execute_pipeline
+from dagster.core.event_log import (
+    EVENT_TYPE_CODES,
+    RECORD_CLASS_CODES,
+    EventLogReader,
+    EventLogWriter,
+    construct_event_log_logger,
+    read_event_records,
+)
+from dagster.core.events import (
+    EventType,
+    ExecutionStepCacheHitRecord,
+    ExecutionStepEventRecord,
+    ExecutionStepSuccessRecord,
+    LogMessageRecord,
+    PipelineEventRecord,
+    StepMaterializationRecord,
+)
+from dagster.utils.error import SerializableErrorInfo
+from dagster.utils.test import get_temp_file_name
+
+
+def _base_args(event_type, **kwargs):
+    return dict(
+        dict(
+            error_info=None,
+            message='a message',
+            level=logging.INFO,
+            user_message='a user message',
+            event_type=event_type,
+            run_id='a_run_id',
+            timestamp=1.5,
+        ),
+        **kwargs
+    )
+
+
+def _step_args(event_type, **kwargs):
+    return _base_args(
+        event_type,
+        step_key='a_solid.transform',
+        pipeline_name='a_pipeline',
+        solid_name='a_solid',
+        solid_definition_name='a_solid_def',
+        **kwargs
+    )
+
+
+def define_event_records():
+    return [
+        PipelineEventRecord(pipeline_name='a_pipeline', **_base_args(EventType.PIPELINE_START)),
+        LogMessageRecord(**_base_args(EventType.UNCATEGORIZED)),
+        ExecutionStepEventRecord(**_step_args(EventType.EXECUTION_PLAN_STEP_START)),
+        ExecutionStepSuccessRecord(
+            millis=12.5, **_step_args(EventType.EXECUTION_PLAN_STEP_SUCCESS)
+        ),
+        ExecutionStepCacheHitRecord(
+            cache_key='a_cache_key', **_step_args(EventType.EXECUTION_PLAN_STEP_CACHE_HIT)
+        ),
+        StepMaterializationRecord(
+            file_name='a_file',
+            file_location='/tmp/a_file',
+            **_step_args(EventType.STEP_MATERIALIZATION)
+        ),
+        ExecutionStepEventRecord(
+            **_step_args(
+                EventType.EXECUTION_PLAN_STEP_FAILURE,
+                level=logging.ERROR,
+                error_info=SerializableErrorInfo('an error', ['line one', u'line tw\xf6']),
+            )
+        ),
+    ]
+
+
+def test_event_records_slotted():
+    for record in define_event_records():
+        assert not hasattr(record, '__dict__')
+
+
+def test_event_log_roundtrip():
+    records = define_event_records()
+    with get_temp_file_name() as path:
+        with EventLogWriter(path) as writer:
+            for record in records:
+                writer.write(record)
+
+        read_records = list(read_event_records(path))
+
+    assert [type(record) for record in read_records] == [type(record) for record in records]
+    assert [record.to_dict() for record in read_records] == [record.to_dict() for record in records]
+
+
+def test_read_json_event_log():
+    records = define_event_records()
+    with get_temp_file_name() as path:
+        # As dagit wrote the logs of runs before the binary format
+        with io.open(path, 'w', encoding='utf-8') as ff:
+            for record in records:
+                ff.write(json.dumps(record.to_dict(), sort_keys=True))
+                ff.write(u'\n')
+
+        read_records = list(read_event_records(path))
+
+    assert [type(record) for record in read_records] == [type(record) for record in records]
+    assert [record.to_dict() for record in read_records] == [record.to_dict() for record in records]
+
+
+def test_event_log_codes():
+    assert set(EVENT_TYPE_CODES) == set(EventType)
+    assert len(set(EVENT_TYPE_CODES.values())) == len(EVENT_TYPE_CODES)
+    assert len(set(RECORD_CLASS_CODES.values())) == len(RECORD_CLASS_CODES)
+
+
+def test_event_log_append():
+    records = define_event_records()
+    with get_temp_file_name() as path:
+        with EventLogWriter(path) as writer:
+            writer.write(records[0])
+
+        reader = EventLogReader(path)
+        assert [record.to_dict() for record in reader] == [records[0].to_dict()]
+
+        # A new writer keeps appending to the log, reusing the names it defines
+        with EventLogWriter(path) as writer:
+            for record in records[1:]:
+                writer.write(record)
+
+        # The reader resumes where it stopped
+        assert [record.to_dict() for record in reader] == [
+            record.to_dict() for record in records[1:]
+        ]
+        assert len(reader.names) == len(set(reader.names))
+
+
+def test_event_log_incomplete_frame():
+    records = define_event_records()
+    with get_temp_file_name() as path:
+        with EventLogWriter(path) as writer:
+            writer.write(records[0])
+            writer.write(records[1])
+
+        with io.open(path, 'rb') as ff:
+            data = ff.read()
+        with io.open(path, 'wb') as ff:
+            ff.write(data[:-3])
+
+        assert [record.to_dict() for record in read_event_records(path)] == [records[0].to_dict()]
+
+        # A writer drops the incomplete frame
+        with EventLogWriter(path) as writer:
+            writer.write(records[2])
+
+        assert [record.to_dict() for record in read_event_records(path)] == [
+            records[0].to_dict(),
+            records[2].to_dict(),
+        ]
+
+
+def test_event_log_logger():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    with get_temp_file_name() as path:
+        event_log_logger = construct_event_log_logger(path)
+        pipeline = PipelineDefinition(
+            name='event_log_pipeline',
+            solids=[return_one],
+            context_definitions={
+                'default': PipelineContextDefinition(
+                    context_fn=lambda _info: ExecutionContext(loggers=[event_log_logger])
+                )
+            },
+        )
+        assert execute_pipeline(pipeline).success
+        for handler in event_log_logger.handlers:
+            handler.close()
+
+        records = list(read_event_records(path))
+
+    event_types = [record.event_type for record in records]
+    assert event_types[0] == EventType.PIPELINE_START
+    assert event_types[-1] == EventType.PIPELINE_SUCCESS
+    assert EventType.EXECUTION_PLAN_STEP_SUCCESS in event_types
+    success_record = records[event_types.index(EventType.EXECUTION_PLAN_STEP_SUCCESS)]
+    assert isinstance(success_record, ExecutionStepSuccessRecord)
+    assert success_record.step_key == 'return_one.transform'
@@ -0,0 +1,99 @@
+import json
+import logging
+
+import pytest
+
+from dagster.core.log import DAGSTER_META_KEY, DagsterLog
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super(RecordingHandler, self).__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _recording_logger(name, level):
+    logger = logging.Logger(name, level)
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def _parse_kv_message(message):
+    return [part.split('=', 1) for part in message.split(' ')]
+
+
+def test_structured_message():
+    logger, handler = _recording_logger('test_structured_message', logging.DEBUG)
+    log = DagsterLog('a_run_id', {'pipeline': 'a_pipeline', 'solid': 'a_solid'}, [logger])
+
+    log.info('a_message', event_type='AN_EVENT', millis=3)
+
+    assert len(handler.records) == 1
+    record = handler.records[0]
+    meta = getattr(record, DAGSTER_META_KEY)
+
+    assert [key for key, _value in _parse_kv_message(record.getMessage())] == [
+        'orig_message',
+        'log_message_id',
+        'run_id',
+        'pipeline',
+        'solid',
+        'event_type',
+        'millis',
+    ]
+    assert {key: json.loads(value) for key, value in _parse_kv_message(record.getMessage())} == meta
+    assert meta['orig_message'] == 'a_message'
+    assert meta['run_id'] == 'a_run_id'
+    assert meta['millis'] == 3
+
+
+def test_message_props_override_tags():
+    logger, handler = _recording_logger('test_message_props_override_tags', logging.DEBUG)
+    log = DagsterLog('a_run_id', {'solid': 'a_solid', 'pipeline': 'a_pipeline'}, [logger])
+
+    log.info('a_message', solid='another_solid')
+
+    message = handler.records[0].getMessage()
+    assert [key for key, _value in _parse_kv_message(message)] == [
+        'orig_message',
+        'log_message_id',
+        'run_id',
+        'solid',
+        'pipeline',
+    ]
+    assert 'solid="another_solid"' in message
+    assert getattr(handler.records[0], DAGSTER_META_KEY)['solid'] == 'another_solid'
+
+
+def test_message_only_formatted_by_handlers():
+    logger, handler = _recording_logger('test_message_only_formatted_by_handlers', logging.DEBUG)
+    log = DagsterLog('a_run_id', {}, [logger])
+
+    # Not json serializable, so formatting the message raises
+    log.debug('a_message', unserializable=object())
+
+    assert len(handler.records) == 1
+    with pytest.raises(TypeError):
+        handler.records[0].getMessage()
+
+
+def test_disabled_levels_skipped():
+    info_logger, info_handler = _recording_logger('test_disabled_levels_info', logging.INFO)
+    error_logger, error_handler = _recording_logger('test_disabled_levels_error', logging.ERROR)
+    log = DagsterLog('a_run_id', {}, [info_logger, error_logger])
+
+    log.debug('a_message', unserializable=object())
+    assert not info_handler.records
+    assert not error_handler.records
+
+    log.info('a_message')
+    assert len(info_handler.records) == 1
+    assert not error_handler.records
+
+    log.error('a_message')
+    assert len(info_handler.records) == 2
+    assert len(error_handler.records) == 1
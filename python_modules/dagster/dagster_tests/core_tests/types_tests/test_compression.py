@@ -0,0 +1,124 @@
+import io
+import os
+
+import pytest
+
+from dagster import PipelineDefinition, execute_pipeline, lambda_solid
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.types.compression import (
+    CHUNK_SIZE,
+    CODECS,
+    COMPRESSED_HEADER_MAGIC,
+    Compression,
+    compressing_file_obj,
+    decompressing_file_obj,
+)
+from dagster.core.types.marshal import (
+    CompressedSerializationStrategy,
+    FilePersistencePolicy,
+    PickleSerializationStrategy,
+    deserialize_from_file,
+    serialize_to_file,
+)
+
+AVAILABLE_CODECS = sorted(name for name, codec in CODECS.items() if codec.is_available)
+
+VALUE = {'rows': [{'id': i, 'name': 'row {i}'.format(i=i)} for i in range(1000)]}
+
+
+@pytest.mark.parametrize('codec', AVAILABLE_CODECS)
+def test_compressed_round_trip(codec):
+    strategy = CompressedSerializationStrategy(PickleSerializationStrategy(), codec)
+
+    write_file_obj = io.BytesIO()
+    strategy.serialize_value(VALUE, write_file_obj)
+    assert write_file_obj.getvalue().startswith(COMPRESSED_HEADER_MAGIC)
+
+    uncompressed_file_obj = io.BytesIO()
+    PickleSerializationStrategy().serialize_value(VALUE, uncompressed_file_obj)
+    assert len(write_file_obj.getvalue()) < len(uncompressed_file_obj.getvalue())
+
+    write_file_obj.seek(0)
+    assert strategy.deserialize_value(write_file_obj) == VALUE
+
+
+@pytest.mark.parametrize('codec', [codec for codec in AVAILABLE_CODECS if codec != 'zstd'])
+def test_decompression_is_bounded(codec):
+    data = b'\0' * (100 * CHUNK_SIZE)
+    write_file_obj = io.BytesIO()
+    compressed_file_obj = compressing_file_obj(write_file_obj, Compression(CODECS[codec]))
+    compressed_file_obj.write(data)
+    compressed_file_obj.close()
+    # Small enough to be read from the file in a single chunk
+    assert len(write_file_obj.getvalue()) < CHUNK_SIZE
+
+    write_file_obj.seek(0)
+    read_file_obj = decompressing_file_obj(write_file_obj)
+    decompressed = []
+    while True:
+        piece = read_file_obj.read(1024)
+        # pylint: disable=W0212
+        assert len(read_file_obj.raw._pending) <= CHUNK_SIZE
+        if not piece:
+            break
+        decompressed.append(piece)
+    assert b''.join(decompressed) == data
+
+
+def test_compressed_strategy_reads_uncompressed_values():
+    write_file_obj = io.BytesIO()
+    PickleSerializationStrategy().serialize_value(VALUE, write_file_obj)
+    write_file_obj.seek(0)
+
+    strategy = CompressedSerializationStrategy(PickleSerializationStrategy(), 'bz2')
+    assert strategy.deserialize_value(write_file_obj) == VALUE
+
+
+def test_compression_level(tmpdir):
+    strategy = PickleSerializationStrategy()
+    fast_path = str(tmpdir.join('fast'))
+    small_path = str(tmpdir.join('small'))
+
+    FilePersistencePolicy().write_value(
+        CompressedSerializationStrategy(strategy, 'zlib', level=1), fast_path, VALUE
+    )
+    FilePersistencePolicy().write_value(
+        CompressedSerializationStrategy(strategy, 'zlib', level=9), small_path, VALUE
+    )
+    assert os.path.getsize(small_path) <= os.path.getsize(fast_path)
+
+    # The codec is recorded in the file, so it is read back by the type's own strategy
+    assert deserialize_from_file(strategy, small_path) == VALUE
+
+
+def test_unknown_codec():
+    with pytest.raises(DagsterInvariantViolationError, match='Unknown compression codec'):
+        CompressedSerializationStrategy(PickleSerializationStrategy(), 'snappy')
+
+
+def test_compression_config(tmpdir):
+    @lambda_solid
+    def return_value():
+        return VALUE
+
+    pipeline = PipelineDefinition(name='compressed_pipeline', solids=[return_value])
+
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'execution': {
+                'intermediate_store': {'filesystem': {'directory': str(tmpdir)}},
+                'compression': {'gzip': {'level': 6}},
+            }
+        },
+    )
+    assert result.success
+
+    path = str(tmpdir.join('return_value.transform.result'))
+    with open(path, 'rb') as read_obj:
+        assert read_obj.read().startswith(COMPRESSED_HEADER_MAGIC)
+
+    assert result.result_for_solid('return_value').transformed_value() == VALUE
+
+    serialize_to_file(PickleSerializationStrategy(), VALUE, path)
+    assert deserialize_from_file(PickleSerializationStrategy(), path) == VALUE
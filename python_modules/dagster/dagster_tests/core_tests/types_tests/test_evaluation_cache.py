@@ -0,0 +1,65 @@
+from dagster import Dict, Field, Int, List, String
+from dagster.core.types.evaluator import EVALUATION_CACHE, evaluate_config_value
+from dagster.core.types.field import resolve_to_config_type
+
+
+def _config_type():
+    return resolve_to_config_type(
+        Dict(
+            {
+                'name': Field(String),
+                'nums': Field(List(Int), is_optional=True, default_value=[1]),
+            }
+        )
+    )
+
+
+def test_repeated_evaluation_cached():
+    config_type = _config_type()
+    EVALUATION_CACHE.clear()
+
+    result = evaluate_config_value(config_type, {'name': 'foo'})
+    assert result.success
+    assert result.value == {'name': 'foo', 'nums': [1]}
+    assert EVALUATION_CACHE.misses == 1
+
+    assert evaluate_config_value(config_type, {'name': 'foo'}).value is result.value
+    assert EVALUATION_CACHE.hits == 1
+
+    assert evaluate_config_value(config_type, {'name': 'bar'}).value == {
+        'name': 'bar',
+        'nums': [1],
+    }
+    assert EVALUATION_CACHE.misses == 2
+
+
+def test_errors_cached():
+    config_type = _config_type()
+    EVALUATION_CACHE.clear()
+
+    for _ in range(2):
+        result = evaluate_config_value(config_type, {'name': 1})
+        assert not result.success
+        assert len(result.errors) == 1
+
+    assert EVALUATION_CACHE.hits == 1
+
+
+def test_scalar_types_distinguished():
+    config_type = resolve_to_config_type(Int)
+    EVALUATION_CACHE.clear()
+
+    assert evaluate_config_value(config_type, 1).success
+    assert not evaluate_config_value(config_type, 1.0).success
+    assert not evaluate_config_value(config_type, '1').success
+    assert EVALUATION_CACHE.misses == 3
+
+
+def test_uncacheable_values_evaluated():
+    config_type = resolve_to_config_type(List(Int))
+    EVALUATION_CACHE.clear()
+
+    # Tuples are not valid lists, and are not cached
+    assert not evaluate_config_value(config_type, (1, 2)).success
+    assert evaluate_config_value(config_type, [1, 2]).success
+    assert len(EVALUATION_CACHE) == 1
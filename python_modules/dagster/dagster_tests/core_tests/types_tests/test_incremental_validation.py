@@ -0,0 +1,184 @@
+import copy
+
+from dagster import Dict, Field, Int, List, Nullable, Selector, String
+from dagster.core.types.evaluator import (
+    VALIDATION_TOKEN_CACHE,
+    validate_config,
+    validate_config_incremental,
+    validate_config_value_incremental,
+)
+from dagster.core.types.field import resolve_to_config_type
+
+
+def _config_type():
+    return resolve_to_config_type(
+        Dict(
+            {
+                'solids': Field(
+                    Dict(
+                        {
+                            'foo': Field(Dict({'config': Field(Dict({'num': Field(Int)}))})),
+                            'bar': Field(Dict({'config': Field(List(Int))}), is_optional=True),
+                        }
+                    )
+                ),
+                'storage': Field(
+                    Selector({'files': Field(Dict({'path': Field(String)})), 'memory': Field(Int)}),
+                    is_optional=True,
+                ),
+                'name': Field(Nullable(String), is_optional=True),
+            }
+        )
+    )
+
+
+def _valid_config():
+    return {
+        'solids': {'foo': {'config': {'num': 1}}, 'bar': {'config': [1, 2]}},
+        'storage': {'files': {'path': '/tmp'}},
+    }
+
+
+def _error_keys(errors):
+    return sorted((tuple(error.stack.path), error.reason, error.message) for error in errors)
+
+
+def _assert_incremental_matches_full(config_type, previous_config, config, changed_path):
+    previous_errors = validate_config(config_type, previous_config)
+    incremental_errors = validate_config_incremental(
+        config_type, config, previous_errors, changed_path
+    )
+    assert _error_keys(incremental_errors) == _error_keys(validate_config(config_type, config))
+    return incremental_errors
+
+
+def _edit(config, path, value):
+    edited = copy.deepcopy(config)
+    parent = edited
+    for component in path[:-1]:
+        parent = parent[component]
+    if value is _REMOVE:
+        del parent[path[-1]]
+    else:
+        parent[path[-1]] = value
+    return edited
+
+
+_REMOVE = object()
+
+
+NUM_PATH = ['solids', 'foo', 'config', 'num']
+
+
+def test_leaf_edits():
+    config_type = _config_type()
+    config = _valid_config()
+
+    invalid = _edit(config, NUM_PATH, 'one')
+    errors = _assert_incremental_matches_full(config_type, config, invalid, NUM_PATH)
+    assert len(errors) == 1
+    assert not _assert_incremental_matches_full(config_type, invalid, config, NUM_PATH)
+
+    # Errors elsewhere in the config are kept
+    both_invalid = _edit(invalid, ['solids', 'bar', 'config', 1], 'two')
+    errors = _assert_incremental_matches_full(
+        config_type, invalid, both_invalid, ['solids', 'bar', 'config', '1']
+    )
+    assert len(errors) == 2
+
+
+def test_added_and_removed_fields():
+    config_type = _config_type()
+    config = _valid_config()
+
+    missing = _edit(config, NUM_PATH, _REMOVE)
+    errors = _assert_incremental_matches_full(config_type, config, missing, NUM_PATH)
+    assert len(errors) == 1
+    assert not _assert_incremental_matches_full(config_type, missing, config, NUM_PATH)
+
+    undefined = _edit(config, ['solids', 'baz'], {})
+    errors = _assert_incremental_matches_full(config_type, config, undefined, ['solids', 'baz'])
+    assert len(errors) == 1
+    assert not _assert_incremental_matches_full(config_type, undefined, config, ['solids', 'baz'])
+
+    # Paths that leave the config
+    for path in [['name'], ['bar', 'config', 5], ['solids', 'bar', 'config', 5]]:
+        assert not _assert_incremental_matches_full(config_type, config, config, path)
+
+
+def test_selector_edits():
+    config_type = _config_type()
+    config = _valid_config()
+
+    two_fields = _edit(config, ['storage', 'memory'], 1)
+    errors = _assert_incremental_matches_full(
+        config_type, config, two_fields, ['storage', 'memory']
+    )
+    assert len(errors) == 1
+
+    # The errors of the field the selector held before are dropped
+    bad_path = _edit(config, ['storage', 'files', 'path'], 1)
+    memory = _edit(bad_path, ['storage'], {'memory': 1})
+    assert not _assert_incremental_matches_full(
+        config_type, bad_path, memory, ['storage', 'memory']
+    )
+    assert not _assert_incremental_matches_full(
+        config_type, two_fields, memory, ['storage', 'files']
+    )
+
+
+def test_validation_with_token_reuses_previous_errors():
+    config_type = _config_type()
+
+    config = _edit(_valid_config(), NUM_PATH, 'one')
+    result = validate_config_value_incremental(config_type, config)
+    assert _error_keys(result.errors) == _error_keys(validate_config(config_type, config))
+
+    fixed = _edit(config, NUM_PATH, 2)
+    result = validate_config_value_incremental(config_type, fixed, NUM_PATH, result.token)
+    assert not result.errors
+
+    broken = _edit(fixed, ['solids', 'bar', 'config', 1], 'two')
+    result = validate_config_value_incremental(
+        config_type, broken, ['solids', 'bar', 'config', 1], result.token
+    )
+    assert _error_keys(result.errors) == _error_keys(validate_config(config_type, broken))
+
+
+def test_validation_with_token_does_not_visit_the_rest_of_the_config(monkeypatch):
+    config_type = _config_type()
+
+    config = _edit(_valid_config(), NUM_PATH, 'one')
+    token = validate_config_value_incremental(config_type, config).token
+
+    full_validations = []
+
+    def _validate_config(config_type, config_value):
+        full_validations.append(config_value)
+        return validate_config(config_type, config_value)
+
+    monkeypatch.setattr('dagster.core.types.evaluator.validate_config', _validate_config)
+
+    # The rest of the config is not even read, so it could be anything
+    result = validate_config_value_incremental(
+        config_type, {'solids': {'foo': {'config': {'num': 2}}}}, NUM_PATH, token
+    )
+    assert not result.errors
+    assert not full_validations
+
+
+def test_validation_without_known_token_is_in_full():
+    config_type = _config_type()
+    config = _edit(_valid_config(), NUM_PATH, 'one')
+    fixed = _edit(config, NUM_PATH, 2)
+
+    token = validate_config_value_incremental(config_type, config).token
+    VALIDATION_TOKEN_CACHE.clear()
+    result = validate_config_value_incremental(config_type, fixed, NUM_PATH, token)
+    assert not result.errors
+
+    # A token of another config type is not used either
+    other_token = validate_config_value_incremental(_config_type(), config).token
+    broken = _edit(fixed, ['name'], 1)
+    result = validate_config_value_incremental(config_type, broken, ['name'], other_token)
+    assert _error_keys(result.errors) == _error_keys(validate_config(config_type, broken))
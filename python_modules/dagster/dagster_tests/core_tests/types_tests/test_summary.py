@@ -0,0 +1,118 @@
+import logging
+
+from dagster import (
+    ExecutionContext,
+    OutputDefinition,
+    PipelineContextDefinition,
+    PipelineDefinition,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.log import DAGSTER_META_KEY
+from dagster.core.types.summary import (
+    MAX_SUMMARY_LENGTH,
+    ValueSummarizer,
+    summarize_value,
+    truncate_summary,
+)
+
+
+def test_summarize_scalars():
+    assert summarize_value(1) == '1'
+    assert summarize_value('foo') == "'foo'"
+    assert summarize_value(None) == 'None'
+
+
+def test_summarize_long_string():
+    summary = summarize_value('a' * 10000)
+    assert len(summary) == MAX_SUMMARY_LENGTH
+    assert summary.startswith("'aaa")
+    assert summary.endswith('...')
+
+
+def test_summarize_collections():
+    assert summarize_value([]) == '[]'
+    assert summarize_value([1, 2]) == '[1, 2]'
+    assert summarize_value((1,)) == '(1,)'
+    assert summarize_value({'a': 1}) == "{'a': 1}"
+    assert summarize_value([[1, 2], {'a': 1}]) == '[<list of length 2>, <dict of length 1>]'
+
+
+def test_summarize_large_collections():
+    assert summarize_value(list(range(100000))) == ('<list of length 100000: [0, 1, 2, 3, 4, ...]>')
+    assert summarize_value({i: i for i in range(10)}, max_items=2) == (
+        '<dict of length 10: {0: 0, 1: 1, ...}>'
+    )
+
+
+def test_truncate_summary():
+    assert truncate_summary('abc', 3) == 'abc'
+    assert truncate_summary('abcdef', 5) == 'ab...'
+
+
+class Secret(object):
+    pass
+
+
+class SecretSummarizer(ValueSummarizer):
+    def __init__(self):
+        self.summarized = 0
+
+    def summarize_value(self, value):
+        self.summarized += 1
+        return '<secret>'
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super(RecordingHandler, self).__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(getattr(record, DAGSTER_META_KEY)['orig_message'])
+
+
+def define_secret_pipeline(summarizer, logger):
+    SecretType = as_dagster_type(Secret, value_summarizer=summarizer)
+
+    @lambda_solid(output=OutputDefinition(SecretType))
+    def return_secret():
+        return Secret()
+
+    return PipelineDefinition(
+        name='secret_pipeline',
+        solids=[return_secret],
+        context_definitions={
+            'default': PipelineContextDefinition(
+                context_fn=lambda _info: ExecutionContext(loggers=[logger])
+            )
+        },
+    )
+
+
+def _recording_logger(name, level):
+    logger = logging.Logger(name, level)
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_runtime_type_summarizer_in_logs():
+    summarizer = SecretSummarizer()
+    logger, handler = _recording_logger('test_runtime_type_summarizer_in_logs', logging.INFO)
+    result = execute_pipeline(define_secret_pipeline(summarizer, logger))
+    assert result.success
+    assert summarizer.summarized == 2
+    assert 'Solid return_secret emitted output "result" value <secret>' in handler.messages
+    assert 'Step return_secret.transform emitted <secret> for output result' in handler.messages
+    assert not any('Secret object' in message for message in handler.messages)
+
+
+def test_summary_skipped_when_not_logged():
+    summarizer = SecretSummarizer()
+    logger, handler = _recording_logger('test_summary_skipped_when_not_logged', logging.ERROR)
+    result = execute_pipeline(define_secret_pipeline(summarizer, logger))
+    assert result.success
+    assert summarizer.summarized == 0
+    assert not handler.messages
@@ -20,3 +20,11 @@ def test_wrong_usage():
     with pytest.raises(Exception):
         timer_result = TimerResult()
         assert timer_result.seconds
+
+
+def test_timed_on_error():
+    with pytest.raises(ValueError):
+        with time_execution_scope() as timer_result:
+            raise ValueError()
+
+    assert isinstance(timer_result.millis, float)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+import toposort as toposort_package
+
+from dagster.utils.toposort import toposort, toposort_flatten
+
+
+def _random_dag(num_items, seed):
+    rand = random.Random(seed)
+    return {
+        'item_{i}'.format(i=i): set(
+            'item_{j}'.format(j=j) for j in rand.sample(range(i), min(i, rand.randint(0, 3)))
+        )
+        for i in range(num_items)
+    }
+
+
+def test_toposort_matches_package():
+    for seed in range(10):
+        data = _random_dag(200, seed)
+        assert toposort(data) == [sorted(level) for level in toposort_package.toposort(data)]
+        assert toposort_flatten(data) == toposort_package.toposort_flatten(data, sort=True)
+
+
+def test_toposort_items_only_in_deps():
+    # Items that are only depended on and self dependencies are handled as by toposort
+    assert toposort({'b': {'a', 'b'}, 'c': {'b', 'a'}}) == [['a'], ['b'], ['c']]
+    assert toposort({}) == []
+
+
+def test_toposort_long_chain():
+    num_items = 50000
+    data = {i: {i - 1} for i in range(1, num_items)}
+    assert toposort_flatten(data) == list(range(num_items))
+
+
+def test_toposort_cycle():
+    with pytest.raises(toposort_package.CircularDependencyError) as exc_info:
+        toposort({'a': {'b'}, 'b': {'a', 'c'}, 'c': set(), 'd': {'a'}})
+    assert exc_info.value.data == {'a': {'b'}, 'b': {'a'}, 'd': {'a'}}